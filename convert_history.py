@@ -8,21 +8,62 @@ Usage:
         [--input_file MyActivity.json] \
         [--output_file Gemini_History.md] \
         [--limit 1000000]
+    python convert_history.py --plan | --preview N | --stats FILE
+    python convert_history.py --store history.sqlite | --batch jobs.csv | --products products.json
+    python convert_history.py --output_file - | --bundle out.zip | --target-files N
+    python convert_history.py serve | resplit | report
+
+Reading (--workers, --mmap, --incremental, --snapshot-dir), output (--redact,
+--attachments, --timezone) and monitoring (--progress, --metrics-log) options
+combine with the modes above. Run with --help, or "<command> --help", for the
+full list, and see README.md for which options can be combined.
 """
 
+import abc
 import argparse
+import bisect
+import contextlib
+import csv
 import functools
+import hashlib
+import heapq
 import html as html_module
+import importlib.util
+import io
+import itertools
 import json
 import locale
+import marshal
+import math
+import mmap
+import multiprocessing
 import os
+import queue
+import random
 import re
+import shutil
+import sqlite3
+import statistics
+import struct
 import sys
-from datetime import datetime, timezone
-from typing import Any
+import tempfile
+import threading
+import time
+import urllib.parse
+import zipfile
+import zoneinfo
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone, tzinfo
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, BinaryIO, Callable, Optional, TextIO, TypeVar, Union
 
 LAST_ENTRY_TIME_FILE = "last_entry_time.txt"
+METRICS_LOG_FILE = "run_metrics.jsonl"
 FORMAT_EXCEPTIONS = (IndexError, KeyError, ValueError, AttributeError, TypeError)
+OUTPUT_HEADER_TIMESTAMP_PATTERN = re.compile(r"\A(# Gemini Chat History Archive\n\n)Generated at: [^\n]*\n")
 
 # TRANSLATIONSに含まれる言語名からISO 639-1コードへのマッピング辞書
 LANG_MAP = {
@@ -70,8 +111,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "تحذير: الملف last_entry_time.txt فارغ. يتم الانتقال إلى وضع إعادة التوليد الكامل.",
         "warning_last_entry_time_invalid": "تحذير: طابع زمني غير صالح في last_entry_time.txt ({!r}). يتم الانتقال إلى وضع إعادة التوليد الكامل.",
         "warning_last_entry_time_naive": "تحذير: يحتوي last_entry_time.txt على طابع زمني بدون منطقة زمنية. سيتم اعتباره بتوقيت UTC.",
-        "warning_removed_existing_outputs": "تحذير: تم إزالة {} من ملفات المخرجات الحالية قبل إعادة التوليد الكامل.",
         "warning_failed_remove_output_file": "تحذير: فشل إزالة ملف المخرجات {}: {}",
+        "warning_json_backend_unavailable": "تحذير: واجهة JSON الخلفية {} غير متاحة. يتم الرجوع إلى وحدة json القياسية.",
+        "batch_job_summary": "{0}: {1} مدخلات جديدة، {2} ملفات، {3:.2f} ث ({4:.0f} مدخلات/ث، {5:.2f} ميغابايت/ث)",
+        "batch_job_failed": "{0}: فشل: {1}",
+        "batch_complete": "✅ اكتملت الدفعة: نجح {0}، وفشل {1}.",
+        "serve_listening": "🌐 خدمة التحويل تستمع على http://{0}:{1}/convert (بحد أقصى {2} عمليات تحويل متزامنة)",
+        "unchanged_output_file": "لم يتغير المحتوى، تُرك الملف كما هو: {}",
+        "changed_output_files": "الملفات التي تغيرت ({}):",
+        "product_entries": "📦 {0}: {1} إدخالات",
+        "store_import": "🗄️ مخزن السجل: تم تخزين {0} إدخالات جديدة (تم فحص {1} من {2} إدخالات)",
+        "resplit_no_outputs": "لم يتم العثور على ملفات إخراج مرقمة لـ {}.",
+        "resplit_complete": "✅ أعيد تقسيم {0} إدخالات من {1} ملف(ات) إلى {2} ملف(ات) بحد {3} بايت.",
+        "plan_summary": "📋 خطة {0}: {1} إدخالات جديدة في {2} ملف(ات)؛ لن تتم كتابة أي شيء.",
+        "plan_file": "  {0}: {1} إدخالات، ~{2} بايت، {3} – {4}",
+        "plan_file_appended": "  {0} (إلحاق): {1} إدخالات جديدة، ~{2} بايت، {3} – {4}",
+        "plan_projection": "⏱️ الوقت المقدر: {0:.1f} ث (التحميل {1:.1f} ث + التحويل {2:.1f} ث، ~{3:.0f} إدخال/ث، من عينة {4} إدخالات)",
+        "warning_target_files_exceeded": "تحذير: لا يمكن احتواء السجل في {0} ملف(ات) ضمن حد {1} بايت؛ سيتم كتابة {2} ملف(ات) بدلاً من ذلك.",
+        "redaction_summary": "🛡️ تم حجب {0} عنصر(ا) (البريد الإلكتروني: {1}، أرقام الهاتف: {2}، مفاتيح API: {3}، المصطلحات: {4}) في {5:.2f} ميغابايت بسرعة {6:.1f} ميغابايت/ث",
+        "snapshot_loaded": "⚡ تم تحميل {0} إدخالات محددة من اللقطة {1}",
+        "snapshot_saved": "💾 تم حفظ اللقطة: {}",
+        "metrics_report_run": "{0}: {1:.2f} ث، إدخال {2:.1f} ميغابايت، {3} مدخلات Gemini ({4} جديدة)، كُتب {5} ملف(ات) ({6:.2f} ميغابايت)، ذروة RSS {7:.0f} ميغابايت",
+        "metrics_report_failed_run": "{0}: فشل بعد {1:.2f} ث",
+        "metrics_report_trend": "📈 آخر تشغيل مقارنة بوسيط {0} تشغيل(ات) سابقة: المدة {1:+.0%}، الإنتاجية {2:+.0%}، حجم الإدخال {3:+.0%}، مدخلات Gemini {4:+.0%}، ذروة RSS {5:+.0%}",
+        "metrics_report_empty": "لا توجد عمليات تشغيل مسجلة في {}.",
+        "incremental_read": "⏩ توقفت القراءة عند آخر إدخال تمت معالجته بعد قراءة {0} من {1} بايت ({2} أنشطة)",
+        "warning_entries_out_of_order": "تحذير: المدخلات ليست مرتبة زمنيًا ({0} مقاطع تصاعدية)؛ يجري فرز {1} مدخلات حسب الطابع الزمني.",
+        "attachments_linked": "📎 تم ربط {0} مرفق(ات) كـ {1} ملف(ات) مخزنة في {2}",
+        "warning_attachments_missing": "تحذير: لم يُعثر على {0} مرفق(ات) مشار إليها في {1}.",
+        "stats_written": "📊 تمت كتابة إحصاءات الاستخدام: {}",
+        "streamed_to_stdout": "تم بث سجلات الدردشة إلى المخرج القياسي باسم: {}",
+        "error_stdout_output_unsupported": "خطأ: لا يمكن استخدام --output_file - مع --store أو --products أو --batch أو --attachments.",
+        "added_to_bundle": "تمت إضافة سجلات الدردشة إلى الحزمة باسم: {}",
+        "bundle_written": "🗜️ تمت كتابة الحزمة: {0} ({1} ملف)",
+        "error_bundle_unsupported": "خطأ: لا يمكن استخدام --bundle مع --store أو --batch أو --attachments أو --output_file -.",
+        "warning_html_budget_exceeded": "تحذير: استغرق تحويل استجابة HTML (عدد الأحرف: {0}) أكثر من {1:.1f} ث؛ سيتم الاكتفاء بإزالة الوسوم.",
+        "preview_written": "🔍 تمت كتابة المعاينة: {0} (عينة من {1} من أصل {2} إدخال)",
+        "error_unknown_timezone": "خطأ: منطقة زمنية غير معروفة: {}",
+        "error_timezone_store": "خطأ: لا يمكن استخدام --timezone مع --store، لأن المخزن يحتفظ بعناوين Markdown كما عُرضت.",
+        "error_store_option_unsupported": "خطأ: لا يمكن استخدام {0} مع --store.",
+        "warning_removed_stale_outputs": "تحذير: تمت إزالة {} من ملفات المخرجات المرقمة القديمة المتبقية من التقسيم السابق.",
     },
     "bn": {
         "error_lang_detection": "সিস্টেম ভাষা সনাক্তকরণে ত্রুটি: {}",
@@ -87,8 +166,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "सतर्कता: last_entry_time.txt ফাইলটি খালি। সম্পূর্ণ পুনরুৎপাদন মোডে পরিবর্তন করা হচ্ছে।",
         "warning_last_entry_time_invalid": "सतर्कता: last_entry_time.txt-এ অবৈধ টাইমস্ট্যাম্প ({!r})। সম্পূর্ণ পুনরুৎပাদন মোডে পরিবর্তন করা হচ্ছে।",
         "warning_last_entry_time_naive": "सतर्कता: last_entry_time.txt-এ টাইমজোন-বিহীন টাইমস্ট্যাম্প রয়েছে। UTC হিসেবেধরে নেওয়া হচ্ছে।",
-        "warning_removed_existing_outputs": "सतर्कता: সম্পূর্ণ পুনরুৎপাদনের আগে {}টি বিদ্যমান আউটপুট ফাইল মুছে ফেলা হয়েছে।",
         "warning_failed_remove_output_file": "सतर्कता: আউটপুট ফাইল {} মুছে ফেলতে ব্যর্থ হয়েছে: {}",
+        "warning_json_backend_unavailable": "সতর্কতা: JSON ব্যাকএন্ড {} উপলব্ধ নয়। স্ট্যান্ডার্ড json মডিউলে ফিরে যাওয়া হচ্ছে।",
+        "batch_job_summary": "{0}: {1}টি নতুন এন্ট্রি, {2}টি ফাইল, {3:.2f} সে ({4:.0f} এন্ট্রি/সে, {5:.2f} MB/সে)",
+        "batch_job_failed": "{0}: ব্যর্থ: {1}",
+        "batch_complete": "✅ ব্যাচ সম্পন্ন: {0}টি সফল, {1}টি ব্যর্থ।",
+        "serve_listening": "🌐 রূপান্তর পরিষেবা http://{0}:{1}/convert এ শুনছে (একসাথে সর্বোচ্চ {2}টি রূপান্তর)",
+        "unchanged_output_file": "বিষয়বস্তু অপরিবর্তিত, ফাইলটি যেমন ছিল তেমন রাখা হয়েছে: {}",
+        "changed_output_files": "যে ফাইলগুলো পরিবর্তিত হয়েছে ({}):",
+        "product_entries": "📦 {0}: {1}টি এন্ট্রি",
+        "store_import": "🗄️ ইতিহাস স্টোর: {0}টি নতুন এন্ট্রি সংরক্ষিত (যাচাই করা হয়েছে: {1}/{2}টি এন্ট্রি)",
+        "resplit_no_outputs": "{} এর জন্য কোনো ক্রমিক আউটপুট ফাইল পাওয়া যায়নি।",
+        "resplit_complete": "✅ পুনঃবিভাজিত: {0}টি এন্ট্রি, {1}টি ফাইল থেকে {2}টি ফাইলে, সীমা {3} বাইট।",
+        "plan_summary": "📋 {0} এর পরিকল্পনা: {1}টি নতুন এন্ট্রি, {2}টি ফাইলে; কিছুই লেখা হবে না।",
+        "plan_file": "  {0}: {1}টি এন্ট্রি, ~{2} বাইট, {3} – {4}",
+        "plan_file_appended": "  {0} (যোগ): {1}টি নতুন এন্ট্রি, ~{2} বাইট, {3} – {4}",
+        "plan_projection": "⏱️ আনুমানিক সময়: {0:.1f} সে (লোড {1:.1f} সে + রূপান্তর {2:.1f} সে, ~{3:.0f} এন্ট্রি/সে, নমুনা {4}টি এন্ট্রি)",
+        "warning_target_files_exceeded": "সতর্কতা: ইতিহাস {0}টি ফাইলে আঁটানো যাচ্ছে না (সীমা {1} বাইট); পরিবর্তে {2}টি ফাইল লেখা হচ্ছে।",
+        "redaction_summary": "🛡️ {0}টি আইটেম গোপন করা হয়েছে (ইমেল: {1}, ফোন নম্বর: {2}, API কী: {3}, শব্দ: {4}) {5:.2f} MB-তে, {6:.1f} MB/সে গতিতে",
+        "snapshot_loaded": "⚡ স্ন্যাপশট থেকে {0}টি নির্বাচিত এন্ট্রি লোড হয়েছে: {1}",
+        "snapshot_saved": "💾 স্ন্যাপশট সংরক্ষিত: {}",
+        "metrics_report_run": "{0}: {1:.2f} সে, {2:.1f} MB ইনপুট, {3}টি Gemini এন্ট্রি ({4}টি নতুন), {5}টি ফাইল লেখা হয়েছে ({6:.2f} MB), সর্বোচ্চ RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: {1:.2f} সে পরে ব্যর্থ হয়েছে",
+        "metrics_report_trend": "📈 সর্বশেষ রান বনাম আগের {0}টি রানের মধ্যমা: সময়কাল {1:+.0%}, থ্রুপুট {2:+.0%}, ইনপুট আকার {3:+.0%}, Gemini এন্ট্রি {4:+.0%}, সর্বোচ্চ RSS {5:+.0%}",
+        "metrics_report_empty": "{} এ কোনো রান রেকর্ড করা নেই।",
+        "incremental_read": "⏩ শেষ প্রক্রিয়াকৃত এন্ট্রিতে থামা হয়েছে ({0} / {1} বাইট পড়া হয়েছে, {2}টি কার্যকলাপ)",
+        "warning_entries_out_of_order": "সতর্কতা: এন্ট্রিগুলো সময়ের ক্রমে নেই ({0}টি ঊর্ধ্বক্রমিক অংশ); {1}টি এন্ট্রি টাইমস্ট্যাম্প অনুযায়ী সাজানো হচ্ছে।",
+        "attachments_linked": "📎 {0}টি সংযুক্তি {1}টি সংরক্ষিত ফাইল হিসেবে {2} এ লিঙ্ক করা হয়েছে",
+        "warning_attachments_missing": "সতর্কতা: উল্লেখিত {0}টি সংযুক্তি {1} এ পাওয়া যায়নি।",
+        "stats_written": "📊 ব্যবহারের পরিসংখ্যান লেখা হয়েছে: {}",
+        "streamed_to_stdout": "চ্যাট ইতিহাস stdout-এ পাঠানো হয়েছে, নাম: {}",
+        "error_stdout_output_unsupported": "ত্রুটি: --output_file - কে --store, --products, --batch বা --attachments এর সাথে ব্যবহার করা যায় না।",
+        "added_to_bundle": "চ্যাট ইতিহাস বান্ডেলে যোগ করা হয়েছে, নাম: {}",
+        "bundle_written": "🗜️ বান্ডেল লেখা হয়েছে: {0} ({1}টি ফাইল)",
+        "error_bundle_unsupported": "ত্রুটি: --bundle কে --store, --batch, --attachments বা --output_file - এর সাথে ব্যবহার করা যায় না।",
+        "warning_html_budget_exceeded": "সতর্কতা: HTML উত্তর (অক্ষর: {0}) রূপান্তরে {1:.1f} সেকেন্ডের বেশি লেগেছে; শুধু ট্যাগ সরানো হবে।",
+        "preview_written": "🔍 প্রিভিউ লেখা হয়েছে: {0} ({1} / {2}টি এন্ট্রি নমুনা)",
+        "error_unknown_timezone": "ত্রুটি: অজানা সময় অঞ্চল: {}",
+        "error_timezone_store": "ত্রুটি: --timezone কে --store এর সাথে ব্যবহার করা যায় না, কারণ স্টোর Markdown শিরোনামগুলো যেভাবে তৈরি হয়েছিল সেভাবেই রাখে।",
+        "error_store_option_unsupported": "ত্রুটি: {0} কে --store এর সাথে ব্যবহার করা যায় না।",
+        "warning_removed_stale_outputs": "সতর্কতা: আগের বিভাজন থেকে থেকে যাওয়া {}টি পুরোনো ক্রমিক আউটপুট ফাইল মুছে ফেলা হয়েছে।",
     },
     "de": {
         "error_lang_detection": "Fehler bei der Erkennung der Systemsprache: {}",
@@ -104,8 +221,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Warnung: last_entry_time.txt ist leer. Wechsel in den Modus zur vollständigen Regenerierung.",
         "warning_last_entry_time_invalid": "Warnung: Ungültiger Zeitstempel in last_entry_time.txt ({!r}). Wechsel in den Modus zur vollständigen Regenerierung.",
         "warning_last_entry_time_naive": "Warnung: last_entry_time.txt enthält einen Zeitstempel ohne Zeitzone. UTC wird angenommen.",
-        "warning_removed_existing_outputs": "Warnung: {} vorhandene Ausgabedatei(en) vor der vollständigen Regenerierung entfernt.",
         "warning_failed_remove_output_file": "Warnung: Ausgabedatei {} konnte nicht entfernt werden: {}",
+        "warning_json_backend_unavailable": "Warnung: JSON-Backend {} ist nicht verfügbar. Es wird auf das Standardmodul json zurückgegriffen.",
+        "batch_job_summary": "{0}: {1} neue Einträge, {2} Datei(en), {3:.2f} s ({4:.0f} Einträge/s, {5:.2f} MB/s)",
+        "batch_job_failed": "{0}: fehlgeschlagen: {1}",
+        "batch_complete": "✅ Stapel abgeschlossen: {0} erfolgreich, {1} fehlgeschlagen.",
+        "serve_listening": "🌐 Konvertierungsdienst lauscht auf http://{0}:{1}/convert (höchstens {2} gleichzeitige Konvertierungen)",
+        "unchanged_output_file": "Inhalt unverändert, Datei bleibt unangetastet: {}",
+        "changed_output_files": "Geänderte Dateien ({}):",
+        "product_entries": "📦 {0}: {1} Einträge",
+        "store_import": "🗄️ Verlaufsspeicher: {0} neue Einträge gespeichert ({1} von {2} Einträgen geprüft)",
+        "resplit_no_outputs": "Keine nummerierten Ausgabedateien für {} gefunden.",
+        "resplit_complete": "✅ {0} Einträge aus {1} Datei(en) in {2} Datei(en) mit Limit {3} Bytes neu aufgeteilt.",
+        "plan_summary": "📋 Plan für {0}: {1} neue Einträge in {2} Datei(en); es wird nichts geschrieben.",
+        "plan_file": "  {0}: {1} Einträge, ~{2} Bytes, {3} – {4}",
+        "plan_file_appended": "  {0} (angehängt): {1} neue Einträge, ~{2} Bytes, {3} – {4}",
+        "plan_projection": "⏱️ Geschätzte Dauer: {0:.1f} s (Laden {1:.1f} s + Konvertierung {2:.1f} s, ~{3:.0f} Einträge/s, aus {4} Stichproben)",
+        "warning_target_files_exceeded": "Warnung: Der Verlauf passt nicht in {0} Datei(en) unter dem Limit von {1} Bytes; stattdessen werden {2} Dateien geschrieben.",
+        "redaction_summary": "🛡️ {0} Treffer geschwärzt (E-Mails: {1}, Telefonnummern: {2}, API-Schlüssel: {3}, Begriffe: {4}) in {5:.2f} MB mit {6:.1f} MB/s",
+        "snapshot_loaded": "⚡ {0} ausgewählte Einträge aus dem Snapshot {1} geladen",
+        "snapshot_saved": "💾 Snapshot gespeichert: {}",
+        "metrics_report_run": "{0}: {1:.2f} s, {2:.1f} MB Eingabe, {3} Gemini-Einträge ({4} neu), {5} Datei(en) geschrieben ({6:.2f} MB), Spitzen-RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: nach {1:.2f} s fehlgeschlagen",
+        "metrics_report_trend": "📈 Letzter Lauf gegenüber dem Median von {0} früheren Läufen: Dauer {1:+.0%}, Durchsatz {2:+.0%}, Eingabegröße {3:+.0%}, Gemini-Einträge {4:+.0%}, Spitzen-RSS {5:+.0%}",
+        "metrics_report_empty": "In {} sind keine Läufe aufgezeichnet.",
+        "incremental_read": "⏩ Beim zuletzt verarbeiteten Eintrag angehalten, nachdem {0} von {1} Bytes gelesen wurden ({2} Aktivitäten)",
+        "warning_entries_out_of_order": "Warnung: Die Einträge sind nicht zeitlich geordnet ({0} aufsteigende Folgen); {1} Einträge werden nach Zeitstempel sortiert.",
+        "attachments_linked": "📎 {0} Anhang/Anhänge als {1} gespeicherte Datei(en) in {2} verknüpft",
+        "warning_attachments_missing": "Warnung: {0} referenzierte(r) Anhang/Anhänge wurde(n) in {1} nicht gefunden.",
+        "stats_written": "📊 Nutzungsstatistik geschrieben: {}",
+        "streamed_to_stdout": "Chatverläufe an die Standardausgabe gestreamt als: {}",
+        "error_stdout_output_unsupported": "Fehler: --output_file - kann nicht mit --store, --products, --batch oder --attachments kombiniert werden.",
+        "added_to_bundle": "Chatverläufe zum Bundle hinzugefügt als: {}",
+        "bundle_written": "🗜️ Bundle geschrieben: {0} ({1} Datei(en))",
+        "error_bundle_unsupported": "Fehler: --bundle kann nicht mit --store, --batch, --attachments oder --output_file - kombiniert werden.",
+        "warning_html_budget_exceeded": "Warnung: Die Umwandlung einer HTML-Antwort mit {0} Zeichen dauerte länger als {1:.1f} s; es werden nur die Tags entfernt.",
+        "preview_written": "🔍 Vorschau geschrieben: {0} ({1} von {2} Einträgen als Stichprobe)",
+        "error_unknown_timezone": "Fehler: Unbekannte Zeitzone: {}",
+        "error_timezone_store": "Fehler: --timezone kann nicht mit --store kombiniert werden, da der Speicher die Markdown-Überschriften so behält, wie sie erzeugt wurden.",
+        "error_store_option_unsupported": "Fehler: {0} kann nicht mit --store kombiniert werden.",
+        "warning_removed_stale_outputs": "Warnung: {} veraltete nummerierte Ausgabedatei(en) aus der vorherigen Aufteilung entfernt.",
     },
     "en": {
         "error_lang_detection": "Error while detecting system language: {}",
@@ -121,8 +276,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Warning: last_entry_time.txt is empty. Switching to full regeneration mode.",
         "warning_last_entry_time_invalid": "Warning: Invalid timestamp in last_entry_time.txt ({!r}). Switching to full regeneration mode.",
         "warning_last_entry_time_naive": "Warning: last_entry_time.txt has a timezone-naive timestamp. Assuming UTC.",
-        "warning_removed_existing_outputs": "Warning: Removed {} existing output file(s) before full regeneration.",
         "warning_failed_remove_output_file": "Warning: Failed to remove output file {}: {}",
+        "warning_json_backend_unavailable": "Warning: JSON backend {} is not available. Falling back to the standard json module.",
+        "batch_job_summary": "{0}: {1} new entries, {2} file(s), {3:.2f} s ({4:.0f} entries/s, {5:.2f} MB/s)",
+        "batch_job_failed": "{0}: failed: {1}",
+        "batch_complete": "✅ Batch completed: {0} succeeded, {1} failed.",
+        "serve_listening": "🌐 Conversion service listening on http://{0}:{1}/convert (at most {2} concurrent conversions)",
+        "unchanged_output_file": "Content unchanged, file left as is: {}",
+        "changed_output_files": "Files that changed ({}):",
+        "product_entries": "📦 {0}: {1} entries",
+        "store_import": "🗄️ History store: {0} new entries stored ({1} of {2} entries checked)",
+        "resplit_no_outputs": "No numbered output files found for {}.",
+        "resplit_complete": "✅ Re-split {0} entries from {1} file(s) into {2} file(s) with a limit of {3} bytes.",
+        "plan_summary": "📋 Plan for {0}: {1} new entries in {2} file(s); nothing is written.",
+        "plan_file": "  {0}: {1} entries, ~{2} bytes, {3} – {4}",
+        "plan_file_appended": "  {0} (append): {1} new entries, ~{2} bytes, {3} – {4}",
+        "plan_projection": "⏱️ Estimated time: {0:.1f} s (loading {1:.1f} s + conversion {2:.1f} s, ~{3:.0f} entries/s, from {4} sampled entries)",
+        "warning_target_files_exceeded": "Warning: The history does not fit into {0} file(s) under the {1}-byte limit; writing {2} files instead.",
+        "redaction_summary": "🛡️ Redacted {0} item(s) (emails: {1}, phone numbers: {2}, API keys: {3}, terms: {4}) in {5:.2f} MB at {6:.1f} MB/s",
+        "snapshot_loaded": "⚡ Loaded {0} selected entries from snapshot {1}",
+        "snapshot_saved": "💾 Snapshot saved: {}",
+        "metrics_report_run": "{0}: {1:.2f} s, {2:.1f} MB input, {3} Gemini entries ({4} new), {5} file(s) written ({6:.2f} MB), peak RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: failed after {1:.2f} s",
+        "metrics_report_trend": "📈 Latest run vs. median of {0} earlier run(s): duration {1:+.0%}, throughput {2:+.0%}, input size {3:+.0%}, Gemini entries {4:+.0%}, peak RSS {5:+.0%}",
+        "metrics_report_empty": "No runs recorded in {}.",
+        "incremental_read": "⏩ Stopped at the last processed entry after reading {0} of {1} bytes ({2} activities)",
+        "warning_entries_out_of_order": "Warning: The entries are not in time order ({0} ascending runs); sorting {1} entries by timestamp.",
+        "attachments_linked": "📎 Linked {0} attachment(s) as {1} stored file(s) in {2}",
+        "warning_attachments_missing": "Warning: {0} referenced attachment(s) were not found in {1}.",
+        "stats_written": "📊 Usage statistics written: {}",
+        "streamed_to_stdout": "Chat histories streamed to stdout as: {}",
+        "error_stdout_output_unsupported": "Error: --output_file - cannot be combined with --store, --products, --batch or --attachments.",
+        "added_to_bundle": "Chat histories added to the bundle as: {}",
+        "bundle_written": "🗜️ Bundle written: {0} ({1} file(s))",
+        "error_bundle_unsupported": "Error: --bundle cannot be combined with --store, --batch, --attachments or --output_file -.",
+        "warning_html_budget_exceeded": "Warning: Converting an HTML response of {0} characters took longer than {1:.1f} s; falling back to plain tag stripping.",
+        "preview_written": "🔍 Preview written: {0} ({1} of {2} entries sampled)",
+        "error_unknown_timezone": "Error: Unknown time zone: {}",
+        "error_timezone_store": "Error: --timezone cannot be combined with --store, which keeps the Markdown headings as they were rendered.",
+        "error_store_option_unsupported": "Error: {0} cannot be combined with --store.",
+        "warning_removed_stale_outputs": "Warning: Removed {} stale numbered output file(s) left over from the previous layout.",
     },
     "es": {
         "error_lang_detection": "Error al detectar el idioma del sistema: {}",
@@ -138,8 +331,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Advertencia: last_entry_time.txt está vacío. Cambiando al modo de regeneración completa.",
         "warning_last_entry_time_invalid": "Advertencia: Marca de tiempo inválida en last_entry_time.txt ({!r}). Cambiando al modo de regeneración completa.",
         "warning_last_entry_time_naive": "Advertencia: last_entry_time.txt tiene una marca de tiempo sin zona horaria. Se asume UTC.",
-        "warning_removed_existing_outputs": "Advertencia: Se eliminaron {} archivos de salida existentes antes de la regeneración completa.",
         "warning_failed_remove_output_file": "Advertencia: No se pudo eliminar el archivo de salida {}: {}",
+        "warning_json_backend_unavailable": "Advertencia: el backend JSON {} no está disponible. Se usará el módulo json estándar.",
+        "batch_job_summary": "{0}: {1} entradas nuevas, {2} archivo(s), {3:.2f} s ({4:.0f} entradas/s, {5:.2f} MB/s)",
+        "batch_job_failed": "{0}: falló: {1}",
+        "batch_complete": "✅ Lote completado: {0} correctos, {1} fallidos.",
+        "serve_listening": "🌐 Servicio de conversión escuchando en http://{0}:{1}/convert (máximo {2} conversiones simultáneas)",
+        "unchanged_output_file": "Contenido sin cambios, el archivo se deja como está: {}",
+        "changed_output_files": "Archivos que cambiaron ({}):",
+        "product_entries": "📦 {0}: {1} entradas",
+        "store_import": "🗄️ Almacén de historial: {0} entradas nuevas guardadas ({1} de {2} entradas comprobadas)",
+        "resplit_no_outputs": "No se encontraron archivos de salida numerados para {}.",
+        "resplit_complete": "✅ Se redividieron {0} entradas de {1} archivo(s) en {2} archivo(s) con un límite de {3} bytes.",
+        "plan_summary": "📋 Plan para {0}: {1} entradas nuevas en {2} archivo(s); no se escribe nada.",
+        "plan_file": "  {0}: {1} entradas, ~{2} bytes, {3} – {4}",
+        "plan_file_appended": "  {0} (anexar): {1} entradas nuevas, ~{2} bytes, {3} – {4}",
+        "plan_projection": "⏱️ Tiempo estimado: {0:.1f} s (carga {1:.1f} s + conversión {2:.1f} s, ~{3:.0f} entradas/s, a partir de {4} entradas de muestra)",
+        "warning_target_files_exceeded": "Advertencia: El historial no cabe en {0} archivo(s) con el límite de {1} bytes; se escribirán {2} archivos.",
+        "redaction_summary": "🛡️ Se ocultaron {0} elemento(s) (correos: {1}, teléfonos: {2}, claves de API: {3}, términos: {4}) en {5:.2f} MB a {6:.1f} MB/s",
+        "snapshot_loaded": "⚡ Se cargaron {0} entradas seleccionadas desde la instantánea {1}",
+        "snapshot_saved": "💾 Instantánea guardada: {}",
+        "metrics_report_run": "{0}: {1:.2f} s, {2:.1f} MB de entrada, {3} entradas de Gemini ({4} nuevas), {5} archivo(s) escrito(s) ({6:.2f} MB), RSS máximo {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: falló después de {1:.2f} s",
+        "metrics_report_trend": "📈 Última ejecución frente a la mediana de {0} ejecución(es) anterior(es): duración {1:+.0%}, rendimiento {2:+.0%}, tamaño de entrada {3:+.0%}, entradas de Gemini {4:+.0%}, RSS máximo {5:+.0%}",
+        "metrics_report_empty": "No hay ejecuciones registradas en {}.",
+        "incremental_read": "⏩ Lectura detenida en la última entrada procesada tras leer {0} de {1} bytes ({2} actividades)",
+        "warning_entries_out_of_order": "Advertencia: Las entradas no están en orden cronológico ({0} tramos ascendentes); ordenando {1} entradas por marca de tiempo.",
+        "attachments_linked": "📎 Se vincularon {0} adjunto(s) como {1} archivo(s) almacenado(s) en {2}",
+        "warning_attachments_missing": "Advertencia: No se encontraron {0} adjunto(s) referenciado(s) en {1}.",
+        "stats_written": "📊 Estadísticas de uso escritas: {}",
+        "streamed_to_stdout": "Historiales de chat enviados a la salida estándar como: {}",
+        "error_stdout_output_unsupported": "Error: --output_file - no se puede combinar con --store, --products, --batch ni --attachments.",
+        "added_to_bundle": "Historiales de chat añadidos al paquete como: {}",
+        "bundle_written": "🗜️ Paquete escrito: {0} ({1} archivo(s))",
+        "error_bundle_unsupported": "Error: --bundle no se puede combinar con --store, --batch, --attachments ni --output_file -.",
+        "warning_html_budget_exceeded": "Advertencia: Convertir una respuesta HTML de {0} caracteres tardó más de {1:.1f} s; solo se eliminarán las etiquetas.",
+        "preview_written": "🔍 Vista previa escrita: {0} ({1} de {2} entradas muestreadas)",
+        "error_unknown_timezone": "Error: Zona horaria desconocida: {}",
+        "error_timezone_store": "Error: --timezone no se puede combinar con --store, que conserva los encabezados Markdown tal como se generaron.",
+        "error_store_option_unsupported": "Error: {0} no se puede combinar con --store.",
+        "warning_removed_stale_outputs": "Advertencia: Se eliminaron {} archivos de salida numerados obsoletos que quedaban de la distribución anterior.",
     },
     "fa": {
         "error_lang_detection": "خطا در شناسایی زبان سیستم: {}",
@@ -155,8 +386,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "هشدار: فایل last_entry_time.txt خالی است. تغییر به حالت بازسازی کامل.",
         "warning_last_entry_time_invalid": "هشدار: برچسب زمان در last_entry_time.txt نامعتبر است ({!r}). تغییر به حالت بازسازی کامل.",
         "warning_last_entry_time_naive": "هشدار: برچسب زمان در last_entry_time.txt فاقد اطلاعات منطقه زمانی است. بر پایه UTC فرض می‌شود.",
-        "warning_removed_existing_outputs": "هشدار: پاکسازی {} فایل خروجی موجود پیش از بازسازی کامل انجام شد.",
         "warning_failed_remove_output_file": "هشدار: حذف فایل خروجی {} با خطا مواجه شد: {}",
+        "warning_json_backend_unavailable": "هشدار: بک‌اند JSON {} در دسترس نیست. به ماژول استاندارد json بازگشت داده می‌شود.",
+        "batch_job_summary": "{0}: {1} ورودی جدید، {2} فایل، {3:.2f} ثانیه ({4:.0f} ورودی/ثانیه، {5:.2f} MB/ثانیه)",
+        "batch_job_failed": "{0}: ناموفق: {1}",
+        "batch_complete": "✅ دسته کامل شد: {0} موفق، {1} ناموفق.",
+        "serve_listening": "🌐 سرویس تبدیل در http://{0}:{1}/convert در حال گوش دادن است (حداکثر {2} تبدیل همزمان)",
+        "unchanged_output_file": "محتوا تغییری نکرده است، فایل دست‌نخورده ماند: {}",
+        "changed_output_files": "فایل‌هایی که تغییر کرده‌اند ({}):",
+        "product_entries": "📦 {0}: {1} ورودی",
+        "store_import": "🗄️ مخزن تاریخچه: {0} ورودی جدید ذخیره شد ({1} از {2} ورودی بررسی شد)",
+        "resplit_no_outputs": "هیچ فایل خروجی شماره‌داری برای {} یافت نشد.",
+        "resplit_complete": "✅ {0} ورودی از {1} فایل به {2} فایل با حد {3} بایت دوباره تقسیم شد.",
+        "plan_summary": "📋 برنامه برای {0}: {1} ورودی جدید در {2} فایل؛ چیزی نوشته نمی‌شود.",
+        "plan_file": "  {0}: {1} ورودی، ~{2} بایت، {3} – {4}",
+        "plan_file_appended": "  {0} (افزودن): {1} ورودی جدید، ~{2} بایت، {3} – {4}",
+        "plan_projection": "⏱️ زمان تخمینی: {0:.1f} ث (بارگذاری {1:.1f} ث + تبدیل {2:.1f} ث، ~{3:.0f} ورودی/ث، از {4} ورودی نمونه)",
+        "warning_target_files_exceeded": "هشدار: تاریخچه در {0} فایل با حد {1} بایت جا نمی‌شود؛ به جای آن {2} فایل نوشته می‌شود.",
+        "redaction_summary": "🛡️ {0} مورد حذف شد (ایمیل: {1}، شماره تلفن: {2}، کلید API: {3}، واژه: {4}) در {5:.2f} مگابایت با سرعت {6:.1f} مگابایت/ث",
+        "snapshot_loaded": "⚡ {0} ورودی انتخاب‌شده از اسنپ‌شات {1} بارگذاری شد",
+        "snapshot_saved": "💾 اسنپ‌شات ذخیره شد: {}",
+        "metrics_report_run": "{0}: {1:.2f} ثانیه، ورودی {2:.1f} مگابایت، {3} ورودی Gemini ({4} جدید)، {5} فایل نوشته شد ({6:.2f} مگابایت)، بیشینه RSS {7:.0f} مگابایت",
+        "metrics_report_failed_run": "{0}: پس از {1:.2f} ثانیه ناموفق بود",
+        "metrics_report_trend": "📈 آخرین اجرا در برابر میانهٔ {0} اجرای قبلی: مدت {1:+.0%}، توان عملیاتی {2:+.0%}، اندازهٔ ورودی {3:+.0%}، ورودی‌های Gemini {4:+.0%}، بیشینه RSS {5:+.0%}",
+        "metrics_report_empty": "هیچ اجرایی در {} ثبت نشده است.",
+        "incremental_read": "⏩ خواندن در آخرین ورودی پردازش‌شده پس از خواندن {0} از {1} بایت متوقف شد ({2} فعالیت)",
+        "warning_entries_out_of_order": "هشدار: ورودی‌ها به ترتیب زمانی نیستند ({0} بخش صعودی)؛ {1} ورودی بر اساس زمان مرتب می‌شوند.",
+        "attachments_linked": "📎 {0} پیوست به‌صورت {1} فایل ذخیره‌شده در {2} پیوند داده شد",
+        "warning_attachments_missing": "هشدار: {0} پیوست ارجاع‌شده در {1} پیدا نشد.",
+        "stats_written": "📊 آمار استفاده نوشته شد: {}",
+        "streamed_to_stdout": "تاریخچه گفتگوها به خروجی استاندارد ارسال شد با نام: {}",
+        "error_stdout_output_unsupported": "خطا: --output_file - را نمی‌توان با --store، --products، --batch یا --attachments ترکیب کرد.",
+        "added_to_bundle": "تاریخچه گفتگوها به بسته افزوده شد با نام: {}",
+        "bundle_written": "🗜️ بسته نوشته شد: {0} ({1} فایل)",
+        "error_bundle_unsupported": "خطا: --bundle را نمی‌توان با --store، --batch، --attachments یا --output_file - ترکیب کرد.",
+        "warning_html_budget_exceeded": "هشدار: تبدیل یک پاسخ HTML با {0} نویسه بیش از {1:.1f} ثانیه طول کشید؛ فقط برچسب‌ها حذف می‌شوند.",
+        "preview_written": "🔍 پیش‌نمایش نوشته شد: {0} ({1} از {2} ورودی نمونه‌برداری شد)",
+        "error_unknown_timezone": "خطا: منطقه زمانی ناشناخته: {}",
+        "error_timezone_store": "خطا: --timezone را نمی‌توان با --store ترکیب کرد، زیرا مخزن عنوان‌های Markdown را همان‌طور که ساخته شده‌اند نگه می‌دارد.",
+        "error_store_option_unsupported": "خطا: {0} را نمی‌توان با --store ترکیب کرد.",
+        "warning_removed_stale_outputs": "هشدار: {} فایل خروجی شماره‌دار قدیمی باقی‌مانده از چیدمان قبلی حذف شد.",
     },
     "fr": {
         "error_lang_detection": "Erreur lors de la détection de la langue du système : {}",
@@ -172,8 +441,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Avertissement : last_entry_time.txt est vide. Passage en mode de régénération complète.",
         "warning_last_entry_time_invalid": "Avertissement : Horodatage non valide dans last_entry_time.txt ({!r}). Passage en mode de régénération complète.",
         "warning_last_entry_time_naive": "Avertissement : last_entry_time.txt contient un horodatage sans fuseau horaire. UTC sera supposé.",
-        "warning_removed_existing_outputs": "Avertissement : {} fichier(s) de sortie existant(s) supprimé(s) avant la régénération complète.",
         "warning_failed_remove_output_file": "Avertissement : Échec de la suppression du fichier de sortie {} : {}",
+        "warning_json_backend_unavailable": "Avertissement : le backend JSON {} n'est pas disponible. Utilisation du module json standard.",
+        "batch_job_summary": "{0} : {1} nouvelles entrées, {2} fichier(s), {3:.2f} s ({4:.0f} entrées/s, {5:.2f} Mo/s)",
+        "batch_job_failed": "{0} : échec : {1}",
+        "batch_complete": "✅ Lot terminé : {0} réussi(s), {1} échoué(s).",
+        "serve_listening": "🌐 Service de conversion à l'écoute sur http://{0}:{1}/convert ({2} conversions simultanées au maximum)",
+        "unchanged_output_file": "Contenu inchangé, fichier laissé tel quel : {}",
+        "changed_output_files": "Fichiers modifiés ({}) :",
+        "product_entries": "📦 {0} : {1} entrées",
+        "store_import": "🗄️ Magasin d'historique : {0} nouvelles entrées enregistrées ({1} sur {2} entrées vérifiées)",
+        "resplit_no_outputs": "Aucun fichier de sortie numéroté trouvé pour {}.",
+        "resplit_complete": "✅ {0} entrées de {1} fichier(s) redécoupées en {2} fichier(s) avec une limite de {3} octets.",
+        "plan_summary": "📋 Plan pour {0} : {1} nouvelles entrées dans {2} fichier(s) ; rien n'est écrit.",
+        "plan_file": "  {0} : {1} entrées, ~{2} octets, {3} – {4}",
+        "plan_file_appended": "  {0} (ajout) : {1} nouvelles entrées, ~{2} octets, {3} – {4}",
+        "plan_projection": "⏱️ Durée estimée : {0:.1f} s (chargement {1:.1f} s + conversion {2:.1f} s, ~{3:.0f} entrées/s, d'après {4} entrées échantillonnées)",
+        "warning_target_files_exceeded": "Avertissement : L'historique ne tient pas dans {0} fichier(s) sous la limite de {1} octets ; {2} fichiers seront écrits.",
+        "redaction_summary": "🛡️ {0} élément(s) masqué(s) (e-mails : {1}, numéros de téléphone : {2}, clés d'API : {3}, termes : {4}) dans {5:.2f} Mo à {6:.1f} Mo/s",
+        "snapshot_loaded": "⚡ {0} entrées sélectionnées chargées depuis l'instantané {1}",
+        "snapshot_saved": "💾 Instantané enregistré : {}",
+        "metrics_report_run": "{0} : {1:.2f} s, {2:.1f} Mo en entrée, {3} entrées Gemini ({4} nouvelles), {5} fichier(s) écrit(s) ({6:.2f} Mo), RSS maximal {7:.0f} Mo",
+        "metrics_report_failed_run": "{0} : échec après {1:.2f} s",
+        "metrics_report_trend": "📈 Dernière exécution par rapport à la médiane de {0} exécution(s) précédente(s) : durée {1:+.0%}, débit {2:+.0%}, taille d'entrée {3:+.0%}, entrées Gemini {4:+.0%}, RSS maximal {5:+.0%}",
+        "metrics_report_empty": "Aucune exécution enregistrée dans {}.",
+        "incremental_read": "⏩ Arrêt à la dernière entrée traitée après lecture de {0} octets sur {1} ({2} activités)",
+        "warning_entries_out_of_order": "Avertissement : Les entrées ne sont pas dans l'ordre chronologique ({0} séquences croissantes) ; tri de {1} entrées par horodatage.",
+        "attachments_linked": "📎 {0} pièce(s) jointe(s) liée(s) sous forme de {1} fichier(s) stocké(s) dans {2}",
+        "warning_attachments_missing": "Avertissement : {0} pièce(s) jointe(s) référencée(s) introuvable(s) dans {1}.",
+        "stats_written": "📊 Statistiques d'utilisation écrites : {}",
+        "streamed_to_stdout": "Historiques de discussion envoyés sur la sortie standard sous le nom : {}",
+        "error_stdout_output_unsupported": "Erreur : --output_file - ne peut pas être combiné avec --store, --products, --batch ou --attachments.",
+        "added_to_bundle": "Historiques de discussion ajoutés à l'archive sous le nom : {}",
+        "bundle_written": "🗜️ Archive écrite : {0} ({1} fichier(s))",
+        "error_bundle_unsupported": "Erreur : --bundle ne peut pas être combiné avec --store, --batch, --attachments ou --output_file -.",
+        "warning_html_budget_exceeded": "Avertissement : La conversion d'une réponse HTML de {0} caractères a pris plus de {1:.1f} s ; seules les balises seront supprimées.",
+        "preview_written": "🔍 Aperçu écrit : {0} ({1} sur {2} entrées échantillonnées)",
+        "error_unknown_timezone": "Erreur : Fuseau horaire inconnu : {}",
+        "error_timezone_store": "Erreur : --timezone ne peut pas être combiné avec --store, qui conserve les titres Markdown tels qu'ils ont été générés.",
+        "error_store_option_unsupported": "Erreur : {0} ne peut pas être combiné avec --store.",
+        "warning_removed_stale_outputs": "Avertissement : {} fichier(s) de sortie numéroté(s) obsolète(s) restant(s) de la répartition précédente supprimé(s).",
     },
     "hi": {
         "error_lang_detection": "त्रुटि: सिस्टम भाषा का पता लगाने में समस्या: {}",
@@ -189,8 +496,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "चेतावनी: last_entry_time.txt खाली है। पूर्ण पुनर्जनन (full regeneration) मोड पर स्विच किया जा रहा है।",
         "warning_last_entry_time_invalid": "चेतावनी: last_entry_time.txt में अमान्य टाइमस्टैम्प ({!r}) है। पूर्ण पुनर्जनन मोड पर स्विच किया जा रहा है।",
         "warning_last_entry_time_naive": "चेतावनी: last_entry_time.txt में टाइमज़ोन-रहित टाइमस्टैम्प है। इसे UTC माना जा रहा है।",
-        "warning_removed_existing_outputs": "चेतावनी: पूर्ण पुनर्जनन से पहले {} मौजूदा आउटपुट फ़ाइलें हटा दी गई हैं।",
         "warning_failed_remove_output_file": "चेतावनी: आउटपुट फ़ाइल {} को हटाने में विफल: {}",
+        "warning_json_backend_unavailable": "चेतावनी: JSON बैकएंड {} उपलब्ध नहीं है। मानक json मॉड्यूल का उपयोग किया जा रहा है।",
+        "batch_job_summary": "{0}: {1} नई प्रविष्टियाँ, {2} फ़ाइल(ें), {3:.2f} से ({4:.0f} प्रविष्टियाँ/से, {5:.2f} MB/से)",
+        "batch_job_failed": "{0}: विफल: {1}",
+        "batch_complete": "✅ बैच पूर्ण: {0} सफल, {1} विफल।",
+        "serve_listening": "🌐 रूपांतरण सेवा http://{0}:{1}/convert पर सुन रही है (एक साथ अधिकतम {2} रूपांतरण)",
+        "unchanged_output_file": "सामग्री अपरिवर्तित, फ़ाइल जैसी थी वैसी छोड़ी गई: {}",
+        "changed_output_files": "बदली गई फ़ाइलें ({}):",
+        "product_entries": "📦 {0}: {1} प्रविष्टियाँ",
+        "store_import": "🗄️ इतिहास स्टोर: {0} नई प्रविष्टियाँ सहेजी गईं (जाँची गई प्रविष्टियाँ: {1}/{2})",
+        "resplit_no_outputs": "{} के लिए कोई क्रमांकित आउटपुट फ़ाइल नहीं मिली।",
+        "resplit_complete": "✅ पुनः विभाजित: {0} प्रविष्टियाँ, {1} फ़ाइल(ों) से {2} फ़ाइल(ों) में, सीमा {3} बाइट।",
+        "plan_summary": "📋 {0} के लिए योजना: {1} नई प्रविष्टियाँ, {2} फ़ाइल(ों) में; कुछ भी नहीं लिखा जाएगा।",
+        "plan_file": "  {0}: {1} प्रविष्टियाँ, ~{2} बाइट, {3} – {4}",
+        "plan_file_appended": "  {0} (जोड़ें): {1} नई प्रविष्टियाँ, ~{2} बाइट, {3} – {4}",
+        "plan_projection": "⏱️ अनुमानित समय: {0:.1f} से (लोड {1:.1f} से + रूपांतरण {2:.1f} से, ~{3:.0f} प्रविष्टियाँ/से, {4} नमूना प्रविष्टियों से)",
+        "warning_target_files_exceeded": "चेतावनी: इतिहास {0} फ़ाइल(ों) में नहीं समाता (सीमा {1} बाइट); इसके बजाय {2} फ़ाइलें लिखी जा रही हैं।",
+        "redaction_summary": "🛡️ {0} आइटम छिपाए गए (ईमेल: {1}, फ़ोन नंबर: {2}, API कुंजियाँ: {3}, शब्द: {4}) {5:.2f} MB में, {6:.1f} MB/से की गति से",
+        "snapshot_loaded": "⚡ स्नैपशॉट से {0} चयनित प्रविष्टियाँ लोड की गईं: {1}",
+        "snapshot_saved": "💾 स्नैपशॉट सहेजा गया: {}",
+        "metrics_report_run": "{0}: {1:.2f} से, {2:.1f} MB इनपुट, {3} Gemini प्रविष्टियाँ ({4} नई), {5} फ़ाइल(ें) लिखी गईं ({6:.2f} MB), अधिकतम RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: {1:.2f} से के बाद विफल",
+        "metrics_report_trend": "📈 नवीनतम रन बनाम पिछले {0} रन का माध्यिका: अवधि {1:+.0%}, थ्रूपुट {2:+.0%}, इनपुट आकार {3:+.0%}, Gemini प्रविष्टियाँ {4:+.0%}, अधिकतम RSS {5:+.0%}",
+        "metrics_report_empty": "{} में कोई रन दर्ज नहीं है।",
+        "incremental_read": "⏩ अंतिम संसाधित प्रविष्टि पर रुका ({0} / {1} बाइट पढ़े गए, {2} गतिविधियाँ)",
+        "warning_entries_out_of_order": "चेतावनी: प्रविष्टियाँ समय क्रम में नहीं हैं ({0} आरोही खंड); {1} प्रविष्टियों को टाइमस्टैम्प के अनुसार क्रमबद्ध किया जा रहा है।",
+        "attachments_linked": "📎 {0} संलग्नक {1} संग्रहीत फ़ाइल(ों) के रूप में {2} में लिंक किए गए",
+        "warning_attachments_missing": "चेतावनी: {0} संदर्भित संलग्नक {1} में नहीं मिले।",
+        "stats_written": "📊 उपयोग आँकड़े लिखे गए: {}",
+        "streamed_to_stdout": "चैट इतिहास stdout पर भेजा गया, नाम: {}",
+        "error_stdout_output_unsupported": "त्रुटि: --output_file - को --store, --products, --batch या --attachments के साथ नहीं जोड़ा जा सकता।",
+        "added_to_bundle": "चैट इतिहास बंडल में जोड़ा गया, नाम: {}",
+        "bundle_written": "🗜️ बंडल लिखा गया: {0} ({1} फ़ाइलें)",
+        "error_bundle_unsupported": "त्रुटि: --bundle को --store, --batch, --attachments या --output_file - के साथ नहीं जोड़ा जा सकता।",
+        "warning_html_budget_exceeded": "चेतावनी: HTML उत्तर (अक्षर: {0}) बदलने में {1:.1f} s से अधिक समय लगा; केवल टैग हटाए जाएंगे।",
+        "preview_written": "🔍 पूर्वावलोकन लिखा गया: {0} ({1} / {2} प्रविष्टियों का नमूना)",
+        "error_unknown_timezone": "त्रुटि: अज्ञात समय क्षेत्र: {}",
+        "error_timezone_store": "त्रुटि: --timezone को --store के साथ नहीं जोड़ा जा सकता, क्योंकि स्टोर Markdown शीर्षकों को वैसे ही रखता है जैसे वे बनाए गए थे।",
+        "error_store_option_unsupported": "त्रुटि: {0} को --store के साथ उपयोग नहीं किया जा सकता।",
+        "warning_removed_stale_outputs": "चेतावनी: पिछले विभाजन से बची {} पुरानी क्रमांकित आउटपुट फ़ाइलें हटा दी गईं।",
     },
     "id": {
         "error_lang_detection": "Error saat mendeteksi bahasa sistem: {}",
@@ -206,8 +551,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Peringatan: last_entry_time.txt kosong. Beralih ke mode regenerasi penuh.",
         "warning_last_entry_time_invalid": "Peringatan: Timestamp tidak valid di last_entry_time.txt ({!r}). Beralih ke mode regenerasi penuh.",
         "warning_last_entry_time_naive": "Peringatan: last_entry_time.txt memiliki timestamp tanpa informasi zona waktu. Diasumsikan sebagai UTC.",
-        "warning_removed_existing_outputs": "Peringatan: Menghapus {} file output yang ada sebelum melakukan regenerasi penuh.",
         "warning_failed_remove_output_file": "Peringatan: Gagal menghapus file output {}: {}",
+        "warning_json_backend_unavailable": "Peringatan: Backend JSON {} tidak tersedia. Beralih ke modul json standar.",
+        "batch_job_summary": "{0}: {1} entri baru, {2} file, {3:.2f} dtk ({4:.0f} entri/dtk, {5:.2f} MB/dtk)",
+        "batch_job_failed": "{0}: gagal: {1}",
+        "batch_complete": "✅ Batch selesai: {0} berhasil, {1} gagal.",
+        "serve_listening": "🌐 Layanan konversi mendengarkan di http://{0}:{1}/convert (maksimal {2} konversi bersamaan)",
+        "unchanged_output_file": "Konten tidak berubah, file dibiarkan apa adanya: {}",
+        "changed_output_files": "File yang berubah ({}):",
+        "product_entries": "📦 {0}: {1} entri",
+        "store_import": "🗄️ Penyimpanan riwayat: {0} entri baru disimpan ({1} dari {2} entri diperiksa)",
+        "resplit_no_outputs": "Tidak ada file keluaran bernomor untuk {}.",
+        "resplit_complete": "✅ {0} entri dari {1} file dibagi ulang menjadi {2} file dengan batas {3} byte.",
+        "plan_summary": "📋 Rencana untuk {0}: {1} entri baru dalam {2} file; tidak ada yang ditulis.",
+        "plan_file": "  {0}: {1} entri, ~{2} byte, {3} – {4}",
+        "plan_file_appended": "  {0} (tambah): {1} entri baru, ~{2} byte, {3} – {4}",
+        "plan_projection": "⏱️ Perkiraan waktu: {0:.1f} d (memuat {1:.1f} d + konversi {2:.1f} d, ~{3:.0f} entri/d, dari {4} entri sampel)",
+        "warning_target_files_exceeded": "Peringatan: Riwayat tidak muat dalam {0} file dengan batas {1} byte; menulis {2} file sebagai gantinya.",
+        "redaction_summary": "🛡️ Menyamarkan {0} item (email: {1}, nomor telepon: {2}, kunci API: {3}, istilah: {4}) dalam {5:.2f} MB pada {6:.1f} MB/d",
+        "snapshot_loaded": "⚡ Memuat {0} entri terpilih dari snapshot {1}",
+        "snapshot_saved": "💾 Snapshot disimpan: {}",
+        "metrics_report_run": "{0}: {1:.2f} d, input {2:.1f} MB, {3} entri Gemini ({4} baru), {5} file ditulis ({6:.2f} MB), RSS puncak {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: gagal setelah {1:.2f} d",
+        "metrics_report_trend": "📈 Proses terbaru vs. median {0} proses sebelumnya: durasi {1:+.0%}, throughput {2:+.0%}, ukuran input {3:+.0%}, entri Gemini {4:+.0%}, RSS puncak {5:+.0%}",
+        "metrics_report_empty": "Tidak ada proses yang tercatat di {}.",
+        "incremental_read": "⏩ Berhenti di entri terakhir yang diproses setelah membaca {0} dari {1} byte ({2} aktivitas)",
+        "warning_entries_out_of_order": "Peringatan: Entri tidak berurutan menurut waktu ({0} rangkaian naik); mengurutkan {1} entri berdasarkan stempel waktu.",
+        "attachments_linked": "📎 {0} lampiran ditautkan sebagai {1} file tersimpan di {2}",
+        "warning_attachments_missing": "Peringatan: {0} lampiran yang dirujuk tidak ditemukan di {1}.",
+        "stats_written": "📊 Statistik penggunaan ditulis: {}",
+        "streamed_to_stdout": "Riwayat obrolan dialirkan ke stdout sebagai: {}",
+        "error_stdout_output_unsupported": "Kesalahan: --output_file - tidak dapat digabungkan dengan --store, --products, --batch, atau --attachments.",
+        "added_to_bundle": "Riwayat obrolan ditambahkan ke bundel sebagai: {}",
+        "bundle_written": "🗜️ Bundel ditulis: {0} ({1} file)",
+        "error_bundle_unsupported": "Kesalahan: --bundle tidak dapat digabungkan dengan --store, --batch, --attachments, atau --output_file -.",
+        "warning_html_budget_exceeded": "Peringatan: Konversi respons HTML sebanyak {0} karakter memakan waktu lebih dari {1:.1f} dtk; hanya tag yang akan dihapus.",
+        "preview_written": "🔍 Pratinjau ditulis: {0} ({1} dari {2} entri diambil sampel)",
+        "error_unknown_timezone": "Kesalahan: Zona waktu tidak dikenal: {}",
+        "error_timezone_store": "Kesalahan: --timezone tidak dapat digabungkan dengan --store, yang menyimpan judul Markdown seperti saat dibuat.",
+        "error_store_option_unsupported": "Kesalahan: {0} tidak dapat digabungkan dengan --store.",
+        "warning_removed_stale_outputs": "Peringatan: Menghapus {} file output bernomor usang yang tersisa dari tata letak sebelumnya.",
     },
     "ja": {
         "error_lang_detection": "システム言語の検出中にエラーが発生しました: {}",
@@ -223,8 +606,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "警告: last_entry_time.txt が空です。全件再生成モードに切り替えます。",
         "warning_last_entry_time_invalid": "警告: last_entry_time.txt のタイムスタンプが不正です（{!r}）。全件再生成モードに切り替えます。",
         "warning_last_entry_time_naive": "警告: last_entry_time.txt のタイムスタンプにタイムゾーン情報がありません。UTC として扱います。",
-        "warning_removed_existing_outputs": "警告: 全件再生成の前に既存の出力ファイル {} 件を削除しました。",
         "warning_failed_remove_output_file": "警告: 出力ファイル {} の削除に失敗しました: {}",
+        "warning_json_backend_unavailable": "警告: JSON バックエンド {} は利用できません。標準の json モジュールを使用します。",
+        "batch_job_summary": "{0}: 新規エントリ {1} 件、ファイル {2} 個、{3:.2f} 秒（{4:.0f} エントリ/秒、{5:.2f} MB/秒）",
+        "batch_job_failed": "{0}: 失敗: {1}",
+        "batch_complete": "✅ バッチ完了: 成功 {0} 件、失敗 {1} 件。",
+        "serve_listening": "🌐 変換サービスを http://{0}:{1}/convert で待ち受けています（同時変換数の上限: {2}）",
+        "unchanged_output_file": "内容に変更がないため、ファイルはそのままです: {}",
+        "changed_output_files": "変更されたファイル（{} 個）:",
+        "product_entries": "📦 {0}: {1} 件",
+        "store_import": "🗄️ 履歴ストア: 新しいエントリ {0} 件を保存しました（確認 {1} 件 / 全 {2} 件）",
+        "resplit_no_outputs": "{} の連番出力ファイルが見つかりません。",
+        "resplit_complete": "✅ 再分割: エントリ {0} 件、{1} ファイル → {2} ファイル（上限 {3} バイト）。",
+        "plan_summary": "📋 {0} の計画: 新しいエントリ {1} 件、{2} ファイル（何も書き込みません）。",
+        "plan_file": "  {0}: {1} 件、約 {2} バイト、{3} – {4}",
+        "plan_file_appended": "  {0}（追記）: 新規 {1} 件、約 {2} バイト、{3} – {4}",
+        "plan_projection": "⏱️ 推定時間: {0:.1f} 秒（読み込み {1:.1f} 秒 + 変換 {2:.1f} 秒、約 {3:.0f} 件/秒、サンプル {4} 件から推定）",
+        "warning_target_files_exceeded": "警告: 履歴を {0} ファイル（上限 {1} バイト）に収められません。代わりに {2} ファイルに書き出します。",
+        "redaction_summary": "🛡️ {0} 件をマスクしました（メール: {1}、電話番号: {2}、API キー: {3}、用語: {4}）。{5:.2f} MB を {6:.1f} MB/秒で処理",
+        "snapshot_loaded": "⚡ 選択済みエントリ {0} 件をスナップショットから読み込みました: {1}",
+        "snapshot_saved": "💾 スナップショットを保存しました: {}",
+        "metrics_report_run": "{0}: {1:.2f} 秒、入力 {2:.1f} MB、Gemini エントリ {3} 件（新規 {4} 件）、書き込み {5} ファイル（{6:.2f} MB）、ピーク RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: {1:.2f} 秒後に失敗",
+        "metrics_report_trend": "📈 直近の実行と過去 {0} 回の中央値の比較: 所要時間 {1:+.0%}、スループット {2:+.0%}、入力サイズ {3:+.0%}、Gemini エントリ {4:+.0%}、ピーク RSS {5:+.0%}",
+        "metrics_report_empty": "{} に実行記録がありません。",
+        "incremental_read": "⏩ 最後に処理したエントリで読み込みを停止しました（{0} / {1} バイト、{2} 件のアクティビティ）",
+        "warning_entries_out_of_order": "警告: エントリが時系列順になっていません（昇順の区間 {0} 個）。{1} 件のエントリをタイムスタンプ順に並べ替えます。",
+        "attachments_linked": "📎 {0} 件の添付ファイルを {1} 個の保存ファイルとして {2} にリンクしました",
+        "warning_attachments_missing": "警告: 参照されている添付ファイル {0} 件が {1} に見つかりませんでした。",
+        "stats_written": "📊 利用統計を書き出しました: {}",
+        "streamed_to_stdout": "チャット履歴を標準出力に送出しました: {}",
+        "error_stdout_output_unsupported": "エラー: --output_file - は --store、--products、--batch、--attachments と併用できません。",
+        "added_to_bundle": "チャット履歴をバンドルに追加しました: {}",
+        "bundle_written": "🗜️ バンドルを書き出しました: {0}（{1} ファイル）",
+        "error_bundle_unsupported": "エラー: --bundle は --store、--batch、--attachments、--output_file - と併用できません。",
+        "warning_html_budget_exceeded": "警告: {0} 文字の HTML 応答の変換に {1:.1f} 秒を超えたため、タグの除去のみに切り替えます。",
+        "preview_written": "🔍 プレビューを書き出しました: {0}（{1} / {2} 件のエントリを抽出）",
+        "error_unknown_timezone": "エラー: 不明なタイムゾーンです: {}",
+        "error_timezone_store": "エラー: --timezone は --store と併用できません。ストアは生成時の Markdown 見出しをそのまま保持します。",
+        "error_store_option_unsupported": "エラー: {0} は --store と併用できません。",
+        "warning_removed_stale_outputs": "警告: 以前の分割で残っていた古い連番出力ファイル {} 件を削除しました。",
     },
     "jv": {
         "error_lang_detection": "Kesalahan saat mendeteksi bahasa sistem: {}",
@@ -240,8 +661,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Pèngetan: last_entry_time.txt kothong. Ngalih menyang mode regenerasi lengkap.",
         "warning_last_entry_time_invalid": "Pèngetan: Timestamp ora sah ing last_entry_time.txt ({!r}). Ngalih menyang mode regenerasi lengkap.",
         "warning_last_entry_time_naive": "Pèngetan: last_entry_time.txt nduweni timestamp tanpa zona wektu. Dianggep minangka UTC.",
-        "warning_removed_existing_outputs": "Pèngetan: Busak {} berkas output sing wis ana sadurunge regenerasi lengkap.",
         "warning_failed_remove_output_file": "Pèngetan: Gagal mbusak berkas output {}: {}",
+        "warning_json_backend_unavailable": "Pènget: Backend JSON {} ora kasedhiya. Bali nganggo modul json standar.",
+        "batch_job_summary": "{0}: {1} entri anyar, {2} berkas, {3:.2f} dt ({4:.0f} entri/dt, {5:.2f} MB/dt)",
+        "batch_job_failed": "{0}: gagal: {1}",
+        "batch_complete": "✅ Batch rampung: {0} kasil, {1} gagal.",
+        "serve_listening": "🌐 Layanan konversi ngrungokake ing http://{0}:{1}/convert (paling akeh {2} konversi bebarengan)",
+        "unchanged_output_file": "Isi ora owah, berkas ditinggal kaya asline: {}",
+        "changed_output_files": "Berkas sing owah ({}):",
+        "product_entries": "📦 {0}: {1} entri",
+        "store_import": "🗄️ Panyimpenan riwayat: {0} entri anyar disimpen ({1} saka {2} entri dipriksa)",
+        "resplit_no_outputs": "Ora ana file output sing wis diwenehi nomer kanggo {}.",
+        "resplit_complete": "✅ {0} entri saka {1} file dipérang manèh dadi {2} file kanthi wates {3} bita.",
+        "plan_summary": "📋 Rencana kanggo {0}: {1} entri anyar ing {2} file; ora ana sing ditulis.",
+        "plan_file": "  {0}: {1} entri, ~{2} bita, {3} – {4}",
+        "plan_file_appended": "  {0} (tambah): {1} entri anyar, ~{2} bita, {3} – {4}",
+        "plan_projection": "⏱️ Perkiraan wektu: {0:.1f} d (ngemot {1:.1f} d + konversi {2:.1f} d, ~{3:.0f} entri/d, saka {4} entri sampel)",
+        "warning_target_files_exceeded": "Pènget: Riwayat ora cukup ing {0} file kanthi wates {1} bita; nulis {2} file minangka gantiné.",
+        "redaction_summary": "🛡️ Nyamarké {0} item (email: {1}, nomer telpon: {2}, kunci API: {3}, istilah: {4}) ing {5:.2f} MB kanthi {6:.1f} MB/d",
+        "snapshot_loaded": "⚡ Ngemot {0} entri pilihan saka snapshot {1}",
+        "snapshot_saved": "💾 Snapshot disimpen: {}",
+        "metrics_report_run": "{0}: {1:.2f} d, input {2:.1f} MB, {3} entri Gemini ({4} anyar), {5} file ditulis ({6:.2f} MB), RSS puncak {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: gagal sawise {1:.2f} d",
+        "metrics_report_trend": "📈 Proses pungkasan vs. median {0} proses sadurungé: durasi {1:+.0%}, throughput {2:+.0%}, ukuran input {3:+.0%}, entri Gemini {4:+.0%}, RSS puncak {5:+.0%}",
+        "metrics_report_empty": "Ora ana proses sing kacathet ing {}.",
+        "incremental_read": "⏩ Mandheg ing entri pungkasan sing wis diproses sawise maca {0} saka {1} bait ({2} aktivitas)",
+        "warning_entries_out_of_order": "Pènget: Entri ora urut miturut wektu ({0} rangkéan munggah); ngurutaké {1} entri miturut cap wektu.",
+        "attachments_linked": "📎 {0} lampiran disambung dadi {1} file sing disimpen ing {2}",
+        "warning_attachments_missing": "Pènget: {0} lampiran sing dirujuk ora ditemokaké ing {1}.",
+        "stats_written": "📊 Statistik panggunaan wis ditulis: {}",
+        "streamed_to_stdout": "Riwayat obrolan dialirake menyang stdout minangka: {}",
+        "error_stdout_output_unsupported": "Kesalahan: --output_file - ora bisa digabung karo --store, --products, --batch utawa --attachments.",
+        "added_to_bundle": "Riwayat obrolan ditambahake menyang bundel minangka: {}",
+        "bundle_written": "🗜️ Bundel ditulis: {0} ({1} berkas)",
+        "error_bundle_unsupported": "Kesalahan: --bundle ora bisa digabung karo --store, --batch, --attachments utawa --output_file -.",
+        "warning_html_budget_exceeded": "Pènget: Ngowahi wangsulan HTML {0} karakter butuh luwih saka {1:.1f} dtk; mung tag sing bakal dibusak.",
+        "preview_written": "🔍 Pratinjau ditulis: {0} ({1} saka {2} entri dijupuk sampel)",
+        "error_unknown_timezone": "Kesalahan: Zona wektu ora dikenal: {}",
+        "error_timezone_store": "Kesalahan: --timezone ora bisa digabung karo --store, sing nyimpen judhul Markdown kaya nalika digawe.",
+        "error_store_option_unsupported": "Kesalahan: {0} ora bisa digabung karo --store.",
+        "warning_removed_stale_outputs": "Pèngetan: Mbusak {} berkas output bernomer lawas sing isih ana saka tata letak sadurungé.",
     },
     "ko": {
         "error_lang_detection": "시스템 언어 설정 감지 중 오류 발생: {}",
@@ -257,8 +716,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "경고: last_entry_time.txt 파일이 비어 있습니다. 전체 재생성 모드로 전환합니다.",
         "warning_last_entry_time_invalid": "경고: last_entry_time.txt의 타임스탬프가 올바르지 않습니다 ({!r}). 전체 재생성 모드로 전환합니다.",
         "warning_last_entry_time_naive": "경고: last_entry_time.txt에 시간대(timezone) 정보가 없는 타임스탬프가 포함되어 있습니다. UTC로 간주합니다.",
-        "warning_removed_existing_outputs": "경고: 전체 재생성 전에 기존 출력 파일 {}개를 삭제했습니다.",
         "warning_failed_remove_output_file": "경고: 출력 파일 {} 삭제에 실패했습니다: {}",
+        "warning_json_backend_unavailable": "경고: JSON 백엔드 {}을(를) 사용할 수 없습니다. 표준 json 모듈로 대체합니다.",
+        "batch_job_summary": "{0}: 새 항목 {1}개, 파일 {2}개, {3:.2f}초 ({4:.0f} 항목/초, {5:.2f} MB/초)",
+        "batch_job_failed": "{0}: 실패: {1}",
+        "batch_complete": "✅ 일괄 처리 완료: 성공 {0}개, 실패 {1}개.",
+        "serve_listening": "🌐 변환 서비스가 http://{0}:{1}/convert 에서 대기 중입니다 (동시 변환 최대 {2}개)",
+        "unchanged_output_file": "내용이 변경되지 않아 파일을 그대로 두었습니다: {}",
+        "changed_output_files": "변경된 파일 ({}개):",
+        "product_entries": "📦 {0}: {1}개 항목",
+        "store_import": "🗄️ 기록 저장소: 새 항목 {0}개 저장됨 (확인한 항목 {1}개 / 전체 {2}개)",
+        "resplit_no_outputs": "{}에 대한 번호가 매겨진 출력 파일을 찾을 수 없습니다.",
+        "resplit_complete": "✅ 재분할: 항목 {0}개, 파일 {1}개 → 파일 {2}개 (제한 {3}바이트).",
+        "plan_summary": "📋 {0} 계획: 새 항목 {1}개, 파일 {2}개 (아무것도 쓰지 않음).",
+        "plan_file": "  {0}: 항목 {1}개, 약 {2}바이트, {3} – {4}",
+        "plan_file_appended": "  {0} (추가): 새 항목 {1}개, 약 {2}바이트, {3} – {4}",
+        "plan_projection": "⏱️ 예상 시간: {0:.1f}초 (로드 {1:.1f}초 + 변환 {2:.1f}초, 약 {3:.0f}개/초, 샘플 항목 {4}개 기준)",
+        "warning_target_files_exceeded": "경고: 기록을 {0}개 파일({1}바이트 제한)에 담을 수 없습니다. 대신 {2}개 파일로 씁니다.",
+        "redaction_summary": "🛡️ {0}개 항목 가림 (이메일: {1}, 전화번호: {2}, API 키: {3}, 용어: {4}), {5:.2f} MB를 {6:.1f} MB/s로 처리",
+        "snapshot_loaded": "⚡ 선택된 항목 {0}개를 스냅샷에서 불러왔습니다: {1}",
+        "snapshot_saved": "💾 스냅샷 저장됨: {}",
+        "metrics_report_run": "{0}: {1:.2f}초, 입력 {2:.1f} MB, Gemini 항목 {3}개(새 항목 {4}개), 파일 {5}개 작성({6:.2f} MB), 최대 RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: {1:.2f}초 후 실패",
+        "metrics_report_trend": "📈 최근 실행과 이전 {0}회 실행의 중앙값 비교: 소요 시간 {1:+.0%}, 처리량 {2:+.0%}, 입력 크기 {3:+.0%}, Gemini 항목 {4:+.0%}, 최대 RSS {5:+.0%}",
+        "metrics_report_empty": "{}에 기록된 실행이 없습니다.",
+        "incremental_read": "⏩ 마지막으로 처리한 항목에서 중지했습니다({0} / {1}바이트, 활동 {2}개)",
+        "warning_entries_out_of_order": "경고: 항목이 시간 순서가 아닙니다(오름차순 구간 {0}개). 항목 {1}개를 타임스탬프 순으로 정렬합니다.",
+        "attachments_linked": "📎 첨부 파일 {0}개를 저장 파일 {1}개로 {2}에 연결했습니다",
+        "warning_attachments_missing": "경고: 참조된 첨부 파일 {0}개를 {1}에서 찾을 수 없습니다.",
+        "stats_written": "📊 사용 통계를 기록했습니다: {}",
+        "streamed_to_stdout": "채팅 기록을 표준 출력으로 전송했습니다: {}",
+        "error_stdout_output_unsupported": "오류: --output_file - 은 --store, --products, --batch, --attachments 와 함께 사용할 수 없습니다.",
+        "added_to_bundle": "채팅 기록을 번들에 추가했습니다: {}",
+        "bundle_written": "🗜️ 번들을 기록했습니다: {0} (파일 {1}개)",
+        "error_bundle_unsupported": "오류: --bundle 은 --store, --batch, --attachments, --output_file - 와 함께 사용할 수 없습니다.",
+        "warning_html_budget_exceeded": "경고: {0}자의 HTML 응답 변환이 {1:.1f}초를 넘었습니다. 태그 제거만 수행합니다.",
+        "preview_written": "🔍 미리보기를 기록했습니다: {0} ({1} / {2}개 항목 샘플링)",
+        "error_unknown_timezone": "오류: 알 수 없는 시간대입니다: {}",
+        "error_timezone_store": "오류: --timezone 은 --store 와 함께 사용할 수 없습니다. 저장소는 생성 당시의 Markdown 제목을 그대로 유지합니다.",
+        "error_store_option_unsupported": "오류: {0}은(는) --store와 함께 사용할 수 없습니다.",
+        "warning_removed_stale_outputs": "경고: 이전 분할에서 남은 오래된 번호 출력 파일 {}개를 삭제했습니다.",
     },
     "mr": {
         "error_lang_detection": "त्रुटी: सिस्टम भाषा ओळखण्यात समस्या: {}",
@@ -274,8 +771,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "तंबी: last_entry_time.txt रिकामी आहे. पूर्ण पुनरुत्पादन (full regeneration) मोडवर स्विच करत आहे.",
         "warning_last_entry_time_invalid": "तंबी: last_entry_time.txt मध्ये अवैध टाइमस्टँप ({!r}) आहे. पूर्ण पुनरुत्पादन मोडवर स्विच करत आहे.",
         "warning_last_entry_time_naive": "तंबी: last_entry_time.txt मध्ये टाइमझोन-विरहित टाइमस्टँप आहे. UTC मानले जात आहे.",
-        "warning_removed_existing_outputs": "तंबी: पूर्ण पुनरुत्पादनापूर्वी {} विद्यमान आउटपुट फाइल्स हटवल्या गेल्या आहेत.",
         "warning_failed_remove_output_file": "तंबी: आउटपुट फाइल {} हटवण्यात अपयश आले: {}",
+        "warning_json_backend_unavailable": "चेतावणी: JSON बॅकएंड {} उपलब्ध नाही. मानक json मॉड्यूल वापरले जात आहे.",
+        "batch_job_summary": "{0}: {1} नवीन नोंदी, {2} फाइल, {3:.2f} से ({4:.0f} नोंदी/से, {5:.2f} MB/से)",
+        "batch_job_failed": "{0}: अयशस्वी: {1}",
+        "batch_complete": "✅ बॅच पूर्ण: {0} यशस्वी, {1} अयशस्वी.",
+        "serve_listening": "🌐 रूपांतरण सेवा http://{0}:{1}/convert वर ऐकत आहे (एकाच वेळी जास्तीत जास्त {2} रूपांतरणे)",
+        "unchanged_output_file": "सामग्री अपरिवर्तित, फाइल आहे तशीच ठेवली: {}",
+        "changed_output_files": "बदललेल्या फाइल ({}):",
+        "product_entries": "📦 {0}: {1} नोंदी",
+        "store_import": "🗄️ इतिहास संग्रह: {0} नवीन नोंदी जतन केल्या (तपासलेल्या नोंदी: {1}/{2})",
+        "resplit_no_outputs": "{} साठी कोणत्याही क्रमांकित आउटपुट फाइल्स आढळल्या नाहीत.",
+        "resplit_complete": "✅ पुन्हा विभाजित: {0} नोंदी, {1} फाइल्समधून {2} फाइल्समध्ये, मर्यादा {3} बाइट्स.",
+        "plan_summary": "📋 {0} साठी योजना: {1} नवीन नोंदी, {2} फाइल्समध्ये; काहीही लिहिले जाणार नाही.",
+        "plan_file": "  {0}: {1} नोंदी, ~{2} बाइट्स, {3} – {4}",
+        "plan_file_appended": "  {0} (जोडणे): {1} नवीन नोंदी, ~{2} बाइट्स, {3} – {4}",
+        "plan_projection": "⏱️ अंदाजे वेळ: {0:.1f} से (लोड {1:.1f} से + रूपांतरण {2:.1f} से, ~{3:.0f} नोंदी/से, {4} नमुना नोंदींवरून)",
+        "warning_target_files_exceeded": "चेतावणी: इतिहास {0} फाइल्समध्ये बसत नाही (मर्यादा {1} बाइट्स); त्याऐवजी {2} फाइल्स लिहिल्या जात आहेत.",
+        "redaction_summary": "🛡️ {0} आयटम लपवले (ईमेल: {1}, फोन नंबर: {2}, API की: {3}, शब्द: {4}) {5:.2f} MB मध्ये, {6:.1f} MB/से वेगाने",
+        "snapshot_loaded": "⚡ स्नॅपशॉटमधून {0} निवडलेल्या नोंदी लोड केल्या: {1}",
+        "snapshot_saved": "💾 स्नॅपशॉट जतन केला: {}",
+        "metrics_report_run": "{0}: {1:.2f} से, {2:.1f} MB इनपुट, {3} Gemini नोंदी ({4} नवीन), {5} फाइल(ी) लिहिल्या ({6:.2f} MB), कमाल RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: {1:.2f} से नंतर अयशस्वी",
+        "metrics_report_trend": "📈 नवीनतम रन विरुद्ध मागील {0} रनचा मध्यक: कालावधी {1:+.0%}, थ्रूपुट {2:+.0%}, इनपुट आकार {3:+.0%}, Gemini नोंदी {4:+.0%}, कमाल RSS {5:+.0%}",
+        "metrics_report_empty": "{} मध्ये कोणतेही रन नोंदवलेले नाहीत.",
+        "incremental_read": "⏩ शेवटच्या प्रक्रिया केलेल्या नोंदीवर थांबले ({0} / {1} बाइट वाचले, {2} क्रियाकलाप)",
+        "warning_entries_out_of_order": "चेतावणी: नोंदी वेळेच्या क्रमाने नाहीत ({0} चढत्या क्रमाचे भाग); {1} नोंदी टाइमस्टॅम्पनुसार क्रमाने लावल्या जात आहेत.",
+        "attachments_linked": "📎 {0} संलग्नक {1} संग्रहित फाइल(ीं) म्हणून {2} मध्ये जोडले",
+        "warning_attachments_missing": "चेतावणी: संदर्भित {0} संलग्नक {1} मध्ये सापडले नाहीत.",
+        "stats_written": "📊 वापर आकडेवारी लिहिली: {}",
+        "streamed_to_stdout": "चॅट इतिहास stdout वर पाठवला, नाव: {}",
+        "error_stdout_output_unsupported": "त्रुटी: --output_file - हे --store, --products, --batch किंवा --attachments सोबत वापरता येत नाही.",
+        "added_to_bundle": "चॅट इतिहास बंडलमध्ये जोडला, नाव: {}",
+        "bundle_written": "🗜️ बंडल लिहिले: {0} ({1} फाइल्स)",
+        "error_bundle_unsupported": "त्रुटी: --bundle हे --store, --batch, --attachments किंवा --output_file - सोबत वापरता येत नाही.",
+        "warning_html_budget_exceeded": "चेतावणी: HTML उत्तर (अक्षरे: {0}) रूपांतरित करण्यास {1:.1f} s पेक्षा जास्त वेळ लागला; फक्त टॅग काढले जातील.",
+        "preview_written": "🔍 पूर्वावलोकन लिहिले: {0} ({1} / {2} नोंदींचा नमुना)",
+        "error_unknown_timezone": "त्रुटी: अज्ञात वेळ क्षेत्र: {}",
+        "error_timezone_store": "त्रुटी: --timezone हे --store सोबत वापरता येत नाही, कारण स्टोअर Markdown शीर्षके तयार झाल्याप्रमाणेच ठेवते.",
+        "error_store_option_unsupported": "त्रुटी: {0} हे --store सोबत वापरता येत नाही.",
+        "warning_removed_stale_outputs": "चेतावणी: मागील विभाजनातून उरलेल्या {} जुन्या क्रमांकित आउटपुट फाइल्स हटवल्या.",
     },
     "ms": {
         "error_lang_detection": "Ralat semasa mengesan bahasa sistem: {}",
@@ -291,8 +826,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Amaran: last_entry_time.txt adalah kosong. Beralih ke mod regenerasi penuh.",
         "warning_last_entry_time_invalid": "Amaran: Penanda masa tidak sah dalam last_entry_time.txt ({!r}). Beralih ke mod regenerasi penuh.",
         "warning_last_entry_time_naive": "Amaran: last_entry_time.txt mempunyai penanda masa tanpa zon masa. Mengandalkan UTC.",
-        "warning_removed_existing_outputs": "Amaran: Mengeluarkan {} fail output sedia ada sebelum regenerasi penuh.",
         "warning_failed_remove_output_file": "Amaran: Gagal mengosongkan/membuang fail output {}: {}",
+        "warning_json_backend_unavailable": "Amaran: Backend JSON {} tidak tersedia. Beralih kepada modul json standard.",
+        "batch_job_summary": "{0}: {1} entri baharu, {2} fail, {3:.2f} s ({4:.0f} entri/s, {5:.2f} MB/s)",
+        "batch_job_failed": "{0}: gagal: {1}",
+        "batch_complete": "✅ Kelompok selesai: {0} berjaya, {1} gagal.",
+        "serve_listening": "🌐 Perkhidmatan penukaran mendengar di http://{0}:{1}/convert (maksimum {2} penukaran serentak)",
+        "unchanged_output_file": "Kandungan tidak berubah, fail dibiarkan seperti asal: {}",
+        "changed_output_files": "Fail yang berubah ({}):",
+        "product_entries": "📦 {0}: {1} entri",
+        "store_import": "🗄️ Stor sejarah: {0} entri baharu disimpan ({1} daripada {2} entri disemak)",
+        "resplit_no_outputs": "Tiada fail output bernombor ditemui untuk {}.",
+        "resplit_complete": "✅ {0} entri daripada {1} fail dipecahkan semula kepada {2} fail dengan had {3} bait.",
+        "plan_summary": "📋 Pelan untuk {0}: {1} entri baharu dalam {2} fail; tiada apa-apa ditulis.",
+        "plan_file": "  {0}: {1} entri, ~{2} bait, {3} – {4}",
+        "plan_file_appended": "  {0} (tambah): {1} entri baharu, ~{2} bait, {3} – {4}",
+        "plan_projection": "⏱️ Anggaran masa: {0:.1f} s (memuat {1:.1f} s + penukaran {2:.1f} s, ~{3:.0f} entri/s, daripada {4} entri sampel)",
+        "warning_target_files_exceeded": "Amaran: Sejarah tidak muat dalam {0} fail di bawah had {1} bait; menulis {2} fail sebaliknya.",
+        "redaction_summary": "🛡️ {0} item disunting (e-mel: {1}, nombor telefon: {2}, kunci API: {3}, istilah: {4}) dalam {5:.2f} MB pada {6:.1f} MB/s",
+        "snapshot_loaded": "⚡ Memuatkan {0} entri terpilih daripada petikan {1}",
+        "snapshot_saved": "💾 Petikan disimpan: {}",
+        "metrics_report_run": "{0}: {1:.2f} s, input {2:.1f} MB, {3} entri Gemini ({4} baharu), {5} fail ditulis ({6:.2f} MB), RSS puncak {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: gagal selepas {1:.2f} s",
+        "metrics_report_trend": "📈 Larian terkini berbanding median {0} larian terdahulu: tempoh {1:+.0%}, daya pemprosesan {2:+.0%}, saiz input {3:+.0%}, entri Gemini {4:+.0%}, RSS puncak {5:+.0%}",
+        "metrics_report_empty": "Tiada larian direkodkan dalam {}.",
+        "incremental_read": "⏩ Berhenti pada entri terakhir yang diproses selepas membaca {0} daripada {1} bait ({2} aktiviti)",
+        "warning_entries_out_of_order": "Amaran: Entri tidak mengikut susunan masa ({0} jujukan menaik); menyusun {1} entri mengikut cap masa.",
+        "attachments_linked": "📎 {0} lampiran dipautkan sebagai {1} fail tersimpan dalam {2}",
+        "warning_attachments_missing": "Amaran: {0} lampiran yang dirujuk tidak ditemui dalam {1}.",
+        "stats_written": "📊 Statistik penggunaan ditulis: {}",
+        "streamed_to_stdout": "Sejarah sembang distrim ke stdout sebagai: {}",
+        "error_stdout_output_unsupported": "Ralat: --output_file - tidak boleh digabungkan dengan --store, --products, --batch atau --attachments.",
+        "added_to_bundle": "Sejarah sembang ditambah ke berkas sebagai: {}",
+        "bundle_written": "🗜️ Berkas ditulis: {0} ({1} fail)",
+        "error_bundle_unsupported": "Ralat: --bundle tidak boleh digabungkan dengan --store, --batch, --attachments atau --output_file -.",
+        "warning_html_budget_exceeded": "Amaran: Penukaran respons HTML sebanyak {0} aksara mengambil masa lebih daripada {1:.1f} s; hanya tag akan dibuang.",
+        "preview_written": "🔍 Pratonton ditulis: {0} ({1} daripada {2} entri disampel)",
+        "error_unknown_timezone": "Ralat: Zon waktu tidak diketahui: {}",
+        "error_timezone_store": "Ralat: --timezone tidak boleh digabungkan dengan --store, yang menyimpan tajuk Markdown seperti semasa dijana.",
+        "error_store_option_unsupported": "Ralat: {0} tidak boleh digabungkan dengan --store.",
+        "warning_removed_stale_outputs": "Amaran: Mengeluarkan {} fail output bernombor lapuk yang tertinggal daripada susun atur sebelumnya.",
     },
     "pa": {
         "error_lang_detection": "ਸਿਸਟਮ ਭਾਸ਼ਾ ਦਾ ਪਤਾ ਲਗਾਉਂਦੇ ਸਮੇਂ ਤਰੁੱਟੀ: {}",
@@ -308,8 +881,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "ਚੇਤਾਵਨੀ: last_entry_time.txt ਖਾਲੀ ਹੈ। ਪੂਰੀ ਰੀਜਨਰੇਸ਼ਨ (full regeneration) ਮੋਡ 'ਤੇ ਸਵਿਚ ਕੀਤਾ ਜਾ ਰਿਹਾ ਹੈ।",
         "warning_last_entry_time_invalid": "ਚੇਤਾਵਨੀ: last_entry_time.txt ਵਿੱਚ ਅਵੈਧ ਟਾਈਮਸਟੈਂਪ ({!r}) ਹੈ। ਪੂਰੀ ਰੀਜਨਰੇਸ਼ਨ ਮੋਡ 'ਤੇ ਸਵਿਚ ਕੀਤਾ ਜਾ ਰਿਹਾ ਹੈ।",
         "warning_last_entry_time_naive": "ਚੇਤਾਵਨੀ: last_entry_time.txt ਵਿੱਚ ਟਾਈਮਜ਼ੋਨ-ਰਹਿਤ ਟਾਈਮਸਟੈਂਪ ਹੈ। ਇਸਨੂੰ UTC ਮੰਨਿਆ ਜਾ ਰਿਹਾ है।",
-        "warning_removed_existing_outputs": "ਚੇਤਾਵਨੀ: ਪੂਰੀ ਰੀਜਨਰੇਸ਼ਨ ਤੋਂ ਪਹਿਲਾਂ {} ਮੌਜੂਦਾ ਆਉਟਪੁੱਟ ਫਾਈਲਾਂ ਨੂੰ ਹਟਾ ਦਿੱਤਾ ਗਿਆ ਹੈ।",
         "warning_failed_remove_output_file": "ਚੇਤਾਵਨੀ: ਆਉਟਪੁੱਟ ਫਾਈਲ {} ਨੂੰ ਹਟਾਉਣ ਵਿੱਚ ਅਸਫਲ: {}",
+        "warning_json_backend_unavailable": "ਚੇਤਾਵਨੀ: JSON ਬੈਕਐਂਡ {} ਉਪਲਬਧ ਨਹੀਂ ਹੈ। ਮਿਆਰੀ json ਮੋਡੀਊਲ ਵਰਤਿਆ ਜਾ ਰਿਹਾ ਹੈ।",
+        "batch_job_summary": "{0}: {1} ਨਵੀਆਂ ਐਂਟਰੀਆਂ, {2} ਫਾਈਲ(ਾਂ), {3:.2f} ਸ ({4:.0f} ਐਂਟਰੀਆਂ/ਸ, {5:.2f} MB/ਸ)",
+        "batch_job_failed": "{0}: ਅਸਫਲ: {1}",
+        "batch_complete": "✅ ਬੈਚ ਪੂਰਾ: {0} ਸਫਲ, {1} ਅਸਫਲ।",
+        "serve_listening": "🌐 ਰੂਪਾਂਤਰਣ ਸੇਵਾ http://{0}:{1}/convert 'ਤੇ ਸੁਣ ਰਹੀ ਹੈ (ਇੱਕੋ ਸਮੇਂ ਵੱਧ ਤੋਂ ਵੱਧ {2} ਰੂਪਾਂਤਰਣ)",
+        "unchanged_output_file": "ਸਮੱਗਰੀ ਨਹੀਂ ਬਦਲੀ, ਫਾਈਲ ਜਿਵੇਂ ਸੀ ਉਵੇਂ ਛੱਡੀ ਗਈ: {}",
+        "changed_output_files": "ਬਦਲੀਆਂ ਫਾਈਲਾਂ ({}):",
+        "product_entries": "📦 {0}: {1} ਐਂਟਰੀਆਂ",
+        "store_import": "🗄️ ਇਤਿਹਾਸ ਸਟੋਰ: {0} ਨਵੀਆਂ ਐਂਟਰੀਆਂ ਸੰਭਾਲੀਆਂ ਗਈਆਂ (ਜਾਂਚੀਆਂ ਐਂਟਰੀਆਂ: {1}/{2})",
+        "resplit_no_outputs": "{} ਲਈ ਕੋਈ ਨੰਬਰ ਵਾਲੀਆਂ ਆਉਟਪੁੱਟ ਫਾਈਲਾਂ ਨਹੀਂ ਮਿਲੀਆਂ।",
+        "resplit_complete": "✅ ਮੁੜ ਵੰਡਿਆ: {0} ਐਂਟਰੀਆਂ, {1} ਫਾਈਲ(ਾਂ) ਤੋਂ {2} ਫਾਈਲ(ਾਂ) ਵਿੱਚ, ਸੀਮਾ {3} ਬਾਈਟ।",
+        "plan_summary": "📋 {0} ਲਈ ਯੋਜਨਾ: {1} ਨਵੀਆਂ ਐਂਟਰੀਆਂ, {2} ਫਾਈਲ(ਾਂ) ਵਿੱਚ; ਕੁਝ ਵੀ ਨਹੀਂ ਲਿਖਿਆ ਜਾਂਦਾ।",
+        "plan_file": "  {0}: {1} ਐਂਟਰੀਆਂ, ~{2} ਬਾਈਟ, {3} – {4}",
+        "plan_file_appended": "  {0} (ਜੋੜੋ): {1} ਨਵੀਆਂ ਐਂਟਰੀਆਂ, ~{2} ਬਾਈਟ, {3} – {4}",
+        "plan_projection": "⏱️ ਅੰਦਾਜ਼ਨ ਸਮਾਂ: {0:.1f} ਸ (ਲੋਡ {1:.1f} ਸ + ਬਦਲਾਅ {2:.1f} ਸ, ~{3:.0f} ਐਂਟਰੀਆਂ/ਸ, {4} ਨਮੂਨਾ ਐਂਟਰੀਆਂ ਤੋਂ)",
+        "warning_target_files_exceeded": "ਚੇਤਾਵਨੀ: ਇਤਿਹਾਸ {0} ਫਾਈਲ(ਾਂ) ਵਿੱਚ ਨਹੀਂ ਸਮਾਉਂਦਾ (ਸੀਮਾ {1} ਬਾਈਟ); ਇਸ ਦੀ ਬਜਾਏ {2} ਫਾਈਲਾਂ ਲਿਖੀਆਂ ਜਾ ਰਹੀਆਂ ਹਨ।",
+        "redaction_summary": "🛡️ {0} ਆਈਟਮਾਂ ਲੁਕਾਈਆਂ (ਈਮੇਲ: {1}, ਫ਼ੋਨ ਨੰਬਰ: {2}, API ਕੁੰਜੀਆਂ: {3}, ਸ਼ਬਦ: {4}) {5:.2f} MB ਵਿੱਚ, {6:.1f} MB/ਸ ਦੀ ਗਤੀ ਨਾਲ",
+        "snapshot_loaded": "⚡ ਸਨੈਪਸ਼ਾਟ ਤੋਂ {0} ਚੁਣੀਆਂ ਐਂਟਰੀਆਂ ਲੋਡ ਕੀਤੀਆਂ: {1}",
+        "snapshot_saved": "💾 ਸਨੈਪਸ਼ਾਟ ਸੰਭਾਲਿਆ ਗਿਆ: {}",
+        "metrics_report_run": "{0}: {1:.2f} ਸਕਿੰਟ, {2:.1f} MB ਇਨਪੁੱਟ, {3} Gemini ਐਂਟਰੀਆਂ ({4} ਨਵੀਆਂ), {5} ਫਾਈਲ(ਾਂ) ਲਿਖੀਆਂ ({6:.2f} MB), ਵੱਧ ਤੋਂ ਵੱਧ RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: {1:.2f} ਸਕਿੰਟ ਬਾਅਦ ਅਸਫਲ",
+        "metrics_report_trend": "📈 ਨਵੀਨਤਮ ਰਨ ਬਨਾਮ ਪਿਛਲੇ {0} ਰਨਾਂ ਦਾ ਮੱਧਕ: ਮਿਆਦ {1:+.0%}, ਥ੍ਰੂਪੁੱਟ {2:+.0%}, ਇਨਪੁੱਟ ਆਕਾਰ {3:+.0%}, Gemini ਐਂਟਰੀਆਂ {4:+.0%}, ਵੱਧ ਤੋਂ ਵੱਧ RSS {5:+.0%}",
+        "metrics_report_empty": "{} ਵਿੱਚ ਕੋਈ ਰਨ ਦਰਜ ਨਹੀਂ ਹੈ।",
+        "incremental_read": "⏩ ਆਖਰੀ ਪ੍ਰੋਸੈਸ ਕੀਤੀ ਐਂਟਰੀ 'ਤੇ ਰੁਕਿਆ ({0} / {1} ਬਾਈਟ ਪੜ੍ਹੇ, {2} ਗਤੀਵਿਧੀਆਂ)",
+        "warning_entries_out_of_order": "ਚੇਤਾਵਨੀ: ਐਂਟਰੀਆਂ ਸਮੇਂ ਦੇ ਕ੍ਰਮ ਵਿੱਚ ਨਹੀਂ ਹਨ ({0} ਵਧਦੇ ਕ੍ਰਮ ਵਾਲੇ ਹਿੱਸੇ); {1} ਐਂਟਰੀਆਂ ਨੂੰ ਟਾਈਮਸਟੈਂਪ ਅਨੁਸਾਰ ਕ੍ਰਮਬੱਧ ਕੀਤਾ ਜਾ ਰਿਹਾ ਹੈ।",
+        "attachments_linked": "📎 {0} ਅਟੈਚਮੈਂਟ {1} ਸਟੋਰ ਕੀਤੀਆਂ ਫਾਈਲਾਂ ਵਜੋਂ {2} ਵਿੱਚ ਲਿੰਕ ਕੀਤੀਆਂ",
+        "warning_attachments_missing": "ਚੇਤਾਵਨੀ: ਹਵਾਲਾ ਦਿੱਤੀਆਂ {0} ਅਟੈਚਮੈਂਟਾਂ {1} ਵਿੱਚ ਨਹੀਂ ਮਿਲੀਆਂ।",
+        "stats_written": "📊 ਵਰਤੋਂ ਦੇ ਅੰਕੜੇ ਲਿਖੇ ਗਏ: {}",
+        "streamed_to_stdout": "ਚੈਟ ਇਤਿਹਾਸ stdout ਤੇ ਭੇਜਿਆ ਗਿਆ, ਨਾਮ: {}",
+        "error_stdout_output_unsupported": "ਗਲਤੀ: --output_file - ਨੂੰ --store, --products, --batch ਜਾਂ --attachments ਨਾਲ ਨਹੀਂ ਵਰਤਿਆ ਜਾ ਸਕਦਾ।",
+        "added_to_bundle": "ਚੈਟ ਇਤਿਹਾਸ ਬੰਡਲ ਵਿੱਚ ਜੋੜਿਆ ਗਿਆ, ਨਾਮ: {}",
+        "bundle_written": "🗜️ ਬੰਡਲ ਲਿਖਿਆ ਗਿਆ: {0} ({1} ਫਾਈਲਾਂ)",
+        "error_bundle_unsupported": "ਗਲਤੀ: --bundle ਨੂੰ --store, --batch, --attachments ਜਾਂ --output_file - ਨਾਲ ਨਹੀਂ ਵਰਤਿਆ ਜਾ ਸਕਦਾ।",
+        "warning_html_budget_exceeded": "ਚੇਤਾਵਨੀ: HTML ਜਵਾਬ (ਅੱਖਰ: {0}) ਬਦਲਣ ਵਿੱਚ {1:.1f} s ਤੋਂ ਵੱਧ ਸਮਾਂ ਲੱਗਾ; ਸਿਰਫ਼ ਟੈਗ ਹਟਾਏ ਜਾਣਗੇ।",
+        "preview_written": "🔍 ਝਲਕ ਲਿਖੀ ਗਈ: {0} ({1} / {2} ਐਂਟਰੀਆਂ ਦਾ ਨਮੂਨਾ)",
+        "error_unknown_timezone": "ਗਲਤੀ: ਅਣਜਾਣ ਸਮਾਂ ਖੇਤਰ: {}",
+        "error_timezone_store": "ਗਲਤੀ: --timezone ਨੂੰ --store ਨਾਲ ਨਹੀਂ ਵਰਤਿਆ ਜਾ ਸਕਦਾ, ਕਿਉਂਕਿ ਸਟੋਰ Markdown ਸਿਰਲੇਖਾਂ ਨੂੰ ਬਣਾਏ ਅਨੁਸਾਰ ਹੀ ਰੱਖਦਾ ਹੈ।",
+        "error_store_option_unsupported": "ਗਲਤੀ: {0} ਨੂੰ --store ਨਾਲ ਨਹੀਂ ਵਰਤਿਆ ਜਾ ਸਕਦਾ।",
+        "warning_removed_stale_outputs": "ਚੇਤਾਵਨੀ: ਪਿਛਲੀ ਵੰਡ ਤੋਂ ਬਚੀਆਂ {} ਪੁਰਾਣੀਆਂ ਨੰਬਰ ਵਾਲੀਆਂ ਆਉਟਪੁੱਟ ਫਾਈਲਾਂ ਹਟਾ ਦਿੱਤੀਆਂ ਗਈਆਂ।",
     },
     "pt": {
         "error_lang_detection": "Erro ao detectar o idioma do sistema: {}",
@@ -325,8 +936,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Aviso: last_entry_time.txt está vazio. Alternando para o modo de regeneração completa.",
         "warning_last_entry_time_invalid": "Aviso: Carimbo de data/hora inválido em last_entry_time.txt ({!r}). Alternando para o modo de regeneração completa.",
         "warning_last_entry_time_naive": "Aviso: last_entry_time.txt possui um carimbo de data/hora sem fuso horário. Assumindo UTC.",
-        "warning_removed_existing_outputs": "Aviso: Removido(s) {} arquivo(s) de saída existente(s) antes da 'regeneração completa.",
         "warning_failed_remove_output_file": "Aviso: Falha ao remover o arquivo de saída {}: {}",
+        "warning_json_backend_unavailable": "Aviso: o backend JSON {} não está disponível. Usando o módulo json padrão.",
+        "batch_job_summary": "{0}: {1} novas entradas, {2} arquivo(s), {3:.2f} s ({4:.0f} entradas/s, {5:.2f} MB/s)",
+        "batch_job_failed": "{0}: falhou: {1}",
+        "batch_complete": "✅ Lote concluído: {0} com sucesso, {1} com falha.",
+        "serve_listening": "🌐 Serviço de conversão escutando em http://{0}:{1}/convert (no máximo {2} conversões simultâneas)",
+        "unchanged_output_file": "Conteúdo inalterado, arquivo mantido como está: {}",
+        "changed_output_files": "Arquivos alterados ({}):",
+        "product_entries": "📦 {0}: {1} entradas",
+        "store_import": "🗄️ Armazenamento do histórico: {0} novas entradas armazenadas ({1} de {2} entradas verificadas)",
+        "resplit_no_outputs": "Nenhum arquivo de saída numerado encontrado para {}.",
+        "resplit_complete": "✅ {0} entradas de {1} arquivo(s) redivididas em {2} arquivo(s) com limite de {3} bytes.",
+        "plan_summary": "📋 Plano para {0}: {1} novas entradas em {2} arquivo(s); nada é gravado.",
+        "plan_file": "  {0}: {1} entradas, ~{2} bytes, {3} – {4}",
+        "plan_file_appended": "  {0} (anexar): {1} novas entradas, ~{2} bytes, {3} – {4}",
+        "plan_projection": "⏱️ Tempo estimado: {0:.1f} s (carregamento {1:.1f} s + conversão {2:.1f} s, ~{3:.0f} entradas/s, a partir de {4} entradas amostradas)",
+        "warning_target_files_exceeded": "Aviso: O histórico não cabe em {0} arquivo(s) com o limite de {1} bytes; gravando {2} arquivos.",
+        "redaction_summary": "🛡️ {0} item(ns) ocultado(s) (e-mails: {1}, telefones: {2}, chaves de API: {3}, termos: {4}) em {5:.2f} MB a {6:.1f} MB/s",
+        "snapshot_loaded": "⚡ {0} entradas selecionadas carregadas do snapshot {1}",
+        "snapshot_saved": "💾 Snapshot salvo: {}",
+        "metrics_report_run": "{0}: {1:.2f} s, {2:.1f} MB de entrada, {3} entradas do Gemini ({4} novas), {5} arquivo(s) gravado(s) ({6:.2f} MB), RSS máximo {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: falhou após {1:.2f} s",
+        "metrics_report_trend": "📈 Última execução vs. mediana de {0} execução(ões) anterior(es): duração {1:+.0%}, vazão {2:+.0%}, tamanho da entrada {3:+.0%}, entradas do Gemini {4:+.0%}, RSS máximo {5:+.0%}",
+        "metrics_report_empty": "Nenhuma execução registrada em {}.",
+        "incremental_read": "⏩ Leitura interrompida na última entrada processada após ler {0} de {1} bytes ({2} atividades)",
+        "warning_entries_out_of_order": "Aviso: As entradas não estão em ordem cronológica ({0} sequências crescentes); ordenando {1} entradas por carimbo de data/hora.",
+        "attachments_linked": "📎 {0} anexo(s) vinculado(s) como {1} arquivo(s) armazenado(s) em {2}",
+        "warning_attachments_missing": "Aviso: {0} anexo(s) referenciado(s) não foram encontrados em {1}.",
+        "stats_written": "📊 Estatísticas de uso gravadas: {}",
+        "streamed_to_stdout": "Históricos de chat enviados para a saída padrão como: {}",
+        "error_stdout_output_unsupported": "Erro: --output_file - não pode ser combinado com --store, --products, --batch ou --attachments.",
+        "added_to_bundle": "Históricos de chat adicionados ao pacote como: {}",
+        "bundle_written": "🗜️ Pacote gravado: {0} ({1} arquivo(s))",
+        "error_bundle_unsupported": "Erro: --bundle não pode ser combinado com --store, --batch, --attachments ou --output_file -.",
+        "warning_html_budget_exceeded": "Aviso: A conversão de uma resposta HTML de {0} caracteres levou mais de {1:.1f} s; apenas as tags serão removidas.",
+        "preview_written": "🔍 Prévia gravada: {0} ({1} de {2} entradas amostradas)",
+        "error_unknown_timezone": "Erro: Fuso horário desconhecido: {}",
+        "error_timezone_store": "Erro: --timezone não pode ser combinado com --store, que mantém os títulos Markdown como foram gerados.",
+        "error_store_option_unsupported": "Erro: {0} não pode ser combinado com --store.",
+        "warning_removed_stale_outputs": "Aviso: Removido(s) {} arquivo(s) de saída numerado(s) obsoleto(s) restante(s) da divisão anterior.",
     },
     "ru": {
         "error_lang_detection": "Ошибка при определении языка системы: {}",
@@ -342,8 +991,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Предупреждение: Файл last_entry_time.txt пуст. Переключение в режим полной регенерации.",
         "warning_last_entry_time_invalid": "Предупреждение: Некорректная метка времени в last_entry_time.txt ({!r}). Переключение в режим полной регенерации.",
         "warning_last_entry_time_naive": "Предупреждение: Метка времени в last_entry_time.txt не содержит указания часового пояса. Предполагается UTC.",
-        "warning_removed_existing_outputs": "Предупреждение: Удалено {} существующих выходных файлов перед полной регенерацией.",
         "warning_failed_remove_output_file": "Предупреждение: Не удалось удалить выходной файл {}: {}",
+        "warning_json_backend_unavailable": "Предупреждение: бэкенд JSON {} недоступен. Используется стандартный модуль json.",
+        "batch_job_summary": "{0}: новых записей: {1}, файлов: {2}, {3:.2f} с ({4:.0f} записей/с, {5:.2f} МБ/с)",
+        "batch_job_failed": "{0}: ошибка: {1}",
+        "batch_complete": "✅ Пакет завершён: успешно {0}, с ошибкой {1}.",
+        "serve_listening": "🌐 Служба конвертации слушает http://{0}:{1}/convert (не более {2} одновременных конвертаций)",
+        "unchanged_output_file": "Содержимое не изменилось, файл оставлен без изменений: {}",
+        "changed_output_files": "Изменённые файлы ({}):",
+        "product_entries": "📦 {0}: записей: {1}",
+        "store_import": "🗄️ Хранилище истории: сохранено новых записей: {0} (проверено {1} из {2})",
+        "resplit_no_outputs": "Не найдены пронумерованные выходные файлы для {}.",
+        "resplit_complete": "✅ Повторно разделено: записей {0}, файлов {1} → файлов {2} (лимит {3} байт).",
+        "plan_summary": "📋 План для {0}: новых записей {1}, файлов {2}; ничего не записывается.",
+        "plan_file": "  {0}: записей {1}, ~{2} байт, {3} – {4}",
+        "plan_file_appended": "  {0} (дополнение): новых записей {1}, ~{2} байт, {3} – {4}",
+        "plan_projection": "⏱️ Оценка времени: {0:.1f} с (загрузка {1:.1f} с + преобразование {2:.1f} с, ~{3:.0f} записей/с, по выборке из {4} записей)",
+        "warning_target_files_exceeded": "Предупреждение: История не помещается в {0} файл(ов) при лимите {1} байт; будет записано файлов: {2}.",
+        "redaction_summary": "🛡️ Скрыто элементов: {0} (email: {1}, телефоны: {2}, ключи API: {3}, термины: {4}) в {5:.2f} МБ со скоростью {6:.1f} МБ/с",
+        "snapshot_loaded": "⚡ Загружено выбранных записей: {0} из снимка {1}",
+        "snapshot_saved": "💾 Снимок сохранён: {}",
+        "metrics_report_run": "{0}: {1:.2f} с, вход {2:.1f} МБ, записей Gemini: {3} (новых: {4}), записано файлов: {5} ({6:.2f} МБ), пиковый RSS {7:.0f} МБ",
+        "metrics_report_failed_run": "{0}: ошибка через {1:.2f} с",
+        "metrics_report_trend": "📈 Последний запуск по сравнению с медианой {0} предыдущих: длительность {1:+.0%}, пропускная способность {2:+.0%}, размер входа {3:+.0%}, записи Gemini {4:+.0%}, пиковый RSS {5:+.0%}",
+        "metrics_report_empty": "В {} нет записанных запусков.",
+        "incremental_read": "⏩ Чтение остановлено на последней обработанной записи: прочитано {0} из {1} байт ({2} действий)",
+        "warning_entries_out_of_order": "Предупреждение: записи расположены не по времени (возрастающих участков: {0}); сортировка записей ({1}) по метке времени.",
+        "attachments_linked": "📎 Связано вложений: {0}, сохранено файлов: {1}, каталог {2}",
+        "warning_attachments_missing": "Предупреждение: не найдено указанных вложений: {0} в {1}.",
+        "stats_written": "📊 Статистика использования записана: {}",
+        "streamed_to_stdout": "История чатов передана в стандартный вывод как: {}",
+        "error_stdout_output_unsupported": "Ошибка: --output_file - нельзя сочетать с --store, --products, --batch или --attachments.",
+        "added_to_bundle": "История чатов добавлена в архив как: {}",
+        "bundle_written": "🗜️ Архив записан: {0} (файлов: {1})",
+        "error_bundle_unsupported": "Ошибка: --bundle нельзя сочетать с --store, --batch, --attachments или --output_file -.",
+        "warning_html_budget_exceeded": "Предупреждение: Преобразование HTML-ответа из {0} символов заняло больше {1:.1f} с; будут только удалены теги.",
+        "preview_written": "🔍 Предпросмотр записан: {0} (выборка {1} из {2} записей)",
+        "error_unknown_timezone": "Ошибка: Неизвестный часовой пояс: {}",
+        "error_timezone_store": "Ошибка: --timezone нельзя сочетать с --store, который хранит заголовки Markdown в том виде, в каком они были созданы.",
+        "error_store_option_unsupported": "Ошибка: {0} нельзя использовать вместе с --store.",
+        "warning_removed_stale_outputs": "Предупреждение: Удалено устаревших нумерованных выходных файлов, оставшихся от прежнего разбиения: {}.",
     },
     "sw": {
         "error_lang_detection": "Hitilafu wakati wa kugundua lugha ya mfumo: {}",
@@ -359,8 +1046,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Onyo: last_entry_time.txt ni tupu. Inabadilisha kwenda hali ya uzalishaji upya kikamilifu.",
         "warning_last_entry_time_invalid": "Onyo: Alama ya muda si halali katika last_entry_time.txt ({!r}). Inabadilisha kwenda hali ya uzalishaji upya kikamilifu.",
         "warning_last_entry_time_naive": "Onyo: last_entry_time.txt ina alama ya muda isiyo na eneo la muda. Inachukuliwa kama UTC.",
-        "warning_removed_existing_outputs": "Onyo: Faili {} zilizopo za matokeo zimeondolewa kabla ya uzalishaji upya kikamilifu.",
         "warning_failed_remove_output_file": "Onyo: Imeshindwa kuondoa faili la matokeo {}: {}",
+        "warning_json_backend_unavailable": "Onyo: Backend ya JSON {} haipatikani. Inarudi kwenye moduli ya kawaida ya json.",
+        "batch_job_summary": "{0}: maingizo mapya {1}, faili {2}, sekunde {3:.2f} (maingizo {4:.0f}/s, {5:.2f} MB/s)",
+        "batch_job_failed": "{0}: imeshindwa: {1}",
+        "batch_complete": "✅ Kundi limekamilika: {0} yamefaulu, {1} yameshindwa.",
+        "serve_listening": "🌐 Huduma ya ubadilishaji inasikiliza kwenye http://{0}:{1}/convert (ubadilishaji {2} kwa wakati mmoja zaidi)",
+        "unchanged_output_file": "Maudhui hayajabadilika, faili imeachwa kama ilivyo: {}",
+        "changed_output_files": "Faili zilizobadilika ({}):",
+        "product_entries": "📦 {0}: maingizo {1}",
+        "store_import": "🗄️ Hifadhi ya historia: maingizo mapya {0} yamehifadhiwa (maingizo {1} kati ya {2} yamekaguliwa)",
+        "resplit_no_outputs": "Hakuna faili za matokeo zenye nambari zilizopatikana kwa {}.",
+        "resplit_complete": "✅ Maingizo {0} kutoka faili {1} yamegawanywa upya kuwa faili {2} kwa kikomo cha baiti {3}.",
+        "plan_summary": "📋 Mpango wa {0}: maingizo mapya {1} katika faili {2}; hakuna kinachoandikwa.",
+        "plan_file": "  {0}: maingizo {1}, ~baiti {2}, {3} – {4}",
+        "plan_file_appended": "  {0} (ongeza): maingizo mapya {1}, ~baiti {2}, {3} – {4}",
+        "plan_projection": "⏱️ Muda unaokadiriwa: sekunde {0:.1f} (kupakia {1:.1f} + ubadilishaji {2:.1f}, ~maingizo {3:.0f}/s, kutoka sampuli ya maingizo {4})",
+        "warning_target_files_exceeded": "Onyo: Historia haitoshi katika faili {0} chini ya kikomo cha baiti {1}; inaandika faili {2} badala yake.",
+        "redaction_summary": "🛡️ Vipengee {0} vimefichwa (barua pepe: {1}, nambari za simu: {2}, funguo za API: {3}, maneno: {4}) katika MB {5:.2f} kwa MB {6:.1f}/s",
+        "snapshot_loaded": "⚡ Maingizo {0} yaliyochaguliwa yamepakiwa kutoka kwa picha {1}",
+        "snapshot_saved": "💾 Picha imehifadhiwa: {}",
+        "metrics_report_run": "{0}: sekunde {1:.2f}, ingizo MB {2:.1f}, maingizo {3} ya Gemini ({4} mapya), faili {5} zimeandikwa (MB {6:.2f}), RSS ya juu MB {7:.0f}",
+        "metrics_report_failed_run": "{0}: imeshindwa baada ya sekunde {1:.2f}",
+        "metrics_report_trend": "📈 Uendeshaji wa hivi karibuni dhidi ya wastani wa kati wa uendeshaji {0} uliopita: muda {1:+.0%}, kasi ya uchakataji {2:+.0%}, ukubwa wa ingizo {3:+.0%}, maingizo ya Gemini {4:+.0%}, RSS ya juu {5:+.0%}",
+        "metrics_report_empty": "Hakuna uendeshaji uliorekodiwa katika {}.",
+        "incremental_read": "⏩ Imesimama kwenye ingizo la mwisho lililochakatwa baada ya kusoma baiti {0} kati ya {1} (shughuli {2})",
+        "warning_entries_out_of_order": "Onyo: Maingizo hayako katika mpangilio wa wakati (mfuatano {0} unaopanda); inapanga maingizo {1} kwa muhuri wa wakati.",
+        "attachments_linked": "📎 Viambatisho {0} vimeunganishwa kama faili {1} zilizohifadhiwa katika {2}",
+        "warning_attachments_missing": "Onyo: Viambatisho {0} vilivyorejelewa havikupatikana katika {1}.",
+        "stats_written": "📊 Takwimu za matumizi zimeandikwa: {}",
+        "streamed_to_stdout": "Historia za gumzo zimetumwa kwa stdout kama: {}",
+        "error_stdout_output_unsupported": "Hitilafu: --output_file - haiwezi kuunganishwa na --store, --products, --batch au --attachments.",
+        "added_to_bundle": "Historia za gumzo zimeongezwa kwenye kifurushi kama: {}",
+        "bundle_written": "🗜️ Kifurushi kimeandikwa: {0} (faili {1})",
+        "error_bundle_unsupported": "Hitilafu: --bundle haiwezi kuunganishwa na --store, --batch, --attachments au --output_file -.",
+        "warning_html_budget_exceeded": "Onyo: Kubadilisha jibu la HTML la herufi {0} kulichukua zaidi ya sekunde {1:.1f}; lebo zitaondolewa tu.",
+        "preview_written": "🔍 Onyesho la awali limeandikwa: {0} (maingizo {1} kati ya {2} yamechukuliwa sampuli)",
+        "error_unknown_timezone": "Hitilafu: Ukanda wa saa usiojulikana: {}",
+        "error_timezone_store": "Hitilafu: --timezone haiwezi kuunganishwa na --store, ambayo huhifadhi vichwa vya Markdown jinsi vilivyotengenezwa.",
+        "error_store_option_unsupported": "Hitilafu: {0} haiwezi kutumika pamoja na --store.",
+        "warning_removed_stale_outputs": "Onyo: Faili {} za matokeo zenye nambari zilizopitwa na wakati zilizobaki kutoka mpangilio wa awali zimeondolewa.",
     },
     "ta": {
         "error_lang_detection": "சிஸ்டம் மொழியை கண்டறிதலில் பிழை: {}",
@@ -376,8 +1101,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "எச்சரிக்கை: last_entry_time.txt காலியாக உள்ளது.முழுமையான மறுஉருவாக்க பயன்முறைக்கு மாறுகிறது.",
         "warning_last_entry_time_invalid": "எச்சரிக்கை: last_entry_time.txt இல் தவறான நேரமுத்திரை ({!r}). முழுமையான மறுஉருவாக்க பயன்முறைக்கு மாறுகிறது.",
         "warning_last_entry_time_naive": "எச்சரிக்கை: last_entry_time.txt இல் உள்ள நேரமுத்திரையில் நேரமண்டல தகவல் இல்லை. UTC எனக் கருதப்படுகிறது.",
-        "warning_removed_existing_outputs": "எச்சரிக்கை: முழுமையான மறுஉருவாக்கத்திற்கு முன் ஏற்கனவே உள்ள நாடுகளில் உள்ள {} வெளியீட்டுக் கோப்புகள் நீக்கப்பட்டன.",
         "warning_failed_remove_output_file": "எச்சரிக்கை: வெளியீட்டுக் கோப்பை {} நீக்குவதில் தோல்வி: {}",
+        "warning_json_backend_unavailable": "எச்சரிக்கை: JSON பின்தளம் {} கிடைக்கவில்லை. நிலையான json தொகுதி பயன்படுத்தப்படுகிறது.",
+        "batch_job_summary": "{0}: {1} புதிய பதிவுகள், {2} கோப்பு(கள்), {3:.2f} வி ({4:.0f} பதிவுகள்/வி, {5:.2f} MB/வி)",
+        "batch_job_failed": "{0}: தோல்வி: {1}",
+        "batch_complete": "✅ தொகுப்பு முடிந்தது: {0} வெற்றி, {1} தோல்வி.",
+        "serve_listening": "🌐 மாற்றும் சேவை http://{0}:{1}/convert இல் கேட்கிறது (ஒரே நேரத்தில் அதிகபட்சம் {2} மாற்றங்கள்)",
+        "unchanged_output_file": "உள்ளடக்கம் மாறவில்லை, கோப்பு அப்படியே விடப்பட்டது: {}",
+        "changed_output_files": "மாறிய கோப்புகள் ({}):",
+        "product_entries": "📦 {0}: {1} பதிவுகள்",
+        "store_import": "🗄️ வரலாற்று சேமிப்பு: {0} புதிய பதிவுகள் சேமிக்கப்பட்டன (சரிபார்க்கப்பட்ட பதிவுகள்: {1}/{2})",
+        "resplit_no_outputs": "{} க்கான எண்ணிடப்பட்ட வெளியீட்டுக் கோப்புகள் எதுவும் இல்லை.",
+        "resplit_complete": "✅ மீண்டும் பிரிக்கப்பட்டது: {0} பதிவுகள், {1} கோப்பு(கள்) → {2} கோப்பு(கள்), வரம்பு {3} பைட்டுகள்.",
+        "plan_summary": "📋 {0} க்கான திட்டம்: {1} புதிய பதிவுகள், {2} கோப்பு(கள்); எதுவும் எழுதப்படாது.",
+        "plan_file": "  {0}: {1} பதிவுகள், ~{2} பைட்டுகள், {3} – {4}",
+        "plan_file_appended": "  {0} (சேர்ப்பு): {1} புதிய பதிவுகள், ~{2} பைட்டுகள், {3} – {4}",
+        "plan_projection": "⏱️ மதிப்பிடப்பட்ட நேரம்: {0:.1f} வி (ஏற்றுதல் {1:.1f} வி + மாற்றம் {2:.1f} வி, ~{3:.0f} பதிவுகள்/வி, {4} மாதிரிப் பதிவுகளிலிருந்து)",
+        "warning_target_files_exceeded": "எச்சரிக்கை: வரலாறு {0} கோப்பு(களில்) அடங்காது (வரம்பு {1} பைட்டுகள்); பதிலாக {2} கோப்புகள் எழுதப்படுகின்றன.",
+        "redaction_summary": "🛡️ {0} உருப்படிகள் மறைக்கப்பட்டன (மின்னஞ்சல்: {1}, தொலைபேசி எண்கள்: {2}, API விசைகள்: {3}, சொற்கள்: {4}) {5:.2f} MB இல், {6:.1f} MB/வி வேகத்தில்",
+        "snapshot_loaded": "⚡ ஸ்னாப்ஷாட்டிலிருந்து {0} தேர்ந்தெடுக்கப்பட்ட பதிவுகள் ஏற்றப்பட்டன: {1}",
+        "snapshot_saved": "💾 ஸ்னாப்ஷாட் சேமிக்கப்பட்டது: {}",
+        "metrics_report_run": "{0}: {1:.2f} வி, {2:.1f} MB உள்ளீடு, {3} Gemini பதிவுகள் ({4} புதியவை), {5} கோப்பு(கள்) எழுதப்பட்டன ({6:.2f} MB), உச்ச RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: {1:.2f} வி பிறகு தோல்வியடைந்தது",
+        "metrics_report_trend": "📈 சமீபத்திய இயக்கம் மற்றும் முந்தைய {0} இயக்கங்களின் இடைநிலை: கால அளவு {1:+.0%}, செயல்திறன் {2:+.0%}, உள்ளீட்டு அளவு {3:+.0%}, Gemini பதிவுகள் {4:+.0%}, உச்ச RSS {5:+.0%}",
+        "metrics_report_empty": "{} இல் எந்த இயக்கமும் பதிவு செய்யப்படவில்லை.",
+        "incremental_read": "⏩ கடைசியாக செயலாக்கப்பட்ட பதிவில் நிறுத்தப்பட்டது ({0} / {1} பைட்டுகள் படிக்கப்பட்டன, {2} செயல்பாடுகள்)",
+        "warning_entries_out_of_order": "எச்சரிக்கை: பதிவுகள் நேர வரிசையில் இல்லை ({0} ஏறுவரிசைப் பகுதிகள்); {1} பதிவுகள் நேர முத்திரைப்படி வரிசைப்படுத்தப்படுகின்றன.",
+        "attachments_linked": "📎 {0} இணைப்புகள் {1} சேமிக்கப்பட்ட கோப்புகளாக {2} இல் இணைக்கப்பட்டன",
+        "warning_attachments_missing": "எச்சரிக்கை: குறிப்பிடப்பட்ட {0} இணைப்புகள் {1} இல் கிடைக்கவில்லை.",
+        "stats_written": "📊 பயன்பாட்டுப் புள்ளிவிவரங்கள் எழுதப்பட்டன: {}",
+        "streamed_to_stdout": "அரட்டை வரலாறு stdout க்கு அனுப்பப்பட்டது, பெயர்: {}",
+        "error_stdout_output_unsupported": "பிழை: --output_file - ஐ --store, --products, --batch அல்லது --attachments உடன் பயன்படுத்த முடியாது.",
+        "added_to_bundle": "அரட்டை வரலாறு தொகுப்பில் சேர்க்கப்பட்டது, பெயர்: {}",
+        "bundle_written": "🗜️ தொகுப்பு எழுதப்பட்டது: {0} ({1} கோப்புகள்)",
+        "error_bundle_unsupported": "பிழை: --bundle ஐ --store, --batch, --attachments அல்லது --output_file - உடன் பயன்படுத்த முடியாது.",
+        "warning_html_budget_exceeded": "எச்சரிக்கை: HTML பதிலை (எழுத்துகள்: {0}) மாற்ற {1:.1f} வி க்கு மேல் ஆனது; குறிச்சொற்கள் மட்டும் நீக்கப்படும்.",
+        "preview_written": "🔍 முன்னோட்டம் எழுதப்பட்டது: {0} ({1} / {2} பதிவுகள் மாதிரி)",
+        "error_unknown_timezone": "பிழை: அறியப்படாத நேர மண்டலம்: {}",
+        "error_timezone_store": "பிழை: --timezone ஐ --store உடன் பயன்படுத்த முடியாது, ஏனெனில் சேமிப்பகம் Markdown தலைப்புகளை உருவாக்கப்பட்டபடியே வைத்திருக்கும்.",
+        "error_store_option_unsupported": "பிழை: {0} ஐ --store உடன் பயன்படுத்த முடியாது.",
+        "warning_removed_stale_outputs": "எச்சரிக்கை: முந்தைய பிரிப்பிலிருந்து மீதமிருந்த {} பழைய எண்ணிடப்பட்ட வெளியீட்டு கோப்புகள் நீக்கப்பட்டன.",
     },
     "te": {
         "error_lang_detection": "సిస్టమ్ భాషను గుర్తించడంలో లోపం: {}",
@@ -393,8 +1156,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "హెచ్చరిక: last_entry_time.txt ఖాళీగా ఉంది. పూర్తి పునరుత్పత్తి (full regeneration) మోడ్‌కు మారుతోంది.",
         "warning_last_entry_time_invalid": "హెచ్చరిక: last_entry_time.txt లో చెల్లని టైమ్‌స్టాంప్ ({!r}) ఉంది. పూర్తి పునరుత్పత్తి మోడ్‌కు మారుతోంది.",
         "warning_last_entry_time_naive": "హెచ్చరిక: last_entry_time.txt లోని టైమ్‌స్టాంప్‌కు టైమ్‌జోన్ సమాచారం లేదు. UTC గా భావించబడుతుంది.",
-        "warning_removed_existing_outputs": "హెచ్చరిక: పూర్తి పుനరుత్పత్తికి ముందు ఇప్పటికే ఉన్న {} అవుట్‌పుట్ ఫైల్‌లు తీసివేయబడ్డాయి.",
         "warning_failed_remove_output_file": "హెచ్చరిక: అవుట్‌పుట్ ఫైల్ {}ని తీసివేయడంలో విఫలమైంది: {}",
+        "warning_json_backend_unavailable": "హెచ్చరిక: JSON బ్యాకెండ్ {} అందుబాటులో లేదు. ప్రామాణిక json మాడ్యూల్‌ను ఉపయోగిస్తోంది.",
+        "batch_job_summary": "{0}: {1} కొత్త ఎంట్రీలు, {2} ఫైల్(లు), {3:.2f} సె ({4:.0f} ఎంట్రీలు/సె, {5:.2f} MB/సె)",
+        "batch_job_failed": "{0}: విఫలమైంది: {1}",
+        "batch_complete": "✅ బ్యాచ్ పూర్తయింది: {0} విజయవంతం, {1} విఫలం.",
+        "serve_listening": "🌐 మార్పిడి సేవ http://{0}:{1}/convert వద్ద వింటోంది (ఒకేసారి గరిష్టంగా {2} మార్పిడులు)",
+        "unchanged_output_file": "కంటెంట్ మారలేదు, ఫైల్‌ను అలాగే ఉంచారు: {}",
+        "changed_output_files": "మారిన ఫైళ్లు ({}):",
+        "product_entries": "📦 {0}: {1} ఎంట్రీలు",
+        "store_import": "🗄️ చరిత్ర నిల్వ: {0} కొత్త ఎంట్రీలు నిల్వ చేయబడ్డాయి (తనిఖీ చేసిన ఎంట్రీలు: {1}/{2})",
+        "resplit_no_outputs": "{} కోసం సంఖ్యలు ఉన్న అవుట్‌పుట్ ఫైల్‌లు ఏవీ కనుగొనబడలేదు.",
+        "resplit_complete": "✅ మళ్లీ విభజించబడింది: {0} ఎంట్రీలు, {1} ఫైల్(లు) → {2} ఫైల్(లు), పరిమితి {3} బైట్లు.",
+        "plan_summary": "📋 {0} కోసం ప్రణాళిక: {1} కొత్త ఎంట్రీలు, {2} ఫైల్(లు); ఏదీ రాయబడదు.",
+        "plan_file": "  {0}: {1} ఎంట్రీలు, ~{2} బైట్లు, {3} – {4}",
+        "plan_file_appended": "  {0} (జోడింపు): {1} కొత్త ఎంట్రీలు, ~{2} బైట్లు, {3} – {4}",
+        "plan_projection": "⏱️ అంచనా సమయం: {0:.1f} సె (లోడ్ {1:.1f} సె + మార్పిడి {2:.1f} సె, ~{3:.0f} ఎంట్రీలు/సె, {4} నమూనా ఎంట్రీల నుండి)",
+        "warning_target_files_exceeded": "హెచ్చరిక: చరిత్ర {0} ఫైల్(ల)లో సరిపోదు (పరిమితి {1} బైట్లు); బదులుగా {2} ఫైళ్లు రాయబడుతున్నాయి.",
+        "redaction_summary": "🛡️ {0} అంశాలు దాచబడ్డాయి (ఇమెయిల్‌లు: {1}, ఫోన్ నంబర్లు: {2}, API కీలు: {3}, పదాలు: {4}) {5:.2f} MB లో, {6:.1f} MB/సె వేగంతో",
+        "snapshot_loaded": "⚡ స్నాప్‌షాట్ నుండి {0} ఎంచుకున్న ఎంట్రీలు లోడ్ అయ్యాయి: {1}",
+        "snapshot_saved": "💾 స్నాప్‌షాట్ సేవ్ చేయబడింది: {}",
+        "metrics_report_run": "{0}: {1:.2f} సె, {2:.1f} MB ఇన్‌పుట్, {3} Gemini ఎంట్రీలు ({4} కొత్తవి), {5} ఫైల్(లు) వ్రాయబడ్డాయి ({6:.2f} MB), గరిష్ఠ RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: {1:.2f} సె తర్వాత విఫలమైంది",
+        "metrics_report_trend": "📈 తాజా రన్ వర్సెస్ మునుపటి {0} రన్‌ల మధ్యగతం: వ్యవధి {1:+.0%}, త్రూపుట్ {2:+.0%}, ఇన్‌పుట్ పరిమాణం {3:+.0%}, Gemini ఎంట్రీలు {4:+.0%}, గరిష్ఠ RSS {5:+.0%}",
+        "metrics_report_empty": "{} లో ఎలాంటి రన్‌లు నమోదు కాలేదు.",
+        "incremental_read": "⏩ చివరిగా ప్రాసెస్ చేసిన ఎంట్రీ వద్ద ఆగింది ({0} / {1} బైట్‌లు చదవబడ్డాయి, {2} కార్యకలాపాలు)",
+        "warning_entries_out_of_order": "హెచ్చరిక: ఎంట్రీలు సమయ క్రమంలో లేవు ({0} ఆరోహణ భాగాలు); {1} ఎంట్రీలను టైమ్‌స్టాంప్ ప్రకారం క్రమబద్ధీకరిస్తోంది.",
+        "attachments_linked": "📎 {0} అటాచ్‌మెంట్‌లు {1} నిల్వ ఫైల్(లు)గా {2} లో లింక్ చేయబడ్డాయి",
+        "warning_attachments_missing": "హెచ్చరిక: సూచించిన {0} అటాచ్‌మెంట్‌లు {1} లో కనుగొనబడలేదు.",
+        "stats_written": "📊 వినియోగ గణాంకాలు వ్రాయబడ్డాయి: {}",
+        "streamed_to_stdout": "చాట్ చరిత్ర stdout కు పంపబడింది, పేరు: {}",
+        "error_stdout_output_unsupported": "లోపం: --output_file - ను --store, --products, --batch లేదా --attachments తో కలపలేరు.",
+        "added_to_bundle": "చాట్ చరిత్ర బండిల్‌కు జోడించబడింది, పేరు: {}",
+        "bundle_written": "🗜️ బండిల్ వ్రాయబడింది: {0} ({1} ఫైళ్లు)",
+        "error_bundle_unsupported": "లోపం: --bundle ను --store, --batch, --attachments లేదా --output_file - తో కలపలేరు.",
+        "warning_html_budget_exceeded": "హెచ్చరిక: HTML ప్రతిస్పందన (అక్షరాలు: {0}) మార్చడానికి {1:.1f} సె కంటే ఎక్కువ పట్టింది; ట్యాగ్‌లు మాత్రమే తొలగించబడతాయి.",
+        "preview_written": "🔍 ప్రివ్యూ వ్రాయబడింది: {0} ({1} / {2} ఎంట్రీల నమూనా)",
+        "error_unknown_timezone": "లోపం: తెలియని సమయ మండలం: {}",
+        "error_timezone_store": "లోపం: --timezone ను --store తో కలపలేరు, ఎందుకంటే స్టోర్ Markdown శీర్షికలను రూపొందించినట్లే ఉంచుతుంది.",
+        "error_store_option_unsupported": "లోపం: {0} ను --store తో కలిపి ఉపయోగించలేరు.",
+        "warning_removed_stale_outputs": "హెచ్చరిక: మునుపటి విభజన నుండి మిగిలిన {} పాత సంఖ్యల అవుట్‌పుట్ ఫైల్‌లు తొలగించబడ్డాయి.",
     },
     "th": {
         "error_lang_detection": "เกิดข้อผิดพลาดขณะตรวจจับภาษาระบบ: {}",
@@ -410,8 +1211,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "คำเตือน: ไฟล์ last_entry_time.txt ว่างเปล่า กำลังเปลี่ยนเป็นโหมดสร้างใหม่ทั้งหมด",
         "warning_last_entry_time_invalid": "คำเตือน: การประทับเวลาใน last_entry_time.txt ไม่ถูกต้อง ({!r}) กำลังเปลี่ยนเป็นโหมดสร้างใหม่ทั้งหมด",
         "warning_last_entry_time_naive": "คำเตือน: การประทับเวลาใน last_entry_time.txt ไม่มีข้อมูลเขตเวลา จะถือว่าเป็นเวลา UTC",
-        "warning_removed_existing_outputs": "คำเตือน: ลบไฟล์เอาต์พุตที่มีอยู่เดิมจำนวน {} ไฟล์ ก่อนเริ่มการสร้างใหม่ทั้งหมด",
         "warning_failed_remove_output_file": "คำเตือน: ไม่สามารถลบไฟล์เอาต์พุตได้ {}: {}",
+        "warning_json_backend_unavailable": "คำเตือน: ไม่มีแบ็กเอนด์ JSON {} จะใช้โมดูล json มาตรฐานแทน",
+        "batch_job_summary": "{0}: รายการใหม่ {1} รายการ, {2} ไฟล์, {3:.2f} วินาที ({4:.0f} รายการ/วินาที, {5:.2f} MB/วินาที)",
+        "batch_job_failed": "{0}: ล้มเหลว: {1}",
+        "batch_complete": "✅ ประมวลผลชุดเสร็จสิ้น: สำเร็จ {0} รายการ ล้มเหลว {1} รายการ",
+        "serve_listening": "🌐 บริการแปลงไฟล์กำลังรอรับที่ http://{0}:{1}/convert (แปลงพร้อมกันได้สูงสุด {2} งาน)",
+        "unchanged_output_file": "เนื้อหาไม่เปลี่ยนแปลง คงไฟล์ไว้ตามเดิม: {}",
+        "changed_output_files": "ไฟล์ที่เปลี่ยนแปลง ({} ไฟล์):",
+        "product_entries": "📦 {0}: {1} รายการ",
+        "store_import": "🗄️ คลังประวัติ: บันทึกรายการใหม่ {0} รายการ (ตรวจสอบ {1} จาก {2} รายการ)",
+        "resplit_no_outputs": "ไม่พบไฟล์เอาต์พุตที่มีหมายเลขสำหรับ {}",
+        "resplit_complete": "✅ แบ่งใหม่ {0} รายการจาก {1} ไฟล์เป็น {2} ไฟล์ โดยจำกัด {3} ไบต์",
+        "plan_summary": "📋 แผนสำหรับ {0}: รายการใหม่ {1} รายการใน {2} ไฟล์ โดยไม่มีการเขียนไฟล์ใด ๆ",
+        "plan_file": "  {0}: {1} รายการ, ~{2} ไบต์, {3} – {4}",
+        "plan_file_appended": "  {0} (ต่อท้าย): รายการใหม่ {1} รายการ, ~{2} ไบต์, {3} – {4}",
+        "plan_projection": "⏱️ เวลาโดยประมาณ: {0:.1f} วินาที (โหลด {1:.1f} วินาที + แปลง {2:.1f} วินาที, ~{3:.0f} รายการ/วินาที จากตัวอย่าง {4} รายการ)",
+        "warning_target_files_exceeded": "คำเตือน: ประวัติไม่สามารถใส่ใน {0} ไฟล์ภายใต้ขีดจำกัด {1} ไบต์ได้ จะเขียนเป็น {2} ไฟล์แทน",
+        "redaction_summary": "🛡️ ปกปิด {0} รายการ (อีเมล: {1}, หมายเลขโทรศัพท์: {2}, คีย์ API: {3}, คำ: {4}) ใน {5:.2f} MB ที่ {6:.1f} MB/วินาที",
+        "snapshot_loaded": "⚡ โหลดรายการที่เลือก {0} รายการจากสแนปช็อต {1}",
+        "snapshot_saved": "💾 บันทึกสแนปช็อตแล้ว: {}",
+        "metrics_report_run": "{0}: {1:.2f} วินาที, อินพุต {2:.1f} MB, รายการ Gemini {3} รายการ (ใหม่ {4}), เขียน {5} ไฟล์ ({6:.2f} MB), RSS สูงสุด {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: ล้มเหลวหลังจาก {1:.2f} วินาที",
+        "metrics_report_trend": "📈 การรันล่าสุดเทียบกับมัธยฐานของ {0} การรันก่อนหน้า: ระยะเวลา {1:+.0%}, ปริมาณงาน {2:+.0%}, ขนาดอินพุต {3:+.0%}, รายการ Gemini {4:+.0%}, RSS สูงสุด {5:+.0%}",
+        "metrics_report_empty": "ไม่มีการรันที่บันทึกไว้ใน {}",
+        "incremental_read": "⏩ หยุดที่รายการที่ประมวลผลล่าสุดหลังจากอ่าน {0} จาก {1} ไบต์ ({2} กิจกรรม)",
+        "warning_entries_out_of_order": "คำเตือน: รายการไม่ได้เรียงตามเวลา ({0} ช่วงที่เรียงจากน้อยไปมาก); กำลังเรียง {1} รายการตามเวลา",
+        "attachments_linked": "📎 ลิงก์ไฟล์แนบ {0} รายการเป็นไฟล์ที่จัดเก็บ {1} ไฟล์ใน {2}",
+        "warning_attachments_missing": "คำเตือน: ไม่พบไฟล์แนบที่อ้างถึง {0} รายการใน {1}",
+        "stats_written": "📊 เขียนสถิติการใช้งานแล้ว: {}",
+        "streamed_to_stdout": "ส่งประวัติแชทไปยังเอาต์พุตมาตรฐานในชื่อ: {}",
+        "error_stdout_output_unsupported": "ข้อผิดพลาด: ไม่สามารถใช้ --output_file - ร่วมกับ --store, --products, --batch หรือ --attachments ได้",
+        "added_to_bundle": "เพิ่มประวัติแชทลงในชุดไฟล์ในชื่อ: {}",
+        "bundle_written": "🗜️ เขียนชุดไฟล์แล้ว: {0} ({1} ไฟล์)",
+        "error_bundle_unsupported": "ข้อผิดพลาด: ไม่สามารถใช้ --bundle ร่วมกับ --store, --batch, --attachments หรือ --output_file - ได้",
+        "warning_html_budget_exceeded": "คำเตือน: การแปลงคำตอบ HTML ขนาด {0} อักขระใช้เวลานานกว่า {1:.1f} วินาที จะลบแท็กออกเท่านั้น",
+        "preview_written": "🔍 เขียนตัวอย่างแล้ว: {0} (สุ่ม {1} จาก {2} รายการ)",
+        "error_unknown_timezone": "ข้อผิดพลาด: ไม่รู้จักเขตเวลา: {}",
+        "error_timezone_store": "ข้อผิดพลาด: ไม่สามารถใช้ --timezone ร่วมกับ --store ได้ เนื่องจากที่เก็บจะเก็บหัวข้อ Markdown ตามที่สร้างไว้",
+        "error_store_option_unsupported": "ข้อผิดพลาด: ไม่สามารถใช้ {0} ร่วมกับ --store ได้",
+        "warning_removed_stale_outputs": "คำเตือน: ลบไฟล์เอาต์พุตแบบมีหมายเลขที่ค้างจากการแบ่งไฟล์ครั้งก่อนจำนวน {} ไฟล์แล้ว",
     },
     "tr": {
         "error_lang_detection": "Sistem dili algılanırken hata oluştu: {}",
@@ -427,8 +1266,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Uyarı: last_entry_time.txt boş. Tam adımlı yeniden oluşturma moduna geçiliyor.",
         "warning_last_entry_time_invalid": "Uyarı: last_entry_time.txt dosyasındaki zaman damgası geçersiz ({!r}). Tam adımlı yeniden oluşturma moduna geçiliyor.",
         "warning_last_entry_time_naive": "Uyarı: last_entry_time.txt dosyasındaki zaman damgası saat dilimi bilgisi içermiyor. UTC olduğu varsayılıyor.",
-        "warning_removed_existing_outputs": "Uyarı: Tam adımlı yeniden oluşturma öncesinde mevcut {} çıktı dosyası silindi.",
         "warning_failed_remove_output_file": "Uyarı: {} çıktı dosyası silinemedi: {}",
+        "warning_json_backend_unavailable": "Uyarı: JSON arka ucu {} kullanılamıyor. Standart json modülüne geri dönülüyor.",
+        "batch_job_summary": "{0}: {1} yeni kayıt, {2} dosya, {3:.2f} sn ({4:.0f} kayıt/sn, {5:.2f} MB/sn)",
+        "batch_job_failed": "{0}: başarısız: {1}",
+        "batch_complete": "✅ Toplu işlem tamamlandı: {0} başarılı, {1} başarısız.",
+        "serve_listening": "🌐 Dönüştürme hizmeti http://{0}:{1}/convert adresinde dinliyor (en fazla {2} eşzamanlı dönüştürme)",
+        "unchanged_output_file": "İçerik değişmedi, dosyaya dokunulmadı: {}",
+        "changed_output_files": "Değişen dosyalar ({}):",
+        "product_entries": "📦 {0}: {1} kayıt",
+        "store_import": "🗄️ Geçmiş deposu: {0} yeni kayıt saklandı (kontrol edilen kayıt: {1}/{2})",
+        "resplit_no_outputs": "{} için numaralı çıktı dosyası bulunamadı.",
+        "resplit_complete": "✅ Yeniden bölündü: {0} kayıt, {1} dosya → {2} dosya ({3} bayt sınırı).",
+        "plan_summary": "📋 {0} için plan: {1} yeni kayıt, {2} dosya; hiçbir şey yazılmaz.",
+        "plan_file": "  {0}: {1} kayıt, ~{2} bayt, {3} – {4}",
+        "plan_file_appended": "  {0} (ekleme): {1} yeni kayıt, ~{2} bayt, {3} – {4}",
+        "plan_projection": "⏱️ Tahmini süre: {0:.1f} sn (yükleme {1:.1f} sn + dönüştürme {2:.1f} sn, ~{3:.0f} kayıt/sn, {4} örnek kayda göre)",
+        "warning_target_files_exceeded": "Uyarı: Geçmiş {0} dosyaya {1} bayt sınırı altında sığmıyor; bunun yerine {2} dosya yazılıyor.",
+        "redaction_summary": "🛡️ {0} öğe gizlendi (e-posta: {1}, telefon numarası: {2}, API anahtarı: {3}, terim: {4}) {5:.2f} MB içinde, {6:.1f} MB/sn hızla",
+        "snapshot_loaded": "⚡ Seçili {0} kayıt anlık görüntüden yüklendi: {1}",
+        "snapshot_saved": "💾 Anlık görüntü kaydedildi: {}",
+        "metrics_report_run": "{0}: {1:.2f} sn, {2:.1f} MB girdi, {3} Gemini girdisi ({4} yeni), {5} dosya yazıldı ({6:.2f} MB), en yüksek RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: {1:.2f} sn sonra başarısız oldu",
+        "metrics_report_trend": "📈 Son çalıştırma ile önceki {0} çalıştırmanın medyanı: süre {1:+.0%}, verim {2:+.0%}, girdi boyutu {3:+.0%}, Gemini girdileri {4:+.0%}, en yüksek RSS {5:+.0%}",
+        "metrics_report_empty": "{} içinde kayıtlı çalıştırma yok.",
+        "incremental_read": "⏩ {0} / {1} bayt okunduktan sonra son işlenen girdide durdu ({2} etkinlik)",
+        "warning_entries_out_of_order": "Uyarı: Girdiler zaman sırasında değil ({0} artan dizi); {1} girdi zaman damgasına göre sıralanıyor.",
+        "attachments_linked": "📎 {0} ek, {1} depolanan dosya olarak {2} içine bağlandı",
+        "warning_attachments_missing": "Uyarı: Başvurulan {0} ek {1} içinde bulunamadı.",
+        "stats_written": "📊 Kullanım istatistikleri yazıldı: {}",
+        "streamed_to_stdout": "Sohbet geçmişi standart çıktıya şu adla aktarıldı: {}",
+        "error_stdout_output_unsupported": "Hata: --output_file - ile --store, --products, --batch veya --attachments birlikte kullanılamaz.",
+        "added_to_bundle": "Sohbet geçmişi pakete şu adla eklendi: {}",
+        "bundle_written": "🗜️ Paket yazıldı: {0} ({1} dosya)",
+        "error_bundle_unsupported": "Hata: --bundle ile --store, --batch, --attachments veya --output_file - birlikte kullanılamaz.",
+        "warning_html_budget_exceeded": "Uyarı: {0} karakterlik bir HTML yanıtının dönüştürülmesi {1:.1f} sn'den uzun sürdü; yalnızca etiketler kaldırılacak.",
+        "preview_written": "🔍 Önizleme yazıldı: {0} ({1} / {2} kayıt örneklendi)",
+        "error_unknown_timezone": "Hata: Bilinmeyen saat dilimi: {}",
+        "error_timezone_store": "Hata: --timezone ile --store birlikte kullanılamaz; depo Markdown başlıklarını oluşturuldukları gibi saklar.",
+        "error_store_option_unsupported": "Hata: {0}, --store ile birlikte kullanılamaz.",
+        "warning_removed_stale_outputs": "Uyarı: Önceki bölümlemeden kalan {} eski numaralı çıktı dosyası silindi.",
     },
     "uk": {
         "error_lang_detection": "Помилка під час визначення мови системи: {}",
@@ -444,8 +1321,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Попередження: Файл last_entry_time.txt порожній. Переключення в режим повної регенерации.",
         "warning_last_entry_time_invalid": "Попередження: Некоректная мітка часу в last_entry_time.txt ({!r}). Переключення в режим повної регенерації.",
         "warning_last_entry_time_naive": "Попередження: Мітка часу в last_entry_time.txt не містить інформації про часовий пояс. Припускається UTC.",
-        "warning_removed_existing_outputs": "Попередження: Видалено {} існуючих вихідних файлів перед повною регенерацією.",
         "warning_failed_remove_output_file": "Попередження: Не вдалося видалити вихідний файл {}: {}",
+        "warning_json_backend_unavailable": "Попередження: бекенд JSON {} недоступний. Використовується стандартний модуль json.",
+        "batch_job_summary": "{0}: нових записів: {1}, файлів: {2}, {3:.2f} с ({4:.0f} записів/с, {5:.2f} МБ/с)",
+        "batch_job_failed": "{0}: помилка: {1}",
+        "batch_complete": "✅ Пакет завершено: успішно {0}, з помилкою {1}.",
+        "serve_listening": "🌐 Служба конвертації слухає http://{0}:{1}/convert (не більше {2} одночасних конвертацій)",
+        "unchanged_output_file": "Вміст не змінився, файл залишено без змін: {}",
+        "changed_output_files": "Змінені файли ({}):",
+        "product_entries": "📦 {0}: записів: {1}",
+        "store_import": "🗄️ Сховище історії: збережено нових записів: {0} (перевірено {1} з {2})",
+        "resplit_no_outputs": "Не знайдено пронумерованих вихідних файлів для {}.",
+        "resplit_complete": "✅ Повторно розділено: записів {0}, файлів {1} → файлів {2} (ліміт {3} байт).",
+        "plan_summary": "📋 План для {0}: нових записів {1}, файлів {2}; нічого не записується.",
+        "plan_file": "  {0}: записів {1}, ~{2} байт, {3} – {4}",
+        "plan_file_appended": "  {0} (доповнення): нових записів {1}, ~{2} байт, {3} – {4}",
+        "plan_projection": "⏱️ Оцінка часу: {0:.1f} с (завантаження {1:.1f} с + перетворення {2:.1f} с, ~{3:.0f} записів/с, за вибіркою з {4} записів)",
+        "warning_target_files_exceeded": "Попередження: Історія не вміщується у {0} файл(ів) при ліміті {1} байт; буде записано файлів: {2}.",
+        "redaction_summary": "🛡️ Приховано елементів: {0} (email: {1}, телефони: {2}, ключі API: {3}, терміни: {4}) у {5:.2f} МБ зі швидкістю {6:.1f} МБ/с",
+        "snapshot_loaded": "⚡ Завантажено вибраних записів: {0} зі знімка {1}",
+        "snapshot_saved": "💾 Знімок збережено: {}",
+        "metrics_report_run": "{0}: {1:.2f} с, вхід {2:.1f} МБ, записів Gemini: {3} (нових: {4}), записано файлів: {5} ({6:.2f} МБ), піковий RSS {7:.0f} МБ",
+        "metrics_report_failed_run": "{0}: помилка через {1:.2f} с",
+        "metrics_report_trend": "📈 Останній запуск порівняно з медіаною {0} попередніх: тривалість {1:+.0%}, пропускна здатність {2:+.0%}, розмір входу {3:+.0%}, записи Gemini {4:+.0%}, піковий RSS {5:+.0%}",
+        "metrics_report_empty": "У {} немає записаних запусків.",
+        "incremental_read": "⏩ Читання зупинено на останньому обробленому записі: прочитано {0} з {1} байт ({2} дій)",
+        "warning_entries_out_of_order": "Попередження: записи розташовані не за часом (зростаючих ділянок: {0}); сортування записів ({1}) за міткою часу.",
+        "attachments_linked": "📎 Пов'язано вкладень: {0}, збережено файлів: {1}, каталог {2}",
+        "warning_attachments_missing": "Попередження: не знайдено вказаних вкладень: {0} у {1}.",
+        "stats_written": "📊 Статистику використання записано: {}",
+        "streamed_to_stdout": "Історію чатів передано у стандартний вивід як: {}",
+        "error_stdout_output_unsupported": "Помилка: --output_file - не можна поєднувати з --store, --products, --batch або --attachments.",
+        "added_to_bundle": "Історію чатів додано до архіву як: {}",
+        "bundle_written": "🗜️ Архів записано: {0} (файлів: {1})",
+        "error_bundle_unsupported": "Помилка: --bundle не можна поєднувати з --store, --batch, --attachments або --output_file -.",
+        "warning_html_budget_exceeded": "Попередження: Перетворення HTML-відповіді з {0} символів тривало понад {1:.1f} с; буде лише видалено теги.",
+        "preview_written": "🔍 Попередній перегляд записано: {0} (вибірка {1} з {2} записів)",
+        "error_unknown_timezone": "Помилка: Невідомий часовий пояс: {}",
+        "error_timezone_store": "Помилка: --timezone не можна поєднувати з --store, який зберігає заголовки Markdown у тому вигляді, в якому їх створено.",
+        "error_store_option_unsupported": "Помилка: {0} не можна поєднувати з --store.",
+        "warning_removed_stale_outputs": "Попередження: Видалено застарілих нумерованих вихідних файлів, що лишилися від попереднього розбиття: {}.",
     },
     "ur": {
         "error_lang_detection": "سسٹم زبان کا پتہ لگانے में خرابی: {}",
@@ -461,8 +1376,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "انتباہ: last_entry_time.txt خالی ہے۔ مکمل بحالی (full regeneration) کے موڈ پر منتقل کیا جا رہا ہے۔",
         "warning_last_entry_time_invalid": "انتباہ: last_entry_time.txt میں غلط ٹائم اسٹیمپ ہے ({!r})۔ مکمل بحالی کے موڈ پر منتقل کیا جا رہا ہے۔",
         "warning_last_entry_time_naive": "انتباہ: last_entry_time.txt میں ٹائم زون کے بغیر ٹائم اسٹیمپ ہے۔ اسے UTC فرض کیا جا رہا ہے۔",
-        "warning_removed_existing_outputs": "انتباہ: مکمل بحالی سے پہلے موصوفہ {} آؤٹ پٹ فائلیں ہٹا دی گئی ہے۔",
         "warning_failed_remove_output_file": "انتباہ: آؤٹ پٹ فائل {} کو ہٹانے میں ناکامی ہوئی: {}",
+        "warning_json_backend_unavailable": "انتباہ: JSON بیک اینڈ {} دستیاب نہیں ہے۔ معیاری json ماڈیول استعمال کیا جا رہا ہے۔",
+        "batch_job_summary": "{0}: {1} نئے اندراجات، {2} فائل(یں)، {3:.2f} سیکنڈ ({4:.0f} اندراجات/سیکنڈ، {5:.2f} MB/سیکنڈ)",
+        "batch_job_failed": "{0}: ناکام: {1}",
+        "batch_complete": "✅ بیچ مکمل: {0} کامیاب، {1} ناکام۔",
+        "serve_listening": "🌐 تبدیلی کی سروس http://{0}:{1}/convert پر سن رہی ہے (بیک وقت زیادہ سے زیادہ {2} تبدیلیاں)",
+        "unchanged_output_file": "مواد تبدیل نہیں ہوا، فائل جیسی تھی ویسی چھوڑ دی گئی: {}",
+        "changed_output_files": "تبدیل ہونے والی فائلیں ({}):",
+        "product_entries": "📦 {0}: {1} اندراجات",
+        "store_import": "🗄️ تاریخ اسٹور: {0} نئے اندراجات محفوظ کیے گئے (جانچے گئے اندراجات: {1}/{2})",
+        "resplit_no_outputs": "{} کے لیے کوئی نمبر شدہ آؤٹ پٹ فائلیں نہیں ملیں۔",
+        "resplit_complete": "✅ دوبارہ تقسیم: {0} اندراجات، {1} فائل(وں) سے {2} فائل(وں) میں، حد {3} بائٹس۔",
+        "plan_summary": "📋 {0} کا منصوبہ: {1} نئے اندراجات، {2} فائل(وں) میں؛ کچھ بھی نہیں لکھا جاتا۔",
+        "plan_file": "  {0}: {1} اندراجات، ~{2} بائٹس، {3} – {4}",
+        "plan_file_appended": "  {0} (اضافہ): {1} نئے اندراجات، ~{2} بائٹس، {3} – {4}",
+        "plan_projection": "⏱️ متوقع وقت: {0:.1f} سیکنڈ (لوڈ {1:.1f} سیکنڈ + تبدیلی {2:.1f} سیکنڈ، ~{3:.0f} اندراجات/سیکنڈ، {4} نمونہ اندراجات سے)",
+        "warning_target_files_exceeded": "انتباہ: تاریخ {0} فائل(وں) میں نہیں سماتی (حد {1} بائٹس)؛ اس کے بجائے {2} فائلیں لکھی جا رہی ہیں۔",
+        "redaction_summary": "🛡️ {0} آئٹمز چھپائے گئے (ای میل: {1}، فون نمبر: {2}، API کلیدیں: {3}، الفاظ: {4}) {5:.2f} MB میں، {6:.1f} MB/سیکنڈ کی رفتار سے",
+        "snapshot_loaded": "⚡ اسنیپ شاٹ سے {0} منتخب اندراجات لوڈ کیے گئے: {1}",
+        "snapshot_saved": "💾 اسنیپ شاٹ محفوظ ہو گیا: {}",
+        "metrics_report_run": "{0}: {1:.2f} سیکنڈ، {2:.1f} MB ان پٹ، {3} Gemini اندراجات ({4} نئے)، {5} فائل(یں) لکھی گئیں ({6:.2f} MB)، زیادہ سے زیادہ RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: {1:.2f} سیکنڈ کے بعد ناکام",
+        "metrics_report_trend": "📈 تازہ ترین رن بمقابلہ پچھلے {0} رنز کا وسطانیہ: دورانیہ {1:+.0%}، تھرو پٹ {2:+.0%}، ان پٹ سائز {3:+.0%}، Gemini اندراجات {4:+.0%}، زیادہ سے زیادہ RSS {5:+.0%}",
+        "metrics_report_empty": "{} میں کوئی رن ریکارڈ نہیں ہے۔",
+        "incremental_read": "⏩ آخری پروسیس شدہ اندراج پر رک گیا ({0} / {1} بائٹس پڑھے گئے، {2} سرگرمیاں)",
+        "warning_entries_out_of_order": "انتباہ: اندراجات وقت کی ترتیب میں نہیں ہیں ({0} صعودی حصے)؛ {1} اندراجات کو ٹائم اسٹیمپ کے مطابق ترتیب دیا جا رہا ہے۔",
+        "attachments_linked": "📎 {0} منسلکات کو {1} محفوظ فائل(وں) کے طور پر {2} میں لنک کیا گیا",
+        "warning_attachments_missing": "انتباہ: حوالہ دیے گئے {0} منسلکات {1} میں نہیں ملے۔",
+        "stats_written": "📊 استعمال کے اعداد و شمار لکھے گئے: {}",
+        "streamed_to_stdout": "چیٹ کی تاریخ stdout پر بھیجی گئی، نام: {}",
+        "error_stdout_output_unsupported": "خرابی: --output_file - کو --store، --products، --batch یا --attachments کے ساتھ استعمال نہیں کیا جا سکتا۔",
+        "added_to_bundle": "چیٹ کی تاریخ بنڈل میں شامل کی گئی، نام: {}",
+        "bundle_written": "🗜️ بنڈل لکھا گیا: {0} ({1} فائلیں)",
+        "error_bundle_unsupported": "خرابی: --bundle کو --store، --batch، --attachments یا --output_file - کے ساتھ استعمال نہیں کیا جا سکتا۔",
+        "warning_html_budget_exceeded": "انتباہ: HTML جواب (حروف: {0}) کو تبدیل کرنے میں {1:.1f} سیکنڈ سے زیادہ لگے؛ صرف ٹیگ ہٹائے جائیں گے۔",
+        "preview_written": "🔍 پیش نظارہ لکھا گیا: {0} ({1} / {2} اندراجات کا نمونہ)",
+        "error_unknown_timezone": "خرابی: نامعلوم ٹائم زون: {}",
+        "error_timezone_store": "خرابی: --timezone کو --store کے ساتھ استعمال نہیں کیا جا سکتا، کیونکہ اسٹور Markdown سرخیاں ویسے ہی رکھتا ہے جیسے وہ بنائی گئی تھیں۔",
+        "error_store_option_unsupported": "خرابی: {0} کو --store کے ساتھ استعمال نہیں کیا جا سکتا۔",
+        "warning_removed_stale_outputs": "انتباہ: پچھلی تقسیم سے بچ جانے والی {} پرانی نمبر والی آؤٹ پٹ فائلیں ہٹا دی گئیں۔",
     },
     "vi": {
         "error_lang_detection": "Lỗi khi phát hiện ngôn ngữ hệ thống: {}",
@@ -478,8 +1431,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "Cảnh báo: last_entry_time.txt trống. Chuyển sang chế độ tái tạo toàn bộ.",
         "warning_last_entry_time_invalid": "Cảnh báo: Dấu thời gian không hợp lệ trong last_entry_time.txt ({!r}). Chuyển sang chế độ tái tạo toàn bộ.",
         "warning_last_entry_time_naive": "Cảnh báo: last_entry_time.txt có dấu thời gian không chứa múi giờ. Giả định là UTC.",
-        "warning_removed_existing_outputs": "Cảnh báo: Đã xóa {} tệp đầu ra hiện có trước khi tái tạo toàn bộ.",
         "warning_failed_remove_output_file": "Cảnh báo: Không thể xóa tệp đầu ra {}: {}",
+        "warning_json_backend_unavailable": "Cảnh báo: Không có backend JSON {}. Chuyển sang dùng mô-đun json tiêu chuẩn.",
+        "batch_job_summary": "{0}: {1} mục mới, {2} tệp, {3:.2f} giây ({4:.0f} mục/giây, {5:.2f} MB/giây)",
+        "batch_job_failed": "{0}: thất bại: {1}",
+        "batch_complete": "✅ Hoàn thành lô: {0} thành công, {1} thất bại.",
+        "serve_listening": "🌐 Dịch vụ chuyển đổi đang lắng nghe tại http://{0}:{1}/convert (tối đa {2} lượt chuyển đổi đồng thời)",
+        "unchanged_output_file": "Nội dung không thay đổi, giữ nguyên tệp: {}",
+        "changed_output_files": "Các tệp đã thay đổi ({}):",
+        "product_entries": "📦 {0}: {1} mục",
+        "store_import": "🗄️ Kho lịch sử: đã lưu {0} mục mới (đã kiểm tra {1} trên {2} mục)",
+        "resplit_no_outputs": "Không tìm thấy tệp đầu ra được đánh số cho {}.",
+        "resplit_complete": "✅ Đã chia lại {0} mục từ {1} tệp thành {2} tệp với giới hạn {3} byte.",
+        "plan_summary": "📋 Kế hoạch cho {0}: {1} mục mới trong {2} tệp; không ghi gì cả.",
+        "plan_file": "  {0}: {1} mục, ~{2} byte, {3} – {4}",
+        "plan_file_appended": "  {0} (nối thêm): {1} mục mới, ~{2} byte, {3} – {4}",
+        "plan_projection": "⏱️ Thời gian ước tính: {0:.1f} giây (tải {1:.1f} giây + chuyển đổi {2:.1f} giây, ~{3:.0f} mục/giây, từ {4} mục mẫu)",
+        "warning_target_files_exceeded": "Cảnh báo: Lịch sử không vừa trong {0} tệp với giới hạn {1} byte; sẽ ghi {2} tệp thay thế.",
+        "redaction_summary": "🛡️ Đã che {0} mục (email: {1}, số điện thoại: {2}, khóa API: {3}, thuật ngữ: {4}) trong {5:.2f} MB với tốc độ {6:.1f} MB/giây",
+        "snapshot_loaded": "⚡ Đã tải {0} mục đã chọn từ bản chụp {1}",
+        "snapshot_saved": "💾 Đã lưu bản chụp: {}",
+        "metrics_report_run": "{0}: {1:.2f} giây, đầu vào {2:.1f} MB, {3} mục Gemini ({4} mới), đã ghi {5} tệp ({6:.2f} MB), RSS đỉnh {7:.0f} MB",
+        "metrics_report_failed_run": "{0}: thất bại sau {1:.2f} giây",
+        "metrics_report_trend": "📈 Lần chạy mới nhất so với trung vị của {0} lần chạy trước: thời gian {1:+.0%}, thông lượng {2:+.0%}, kích thước đầu vào {3:+.0%}, mục Gemini {4:+.0%}, RSS đỉnh {5:+.0%}",
+        "metrics_report_empty": "Không có lần chạy nào được ghi trong {}.",
+        "incremental_read": "⏩ Đã dừng ở mục được xử lý gần nhất sau khi đọc {0} trên {1} byte ({2} hoạt động)",
+        "warning_entries_out_of_order": "Cảnh báo: Các mục không theo thứ tự thời gian ({0} đoạn tăng dần); đang sắp xếp {1} mục theo dấu thời gian.",
+        "attachments_linked": "📎 Đã liên kết {0} tệp đính kèm thành {1} tệp lưu trữ trong {2}",
+        "warning_attachments_missing": "Cảnh báo: Không tìm thấy {0} tệp đính kèm được tham chiếu trong {1}.",
+        "stats_written": "📊 Đã ghi thống kê sử dụng: {}",
+        "streamed_to_stdout": "Đã truyền lịch sử trò chuyện ra stdout với tên: {}",
+        "error_stdout_output_unsupported": "Lỗi: không thể kết hợp --output_file - với --store, --products, --batch hoặc --attachments.",
+        "added_to_bundle": "Đã thêm lịch sử trò chuyện vào gói với tên: {}",
+        "bundle_written": "🗜️ Đã ghi gói: {0} ({1} tệp)",
+        "error_bundle_unsupported": "Lỗi: không thể kết hợp --bundle với --store, --batch, --attachments hoặc --output_file -.",
+        "warning_html_budget_exceeded": "Cảnh báo: Chuyển đổi phản hồi HTML gồm {0} ký tự mất hơn {1:.1f} giây; chỉ loại bỏ thẻ.",
+        "preview_written": "🔍 Đã ghi bản xem trước: {0} (lấy mẫu {1} trên {2} mục)",
+        "error_unknown_timezone": "Lỗi: Múi giờ không xác định: {}",
+        "error_timezone_store": "Lỗi: không thể kết hợp --timezone với --store, vì kho lưu giữ các tiêu đề Markdown như khi được tạo.",
+        "error_store_option_unsupported": "Lỗi: Không thể kết hợp {0} với --store.",
+        "warning_removed_stale_outputs": "Cảnh báo: Đã xóa {} tệp đầu ra đánh số cũ còn sót lại từ cách chia trước.",
     },
     "zh_CN": {
         "error_lang_detection": "检测系统语言时出错：{}",
@@ -495,8 +1486,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "警告：last_entry_time.txt 为空，已切换为全量重新生成模式。",
         "warning_last_entry_time_invalid": "警告：last_entry_time.txt 中的时间戳无效（{!r}），已切换为全量重新生成模式。",
         "warning_last_entry_time_naive": "警告：last_entry_time.txt 中的时间戳缺少时区信息，将按 UTC 处理。",
-        "warning_removed_existing_outputs": "警告：已在全量重新生成前删除 {} 个既有输出文件。",
         "warning_failed_remove_output_file": "警告：未能删除输出文件 {}：{}",
+        "warning_json_backend_unavailable": "警告：JSON 后端 {} 不可用，将改用标准 json 模块。",
+        "batch_job_summary": "{0}：新增 {1} 条条目，{2} 个文件，{3:.2f} 秒（{4:.0f} 条/秒，{5:.2f} MB/秒）",
+        "batch_job_failed": "{0}：失败：{1}",
+        "batch_complete": "✅ 批处理完成：成功 {0} 个，失败 {1} 个。",
+        "serve_listening": "🌐 转换服务正在 http://{0}:{1}/convert 上监听（最多 {2} 个并发转换）",
+        "unchanged_output_file": "内容未变化，文件保持不变：{}",
+        "changed_output_files": "发生变化的文件（{} 个）：",
+        "product_entries": "📦 {0}：{1} 条条目",
+        "store_import": "🗄️ 历史存储：已保存 {0} 条新条目（已检查 {1}/{2} 条）",
+        "resplit_no_outputs": "未找到 {} 的编号输出文件。",
+        "resplit_complete": "✅ 已重新拆分：{0} 条条目，{1} 个文件 → {2} 个文件（上限 {3} 字节）。",
+        "plan_summary": "📋 {0} 的计划：{1} 条新条目，{2} 个文件；不会写入任何内容。",
+        "plan_file": "  {0}：{1} 条条目，约 {2} 字节，{3} – {4}",
+        "plan_file_appended": "  {0}（追加）：{1} 条新条目，约 {2} 字节，{3} – {4}",
+        "plan_projection": "⏱️ 预计耗时：{0:.1f} 秒（加载 {1:.1f} 秒 + 转换 {2:.1f} 秒，约 {3:.0f} 条/秒，基于 {4} 条抽样条目）",
+        "warning_target_files_exceeded": "警告：无法将历史记录放入 {0} 个文件（上限 {1} 字节）；改为写入 {2} 个文件。",
+        "redaction_summary": "🛡️ 已脱敏 {0} 项（邮箱：{1}，电话号码：{2}，API 密钥：{3}，术语：{4}），处理 {5:.2f} MB，速度 {6:.1f} MB/秒",
+        "snapshot_loaded": "⚡ 已从快照加载 {0} 条选定条目：{1}",
+        "snapshot_saved": "💾 快照已保存：{}",
+        "metrics_report_run": "{0}：{1:.2f} 秒，输入 {2:.1f} MB，Gemini 条目 {3} 条（新增 {4} 条），写入 {5} 个文件（{6:.2f} MB），峰值 RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}：{1:.2f} 秒后失败",
+        "metrics_report_trend": "📈 最近一次运行与之前 {0} 次运行的中位数相比：耗时 {1:+.0%}，吞吐量 {2:+.0%}，输入大小 {3:+.0%}，Gemini 条目 {4:+.0%}，峰值 RSS {5:+.0%}",
+        "metrics_report_empty": "{} 中没有运行记录。",
+        "incremental_read": "⏩ 已在上次处理的条目处停止读取（已读取 {0} / {1} 字节，{2} 条活动）",
+        "warning_entries_out_of_order": "警告：条目未按时间排序（{0} 个递增段）；正在按时间戳对 {1} 个条目排序。",
+        "attachments_linked": "📎 已将 {0} 个附件链接为 {1} 个存储文件，位于 {2}",
+        "warning_attachments_missing": "警告：有 {0} 个引用的附件未在 {1} 中找到。",
+        "stats_written": "📊 已写入使用统计：{}",
+        "streamed_to_stdout": "聊天记录已流式输出到标准输出: {}",
+        "error_stdout_output_unsupported": "错误: --output_file - 不能与 --store、--products、--batch 或 --attachments 同时使用。",
+        "added_to_bundle": "聊天记录已添加到压缩包: {}",
+        "bundle_written": "🗜️ 已写入压缩包: {0}（{1} 个文件）",
+        "error_bundle_unsupported": "错误: --bundle 不能与 --store、--batch、--attachments 或 --output_file - 同时使用。",
+        "warning_html_budget_exceeded": "警告: 转换 HTML 响应（{0} 个字符）耗时超过 {1:.1f} 秒，将仅去除标签。",
+        "preview_written": "🔍 已写入预览: {0}（抽样 {1} / {2} 条记录）",
+        "error_unknown_timezone": "错误: 未知的时区: {}",
+        "error_timezone_store": "错误: --timezone 不能与 --store 同时使用，存储会保留生成时的 Markdown 标题。",
+        "error_store_option_unsupported": "错误：{0} 不能与 --store 同时使用。",
+        "warning_removed_stale_outputs": "警告：已删除上次拆分遗留的 {} 个过期编号输出文件。",
     },
     "zh_TW": {
         "error_lang_detection": "檢測系統語言時出錯：{}",
@@ -512,8 +1541,46 @@ TRANSLATIONS = {
         "warning_last_entry_time_empty": "警告：last_entry_time.txt 為空，已切換為全量重新產生模式。",
         "warning_last_entry_time_invalid": "警告：last_entry_time.txt 中的時間戳無效（{!r}），已切換為全量重新產生模式。",
         "warning_last_entry_time_naive": "警告：last_entry_time.txt 中的時間戳缺少時區資訊，將視為 UTC。",
-        "warning_removed_existing_outputs": "警告：已在全量重新產生前刪除 {} 個既有輸出檔。",
         "warning_failed_remove_output_file": "警告：未能刪除輸出檔 {}：{}",
+        "warning_json_backend_unavailable": "警告：JSON 後端 {} 無法使用，將改用標準 json 模組。",
+        "batch_job_summary": "{0}：新增 {1} 條條目，{2} 個檔案，{3:.2f} 秒（{4:.0f} 條/秒，{5:.2f} MB/秒）",
+        "batch_job_failed": "{0}：失敗：{1}",
+        "batch_complete": "✅ 批次處理完成：成功 {0} 個，失敗 {1} 個。",
+        "serve_listening": "🌐 轉換服務正在 http://{0}:{1}/convert 上監聽（最多 {2} 個同時轉換）",
+        "unchanged_output_file": "內容未變更，檔案保持不變：{}",
+        "changed_output_files": "有變更的檔案（{} 個）：",
+        "product_entries": "📦 {0}：{1} 條條目",
+        "store_import": "🗄️ 歷史儲存庫：已儲存 {0} 條新條目（已檢查 {1}/{2} 條）",
+        "resplit_no_outputs": "找不到 {} 的編號輸出檔案。",
+        "resplit_complete": "✅ 已重新分割：{0} 條條目，{1} 個檔案 → {2} 個檔案（上限 {3} 位元組）。",
+        "plan_summary": "📋 {0} 的計畫：{1} 條新條目，{2} 個檔案；不會寫入任何內容。",
+        "plan_file": "  {0}：{1} 條條目，約 {2} 位元組，{3} – {4}",
+        "plan_file_appended": "  {0}（附加）：{1} 條新條目，約 {2} 位元組，{3} – {4}",
+        "plan_projection": "⏱️ 預估耗時：{0:.1f} 秒（載入 {1:.1f} 秒 + 轉換 {2:.1f} 秒，約 {3:.0f} 條/秒，基於 {4} 條抽樣條目）",
+        "warning_target_files_exceeded": "警告：無法將歷史記錄放入 {0} 個檔案（上限 {1} 位元組）；改為寫入 {2} 個檔案。",
+        "redaction_summary": "🛡️ 已遮蔽 {0} 項（電子郵件：{1}，電話號碼：{2}，API 金鑰：{3}，術語：{4}），處理 {5:.2f} MB，速度 {6:.1f} MB/秒",
+        "snapshot_loaded": "⚡ 已從快照載入 {0} 條選定條目：{1}",
+        "snapshot_saved": "💾 快照已儲存：{}",
+        "metrics_report_run": "{0}：{1:.2f} 秒，輸入 {2:.1f} MB，Gemini 項目 {3} 筆（新增 {4} 筆），寫入 {5} 個檔案（{6:.2f} MB），峰值 RSS {7:.0f} MB",
+        "metrics_report_failed_run": "{0}：{1:.2f} 秒後失敗",
+        "metrics_report_trend": "📈 最近一次執行與先前 {0} 次執行的中位數相比：耗時 {1:+.0%}，吞吐量 {2:+.0%}，輸入大小 {3:+.0%}，Gemini 項目 {4:+.0%}，峰值 RSS {5:+.0%}",
+        "metrics_report_empty": "{} 中沒有執行記錄。",
+        "incremental_read": "⏩ 已在上次處理的項目處停止讀取（已讀取 {0} / {1} 位元組，{2} 筆活動）",
+        "warning_entries_out_of_order": "警告：項目未依時間排序（{0} 個遞增區段）；正在依時間戳記排序 {1} 個項目。",
+        "attachments_linked": "📎 已將 {0} 個附件連結為 {1} 個儲存檔案，位於 {2}",
+        "warning_attachments_missing": "警告：有 {0} 個引用的附件未在 {1} 中找到。",
+        "stats_written": "📊 已寫入使用統計：{}",
+        "streamed_to_stdout": "聊天紀錄已串流輸出到標準輸出: {}",
+        "error_stdout_output_unsupported": "錯誤: --output_file - 不能與 --store、--products、--batch 或 --attachments 同時使用。",
+        "added_to_bundle": "聊天紀錄已加入壓縮檔: {}",
+        "bundle_written": "🗜️ 已寫入壓縮檔: {0}（{1} 個檔案）",
+        "error_bundle_unsupported": "錯誤: --bundle 不能與 --store、--batch、--attachments 或 --output_file - 同時使用。",
+        "warning_html_budget_exceeded": "警告: 轉換 HTML 回應（{0} 個字元）耗時超過 {1:.1f} 秒，將僅移除標籤。",
+        "preview_written": "🔍 已寫入預覽: {0}（抽樣 {1} / {2} 筆紀錄）",
+        "error_unknown_timezone": "錯誤: 未知的時區: {}",
+        "error_timezone_store": "錯誤: --timezone 不能與 --store 同時使用，儲存區會保留產生時的 Markdown 標題。",
+        "error_store_option_unsupported": "錯誤：{0} 不能與 --store 同時使用。",
+        "warning_removed_stale_outputs": "警告：已刪除上次分割遺留的 {} 個過期編號輸出檔。",
     },
 }
 
@@ -610,18 +1677,406 @@ def print_warning(key: str, *args: Any) -> None:
     print_error(t(key, *args))
 
 
-def load_json(filepath: str) -> list[dict[str, Any]]:
+def load_stdlib_json(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+def load_ujson(data: Union[bytes, str]) -> Any:
+    import ujson
+
+    try:
+        return ujson.loads(data)
+    except ValueError as e:
+        # ujson raises its own ValueError subclass; normalize it for the callers' error handling.
+        raise json.JSONDecodeError(str(e), "", 0) from e
+
+
+def load_orjson(data: Union[bytes, str]) -> Any:
+    import orjson
+
+    return orjson.loads(data)  # orjson.JSONDecodeError already subclasses json.JSONDecodeError
+
+
+# Decoders keyed by backend name, in the order "auto" tries them.
+JSON_BACKENDS: dict[str, Callable[[Union[bytes, str]], Any]] = {
+    "orjson": load_orjson,
+    "ujson": load_ujson,
+    "json": load_stdlib_json,
+}
+
+
+def is_json_backend_available(name: str) -> bool:
+    """Return True when the module behind a JSON backend can be imported."""
+    return name == "json" or importlib.util.find_spec(name) is not None
+
+
+@functools.cache
+def resolve_json_backend(name: str = "auto") -> tuple[str, Callable[[Union[bytes, str]], Any]]:
+    """
+    Resolve a backend name to (backend name, loads function).
+    "auto" picks the first importable accelerated decoder, falling back to the stdlib json module.
+    """
+    if name == "auto":
+        name = next(backend for backend in JSON_BACKENDS if is_json_backend_available(backend))
+    elif not is_json_backend_available(name):
+        print_warning("warning_json_backend_unavailable", name)
+        name = "json"
+    return name, JSON_BACKENDS[name]
+
+
+def benchmark_json_backends(filepath: str, repeat: int = 3) -> list[tuple[str, float]]:
+    """Time a full decode and Gemini filter of the same export with every importable backend (best of repeat)."""
+    with open(filepath, "rb") as f:
+        data = f.read()
+
+    results: list[tuple[str, float]] = []
+    for name, loads in JSON_BACKENDS.items():
+        if not is_json_backend_available(name):
+            continue
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            entries = loads(data)
+            sum(1 for entry in entries if is_gemini_entry(entry))
+            timings.append(time.perf_counter() - started)
+        results.append((name, min(timings)))
+    return results
+
+
+def load_json(filepath: str, json_backend: str = "auto") -> list[dict[str, Any]]:
     """Load a JSON file"""
     if not os.path.exists(filepath):
         print_error(t("file_not_found", filepath))
         return []
 
-    with open(filepath, encoding="utf-8") as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError as e:
-            print_error(t("json_decode_error", e))
-            return []
+    name, loads = resolve_json_backend(json_backend)
+    try:
+        if name == "json":
+            # A text handle decodes the file before parsing, so its bytes are not kept next to the text.
+            with open(filepath, encoding="utf-8") as f:
+                return json.load(f)
+        # The accelerated decoders take bytes; the buffer is released as soon as they return.
+        with open(filepath, "rb") as f:
+            return loads(f.read())
+    except json.JSONDecodeError as e:
+        print_error(t("json_decode_error", e))
+        return []
+
+
+# One token per match: a complete JSON string (escapes included), an opening bracket or a closing bracket.
+# Matching whole strings lets braces and quotes inside prompts/responses pass through untouched.
+ACTIVITY_TOKEN_PATTERN = re.compile(rb'("[^"\\]*(?:\\.[^"\\]*)*")|([\[{])|([\]}])')
+LEADING_WHITESPACE_PATTERN = re.compile(rb"\s*")
+PARALLEL_BATCH_BYTES = 8 * 1024 * 1024
+SCAN_CHUNKS_PER_WORKER = 4
+
+# (offset, depth after the bracket, is opening bracket)
+DepthEvent = tuple[int, int, bool]
+InputView = Union[bytes, mmap.mmap]
+
+
+def is_gemini_entry(entry: dict[str, Any]) -> bool:
+    """Return True when an activity belongs to Gemini."""
+    return "Gemini" in entry.get("header", "")
+
+
+def scan_depth_events(
+    buffer: InputView, start: int = 0, end: Optional[int] = None
+) -> tuple[int, list[DepthEvent]]:
+    """
+    Tokenize buffer[start:end], which must begin outside a JSON string, and return the net
+    bracket depth change together with the bracket events close to the shallowest depth reached.
+    Depths are relative to the depth at `start`; opening brackets are reported at their own
+    offset and closing brackets just past it, so events can be turned into byte ranges directly.
+    """
+    if end is None:
+        end = len(buffer)
+    depth = 0
+    lowest = 0
+    events: list[DepthEvent] = []
+    for match in ACTIVITY_TOKEN_PATTERN.finditer(buffer, start, end):
+        kind = match.lastindex
+        if kind == 1:
+            continue
+        if kind == 2:
+            depth += 1
+            if depth <= lowest + 2:
+                events.append((match.start(), depth, True))
+        else:
+            depth -= 1
+            if depth < lowest:
+                lowest = depth
+            if depth <= lowest + 1:
+                events.append((match.end(), depth, False))
+    return depth, events
+
+
+def resolve_activity_boundaries(
+    scanned_chunks: Iterable[tuple[int, list[DepthEvent]]],
+) -> list[tuple[int, int]]:
+    """Stitch per-chunk depth events, in file order, into (start, end) ranges of top-level objects."""
+    boundaries: list[tuple[int, int]] = []
+    base_depth = 0
+    object_start = -1
+    for net_depth, events in scanned_chunks:
+        for offset, depth, is_opening in events:
+            absolute_depth = base_depth + depth
+            if is_opening and absolute_depth == 2:
+                object_start = offset
+            elif not is_opening and absolute_depth == 1 and object_start >= 0:
+                boundaries.append((object_start, offset))
+                object_start = -1
+            elif absolute_depth < 0:
+                raise json.JSONDecodeError("Unbalanced brackets in top-level JSON array", "", offset)
+        base_depth += net_depth
+
+    if base_depth != 0:
+        raise json.JSONDecodeError("Unbalanced brackets in top-level JSON array", "", 0)
+    return boundaries
+
+
+def check_top_level_array(buffer: InputView) -> None:
+    """Raise JSONDecodeError unless the buffer starts with a JSON array."""
+    array_start = LEADING_WHITESPACE_PATTERN.match(buffer).end()
+    if buffer[array_start : array_start + 1] != b"[":
+        raise json.JSONDecodeError("Expected a top-level JSON array", "", array_start)
+
+
+def scan_activity_boundaries(buffer: InputView) -> list[tuple[int, int]]:
+    """
+    Scan a top-level JSON array once and return (start, end) byte offsets
+    of each activity object it contains.
+    """
+    check_top_level_array(buffer)
+    return resolve_activity_boundaries([scan_depth_events(buffer)])
+
+
+def split_at_newlines(view: InputView, parts: int) -> list[tuple[int, int]]:
+    """
+    Split a view into roughly equal (start, end) chunks that each begin right after a newline.
+    A raw newline can never occur inside a JSON string, so every chunk starts outside one.
+    """
+    offsets = [0]
+    for part in range(1, parts):
+        newline = view.find(b"\n", max(part * len(view) // parts, offsets[-1]))
+        if newline < 0:
+            break
+        offsets.append(newline + 1)
+    offsets.append(len(view))
+    return [(start, end) for start, end in zip(offsets, offsets[1:]) if start < end]
+
+
+@contextlib.contextmanager
+def open_input_view(filepath: str) -> Iterator[InputView]:
+    """
+    Map a file read-only and yield a zero-copy bytes-like view of it.
+    Slicing, regex scanning and find() all read straight from the page cache.
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # mmap cannot map an empty file
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield view
+
+
+def scan_file_chunk(filepath: str, start: int, end: int) -> tuple[int, list[DepthEvent]]:
+    """Scan one newline-aligned chunk of a file; event offsets are absolute file offsets."""
+    with open_input_view(filepath) as view:
+        return scan_depth_events(view, start, end)
+
+
+def batch_activity_ranges(
+    boundaries: list[tuple[int, int]], batch_bytes: int = PARALLEL_BATCH_BYTES
+) -> list[list[tuple[int, int]]]:
+    """Group consecutive activity ranges into batches of roughly batch_bytes each."""
+    batches: list[list[tuple[int, int]]] = []
+    current: list[tuple[int, int]] = []
+    current_bytes = 0
+    for start, end in boundaries:
+        current.append((start, end))
+        current_bytes += end - start
+        if current_bytes >= batch_bytes:
+            batches.append(current)
+            current = []
+            current_bytes = 0
+    if current:
+        batches.append(current)
+    return batches
+
+
+def may_be_gemini_activity(
+    view: InputView, start: int, end: int, literals: tuple[bytes, ...] = (b"Gemini",)
+) -> bool:
+    """
+    Cheap header prefilter on raw bytes. An activity can only be selected if one of the header
+    literals ("Gemini" by default) appears in it, or if it contains \\u escapes that could spell one.
+    """
+    if any(view.find(literal, start, end) >= 0 for literal in literals):
+        return True
+    return view.find(b"\\u", start, end) >= 0
+
+
+def decode_gemini_view_ranges(
+    view: InputView,
+    ranges: list[tuple[int, int]],
+    json_backend: str = "auto",
+    entry_filter: Optional[Callable[[dict[str, Any]], bool]] = None,
+    literals: tuple[bytes, ...] = (b"Gemini",),
+) -> list[dict[str, Any]]:
+    """
+    Decode only the prefiltered activity objects at the given byte ranges and keep the ones
+    accepted by entry_filter (Gemini entries by default).
+    """
+    _, loads = resolve_json_backend(json_backend)
+    entry_filter = entry_filter or is_gemini_entry
+    entries: list[dict[str, Any]] = []
+    for start, end in ranges:
+        if not may_be_gemini_activity(view, start, end, literals):
+            continue
+        entry = loads(view[start:end])
+        if entry_filter(entry):
+            entries.append(entry)
+    return entries
+
+
+def decode_gemini_ranges(
+    filepath: str,
+    ranges: list[tuple[int, int]],
+    json_backend: str = "auto",
+    entry_filter: Optional[Callable[[dict[str, Any]], bool]] = None,
+    literals: tuple[bytes, ...] = (b"Gemini",),
+) -> list[dict[str, Any]]:
+    """Process pool entry point: map the file and decode the selected entries in the given ranges."""
+    with open_input_view(filepath) as view:
+        return decode_gemini_view_ranges(view, ranges, json_backend, entry_filter, literals)
+
+
+def load_gemini_entries(
+    filepath: str,
+    workers: int = 1,
+    json_backend: str = "auto",
+    entry_filter: Optional[Callable[[dict[str, Any]], bool]] = None,
+    literals: tuple[bytes, ...] = (b"Gemini",),
+) -> tuple[int, list[dict[str, Any]]]:
+    """
+    Load Gemini entries from the raw bytes of a memory-mapped export: activity boundaries are
+    scanned, headers are prefiltered and only the selected objects are decoded. With more than
+    one worker, newline-aligned chunks are scanned and byte ranges decoded in a process pool.
+    entry_filter and literals replace the default Gemini header check and its byte prefilter.
+    Returns (total activity count, selected entries in file order).
+    """
+    if not os.path.exists(filepath):
+        print_error(t("file_not_found", filepath))
+        return 0, []
+
+    try:
+        if workers <= 1:
+            with open_input_view(filepath) as view:
+                boundaries = scan_activity_boundaries(view)
+                return len(boundaries), decode_gemini_view_ranges(
+                    view, boundaries, json_backend, entry_filter, literals
+                )
+
+        with open_input_view(filepath) as view:
+            check_top_level_array(view)
+            chunks = split_at_newlines(view, workers * SCAN_CHUNKS_PER_WORKER)
+
+        gemini_entries: list[dict[str, Any]] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # executor.map yields results in submission order, which keeps the file order intact.
+            scanned_chunks = executor.map(scan_file_chunk, [filepath] * len(chunks), *zip(*chunks))
+            boundaries = resolve_activity_boundaries(scanned_chunks)
+            batches = batch_activity_ranges(boundaries)
+            # Resolve once here so an unavailable backend is reported once instead of in every worker.
+            json_backend, _ = resolve_json_backend(json_backend)
+            for batch_entries in executor.map(
+                decode_gemini_ranges,
+                [filepath] * len(batches),
+                batches,
+                [json_backend] * len(batches),
+                [entry_filter] * len(batches),
+                [literals] * len(batches),
+            ):
+                gemini_entries.extend(batch_entries)
+    except json.JSONDecodeError as e:
+        print_error(t("json_decode_error", e))
+        return 0, []
+
+    return len(boundaries), gemini_entries
+
+
+def is_after_checkpoint(entry: dict[str, Any], last_entry_time_loaded: datetime) -> bool:
+    """Same test extract_text_content applies before rendering; unparsable times are always rendered."""
+    try:
+        return datetime.fromisoformat(entry.get("time", "").replace("Z", "+00:00")) > last_entry_time_loaded
+    except ValueError:
+        return True
+
+
+def iter_activity_ranges(view: InputView) -> Iterator[tuple[int, int]]:
+    """
+    Lazily yield the (start, end) byte offsets of each top-level activity object in file order.
+    Unlike scan_activity_boundaries, nothing past the last object the caller consumed is scanned.
+    """
+    check_top_level_array(view)
+    depth = 0
+    object_start = -1
+    for match in ACTIVITY_TOKEN_PATTERN.finditer(view):
+        kind = match.lastindex
+        if kind == 1:
+            continue
+        if kind == 2:
+            depth += 1
+            if depth == 2:
+                object_start = match.start()
+        else:
+            depth -= 1
+            if depth == 1:
+                yield object_start, match.end()
+            elif depth < 0:
+                raise json.JSONDecodeError("Unbalanced brackets in top-level JSON array", "", match.start())
+
+
+def load_entries_until_checkpoint(
+    filepath: str,
+    checkpoint: datetime,
+    json_backend: str = "auto",
+    entry_filter: Optional[Callable[[dict[str, Any]], bool]] = None,
+    literals: tuple[bytes, ...] = (b"Gemini",),
+) -> tuple[int, list[dict[str, Any]], int]:
+    """
+    Decode selected activities from the start of a newest-first export and stop at the first one
+    at or before the checkpoint: everything after it has already been converted. Only the pages
+    up to that activity are read from the memory-mapped file.
+    Returns (activities read, selected entries in file order, bytes read).
+    """
+    if not os.path.exists(filepath):
+        print_error(t("file_not_found", filepath))
+        return 0, [], 0
+
+    _, loads = resolve_json_backend(json_backend)
+    entry_filter = entry_filter or is_gemini_entry
+    activities = 0
+    bytes_read = 0
+    entries: list[dict[str, Any]] = []
+    try:
+        with open_input_view(filepath) as view:
+            for start, end in iter_activity_ranges(view):
+                activities += 1
+                bytes_read = end
+                if not may_be_gemini_activity(view, start, end, literals):
+                    continue
+                entry = loads(view[start:end])
+                if not entry_filter(entry):
+                    continue
+                if not is_after_checkpoint(entry, checkpoint):
+                    break
+                entries.append(entry)
+    except json.JSONDecodeError as e:
+        print_error(t("json_decode_error", e))
+        return 0, [], 0
+    return activities, entries, bytes_read
 
 
 def load_last_entry_time(filepath: str) -> tuple[datetime, bool]:
@@ -650,15 +2105,34 @@ def load_last_entry_time(filepath: str) -> tuple[datetime, bool]:
     return parsed_time, False
 
 
-def remove_numbered_output_files(base_name: str, ext: str) -> int:
-    """Remove previously generated numbered output files and return count."""
+def incremental_checkpoint(state_files: Iterable[str]) -> Optional[datetime]:
+    """
+    Return the oldest of the given checkpoints, or None when any of them calls for a full pass
+    (no checkpoint yet, or an unreadable one, which the writer reports later).
+    """
+    checkpoints = []
+    for state_file in state_files:
+        with contextlib.redirect_stderr(io.StringIO()):
+            last_entry_time, force_full_regeneration = load_last_entry_time(state_file)
+        if force_full_regeneration or last_entry_time == datetime.min.replace(tzinfo=timezone.utc):
+            return None
+        checkpoints.append(last_entry_time)
+    return min(checkpoints, default=None)
+
+
+def remove_numbered_output_files(base_name: str, ext: str, keep: int = 0) -> int:
+    """
+    Remove numbered output files above `keep`, left over from a previous layout that had more files,
+    and return the count.
+    """
     removed = 0
     base_leaf = os.path.basename(base_name)
-    pattern = re.compile(rf"^{re.escape(base_leaf)}-\d+{re.escape(ext)}$")
+    pattern = re.compile(rf"^{re.escape(base_leaf)}-(\d+){re.escape(ext)}$")
 
     try:
         for entry in sorted(os.listdir(os.path.dirname(base_name) or ".")):
-            if not pattern.match(entry):
+            match = pattern.match(entry)
+            if not match or int(match.group(1)) <= keep:
                 continue
             file_path = os.path.join(os.path.dirname(base_name), entry) if os.path.dirname(base_name) else entry
             try:
@@ -666,14 +2140,28 @@ def remove_numbered_output_files(base_name: str, ext: str) -> int:
                 removed += 1
             except OSError as remove_error:
                 print_warning("warning_failed_remove_output_file", file_path, remove_error)
-                raise RuntimeError("Aborting full regeneration because an output file could not be removed.") from remove_error
+                raise RuntimeError(
+                    "Aborting because a stale output file could not be removed."
+                ) from remove_error
     finally:
         if removed:
-            print_warning("warning_removed_existing_outputs", removed)
+            print_warning("warning_removed_stale_outputs", removed)
 
     return removed
 
 
+def output_content_digest(content: str) -> str:
+    """Hash rendered output content, ignoring the "Generated at" timestamp in its header."""
+    normalized = OUTPUT_HEADER_TIMESTAMP_PATTERN.sub(r"\1", content, count=1)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def output_file_digest(filepath: str) -> str:
+    """Hash an existing output file the same way as output_content_digest."""
+    with open(filepath, encoding="utf-8") as f:
+        return output_content_digest(f.read())
+
+
 def decode_unicode_escapes(s: str) -> str:
     """Decode Unicode escape sequences"""
 
@@ -683,43 +2171,243 @@ def decode_unicode_escapes(s: str) -> str:
     return re.sub(r"\\u([0-9a-fA-F]{4})", repl, s)
 
 
-def html_to_markdown(html_str: str) -> str:
+HTML_CONVERSION_BUDGET_SECONDS = 1.0
+HEADING_OPEN_PATTERN = re.compile(r"<h[1-6]", re.IGNORECASE)
+HEADING_CLOSE_PATTERN = re.compile(r"</h[1-6]>", re.IGNORECASE)
+BOLD_OPEN_PATTERN = re.compile(r"<(b|strong)", re.IGNORECASE)
+BOLD_CLOSE_PATTERNS = {
+    "b": re.compile(r"</b>", re.IGNORECASE),
+    "strong": re.compile(r"</strong>", re.IGNORECASE),
+}
+LIST_ITEM_TAG_PATTERN = re.compile(r"<li[^>]*>", re.IGNORECASE)
+PARAGRAPH_END_PATTERN = re.compile(r"</p>", re.IGNORECASE)
+DIV_END_PATTERN = re.compile(r"</div>", re.IGNORECASE)
+LINE_BREAK_TAG_PATTERN = re.compile(r"<br\s*/?>", re.IGNORECASE)
+ANY_TAG_PATTERN = re.compile(r"<[^>]+>")
+PLAIN_TAG_PATTERN = re.compile(r"<[^<>]*>")
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
+
+def replace_tag_pairs(
+    text: str,
+    opening: re.Pattern[str],
+    closing_for: Callable[[re.Match[str]], re.Pattern[str]],
+    template: str,
+) -> str:
+    """
+    Linear-time equivalent of re.sub(opening + r"[^>]*>(.*?)" + closing, template, text): each
+    opening tag and the first closing tag after it on the same line are replaced by template
+    filled with the content between them. re.sub rescans the rest of the line, or of the text when
+    no ">" follows, for every tag that is never closed, which is quadratic on responses full of
+    unclosed tags. Here the next ">", line break and closing tag are each looked up once and
+    reused while they are still ahead.
+    """
+    parts = []
+    last = 0
+    tag_end = line_end = -1
+    closings: dict[re.Pattern[str], Optional[re.Match[str]]] = {}
+    for match in opening.finditer(text):
+        if match.start() < last:
+            continue
+        if tag_end < match.end():
+            tag_end = text.find(">", match.end())
+            if tag_end < 0:
+                break
+        content_start = tag_end + 1
+        if line_end < content_start:
+            line_end = text.find("\n", content_start)
+            if line_end < 0:
+                line_end = len(text)
+        closing_pattern = closing_for(match)
+        closing = closings.get(closing_pattern)
+        if closing_pattern not in closings or (closing is not None and closing.start() < content_start):
+            closing = closings[closing_pattern] = closing_pattern.search(text, content_start)
+        if closing is None or closing.start() > line_end:
+            continue
+        parts.append(text[last : match.start()])
+        parts.append(template.format(text[content_start : closing.start()]))
+        last = closing.end()
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def sub_tags(pattern: re.Pattern[str], repl: str, text: str) -> str:
+    """
+    pattern.sub(repl, text) for a pattern whose matches all end with ">". The text after the last
+    ">" cannot match and is left out, since re.sub would rescan it for every tag that never ends.
+    """
+    end = text.rfind(">") + 1
+    return pattern.sub(repl, text[:end]) + text[end:]
+
+
+def strip_html_tags(html_str: str) -> str:
+    """Fallback conversion: decode, drop every tag and collapse blank lines, each in one linear pass."""
+    text = html_module.unescape(decode_unicode_escapes(html_str))
+    text = PLAIN_TAG_PATTERN.sub("", text)
+    return BLANK_LINES_PATTERN.sub("\n\n", text).strip()
+
+
+HTML_CONVERSION_STEPS: tuple[Callable[[str], str], ...] = (
+    decode_unicode_escapes,
+    html_module.unescape,
+    # Headings (h1-h6) -> **Heading** + line break
+    lambda text: replace_tag_pairs(
+        text, HEADING_OPEN_PATTERN, lambda match: HEADING_CLOSE_PATTERN, "\n**{}**\n"
+    ),
+    # List items (li) -> - + line break
+    lambda text: sub_tags(LIST_ITEM_TAG_PATTERN, "\n- ", text),
+    # Paragraphs (p), line breaks (div), line breaks (br) -> line breaks
+    lambda text: PARAGRAPH_END_PATTERN.sub("\n\n", text),
+    lambda text: DIV_END_PATTERN.sub("\n", text),
+    lambda text: LINE_BREAK_TAG_PATTERN.sub("\n", text),
+    # Bold (b, strong) -> **text**
+    lambda text: replace_tag_pairs(
+        text, BOLD_OPEN_PATTERN, lambda match: BOLD_CLOSE_PATTERNS[match.group(1).lower()], "**{}**"
+    ),
+    # Remove all other HTML tags (keep the content)
+    lambda text: sub_tags(ANY_TAG_PATTERN, "", text),
+    # Organize consecutive blank lines (reduce 3 or more line breaks to 2)
+    lambda text: BLANK_LINES_PATTERN.sub("\n\n", text),
+)
+
+
+def html_to_markdown(html_str: str, time_budget: float = HTML_CONVERSION_BUDGET_SECONDS) -> str:
     """
     Simple HTML -> Markdown/Text conversion
     Remove HTML tags and format into readable text
+    Every step is linear in the input. Should a response still take longer than time_budget
+    seconds, it is converted by plain tag stripping instead, so one entry cannot stall a run.
     """
     if not html_str:
         return ""
 
-    text = decode_unicode_escapes(html_str)
-    text = html_module.unescape(text)
+    deadline = time.perf_counter() + time_budget
+    text = html_str
+    for step in HTML_CONVERSION_STEPS:
+        text = step(text)
+        if time.perf_counter() > deadline:
+            print_warning("warning_html_budget_exceeded", len(html_str), time_budget)
+            return strip_html_tags(html_str)
+    return text.strip()
 
-    # Replace major tags (h1-h6, li, p, div, br, b, strong) with Markdown-like symbols and line breaks
-    # Headings (h1-h6) -> **Heading** + line break
-    text = re.sub(r"<h[1-6][^>]*>(.*?)</h[1-6]>", r"\n**\1**\n", text, flags=re.IGNORECASE)
 
-    # List items (li) -> - + line break
-    text = re.sub(r"<li[^>]*>", r"\n- ", text, flags=re.IGNORECASE)
+ATTACHMENT_FIELDS = ("attachedFiles", "imageFile")
+IMAGE_EXTENSIONS = frozenset({".bmp", ".gif", ".heic", ".jpeg", ".jpg", ".png", ".webp"})
 
-    # Paragraphs (p), line breaks (div), line breaks (br) -> line breaks
-    text = re.sub(r"</p>", r"\n\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"</div>", r"\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<br\s*/?>", r"\n", text, flags=re.IGNORECASE)
 
-    # Bold (b, strong) -> **text**
-    text = re.sub(r"<(b|strong)[^>]*>(.*?)</\1>", r"**\2**", text, flags=re.IGNORECASE)
+def entry_attachment_names(entry: dict[str, Any]) -> list[str]:
+    """Return the file names an activity references as uploaded attachments."""
+    names: list[str] = []
+    for field_name in ATTACHMENT_FIELDS:
+        value = entry.get(field_name)
+        if isinstance(value, str):
+            names.append(value)
+        elif isinstance(value, list):
+            names.extend(item for item in value if isinstance(item, str))
+    return names
 
-    # Remove all other HTML tags (keep the content)
-    text = re.sub(r"<[^>]+>", "", text)
 
-    # Organize consecutive blank lines (reduce 3 or more line breaks to 2)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ONE_SECOND = timedelta(seconds=1)
+TWO_DIGITS = tuple(f"{number:02d}" for number in range(100))
+# UTC offsets are tabulated per span of 2**22 seconds (about 48.5 days), probed every 6 hours.
+OFFSET_SPAN_SHIFT = 22
+OFFSET_PROBE_SECONDS = 6 * 3600
 
-    return text.strip()
 
+def format_heading_time(dt: datetime) -> str:
+    """dt.strftime("%Y/%m/%d %H:%M:%S") in the datetime's own offset, without strftime's overhead."""
+    return (
+        f"{dt.year}/{TWO_DIGITS[dt.month]}/{TWO_DIGITS[dt.day]} "
+        f"{TWO_DIGITS[dt.hour]}:{TWO_DIGITS[dt.minute]}:{TWO_DIGITS[dt.second]}"
+    )
+
+
+class HeadingTimeFormatter:
+    """
+    Formats activity times as "YYYY/MM/DD HH:MM:SS" headings in one time zone. Converting every
+    entry with astimezone is slow over millions of entries, so the zone's UTC offset transitions
+    are tabulated once per span of time and looked up by Unix time: a dictionary access, plus a
+    bisect in the rare span that holds a transition. The date text of each local day is cached.
+    """
+
+    def __init__(self, zone: tzinfo) -> None:
+        self.zone = zone
+        self.spans: dict[int, tuple[list[int], list[int]]] = {}
+        self.dates: dict[int, str] = {}
+
+    def zone_offset(self, seconds: int) -> int:
+        """UTC offset in seconds at a Unix time, asked of the time zone itself."""
+        offset = (UNIX_EPOCH + timedelta(seconds=seconds)).astimezone(self.zone).utcoffset()
+        return offset // ONE_SECOND if offset is not None else 0
 
-def extract_text_content(entry: dict[str, Any], last_entry_time_loaded: datetime) -> tuple[datetime, str]:
-    """Extract Markdown-formatted text content from an entry"""
+    def offset_transitions(self, start: int, end: int) -> tuple[list[int], list[int]]:
+        """
+        Return (transition times, offsets) for Unix times in [start, end): offsets[i] is in effect
+        from starts[i] on. The offset is probed every few hours and each change is bisected to
+        the second.
+        """
+        starts = [start]
+        offsets = [self.zone_offset(start)]
+        previous = start
+        probes = itertools.chain(range(start + OFFSET_PROBE_SECONDS, end, OFFSET_PROBE_SECONDS), (end - 1,))
+        for probe in probes:
+            offset = self.zone_offset(probe)
+            if offset != offsets[-1]:
+                low, high = previous, probe
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self.zone_offset(middle) == offsets[-1]:
+                        low = middle
+                    else:
+                        high = middle
+                starts.append(high)
+                offsets.append(offset)
+            previous = probe
+        return starts, offsets
+
+    def utc_offset(self, seconds: int) -> int:
+        span = seconds >> OFFSET_SPAN_SHIFT
+        table = self.spans.get(span)
+        if table is None:
+            table = self.spans[span] = self.offset_transitions(
+                span << OFFSET_SPAN_SHIFT, (span + 1) << OFFSET_SPAN_SHIFT
+            )
+        starts, offsets = table
+        if len(offsets) == 1:
+            return offsets[0]
+        return offsets[bisect.bisect_right(starts, seconds) - 1]
+
+    def format(self, dt: datetime) -> str:
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        seconds = (dt - UNIX_EPOCH) // ONE_SECOND
+        day, second_of_day = divmod(seconds + self.utc_offset(seconds), 86400)
+        date_text = self.dates.get(day)
+        if date_text is None:
+            date = UNIX_EPOCH + timedelta(days=day)
+            date_text = self.dates[day] = f"{date.year}/{TWO_DIGITS[date.month]}/{TWO_DIGITS[date.day]} "
+        hour, second_of_hour = divmod(second_of_day, 3600)
+        minute, second = divmod(second_of_hour, 60)
+        return f"{date_text}{TWO_DIGITS[hour]}:{TWO_DIGITS[minute]}:{TWO_DIGITS[second]}"
+
+
+def heading_time_formatter(timezone_name: Optional[str]) -> Optional[HeadingTimeFormatter]:
+    return HeadingTimeFormatter(zoneinfo.ZoneInfo(timezone_name)) if timezone_name else None
+
+
+def extract_text_content(
+    entry: dict[str, Any],
+    last_entry_time_loaded: datetime,
+    html_converter: Optional[Callable[[str], str]] = None,
+    attachment_links: Optional[dict[str, str]] = None,
+    heading_time: Optional[HeadingTimeFormatter] = None,
+) -> tuple[datetime, str]:
+    """
+    Extract Markdown-formatted text content from an entry (html_converter defaults to html_to_markdown).
+    attachment_links maps attachment file names to the paths they were linked to, relative to the outputs.
+    heading_time, if given, shows the entry time in its time zone instead of the time's own offset.
+    """
 
     time_str = entry.get("time", "")
     dt: datetime = datetime.min.replace(tzinfo=timezone.utc)  # Default value
@@ -727,7 +2415,7 @@ def extract_text_content(entry: dict[str, Any], last_entry_time_loaded: datetime
         dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
         if dt <= last_entry_time_loaded:
             return dt, ""  # Skip already processed entries
-        formatted_date = dt.strftime("%Y/%m/%d %H:%M:%S")
+        formatted_date = heading_time.format(dt) if heading_time else format_heading_time(dt)
     except ValueError:
         formatted_date = time_str
 
@@ -758,7 +2446,7 @@ def extract_text_content(entry: dict[str, Any], last_entry_time_loaded: datetime
             html = item.get("html", "")
             if html:
                 # Convert HTML to text/Markdown and concatenate
-                converted_text = html_to_markdown(html)
+                converted_text = (html_converter or html_to_markdown)(html)
                 response_text += converted_text + "\n\n"
 
         # Output header only if there is content
@@ -766,11 +2454,128 @@ def extract_text_content(entry: dict[str, Any], last_entry_time_loaded: datetime
             md_output += "### Gemini (Response)\n"
             md_output += f"{response_text}\n"
 
+    # 4. Attachments (only the ones that were linked next to the outputs)
+    if attachment_links:
+        linked = [name for name in entry_attachment_names(entry) if name in attachment_links]
+        if linked:
+            md_output += "### Attachments\n"
+            for name in linked:
+                image = "!" if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS else ""
+                md_output += f"- {image}[{name}]({urllib.parse.quote(attachment_links[name])})\n"
+            md_output += "\n"
+
     md_output += "---\n\n"  # Separator
     return dt, md_output
 
 
-def main() -> int:
+# Every match must start where an ASCII word starts. That one lookbehind fails cheaply at most positions
+# and keeps the combined alternation fast, since CPython's re cannot use its literal-prefix search on it.
+# The guards are ASCII on purpose: Japanese and Chinese text runs straight into addresses and numbers
+# without spaces, and \w would count those characters as part of the same word.
+REDACTION_WORD_START = r"(?<![A-Za-z0-9_])"
+# Lookbehind for patterns that must not start inside a longer address, number, or key.
+REDACTION_TOKEN_START = r"(?<![.%+-])"
+# Digit groups shaped like DD-MM-YYYY / MM-DD-YYYY and YYYY-MM-NNNN are dates, not phone numbers.
+REDACTION_DATE_SHAPES = (
+    r"(?!\d{1,2}[ ./-]\d{1,2}[ ./-](?:19|20)\d{2}(?![0-9]))"
+    r"(?!(?:19|20)\d{2}[ ./-](?:0?[1-9]|1[0-2])[ ./-]\d{1,4}(?![0-9]))"
+)
+REDACTION_PATTERNS: dict[str, str] = {
+    "EMAIL": REDACTION_TOKEN_START + r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}",
+    "API_KEY": REDACTION_TOKEN_START
+    + (
+        r"(?:sk-(?:proj-)?[A-Za-z0-9_-]{20,}|AIza[0-9A-Za-z_-]{35}|gh[pousr]_[A-Za-z0-9]{36,}"
+        r"|github_pat_[A-Za-z0-9_]{22,}|AKIA[0-9A-Z]{16}|xox[abprs]-[A-Za-z0-9-]{10,})(?![A-Za-z0-9_])"
+    ),
+    "PHONE": REDACTION_TOKEN_START
+    + REDACTION_DATE_SHAPES
+    + (
+        r"(?:\+\d{9,15}|(?:\+\d{1,3}[ .-]?)?(?:\(\d{1,4}\)[ .-]?\d{2,4}|\d{1,4}[ .-]\d{2,4})[ .-]\d{4})"
+        r"(?![A-Za-z0-9_.])"
+    ),
+}
+
+
+def literal_trie_pattern(terms: Iterable[str]) -> str:
+    """
+    Regex for a list of literals, factored into a prefix trie so the regex engine follows one
+    branch per character instead of trying every term at every position (the Aho-Corasick idea
+    within the re module).
+    """
+    trie: dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if "" not in node:
+            return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{'|'.join(branches)})?"
+
+    return build(trie)
+
+
+class Redactor:
+    """
+    Scrubs emails, phone numbers, API keys and configured terms (case-insensitive, whole words) from
+    rendered Markdown. Everything is compiled into one regex of named alternatives, so each entry
+    is scanned once (about 15 MB/s with thousands of terms); counts per kind and the time spent
+    are kept for the summary.
+    """
+
+    def __init__(self, terms: Iterable[str] = ()) -> None:
+        patterns = dict(REDACTION_PATTERNS)
+        terms = sorted({term.lower() for term in terms if term})
+        if terms:
+            patterns["TERM"] = rf"(?i:{literal_trie_pattern(terms)})(?![A-Za-z0-9_])"
+        alternatives = "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in patterns.items())
+        self.pattern = re.compile(f"{REDACTION_WORD_START}(?:{alternatives})")
+        # Identifies the patterns and terms, so outputs scrubbed with other settings can be told apart.
+        self.settings_digest = hashlib.sha256(self.pattern.pattern.encode("utf-8")).hexdigest()[:16]
+        self.counts = dict.fromkeys(["EMAIL", "PHONE", "API_KEY", "TERM"], 0)
+        self.scanned_bytes = 0
+        self.seconds = 0.0
+
+    def replace(self, match: re.Match) -> str:
+        kind = match.lastgroup
+        self.counts[kind] += 1
+        return f"[REDACTED:{kind}]"
+
+    def redact(self, text: str) -> str:
+        started = time.perf_counter()
+        redacted = self.pattern.sub(self.replace, text)
+        self.seconds += time.perf_counter() - started
+        self.scanned_bytes += len(text.encode("utf-8"))
+        return redacted
+
+    def print_summary(self) -> None:
+        megabytes = self.scanned_bytes / (1024 * 1024)
+        print(
+            t(
+                "redaction_summary",
+                sum(self.counts.values()),
+                self.counts["EMAIL"],
+                self.counts["PHONE"],
+                self.counts["API_KEY"],
+                self.counts["TERM"],
+                megabytes,
+                megabytes / self.seconds if self.seconds else 0.0,
+            )
+        )
+
+
+def load_redaction_terms(filepath: str) -> list[str]:
+    """Read terms to redact, one per line; blank lines and lines starting with # are ignored."""
+    with open(filepath, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Convert Google Takeout JSON to Markdown for NotebookLM")
     parser.add_argument(
         "--input_file", metavar="FILE", type=str, default="MyActivity.json", help="Path to input JSON file"
@@ -780,109 +2585,2558 @@ def main() -> int:
         metavar="FILE",
         type=str,
         default="Gemini_History.md",
-        help="Path to output Markdown file",
+        help="Path to output Markdown file, or - to stream the files to stdout",
     )
     parser.add_argument("--limit", type=int, default=1000000, help="Split file size limit in bytes")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to decode the input JSON (2 or more implies --mmap)",
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="Read the input through a memory-mapped view and decode only prefiltered Gemini activities",
+    )
+    parser.add_argument(
+        "--json-backend",
+        choices=["auto", *JSON_BACKENDS],
+        default="auto",
+        help="JSON decoder to use (auto = fastest importable one, falling back to the standard json module)",
+    )
+    parser.add_argument(
+        "--benchmark-json-backends",
+        action="store_true",
+        help="Time every importable JSON backend on the input file and exit without converting",
+    )
+    parser.add_argument(
+        "--state_file",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help=f"File that records the last processed entry time (default: {LAST_ENTRY_TIME_FILE})",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help="Convert every job in a CSV job list (input_file,output_dir[,state_file])",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of batch jobs converted concurrently (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--products",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help="JSON list of product filters; each product's entries go to its own output files in one pass",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Read the newest-first export only up to the last processed entry instead of decoding all of it",
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        metavar="DIR",
+        type=str,
+        default=None,
+        help="Cache the selected entries of each input in DIR and reuse them while the input is unchanged",
+    )
+    parser.add_argument(
+        "--attachments",
+        action="store_true",
+        help="Store the files entries reference (found next to the input) in <output>_assets and link them",
+    )
+    parser.add_argument(
+        "--redact",
+        action="store_true",
+        help="Replace emails, phone numbers and API keys in the Markdown with [REDACTED:KIND] markers",
+    )
+    parser.add_argument(
+        "--redact-terms",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help="Also redact the terms listed in FILE, one per line (implies --redact)",
+    )
+    parser.add_argument(
+        "--target-files",
+        metavar="N",
+        type=int,
+        default=None,
+        help="Regenerate into at most N files of balanced size (each still under --limit)",
+    )
+    parser.add_argument(
+        "--stats",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help="Write usage statistics (entries per day and month, length distributions, top titles) as JSON",
+    )
+    parser.add_argument(
+        "--timezone",
+        metavar="NAME",
+        type=str,
+        default=None,
+        help="Show entry times in this IANA time zone (for example Asia/Tokyo) instead of the export's UTC times",
+    )
+    parser.add_argument(
+        "--bundle",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help="Write the numbered files into one zip archive with a manifest instead of the output directory",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Print the planned output files and an estimated conversion time without writing anything",
+    )
+    parser.add_argument(
+        "--preview",
+        metavar="N",
+        type=int,
+        default=None,
+        help="Render N entries sampled across the whole history into one preview file and exit",
+    )
+    parser.add_argument(
+        "--progress",
+        choices=["json"],
+        default=None,
+        help="Emit periodic JSON-lines progress events (throughput and ETA) while converting",
+    )
+    parser.add_argument(
+        "--progress-fd",
+        metavar="FD",
+        type=int,
+        default=2,
+        help="File descriptor that receives the --progress events (default: 2, standard error)",
+    )
+    parser.add_argument(
+        "--metrics-log",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help=f"Append a JSON-lines record of this run's metrics to FILE (e.g. {METRICS_LOG_FILE}); see the report command",
+    )
+    parser.add_argument(
+        "--prometheus-textfile",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help="Write this run's metrics to FILE in the Prometheus node-exporter textfile format",
+    )
+    parser.add_argument(
+        "--store",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help="SQLite history store; only entries new to the store are imported and the affected tail re-rendered",
+    )
+    return parser
 
-    args = parser.parse_args()
-    input_json_filename: str = args.input_file
-    output_md_filename: str = args.output_file
-    md_file_size_limit: int = args.limit
 
-    try:
-        print(t("start_processing", input_json_filename))
+@dataclass
+class ProductFilter:
+    name: str
+    patterns: tuple[str, ...]
+    output_file: str
+    limit: int
+    state_file: str
 
-        data = load_json(input_json_filename)
-        if not data:
-            return 1
 
-        # Filter only "Gemini" related activities
-        gemini_entries: list[dict[str, Any]] = [
-            entry for entry in data if "Gemini" in entry.get("header", "")
-        ]
+class ProductMatcher:
+    """
+    Routes activity headers to product filters in one pass. All header patterns are compiled into
+    a single regex that rejects unrelated headers, and the route of every distinct header is cached
+    (an export only has a handful), so routing an entry is usually one dict lookup.
+    The first product in configuration order whose pattern occurs in the header wins.
+    """
 
-        print(t("extracted_entries", len(data), len(gemini_entries)))
-        print(t("converting_markdown"))
+    def __init__(self, products: list[ProductFilter]) -> None:
+        self.products = products
+        all_patterns = [pattern for product in products for pattern in product.patterns]
+        self.literals = tuple(pattern.encode("utf-8") for pattern in all_patterns)
+        self.pattern = re.compile("|".join(re.escape(pattern) for pattern in all_patterns))
+        self.routes: dict[str, Optional[int]] = {}
 
-        gemini_entries.reverse()
+    def route(self, header: str) -> Optional[int]:
+        """Return the index of the product a header belongs to, or None."""
+        try:
+            return self.routes[header]
+        except KeyError:
+            pass
+        index = None
+        if self.pattern.search(header):
+            index = next(
+                i
+                for i, product in enumerate(self.products)
+                if any(pattern in header for pattern in product.patterns)
+            )
+        self.routes[header] = index
+        return index
 
-        last_entry_time_loaded, force_full_regeneration = load_last_entry_time(LAST_ENTRY_TIME_FILE)
-        last_entry_time_processed: datetime = datetime.min.replace(tzinfo=timezone.utc)
+    def matches(self, entry: dict[str, Any]) -> bool:
+        return self.route(entry.get("header", "")) is not None
 
-        base_name, ext = os.path.splitext(output_md_filename)
 
-        def get_output_filename(idx: int) -> str:
-            return f"{base_name}-{idx:02d}{ext}"
+@dataclass
+class ConversionOptions:
+    input_file: str = "MyActivity.json"
+    output_file: str = "Gemini_History.md"
+    limit: int = 1000000
+    state_file: str = LAST_ENTRY_TIME_FILE
+    workers: int = 1
+    use_mmap: bool = False
+    json_backend: str = "auto"
+    products: list[ProductFilter] = field(default_factory=list)
+    store_file: Optional[str] = None
+    target_files: Optional[int] = None
+    redact: bool = False
+    redact_terms: list[str] = field(default_factory=list)
+    snapshot_dir: Optional[str] = None
+    progress_fd: Optional[int] = None
+    incremental: bool = False
+    attachments: bool = False
+    stats_file: Optional[str] = None
+    timezone: Optional[str] = None
 
-        file_index = 1
-        is_append_mode = False
-        if force_full_regeneration:
-            remove_numbered_output_files(base_name, ext)
-        else:
-            while os.path.exists(get_output_filename(file_index)):
-                is_append_mode = True
-                file_index += 1
-                output_filename = get_output_filename(file_index)
-            if file_index > 1:
-                file_index -= 1  # Use the last existing file for appending
-        output_filename = get_output_filename(file_index)
-        current_file_size = 0
-        if is_append_mode:
-            current_file_size = os.path.getsize(output_filename)
-
-        header = "# Gemini Chat History Archive\n\n"
-        header += f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-        def write_file(output_filename: str, header: str, texts: list[str], is_append_mode: bool) -> None:
-            mode = "a" if is_append_mode else "w"
-            with open(output_filename, mode, encoding="utf-8") as f:
-                if not is_append_mode:
-                    f.write(header)
-                for text in texts:
-                    f.write(text)
-
-        texts = []
-        if not is_append_mode:
-            current_file_size += len(header.encode("utf-8"))
 
-        for entry in gemini_entries:
-            dt, text = extract_text_content(entry, last_entry_time_loaded)
-            if text == "":
-                continue
-            last_entry_time_processed = dt
-            text_size = len(text.encode("utf-8"))
-
-            if current_file_size + text_size > md_file_size_limit:
-                if texts:
-                    write_file(output_filename, header, texts, is_append_mode)
-                    print(
-                        t("appended_to_file", output_filename)
-                        if is_append_mode
-                        else t("written_to_file", output_filename)
-                    )
-                file_index += 1
-                output_filename = get_output_filename(file_index)
-                is_append_mode = False
-                texts = []
-                current_file_size = len(header.encode("utf-8"))
-
-            texts.append(text)
-            current_file_size += text_size
+@dataclass
+class ConversionResult:
+    total_entries: int
+    gemini_entries: int
+    new_entries: int = 0
+    file_count: int = 0
+    files_written: list[str] = field(default_factory=list)
+    files_unchanged: list[str] = field(default_factory=list)
+    bytes_written: int = 0
+    last_entry_time_loaded: datetime = datetime.min.replace(tzinfo=timezone.utc)
+    last_entry_time_processed: datetime = datetime.min.replace(tzinfo=timezone.utc)
 
-        if texts:
-            write_file(output_filename, header, texts, is_append_mode)
+
+def load_product_filters(filepath: str, default_limit: int) -> list[ProductFilter]:
+    """
+    Read product filters from a JSON list of objects with "name", "match" (a header substring or a
+    list of them), "output_file" and optional "limit" and "state_file". The state file defaults to
+    the output base name followed by _last_entry_time.txt so every product keeps its own checkpoint.
+    """
+    with open(filepath, encoding="utf-8") as f:
+        config = json.load(f)
+
+    products: list[ProductFilter] = []
+    for item in config:
+        patterns = item["match"]
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        output_file = item["output_file"]
+        default_state_file = f"{os.path.splitext(output_file)[0]}_{LAST_ENTRY_TIME_FILE}"
+        products.append(
+            ProductFilter(
+                name=item["name"],
+                patterns=tuple(patterns),
+                output_file=output_file,
+                limit=int(item.get("limit", default_limit)),
+                state_file=item.get("state_file") or default_state_file,
+            )
+        )
+    if len({product.output_file for product in products}) != len(products):
+        raise ValueError(f"{filepath}: every product needs its own output_file")
+    return products
+
+
+def options_from_args(args: argparse.Namespace) -> ConversionOptions:
+    """Build conversion options from parsed command-line arguments."""
+    return ConversionOptions(
+        input_file=args.input_file,
+        output_file=args.output_file,
+        limit=args.limit,
+        state_file=args.state_file or LAST_ENTRY_TIME_FILE,
+        workers=args.workers,
+        use_mmap=args.mmap or args.workers > 1,
+        json_backend=args.json_backend,
+        products=load_product_filters(args.products, args.limit) if args.products else [],
+        store_file=args.store,
+        target_files=args.target_files,
+        redact=args.redact or bool(args.redact_terms),
+        redact_terms=load_redaction_terms(args.redact_terms) if args.redact_terms else [],
+        snapshot_dir=args.snapshot_dir,
+        progress_fd=args.progress_fd if args.progress else None,
+        incremental=args.incremental,
+        attachments=args.attachments,
+        stats_file=args.stats,
+        timezone=args.timezone,
+    )
+
+
+def relocate_outputs(
+    options: ConversionOptions, output_dir: str, state_file: Optional[str] = None
+) -> ConversionOptions:
+    """
+    Move every output and checkpoint of a conversion into output_dir, keeping file names.
+    state_file, if given, overrides the checkpoint of the default single-product conversion.
+    """
+    return replace(
+        options,
+        output_file=os.path.join(output_dir, os.path.basename(options.output_file)),
+        state_file=state_file or os.path.join(output_dir, os.path.basename(options.state_file)),
+        products=[
+            replace(
+                product,
+                output_file=os.path.join(output_dir, os.path.basename(product.output_file)),
+                state_file=os.path.join(output_dir, os.path.basename(product.state_file)),
+            )
+            for product in options.products
+        ],
+        store_file=options.store_file and os.path.join(output_dir, os.path.basename(options.store_file)),
+        stats_file=options.stats_file and os.path.join(output_dir, os.path.basename(options.stats_file)),
+    )
+
+
+SNAPSHOT_MAGIC = b"GJ2MD-SNAPSHOT\n"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(filepath: str) -> str:
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(SNAPSHOT_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def snapshot_path(snapshot_dir: str, input_file: str, filter_key: str) -> str:
+    """One snapshot per input path and activity filter."""
+    name = hashlib.sha256(f"{os.path.abspath(input_file)}\0{filter_key}".encode()).hexdigest()[:24]
+    return os.path.join(snapshot_dir, f"{name}.snapshot")
+
+
+def save_snapshot(
+    path: str,
+    input_file: str,
+    filter_key: str,
+    total_entries: int,
+    entries: list[dict[str, Any]],
+    content_hash: Optional[str] = None,
+) -> None:
+    """
+    Write the selected entries of input_file as a marshal snapshot, preceded by a small metadata
+    block (input identity, content hash, filter) that can be checked without loading the entries.
+    The file is written under a temporary name and renamed, so readers never see a partial snapshot.
+    """
+    stat = os.stat(input_file)
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "python": f"{sys.implementation.name}-{sys.version_info[0]}.{sys.version_info[1]}",
+        "input": os.path.abspath(input_file),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": content_hash or file_sha256(input_file),
+        "filter": filter_key,
+        "total_entries": total_entries,
+    }
+    meta_bytes = marshal.dumps(meta)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".tmp", delete=False) as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(struct.pack("<I", len(meta_bytes)))
+        f.write(meta_bytes)
+        marshal.dump(entries, f)
+    os.replace(f.name, path)
+
+
+def load_snapshot(
+    path: str, input_file: str, filter_key: str, refresh: bool = True
+) -> Optional[tuple[int, list[dict[str, Any]]]]:
+    """
+    Return (total entries, selected entries) from a snapshot that still matches input_file, or None.
+    Matching size and mtime are trusted; if only the mtime moved, the content hash decides, and a
+    snapshot that is still valid is rewritten with the new mtime unless refresh is False.
+    Unreadable snapshots are ignored.
+    """
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(input_file)
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                return None
+            (meta_length,) = struct.unpack("<I", f.read(4))
+            meta = marshal.loads(f.read(meta_length))
+            if (
+                meta["version"] != SNAPSHOT_VERSION
+                or meta["python"] != f"{sys.implementation.name}-{sys.version_info[0]}.{sys.version_info[1]}"
+                or meta["input"] != os.path.abspath(input_file)
+                or meta["filter"] != filter_key
+                or meta["size"] != stat.st_size
+            ):
+                return None
+            content_hash = None
+            if meta["mtime_ns"] != stat.st_mtime_ns:
+                content_hash = file_sha256(input_file)
+                if content_hash != meta["sha256"]:
+                    return None
+            entries = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError, KeyError, struct.error):
+        return None
+
+    if content_hash is not None and refresh:
+        save_snapshot(path, input_file, filter_key, meta["total_entries"], entries, content_hash)
+    return meta["total_entries"], entries
+
+
+ATTACHMENT_COPY_WORKERS = 8
+FICLONE = 0x40049409  # Linux ioctl that makes a copy-on-write clone (Btrfs, XFS, bcachefs...)
+
+
+def clone_file(source: str, destination: str) -> None:
+    """Make a copy-on-write clone of source; raises OSError where the platform or filesystem has no clones."""
+    try:
+        import fcntl
+    except ImportError as e:
+        raise OSError("copy-on-write clones are not supported on this platform") from e
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def place_attachment(source: str, assets_dir: str) -> str:
+    """
+    Store one attachment in assets_dir under its content hash and return the stored file name, so
+    identical files are stored once. A hardlink is tried first, then a copy-on-write clone, then a
+    plain copy. The file is placed under a temporary name and renamed, so it is never seen partially.
+    """
+    stored_name = file_sha256(source)[:32] + os.path.splitext(source)[1].lower()
+    destination = os.path.join(assets_dir, stored_name)
+    if os.path.exists(destination):
+        return stored_name
+
+    temporary = os.path.join(assets_dir, f".{stored_name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    for place in (os.link, clone_file, shutil.copyfile):
+        try:
+            place(source, temporary)
+            break
+        except OSError:
+            if place is shutil.copyfile:
+                raise
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temporary)
+    os.replace(temporary, destination)
+    return stored_name
+
+
+def assets_dir_for(output_file: str) -> str:
+    """Attachments of an output set go to <output base name>_assets next to the outputs."""
+    return f"{os.path.splitext(output_file)[0]}_assets"
+
+
+def link_attachments(entries: Iterable[dict[str, Any]], input_file: str, assets_dir: str) -> dict[str, str]:
+    """
+    Link the attachments the entries reference, found next to the input file, into assets_dir on a
+    thread pool (hashing and copying release the GIL). Returns a map from attachment name to the
+    stored file's path relative to the outputs; missing attachments are left out and reported.
+    """
+    input_dir = os.path.dirname(input_file)
+    names = dict.fromkeys(name for entry in entries for name in entry_attachment_names(entry))
+    sources: dict[str, str] = {}
+    for name in names:
+        # Takeout stores attachments as plain file names; anything with a path is not one of them.
+        if os.path.basename(name) != name or name in ("", ".", ".."):
+            continue
+        source = os.path.join(input_dir, name)
+        if os.path.isfile(source):
+            sources[name] = source
+    if len(sources) < len(names):
+        print_warning("warning_attachments_missing", len(names) - len(sources), input_dir or ".")
+    if not sources:
+        return {}
+
+    os.makedirs(assets_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=ATTACHMENT_COPY_WORKERS) as executor:
+        stored_names = list(executor.map(place_attachment, sources.values(), itertools.repeat(assets_dir)))
+    print(t("attachments_linked", len(sources), len(set(stored_names)), assets_dir))
+
+    assets_dirname = os.path.basename(assets_dir)
+    return {name: f"{assets_dirname}/{stored_name}" for name, stored_name in zip(sources, stored_names)}
+
+
+def load_routed_entries(
+    options: ConversionOptions, write_snapshot: bool = True
+) -> Optional[tuple[list[ProductFilter], list[list[dict[str, Any]]], ConversionResult]]:
+    """
+    Load the export, keep the selected activities and route them to their products (newest first,
+    as exported). Returns None when the input could not be loaded (the reason has already been printed).
+    With write_snapshot False, a snapshot is used if valid but never created or refreshed.
+    """
+    print(t("start_processing", options.input_file))
+
+    products = options.products or [
+        ProductFilter("Gemini", ("Gemini",), options.output_file, options.limit, options.state_file)
+    ]
+    matcher = ProductMatcher(products)
+    entry_filter = matcher.matches if options.products else is_gemini_entry
+    filter_key = "\x1f".join("\x1e".join(product.patterns) for product in products)
+    snapshot = snapshot_path(options.snapshot_dir, options.input_file, filter_key) if options.snapshot_dir else None
+
+    checkpoint = None
+    if options.incremental and not options.store_file and not options.target_files:
+        # The store keeps its own watermark and balanced splits need every entry, so both read it all.
+        checkpoint = incremental_checkpoint(product.state_file for product in products)
+
+    cached = (
+        load_snapshot(snapshot, options.input_file, filter_key, refresh=write_snapshot)
+        if snapshot and checkpoint is None
+        else None
+    )
+    if checkpoint is not None:
+        total_entries, gemini_entries, bytes_read = load_entries_until_checkpoint(
+            options.input_file, checkpoint, options.json_backend, entry_filter, matcher.literals
+        )
+        if not total_entries:
+            return None
+        print(t("incremental_read", bytes_read, os.path.getsize(options.input_file), total_entries))
+    elif cached is not None:
+        total_entries, gemini_entries = cached
+        print(t("snapshot_loaded", len(gemini_entries), snapshot))
+    elif options.use_mmap:
+        total_entries, gemini_entries = load_gemini_entries(
+            options.input_file, options.workers, options.json_backend, entry_filter, matcher.literals
+        )
+        if not total_entries:
+            return None
+    else:
+        data = load_json(options.input_file, options.json_backend)
+        if not data:
+            return None
+
+        # Filter only "Gemini" related activities
+        gemini_entries = [entry for entry in data if entry_filter(entry)]
+        total_entries = len(data)
+
+    if snapshot and cached is None and checkpoint is None and write_snapshot:
+        save_snapshot(snapshot, options.input_file, filter_key, total_entries, gemini_entries)
+        print(t("snapshot_saved", snapshot))
+
+    result = ConversionResult(total_entries=total_entries, gemini_entries=len(gemini_entries))
+    print(t("extracted_entries", total_entries, len(gemini_entries)))
+
+    if len(products) == 1:
+        routed_entries = [gemini_entries]
+    else:
+        routed_entries = [[] for _ in products]
+        for entry in gemini_entries:
+            routed_entries[matcher.route(entry.get("header", ""))].append(entry)
+    return products, routed_entries, result
+
+
+PROGRESS_INTERVAL_SECONDS = 1.0
+PROGRESS_CHECK_ENTRIES = 256
+
+T = TypeVar("T")
+
+
+class ProgressReporter:
+    """
+    Writes JSON-lines progress events for orchestrators. Reporting is rate limited so it costs
+    almost nothing: the clock is only read every PROGRESS_CHECK_ENTRIES scanned entries, and an
+    event is emitted at most once per interval. bytes_written counts completed output files.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        input_file: str,
+        result: ConversionResult,
+        interval: float = PROGRESS_INTERVAL_SECONDS,
+    ) -> None:
+        self.stream = stream
+        self.input_file = input_file
+        self.result = result
+        self.interval = interval
+        self.entries_scanned = 0
+        self.entries_rendered = 0
+        self.current_file: Optional[str] = None
+        self.started = time.monotonic()
+        self.next_event = self.started + interval
+        self.next_check = PROGRESS_CHECK_ENTRIES
+
+    def track(self, entries: Iterable[T]) -> Iterator[T]:
+        """Yield entries, counting each one as scanned."""
+        for entry in entries:
+            self.entries_scanned += 1
+            if self.entries_scanned >= self.next_check:
+                self.next_check += PROGRESS_CHECK_ENTRIES
+                now = time.monotonic()
+                if now >= self.next_event:
+                    self.next_event = now + self.interval
+                    self.emit("progress", now)
+            yield entry
+
+    def rendered(self, output_filename: str) -> None:
+        self.entries_rendered += 1
+        self.current_file = output_filename
+
+    def emit(self, event: str, now: Optional[float] = None) -> None:
+        elapsed = (time.monotonic() if now is None else now) - self.started
+        total = self.result.gemini_entries
+        rate = self.entries_scanned / elapsed if elapsed > 0 else 0.0
+        remaining = max(total - self.entries_scanned, 0)
+        record = {
+            "event": event,
+            "input_file": self.input_file,
+            "elapsed_seconds": round(elapsed, 3),
+            "entries_total": total,
+            "entries_scanned": self.entries_scanned,
+            "entries_rendered": self.entries_rendered,
+            "bytes_written": self.result.bytes_written,
+            "current_file": self.current_file,
+            "entries_per_second": round(rate, 1),
+            "eta_seconds": round(remaining / rate, 1) if rate else None,
+        }
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+STATS_HISTOGRAM_BUCKETS = 24  # Powers of two up to 2**22 characters, then one overflow bucket
+STATS_TOP_K = 20
+STATS_TOP_K_CAPACITY = 2000  # Distinct keys tracked before the rarest are dropped
+
+
+class LengthHistogram:
+    """
+    Fixed-size histogram of text lengths in power-of-two buckets: bucket i holds lengths below 2**i
+    (bucket 0 is the empty text). Count, sum, min and max are exact; percentiles are bucket bounds.
+    """
+
+    def __init__(self) -> None:
+        self.buckets = [0] * STATS_HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max = 0
+
+    def add(self, length: int) -> None:
+        self.buckets[min(length.bit_length(), STATS_HISTOGRAM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += length
+        if self.min is None or length < self.min:
+            self.min = length
+        if length > self.max:
+            self.max = length
+
+    def percentile(self, fraction: float) -> Optional[int]:
+        """Upper bound of the bucket holding the given fraction of lengths (capped at the maximum)."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return min((1 << index) - 1, self.max) if index < STATS_HISTOGRAM_BUCKETS - 1 else self.max
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        last_used = max((index for index, bucket in enumerate(self.buckets) if bucket), default=-1)
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": round(self.total / self.count, 1) if self.count else None,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "histogram": [
+                {"below": 1 << index if index < STATS_HISTOGRAM_BUCKETS - 1 else None, "count": bucket}
+                for index, bucket in enumerate(self.buckets[: last_used + 1])
+            ],
+        }
+
+
+class TopCounter:
+    """
+    Bounded frequency counter (Misra-Gries): at most `capacity` keys are tracked. A new key that does
+    not fit cancels one occurrence of every tracked key instead, which is amortized O(1) per key.
+    Any key seen more than n / (capacity + 1) times out of n is kept, and each count is low by at
+    most `max_error`, the number of such cancellations.
+    """
+
+    def __init__(self, capacity: int = STATS_TOP_K_CAPACITY) -> None:
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+        self.max_error = 0
+
+    def add(self, key: str) -> None:
+        counts = self.counts
+        if key in counts:
+            counts[key] += 1
+        elif len(counts) < self.capacity:
+            counts[key] = 1
+        else:
+            self.counts = {tracked: count - 1 for tracked, count in counts.items() if count > 1}
+            self.max_error += 1
+
+    def most_common(self, k: int = STATS_TOP_K) -> list[dict[str, Any]]:
+        top = heapq.nlargest(k, self.counts.items(), key=lambda item: item[1])
+        return [{"title": key, "count": count} for key, count in top]
+
+
+class UsageStats:
+    """Usage aggregates accumulated over the selected entries of a conversion, written as JSON."""
+
+    def __init__(self) -> None:
+        self.entries = 0
+        self.per_day: dict[str, int] = {}
+        self.per_month: dict[str, int] = {}
+        self.per_product: dict[str, int] = {}
+        self.first_time: Optional[datetime] = None
+        self.last_time: Optional[datetime] = None
+        self.prompt_chars = LengthHistogram()
+        self.response_html_chars = LengthHistogram()
+        self.actions = TopCounter()
+        self.titles = TopCounter()
+
+    def update(self, product: str, entries: Iterable[dict[str, Any]]) -> None:
+        unparsable = datetime.min.replace(tzinfo=timezone.utc)
+        for entry in entries:
+            self.entries += 1
+            self.per_product[product] = self.per_product.get(product, 0) + 1
+            dt = entry_time(entry)
+            if dt != unparsable:
+                if dt.utcoffset():
+                    dt = dt.astimezone(timezone.utc)
+                day = dt.date().isoformat()
+                self.per_day[day] = self.per_day.get(day, 0) + 1
+                self.per_month[day[:7]] = self.per_month.get(day[:7], 0) + 1
+                if self.first_time is None or dt < self.first_time:
+                    self.first_time = dt
+                if self.last_time is None or dt > self.last_time:
+                    self.last_time = dt
+            self.prompt_chars.add(sum(len(item.get("value", "")) for item in entry.get("subtitles", [])))
+            self.response_html_chars.add(sum(len(item.get("html", "")) for item in entry.get("safeHtmlItem", [])))
+            title = entry.get("title", "")
+            if title:
+                self.actions.add(title.split(maxsplit=1)[0])
+                self.titles.add(title)
+
+    def to_dict(self, input_file: str) -> dict[str, Any]:
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "input_file": input_file,
+            "entries": self.entries,
+            "entries_per_product": self.per_product,
+            "first_time": self.first_time.isoformat() if self.first_time else None,
+            "last_time": self.last_time.isoformat() if self.last_time else None,
+            "entries_per_month": dict(sorted(self.per_month.items())),
+            "entries_per_day": dict(sorted(self.per_day.items())),
+            "prompt_chars": self.prompt_chars.to_dict(),
+            "response_html_chars": self.response_html_chars.to_dict(),
+            "top_actions": self.actions.most_common(),
+            "top_titles": self.titles.most_common(),
+            "top_titles_max_undercount": self.titles.max_error,
+        }
+
+    def write(self, filepath: str, input_file: str) -> None:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(input_file), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+
+def open_progress_stream(fd: int) -> TextIO:
+    """Open a file descriptor for progress events; fd 2 uses sys.stderr so it stays ordered with warnings."""
+    if fd == 2:
+        return sys.stderr
+    return os.fdopen(fd, "w", encoding="utf-8", closefd=False)
+
+
+def convert(
+    options: ConversionOptions,
+    on_file_written: Optional[Callable[[str], None]] = None,
+    sink: Optional["OutputSink"] = None,
+) -> Optional[ConversionResult]:
+    """
+    Convert one export into numbered Markdown files, one output set per product filter.
+    on_file_written, if given, is called with each output path as soon as that file is complete.
+    sink, if given, receives the numbered files instead of the disk; such a run covers the whole
+    history and leaves the checkpoint alone.
+    Returns None when the input could not be loaded (the reason has already been printed).
+    """
+    if sink is not None:
+        options = replace(options, incremental=False)  # Every entry is rendered, so all of them are read
+    loaded = load_routed_entries(options)
+    if loaded is None:
+        return None
+    products, routed_entries, result = loaded
+    print(t("converting_markdown"))
+    redactor = Redactor(options.redact_terms) if options.redact else None
+    progress = None
+    if options.progress_fd is not None:
+        progress = ProgressReporter(open_progress_stream(options.progress_fd), options.input_file, result)
+        progress.emit("start")
+
+    heading_time = heading_time_formatter(options.timezone)
+    stats = UsageStats() if options.stats_file else None
+    if stats is not None:
+        for product, product_entries in zip(products, routed_entries):
+            stats.update(product.name, product_entries)
+
+    if options.store_file:
+        with contextlib.closing(HistoryStore(options.store_file)) as store:
+            for product, product_entries in zip(products, routed_entries):
+                if options.products:
+                    print(t("product_entries", product.name, len(product_entries)))
+                render_from_store(store, product, product_entries, result, on_file_written, redactor, progress)
+    else:
+        for product, product_entries in zip(products, routed_entries):
+            if options.products:
+                print(t("product_entries", product.name, len(product_entries)))
+            attachment_links = None
+            if options.attachments:
+                # Only entries the writer will render need their attachments linked.
+                checkpoint = None if options.target_files else incremental_checkpoint([product.state_file])
+                pending_entries = (
+                    entry
+                    for entry in product_entries
+                    if checkpoint is None or is_after_checkpoint(entry, checkpoint)
+                )
+                attachment_links = link_attachments(
+                    pending_entries, options.input_file, assets_dir_for(product.output_file)
+                )
+            product_entries.reverse()
+            write_numbered_outputs(
+                time_ordered_entries(product_entries),
+                product,
+                result,
+                on_file_written,
+                options.target_files,
+                redactor,
+                progress,
+                attachment_links,
+                sink,
+                heading_time,
+            )
+
+    if redactor is not None:
+        redactor.print_summary()
+    if stats is not None:
+        stats.write(options.stats_file, options.input_file)
+        print(t("stats_written", options.stats_file))
+    if progress is not None:
+        progress.emit("done")
+    return result
+
+
+SORT_RUN_ENTRIES = 50000
+STDOUT_OUTPUT = "-"
+# Streamed files are named like the default outputs and each starts with the ASCII file separator.
+STREAM_RECORD_FILE = "Gemini_History.md"
+STREAM_FILE_SEPARATOR = "\x1c"
+BUNDLE_MANIFEST_FILE = "manifest.json"
+# Where an oversized entry may be cut, coarsest first: paragraphs, then lines (list items, table rows).
+ENTRY_SPLIT_SEPARATORS = ("\n\n", "\n")
+UTF8_MAX_CHAR_BYTES = 4
+
+
+def entry_time(entry: dict[str, Any]) -> datetime:
+    """Activity time as an aware datetime for ordering; naive times are taken as UTC, unparsable ones sort first."""
+    try:
+        dt = datetime.fromisoformat(entry.get("time", "").replace("Z", "+00:00"))
+    except ValueError:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+def count_order_breaks(entries: Iterable[dict[str, Any]]) -> int:
+    """
+    Count the places where an entry is older than the one before it. Oldest-first entries with
+    n breaks form n + 1 ascending runs; 0 means they can be written as they are.
+    """
+    breaks = 0
+    previous = None
+    for current in map(entry_time, entries):
+        if previous is not None and current < previous:
+            breaks += 1
+        previous = current
+    return breaks
+
+
+def iter_marshal_file(f: BinaryIO) -> Iterator[Any]:
+    while True:
+        try:
+            yield marshal.load(f)
+        except EOFError:
+            return
+
+
+def external_sort_entries(
+    entries: list[dict[str, Any]], run_entries: int = SORT_RUN_ENTRIES
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield entries oldest-first with bounded memory: runs of run_entries are sorted and spilled to
+    temporary files, the list is emptied, and the runs are merged back lazily. The sort is stable,
+    so entries sharing a timestamp keep their order. The spill files are removed once the
+    iterator is exhausted or closed.
+    """
+    with tempfile.TemporaryDirectory(prefix="gemini-json2md-sort-") as sort_dir:
+        run_files = []
+        for run_start in range(0, len(entries), run_entries):
+            run_file = os.path.join(sort_dir, f"run-{len(run_files):05d}")
+            with open(run_file, "wb") as f:
+                for entry in sorted(entries[run_start : run_start + run_entries], key=entry_time):
+                    marshal.dump(entry, f)
+            run_files.append(run_file)
+        entries.clear()
+
+        with contextlib.ExitStack() as stack:
+            runs = [iter_marshal_file(stack.enter_context(open(run_file, "rb"))) for run_file in run_files]
+            yield from heapq.merge(*runs, key=entry_time)
+
+
+def time_ordered_entries(entries: list[dict[str, Any]]) -> Iterable[dict[str, Any]]:
+    """
+    Return oldest-first entries unchanged when they are in time order. Otherwise warn and return
+    them through an external merge sort, since the writer's checkpoint assumes time order.
+    """
+    breaks = count_order_breaks(entries)
+    if not breaks:
+        return entries
+    print_warning("warning_entries_out_of_order", breaks + 1, len(entries))
+    return external_sort_entries(entries)
+
+
+def iter_text_fragments(
+    text: str, budget: int, separators: tuple[str, ...] = ENTRY_SPLIT_SEPARATORS
+) -> Iterator[str]:
+    """
+    Yield consecutive slices of text that each end at a separator and fit in budget UTF-8 bytes.
+    A slice too large at one separator is cut at the next finer one, and a single line that is still
+    too large is cut at the last character boundary within the budget. Every slice holds at least one
+    character, so a budget narrower than a character yields that character alone instead of nothing.
+    """
+    if not separators:
+        data = text.encode("utf-8")
+        start = 0
+        while start < len(data):
+            end = min(start + budget, len(data))
+            while end < len(data) and data[end] & 0xC0 == 0x80:  # Never cut inside a UTF-8 sequence
+                end -= 1
+            if end <= start:  # Not even one character fits; take it whole
+                end = start + 1
+                while end < len(data) and data[end] & 0xC0 == 0x80:
+                    end += 1
+            yield data[start:end].decode("utf-8")
+            start = end
+        return
+
+    separator = separators[0]
+    start = 0
+    while start < len(text):
+        end = text.find(separator, start)
+        end = len(text) if end < 0 else end + len(separator)
+        fragment = text[start:end]
+        if len(fragment.encode("utf-8")) <= budget:
+            yield fragment
+        else:
+            yield from iter_text_fragments(fragment, budget, separators[1:])
+        start = end
+
+
+def split_oversized_entry(text: str, capacity: int) -> Iterator[str]:
+    """
+    Yield a rendered entry whole if it fits in capacity UTF-8 bytes, otherwise in pieces that do,
+    cut at paragraph or line boundaries where possible. Every piece after the first starts with the
+    entry heading marked "(continued)", so each output file stays readable on its own. Pieces are
+    produced lazily, so only one output file's worth of them is held at a time.
+    """
+    if len(text) * 4 <= capacity or len(text.encode("utf-8")) <= capacity:
+        yield text
+        return
+
+    heading, separator, body = text.partition("\n\n")
+    continuation = f"{heading} (continued)\n\n"
+    continuation_size = len(continuation.encode("utf-8"))
+    budget = capacity - continuation_size
+    if budget < UTF8_MAX_CHAR_BYTES:
+        yield text  # The limit cannot hold a heading and any character; keep the previous behavior.
+        return
+
+    parts = [heading + separator]
+    size = len(parts[0].encode("utf-8"))
+    for fragment in iter_text_fragments(body, budget):
+        fragment_size = len(fragment.encode("utf-8"))
+        if size + fragment_size > capacity:
+            yield "".join(parts)
+            parts = [continuation]
+            size = continuation_size
+        parts.append(fragment)
+        size += fragment_size
+    yield "".join(parts)
+
+
+class OutputSink(abc.ABC):
+    """
+    Destination that replaces the output files on disk. The writer calls start_file with the file
+    name, write with the header and with each entry as soon as it is rendered, and end_file once
+    the file is complete.
+    """
+
+    def prepare(self, text: str) -> str:
+        """Adjust a rendered entry before it is sized and written."""
+        return text
+
+    @abc.abstractmethod
+    def start_file(self, name: str) -> None:
+        """Begin the file with the given name."""
+
+    @abc.abstractmethod
+    def write(self, data: bytes) -> None:
+        """Append data to the current file."""
+
+    @abc.abstractmethod
+    def end_file(self, entries: int, first_time: Optional[datetime], last_time: Optional[datetime]) -> None:
+        """Complete the current file, which holds entries dated from first_time to last_time."""
+
+
+class StdoutRecordSink(OutputSink):
+    """Files written one after another to a byte stream, each after a line with the separator and its name."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self.stream = stream
+        self.name = ""
+
+    def prepare(self, text: str) -> str:
+        return text.replace(STREAM_FILE_SEPARATOR, "")  # Keep record boundaries unambiguous
+
+    def start_file(self, name: str) -> None:
+        self.name = name
+        self.stream.write(f"{STREAM_FILE_SEPARATOR}{name}\n".encode())
+
+    def write(self, data: bytes) -> None:
+        self.stream.write(data)
+
+    def end_file(self, entries: int, first_time: Optional[datetime], last_time: Optional[datetime]) -> None:
+        self.stream.flush()
+        print(t("streamed_to_stdout", self.name))
+
+
+class ZipBundleSink(OutputSink):
+    """
+    Files written as members of one zip archive, compressed as they are produced, plus a manifest
+    of the files and their date ranges. The archive is built under a temporary name and only
+    replaces path when close is called with keep=True.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path) or ".", suffix=".tmp", delete=False) as f:
+            self.temp_path = f.name
+        self.archive = zipfile.ZipFile(self.temp_path, "w", zipfile.ZIP_DEFLATED)
+        self.member: Optional[BinaryIO] = None
+        self.name = ""
+        self.size = 0
+        self.files: list[dict[str, Any]] = []
+
+    def start_file(self, name: str) -> None:
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        self.member = self.archive.open(info, "w")
+        self.name = name
+        self.size = 0
+
+    def write(self, data: bytes) -> None:
+        self.member.write(data)
+        self.size += len(data)
+
+    def end_file(self, entries: int, first_time: Optional[datetime], last_time: Optional[datetime]) -> None:
+        self.member.close()
+        self.member = None
+        self.files.append(
+            {
+                "file": self.name,
+                "entries": entries,
+                "bytes": self.size,
+                "first_entry_time": first_time.isoformat() if first_time else None,
+                "last_entry_time": last_time.isoformat() if last_time else None,
+            }
+        )
+        print(t("added_to_bundle", self.name))
+
+    def close(self, keep: bool) -> None:
+        try:
+            if self.member is not None:
+                self.member.close()
+            if keep:
+                manifest = {"generated_at": datetime.now(timezone.utc).isoformat(), "files": self.files}
+                self.archive.writestr(
+                    BUNDLE_MANIFEST_FILE, json.dumps(manifest, ensure_ascii=False, indent=2) + "\n"
+                )
+        finally:
+            self.archive.close()
+            if keep:
+                os.replace(self.temp_path, self.path)
+            else:
+                os.remove(self.temp_path)
+
+
+def spill_pieces(
+    pieces: Iterable[tuple[datetime, str, bool]],
+) -> tuple[list[int], Iterator[tuple[datetime, str, bool]]]:
+    """
+    Write rendered (time, text, starts entry) pieces to a temporary file and return their UTF-8
+    sizes with an iterator that reads them back in order. A split that needs every size up front
+    then holds only the sizes in memory, not the rendered history. The file is removed once the
+    iterator is exhausted or closed.
+    """
+    sizes: list[int] = []
+    with contextlib.ExitStack() as cleanup:
+        spill = cleanup.enter_context(tempfile.TemporaryFile())
+        for dt, text, starts_entry in pieces:
+            data = text.encode("utf-8")
+            marshal.dump((dt.isoformat(), data, starts_entry), spill)
+            sizes.append(len(data))
+        cleanup.pop_all()  # Written in full; the reader below closes the file from here on
+
+    count = len(sizes)
+
+    def replay() -> Iterator[tuple[datetime, str, bool]]:
+        with spill:
+            spill.seek(0)
+            for _ in range(count):
+                time_str, data, starts_entry = marshal.load(spill)
+                yield datetime.fromisoformat(time_str), data.decode("utf-8"), starts_entry
+
+    return sizes, replay()
+
+
+def build_output_header() -> str:
+    header = "# Gemini Chat History Archive\n\n"
+    header += f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    return header
+
+
+def write_numbered_outputs(
+    gemini_entries: Iterable[dict[str, Any]],
+    product: ProductFilter,
+    result: ConversionResult,
+    on_file_written: Optional[Callable[[str], None]] = None,
+    target_files: Optional[int] = None,
+    redactor: Optional[Redactor] = None,
+    progress: Optional[ProgressReporter] = None,
+    attachment_links: Optional[dict[str, str]] = None,
+    sink: Optional[OutputSink] = None,
+    heading_time: Optional[HeadingTimeFormatter] = None,
+) -> None:
+    """
+    Render oldest-first entries into one product's numbered files, honoring its limit and checkpoint.
+    With target_files, every entry is rendered first and split into balanced files instead.
+    An entry too large for a file of its own is split across consecutive files.
+    A redactor, if given, scrubs each rendered entry before it is sized and written.
+    A progress reporter, if given, counts every scanned and rendered entry.
+    attachment_links, if given, adds links to the attachments an entry references.
+    sink, if given, receives the files instead, each entry as soon as it is rendered. Every entry is
+    rendered, and neither the files on disk nor the checkpoint are read or written, so a streamed or
+    bundled set is always complete and a later run to disk still sees every new entry.
+    heading_time, if given, formats the entry headings in its time zone.
+    """
+    if target_files or sink is not None:
+        # Balanced split points depend on every entry's size, and a sink receives a whole new set,
+        # so the whole set is regenerated.
+        last_entry_time_loaded, force_full_regeneration = datetime.min.replace(tzinfo=timezone.utc), True
+    else:
+        last_entry_time_loaded, force_full_regeneration = load_last_entry_time(product.state_file)
+    last_entry_time_processed: datetime = datetime.min.replace(tzinfo=timezone.utc)
+    files_written_before = len(result.files_written)
+    files_produced_before = files_written_before + len(result.files_unchanged)
+
+    base_name, ext = os.path.splitext(
+        STREAM_RECORD_FILE if product.output_file == STDOUT_OUTPUT else product.output_file
+    )
+
+    def get_output_filename(idx: int) -> str:
+        return f"{base_name}-{idx:02d}{ext}"
+
+    file_index = 1
+    is_append_mode = False
+    if not force_full_regeneration and sink is None:
+        while os.path.exists(get_output_filename(file_index)):
+            is_append_mode = True
+            file_index += 1
+            output_filename = get_output_filename(file_index)
+        if file_index > 1:
+            file_index -= 1  # Use the last existing file for appending
+    output_filename = get_output_filename(file_index)
+    current_file_size = 0
+    if is_append_mode:
+        current_file_size = os.path.getsize(output_filename)
+
+    header = build_output_header()
+
+    def write_file(output_filename: str, header: str, texts: list[str], is_append_mode: bool) -> None:
+        if sink is not None:
+            # The file was written as it was rendered; only close it off.
+            sink.end_file(file_entries, file_first_time, file_last_time)
+            result.files_written.append(output_filename)
+            result.bytes_written += current_file_size
+            return
+
+        # Full regeneration: leave files whose content only differs by the header timestamp untouched.
+        if (
+            not is_append_mode
+            and os.path.exists(output_filename)
+            and output_content_digest(header + "".join(texts)) == output_file_digest(output_filename)
+        ):
+            result.files_unchanged.append(output_filename)
+            print(t("unchanged_output_file", output_filename))
+            return
+
+        mode = "a" if is_append_mode else "w"
+        with open(output_filename, mode, encoding="utf-8") as f:
+            if not is_append_mode:
+                f.write(header)
+            for text in texts:
+                f.write(text)
+        result.files_written.append(output_filename)
+        result.bytes_written += current_file_size - existing_file_size
+        print(t("appended_to_file", output_filename) if is_append_mode else t("written_to_file", output_filename))
+        if on_file_written is not None:
+            on_file_written(output_filename)
+
+    texts = []
+    existing_file_size = current_file_size
+    # Entries started in the current file and its date range, reported to a sink
+    file_entries = 0
+    file_first_time: Optional[datetime] = None
+    file_last_time: Optional[datetime] = None
+    header_size = len(header.encode("utf-8"))
+    if not is_append_mode:
+        current_file_size += header_size
+
+    rendered = (
+        (dt, redactor.redact(text) if redactor else text)
+        for dt, text in (
+            extract_text_content(
+                entry, last_entry_time_loaded, attachment_links=attachment_links, heading_time=heading_time
+            )
+            for entry in (progress.track(gemini_entries) if progress else gemini_entries)
+        )
+        if text != ""
+    )
+    # (time, text, whether the text starts an entry) for every entry or piece of an oversized one
+    pieces: Iterable[tuple[datetime, str, bool]] = (
+        (dt, piece, index == 0)
+        for dt, text in rendered
+        for index, piece in enumerate(split_oversized_entry(text, product.limit - header_size))
+    )
+    split_points: Optional[set[int]] = None
+    if target_files:
+        sizes, pieces = spill_pieces(pieces)
+        points = balanced_split_points(sizes, header_size, product.limit, target_files)
+        if len(points) + 1 > target_files:
+            print_warning("warning_target_files_exceeded", target_files, product.limit, len(points) + 1)
+        split_points = set(points)
+
+    for position, (dt, text, starts_entry) in enumerate(pieces):
+        last_entry_time_processed = dt
+        if starts_entry:
+            result.new_entries += 1
+        if sink is not None:
+            text = sink.prepare(text)
+        text_size = len(text.encode("utf-8"))
+
+        if (
+            position in split_points
+            if split_points is not None
+            else current_file_size + text_size > product.limit
+        ):
+            if texts:
+                write_file(output_filename, header, texts, is_append_mode)
+            file_index += 1
+            output_filename = get_output_filename(file_index)
+            is_append_mode = False
+            texts = []
+            existing_file_size = 0
+            current_file_size = header_size
+            file_entries = 0
+            file_first_time = None
+
+        texts.append(text)
+        current_file_size += text_size
+        if sink is not None:
+            if len(texts) == 1:
+                sink.start_file(os.path.basename(output_filename))
+                sink.write(header.encode("utf-8"))
+            sink.write(text.encode("utf-8"))
+            if starts_entry:
+                file_entries += 1
+            file_first_time = file_first_time or dt
+            file_last_time = dt
+        if progress and starts_entry:
+            progress.rendered(output_filename)
+
+    if texts:
+        write_file(output_filename, header, texts, is_append_mode)
+
+    if force_full_regeneration and sink is None:
+        # Only outputs beyond the regenerated set are stale now.
+        produced = len(result.files_written) + len(result.files_unchanged) - files_produced_before
+        remove_numbered_output_files(base_name, ext, keep=produced)
+
+    changed_files = result.files_written[files_written_before:]
+    print(t("changed_output_files", len(changed_files)))
+    for changed_file in changed_files:
+        print(f"  - {changed_file}")
+
+    if sink is None and last_entry_time_loaded < last_entry_time_processed:
+        with open(product.state_file, "w", encoding="utf-8") as f:
+            f.write(last_entry_time_processed.isoformat())
+
+    print(t("processing_complete", last_entry_time_loaded, last_entry_time_processed, file_index))
+    result.file_count += file_index
+    result.last_entry_time_loaded = last_entry_time_loaded
+    result.last_entry_time_processed = max(result.last_entry_time_processed, last_entry_time_processed)
+
+
+def greedy_split_points(
+    prefix_sizes: list[int], header_size: int, capacity: int, max_files: Optional[int] = None
+) -> list[int]:
+    """
+    Indices where a new file starts when entries are packed greedily into files of at most capacity
+    bytes (an oversized entry gets a file of its own). prefix_sizes[i] is the size of entries[:i].
+    Each file costs one binary search, and packing stops once max_files is exceeded.
+    """
+    entry_count = len(prefix_sizes) - 1
+    points: list[int] = []
+    start = 0
+    while True:
+        end = bisect.bisect_right(prefix_sizes, prefix_sizes[start] + capacity - header_size, lo=start + 1) - 1
+        start = max(end, start + 1)
+        if start >= entry_count:
+            return points
+        points.append(start)
+        if max_files is not None and len(points) >= max_files:
+            return points
+
+
+def balanced_split_points(sizes: list[int], header_size: int, limit: int, target_files: int) -> list[int]:
+    """
+    Split points that keep chronological order and the byte limit while minimizing the largest file
+    for at most target_files files. The smallest feasible capacity is found by binary search, each
+    probe being a greedy packing over prefix sums, so millions of entries take milliseconds.
+    If target_files cannot be met under the limit, the plain greedy split at the limit is returned.
+    """
+    if not sizes:
+        return []
+    prefix_sizes = list(itertools.accumulate(sizes, initial=0))
+    # No file can be smaller than its largest entry; an entry over the limit gets a file of its own.
+    high = limit
+    low = min(header_size + max(sizes), high)
+    if len(greedy_split_points(prefix_sizes, header_size, high, target_files)) >= target_files:
+        return greedy_split_points(prefix_sizes, header_size, high)
+    while low < high:
+        capacity = (low + high) // 2
+        if len(greedy_split_points(prefix_sizes, header_size, capacity, target_files)) < target_files:
+            high = capacity
+        else:
+            low = capacity + 1
+    return greedy_split_points(prefix_sizes, header_size, low)
+
+
+PLAN_SAMPLE_SIZE = 200
+
+
+@dataclass
+class PlannedFile:
+    path: str
+    size: int
+    entries: int = 0
+    first_time: Optional[datetime] = None
+    last_time: Optional[datetime] = None
+    appended: bool = False
+
+
+def sample_conversion_cost(
+    entries: list[dict[str, Any]], sample_size: int = PLAN_SAMPLE_SIZE
+) -> tuple[float, float]:
+    """
+    Render an evenly spaced sample of entries and return (seconds per entry, Markdown bytes produced
+    per HTML character), the two figures the planner extrapolates from.
+    """
+    if not entries:
+        return 0.0, 1.0
+    sample = entries[:: max(1, len(entries) // sample_size)][:sample_size]
+    html_chars = 0
+    markdown_bytes = 0
+
+    def measuring_converter(html: str) -> str:
+        nonlocal html_chars, markdown_bytes
+        converted = html_to_markdown(html)
+        html_chars += len(html)
+        markdown_bytes += len(converted.encode("utf-8"))
+        return converted
+
+    started = time.perf_counter()
+    for entry in sample:
+        extract_text_content(entry, datetime.min.replace(tzinfo=timezone.utc), measuring_converter)
+    seconds = time.perf_counter() - started
+    return seconds / len(sample), markdown_bytes / html_chars if html_chars else 1.0
+
+
+def plan_numbered_outputs(
+    gemini_entries: list[dict[str, Any]], product: ProductFilter, target_files: Optional[int] = None
+) -> tuple[list[PlannedFile], float, int]:
+    """
+    Dry run of write_numbered_outputs for oldest-first entries: same time ordering, checkpoint,
+    append target and greedy or balanced split, but nothing is written and HTML responses are not
+    converted; their Markdown size is extrapolated from a rendered sample. Returns (planned files,
+    seconds per entry, sample size).
+    """
+    if target_files:
+        last_entry_time_loaded, force_full_regeneration = datetime.min.replace(tzinfo=timezone.utc), True
+    else:
+        last_entry_time_loaded, force_full_regeneration = load_last_entry_time(product.state_file)
+    new_entries = [
+        entry
+        for entry in time_ordered_entries(gemini_entries)
+        if is_after_checkpoint(entry, last_entry_time_loaded)
+    ]
+    seconds_per_entry, markdown_per_html_char = sample_conversion_cost(new_entries)
+
+    def estimate_markdown(html: str) -> str:
+        return "x" * round(len(html) * markdown_per_html_char)
+
+    base_name, ext = os.path.splitext(product.output_file)
+
+    def get_output_filename(idx: int) -> str:
+        return f"{base_name}-{idx:02d}{ext}"
+
+    file_index = 1
+    if not force_full_regeneration:
+        while os.path.exists(get_output_filename(file_index)):
+            file_index += 1
+        file_index = max(1, file_index - 1)
+    output_filename = get_output_filename(file_index)
+    header_size = len(build_output_header().encode("utf-8"))
+    if not force_full_regeneration and os.path.exists(output_filename):
+        current = PlannedFile(output_filename, os.path.getsize(output_filename), appended=True)
+    else:
+        current = PlannedFile(output_filename, header_size)
+
+    # (time, size, whether the piece starts an entry) of every entry or piece of an oversized one
+    pieces = [
+        (dt, len(piece.encode("utf-8")), index == 0)
+        for dt, text in (
+            extract_text_content(entry, last_entry_time_loaded, estimate_markdown) for entry in new_entries
+        )
+        for index, piece in enumerate(split_oversized_entry(text, product.limit - header_size))
+    ]
+    split_points: Optional[set[int]] = None
+    if target_files:
+        points = balanced_split_points(
+            [size for _, size, _ in pieces], header_size, product.limit, target_files
+        )
+        if len(points) + 1 > target_files:
+            print_warning("warning_target_files_exceeded", target_files, product.limit, len(points) + 1)
+        split_points = set(points)
+
+    planned: list[PlannedFile] = []
+    file_pieces = 0  # A file may hold only the continuation of an entry started in the previous one
+    for position, (dt, text_size, starts_entry) in enumerate(pieces):
+        if position in split_points if split_points is not None else current.size + text_size > product.limit:
+            if file_pieces:
+                planned.append(current)
+            file_index += 1
+            current = PlannedFile(get_output_filename(file_index), header_size)
+            file_pieces = 0
+        file_pieces += 1
+        if starts_entry:
+            current.entries += 1
+        current.size += text_size
+        current.first_time = current.first_time or dt
+        current.last_time = dt
+    if file_pieces:
+        planned.append(current)
+    return planned, seconds_per_entry, min(len(new_entries), PLAN_SAMPLE_SIZE)
+
+
+def plan(options: ConversionOptions) -> bool:
+    """Print every product's planned output files and a projected conversion time; writes nothing."""
+    started = time.perf_counter()
+    loaded = load_routed_entries(options, write_snapshot=False)
+    if loaded is None:
+        return False
+    load_seconds = time.perf_counter() - started
+    products, routed_entries, _ = loaded
+
+    new_entries = 0
+    sampled_entries = 0
+    render_seconds = 0.0
+    for product, product_entries in zip(products, routed_entries):
+        product_entries.reverse()
+        planned, seconds_per_entry, sample_size = plan_numbered_outputs(
+            product_entries, product, options.target_files
+        )
+        product_new_entries = sum(planned_file.entries for planned_file in planned)
+        print(t("plan_summary", product.output_file, product_new_entries, len(planned)))
+        for planned_file in planned:
             print(
-                t("appended_to_file", output_filename)
-                if is_append_mode
-                else t("written_to_file", output_filename)
+                t(
+                    "plan_file_appended" if planned_file.appended else "plan_file",
+                    planned_file.path,
+                    planned_file.entries,
+                    planned_file.size,
+                    planned_file.first_time,
+                    planned_file.last_time,
+                )
             )
+        new_entries += product_new_entries
+        sampled_entries += sample_size
+        render_seconds += product_new_entries * seconds_per_entry
+
+    total_seconds = load_seconds + render_seconds
+    entries_per_second = new_entries / total_seconds if total_seconds else 0.0
+    print(t("plan_projection", total_seconds, load_seconds, render_seconds, entries_per_second, sampled_entries))
+    return True
+
+
+def open_unit_random(rng: random.Random) -> float:
+    """Uniform random number in the open interval (0, 1), safe to take the logarithm of."""
+    value = rng.random()
+    while value == 0.0:
+        value = rng.random()
+    return value
+
+
+def reservoir_sample(items: Iterable[T], k: int, rng: Optional[random.Random] = None) -> list[T]:
+    """
+    Uniform random sample of k items from a stream of unknown length, in one pass and O(k) memory
+    (all items when there are fewer). Uses Li's Algorithm L, which draws how many items to skip
+    instead of a random number per item, so the cost beyond iterating is O(k log(n / k)).
+    """
+    rng = rng or random.Random()
+    iterator = iter(items)
+    reservoir = list(itertools.islice(iterator, max(k, 0)))
+    if k <= 0 or len(reservoir) < k:
+        return reservoir
+
+    weight = math.exp(math.log(open_unit_random(rng)) / k)
+    while True:
+        skip = math.floor(math.log(open_unit_random(rng)) / math.log1p(-weight)) if weight < 1.0 else 0
+        for item in itertools.islice(iterator, skip, skip + 1):
+            reservoir[rng.randrange(k)] = item
+            break
+        else:
+            return reservoir
+        weight *= math.exp(math.log(open_unit_random(rng)) / k)
+
+
+def preview_output_path(output_file: str) -> str:
+    base_name, ext = os.path.splitext(STREAM_RECORD_FILE if output_file == STDOUT_OUTPUT else output_file)
+    return f"{base_name}-preview{ext}"
+
+
+def preview(options: ConversionOptions, sample_size: int, rng: Optional[random.Random] = None) -> bool:
+    """
+    Render sample_size entries drawn uniformly from every selected entry into one preview file,
+    oldest first. Only the sampled entries are rendered; no numbered output or checkpoint is touched.
+    """
+    loaded = load_routed_entries(options)
+    if loaded is None:
+        return False
+    _, routed_entries, result = loaded
+
+    sample = reservoir_sample(itertools.chain.from_iterable(routed_entries), sample_size, rng)
+    sample.sort(key=entry_time)
+    redactor = Redactor(options.redact_terms) if options.redact else None
+    heading_time = heading_time_formatter(options.timezone)
+    checkpoint = datetime.min.replace(tzinfo=timezone.utc)
+    output_filename = preview_output_path(options.output_file)
+    with open(output_filename, "w", encoding="utf-8") as f:
+        f.write(build_output_header())
+        for entry in sample:
+            _, text = extract_text_content(entry, checkpoint, heading_time=heading_time)
+            f.write(redactor.redact(text) if redactor else text)
+    print(t("preview_written", output_filename, len(sample), result.gemini_entries))
+    return True
+
+
+STORE_TIME_KEY_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS activities (
+    product TEXT NOT NULL,
+    time_key TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    time TEXT NOT NULL,
+    header TEXT NOT NULL,
+    title TEXT NOT NULL,
+    subtitles TEXT NOT NULL,
+    safe_html TEXT NOT NULL,
+    markdown TEXT NOT NULL,
+    PRIMARY KEY (product, time_key, fingerprint)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS renders (
+    product TEXT PRIMARY KEY,
+    output_file TEXT NOT NULL,
+    size_limit INTEGER NOT NULL,
+    redaction TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS rendered_files (
+    product TEXT NOT NULL,
+    file_index INTEGER NOT NULL,
+    first_time_key TEXT NOT NULL,
+    first_fingerprint TEXT NOT NULL,
+    PRIMARY KEY (product, file_index)
+);
+"""
+
+StoreKey = tuple[str, str]  # (time_key, fingerprint): the store's total order of activities
+
+
+def store_time_key(time_str: str) -> str:
+    """Normalize an activity time to a UTC key that sorts chronologically; unparsable times sort first."""
+    try:
+        dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+    except ValueError:
+        return ""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime(STORE_TIME_KEY_FORMAT)
+
+
+def entry_fingerprint(entry: dict[str, Any]) -> str:
+    """Content fingerprint that tells apart different activities sharing a timestamp."""
+    canonical = json.dumps(entry, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+class HistoryStore:
+    """
+    Canonical SQLite copy of every imported activity, keyed by (product, time key, fingerprint),
+    with its normalized fields and rendered Markdown. Also remembers how each product's output
+    files were laid out, so a later import only re-renders the files from the first new entry on.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(STORE_SCHEMA)
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(renders)")]
+        if "redaction" not in columns:  # Stores created before redaction settings were recorded
+            with self.connection:
+                self.connection.execute("ALTER TABLE renders ADD COLUMN redaction TEXT NOT NULL DEFAULT ''")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def latest_key(self, product: str) -> Optional[StoreKey]:
+        row = self.connection.execute(
+            "SELECT time_key, fingerprint FROM activities WHERE product = ? "
+            "ORDER BY time_key DESC, fingerprint DESC LIMIT 1",
+            (product,),
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def upsert(self, product: str, entries: Iterable[dict[str, Any]]) -> list[StoreKey]:
+        """Insert entries not stored yet, rendering Markdown for those only; return their keys."""
+        inserted: list[StoreKey] = []
+        with self.connection:
+            for entry in entries:
+                key = (store_time_key(entry.get("time", "")), entry_fingerprint(entry))
+                exists = self.connection.execute(
+                    "SELECT 1 FROM activities WHERE product = ? AND time_key = ? AND fingerprint = ?",
+                    (product, *key),
+                ).fetchone()
+                if exists:
+                    continue
+                _, markdown = extract_text_content(entry, datetime.min.replace(tzinfo=timezone.utc))
+                self.connection.execute(
+                    "INSERT INTO activities VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        product,
+                        *key,
+                        entry.get("time", ""),
+                        entry.get("header", ""),
+                        entry.get("title", ""),
+                        json.dumps(entry.get("subtitles", []), ensure_ascii=False),
+                        json.dumps(entry.get("safeHtmlItem", []), ensure_ascii=False),
+                        markdown,
+                    ),
+                )
+                inserted.append(key)
+        return inserted
+
+    def iter_markdown(self, product: str, start: StoreKey) -> Iterator[tuple[str, str, str]]:
+        """Yield (time_key, fingerprint, markdown) in chronological order from start on."""
+        yield from self.connection.execute(
+            "SELECT time_key, fingerprint, markdown FROM activities "
+            "WHERE product = ? AND (time_key, fingerprint) >= (?, ?) ORDER BY time_key, fingerprint",
+            (product, *start),
+        )
+
+    def rendered_files(self, product: ProductFilter, redaction: str = "") -> list[tuple[int, StoreKey]]:
+        """
+        Return (file_index, first key) of the last render, or [] if it used another output, limit
+        or redaction setting (files rendered with other redaction settings must all be rewritten).
+        """
+        render = self.connection.execute(
+            "SELECT output_file, size_limit, redaction FROM renders WHERE product = ?", (product.name,)
+        ).fetchone()
+        if render != (product.output_file, product.limit, redaction):
+            return []
+        rows = self.connection.execute(
+            "SELECT file_index, first_time_key, first_fingerprint FROM rendered_files "
+            "WHERE product = ? ORDER BY file_index",
+            (product.name,),
+        )
+        return [(index, (time_key, fingerprint)) for index, time_key, fingerprint in rows]
+
+    def record_rendered_files(
+        self, product: ProductFilter, start_index: int, files: list[tuple[int, StoreKey]], redaction: str = ""
+    ) -> None:
+        """Replace the layout of files numbered start_index and above."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO renders VALUES (?, ?, ?, ?)",
+                (product.name, product.output_file, product.limit, redaction),
+            )
+            self.connection.execute(
+                "DELETE FROM rendered_files WHERE product = ? AND file_index >= ?", (product.name, start_index)
+            )
+            self.connection.executemany(
+                "INSERT INTO rendered_files VALUES (?, ?, ?, ?)",
+                [(product.name, index, *key) for index, key in files],
+            )
+
+
+def store_key_time(key: Optional[StoreKey]) -> datetime:
+    if not key or not key[0]:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    return datetime.strptime(key[0], STORE_TIME_KEY_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def render_from_store(
+    store: HistoryStore,
+    product: ProductFilter,
+    entries: list[dict[str, Any]],
+    result: ConversionResult,
+    on_file_written: Optional[Callable[[str], None]] = None,
+    redactor: Optional[Redactor] = None,
+    progress: Optional[ProgressReporter] = None,
+) -> None:
+    """
+    Import one product's entries into the store and re-render its outputs from the file holding
+    the earliest new entry on. Exports are cumulative, so entries older than the newest stored one
+    are already in the store and are skipped before fingerprinting. The checkpoint file is still
+    written for runs without --store but is not needed: the store keeps its own high-water mark.
+    The store holds unredacted Markdown; a redactor, if given, is applied while rendering, and
+    adding, removing or changing it re-renders every file.
+    """
+    latest = store.latest_key(product.name)
+    watermark = latest[0] if latest else ""
+    candidates = [
+        entry
+        for entry in (progress.track(entries) if progress else entries)
+        if store_time_key(entry.get("time", "")) >= watermark
+    ]
+    inserted = store.upsert(product.name, candidates)
+    result.new_entries += len(inserted)
+    print(t("store_import", len(inserted), len(candidates), len(entries)))
+
+    base_name, ext = os.path.splitext(product.output_file)
+
+    def get_output_filename(idx: int) -> str:
+        return f"{base_name}-{idx:02d}{ext}"
+
+    redaction = redactor.settings_digest if redactor else ""
+    layout = store.rendered_files(product, redaction)
+    if not layout or not all(os.path.exists(get_output_filename(index)) for index, _ in layout):
+        # First run, lost outputs, or changed limit or redaction settings: render everything
+        start_index, start_key = 1, ("", "")
+    elif inserted:
+        earliest = min(inserted)
+        start_index, start_key = layout[0]
+        for index, first_key in layout:
+            # Files that open with the continuation of a split entry share its key; keep the first.
+            if first_key <= earliest and first_key != start_key:
+                start_index, start_key = index, first_key
+    else:
+        start_index, start_key = 0, ("", "")  # Nothing new and the outputs are intact
+
+    files_written_before = len(result.files_written)
+    file_index = layout[-1][0] if layout else 0
+    if start_index:
+        header = build_output_header()
+        header_size = len(header.encode("utf-8"))
+        new_layout: list[tuple[int, StoreKey]] = []
+        texts: list[str] = []
+        current_file_size = header_size
+
+        def write_file(output_filename: str, texts: list[str]) -> None:
+            content = header + "".join(texts)
+            if os.path.exists(output_filename) and output_content_digest(content) == output_file_digest(
+                output_filename
+            ):
+                result.files_unchanged.append(output_filename)
+                print(t("unchanged_output_file", output_filename))
+                return
+            with open(output_filename, "w", encoding="utf-8") as f:
+                f.write(content)
+            result.files_written.append(output_filename)
+            result.bytes_written += len(content.encode("utf-8"))
+            print(t("written_to_file", output_filename))
+            if on_file_written is not None:
+                on_file_written(output_filename)
+
+        file_index = start_index
+        for time_key, fingerprint, markdown in store.iter_markdown(product.name, start_key):
+            if redactor:
+                markdown = redactor.redact(markdown)
+            for piece in split_oversized_entry(markdown, product.limit - header_size):
+                text_size = len(piece.encode("utf-8"))
+                if texts and current_file_size + text_size > product.limit:
+                    write_file(get_output_filename(file_index), texts)
+                    file_index += 1
+                    texts = []
+                    current_file_size = header_size
+                if not texts:
+                    new_layout.append((file_index, (time_key, fingerprint)))
+                texts.append(piece)
+                current_file_size += text_size
+            if progress:
+                progress.rendered(get_output_filename(file_index))
+        if texts:
+            write_file(get_output_filename(file_index), texts)
+        else:
+            file_index -= 1
+
+        remove_numbered_output_files(base_name, ext, keep=file_index)
+        store.record_rendered_files(product, start_index, new_layout, redaction)
+
+    changed_files = result.files_written[files_written_before:]
+    print(t("changed_output_files", len(changed_files)))
+    for changed_file in changed_files:
+        print(f"  - {changed_file}")
+
+    last_entry_time_loaded = store_key_time(latest)
+    last_entry_time_processed = store_key_time(store.latest_key(product.name))
+    if last_entry_time_processed > datetime.min.replace(tzinfo=timezone.utc):
+        with open(product.state_file, "w", encoding="utf-8") as f:
+            f.write(last_entry_time_processed.isoformat())
+
+    print(t("processing_complete", last_entry_time_loaded, last_entry_time_processed, file_index))
+    result.file_count += file_index
+    result.last_entry_time_loaded = last_entry_time_loaded
+    result.last_entry_time_processed = max(result.last_entry_time_processed, last_entry_time_processed)
+
+
+@dataclass
+class BatchJob:
+    input_file: str
+    output_dir: str
+    state_file: str
+
+
+@dataclass
+class BatchJobResult:
+    job: BatchJob
+    succeeded: bool
+    seconds: float
+    input_bytes: int = 0
+    result: Optional[ConversionResult] = None
+    error: str = ""
+
+
+def load_batch_jobs(filepath: str) -> list[BatchJob]:
+    """
+    Read a batch job list: one CSV row per job with input_file, output_dir and an optional
+    state_file (defaults to last_entry_time.txt inside output_dir). Blank lines and lines
+    starting with # are ignored.
+    """
+    jobs: list[BatchJob] = []
+    with open(filepath, encoding="utf-8", newline="") as f:
+        rows = csv.reader(line for line in f if line.strip() and not line.lstrip().startswith("#"))
+        for row in rows:
+            input_file, output_dir, *rest = (cell.strip() for cell in row)
+            state_file = rest[0] if rest and rest[0] else os.path.join(output_dir, LAST_ENTRY_TIME_FILE)
+            jobs.append(BatchJob(input_file=input_file, output_dir=output_dir, state_file=state_file))
+    return jobs
+
+
+def run_batch_job(job: BatchJob, template: ConversionOptions) -> BatchJobResult:
+    """
+    Process pool entry point for one batch job. Progress output is captured so concurrent jobs
+    do not interleave, and any failure is confined to this job's result.
+    """
+    started = time.perf_counter()
+    captured_stderr = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(captured_stderr):
+            os.makedirs(job.output_dir, exist_ok=True)
+            options = replace(relocate_outputs(template, job.output_dir, job.state_file), input_file=job.input_file)
+            result = convert(options)
+    except Exception as e:
+        return BatchJobResult(job=job, succeeded=False, seconds=time.perf_counter() - started, error=str(e))
+
+    seconds = time.perf_counter() - started
+    if result is None:
+        error = captured_stderr.getvalue().strip()
+        return BatchJobResult(job=job, succeeded=False, seconds=seconds, error=error)
+    return BatchJobResult(
+        job=job,
+        succeeded=True,
+        seconds=seconds,
+        input_bytes=os.path.getsize(job.input_file),
+        result=result,
+    )
+
+
+def run_batch(
+    jobs: list[BatchJob], template: ConversionOptions, max_workers: Optional[int] = None
+) -> list[BatchJobResult]:
+    """Run batch jobs on a process pool and return their results in job-list order."""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_batch_job, jobs, [template] * len(jobs)))
+
+
+def print_batch_summary(results: list[BatchJobResult]) -> None:
+    """Print one line per batch job with its throughput, then the overall counts."""
+    for job_result in results:
+        if not job_result.succeeded:
+            print_error(t("batch_job_failed", job_result.job.input_file, job_result.error))
+            continue
+        seconds = max(job_result.seconds, 1e-9)
+        print(
+            t(
+                "batch_job_summary",
+                job_result.job.input_file,
+                job_result.result.new_entries,
+                len(job_result.result.files_written),
+                job_result.seconds,
+                job_result.result.gemini_entries / seconds,
+                job_result.input_bytes / (1024 * 1024) / seconds,
+            )
+        )
+    succeeded = sum(1 for job_result in results if job_result.succeeded)
+    print(t("batch_complete", succeeded, len(results) - succeeded))
+
+
+METRICS_REPORT_RUNS = 20
+PROMETHEUS_METRIC_PREFIX = "gemini_json2md"
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Return the peak resident set size of this process, or None where it cannot be read (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # macOS reports bytes, Linux kilobytes
+
+
+def build_run_metrics(input_file: str, seconds: float, result: Optional[ConversionResult]) -> dict[str, Any]:
+    """Summarize one conversion run; result is None when the input could not be loaded."""
+    return {
+        "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "input_file": input_file,
+        "succeeded": result is not None,
+        "duration_seconds": round(seconds, 3),
+        "input_bytes": os.path.getsize(input_file) if os.path.exists(input_file) else 0,
+        "entries_total": result.total_entries if result else 0,
+        "entries_gemini": result.gemini_entries if result else 0,
+        "entries_new": result.new_entries if result else 0,
+        "files_written": len(result.files_written) if result else 0,
+        "files_unchanged": len(result.files_unchanged) if result else 0,
+        "bytes_written": result.bytes_written if result else 0,
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def append_run_metrics(filepath: str, record: dict[str, Any]) -> None:
+    with open(filepath, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def load_run_metrics(filepath: str) -> list[dict[str, Any]]:
+    """Read a metrics log, skipping blank lines and lines cut short by an interrupted run."""
+    records = []
+    with open(filepath, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def write_prometheus_textfile(filepath: str, record: dict[str, Any]) -> None:
+    """
+    Write a run's metrics in the node-exporter textfile format. The file is written under a
+    temporary name and renamed, so the collector never scrapes a partial file.
+    """
+    finished_at = datetime.fromisoformat(record["finished_at"]).timestamp()
+    metrics = [
+        ("last_run_timestamp_seconds", "Time the last conversion run finished.", "", finished_at),
+        ("last_run_success", "1 if the last conversion run succeeded.", "", int(record["succeeded"])),
+        ("last_run_duration_seconds", "Duration of the last conversion run.", "", record["duration_seconds"]),
+        ("input_bytes", "Size of the input export.", "", record["input_bytes"]),
+        ("entries", "Entries in the last run by kind.", 'kind="total"', record["entries_total"]),
+        ("entries", None, 'kind="gemini"', record["entries_gemini"]),
+        ("entries", None, 'kind="new"', record["entries_new"]),
+        ("files", "Output files of the last run by state.", 'state="written"', record["files_written"]),
+        ("files", None, 'state="unchanged"', record["files_unchanged"]),
+        ("bytes_written", "Bytes written by the last run.", "", record["bytes_written"]),
+    ]
+    if record["peak_rss_bytes"] is not None:
+        metrics.append(("peak_rss_bytes", "Peak resident set size of the last run.", "", record["peak_rss_bytes"]))
+
+    lines = []
+    for name, help_text, labels, value in metrics:
+        full_name = f"{PROMETHEUS_METRIC_PREFIX}_{name}"
+        if help_text is not None:
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} gauge")
+        lines.append(f"{full_name}{{{labels}}} {value}" if labels else f"{full_name} {value}")
+
+    directory = os.path.dirname(filepath) or "."
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False) as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(f.name, filepath)
+
+
+def relative_change(latest: float, baseline: float) -> float:
+    return (latest - baseline) / baseline if baseline else 0.0
+
+
+def print_metrics_report(records: list[dict[str, Any]], runs: int = METRICS_REPORT_RUNS) -> None:
+    """
+    Print the most recent runs, then how the latest successful run compares with the median of the
+    earlier successful ones, so slowdowns and data growth stand out.
+    """
+    for record in records[-runs:]:
+        if not record.get("succeeded"):
+            print(t("metrics_report_failed_run", record["finished_at"], record["duration_seconds"]))
+            continue
+        print(
+            t(
+                "metrics_report_run",
+                record["finished_at"],
+                record["duration_seconds"],
+                record["input_bytes"] / (1024 * 1024),
+                record["entries_gemini"],
+                record["entries_new"],
+                record["files_written"],
+                record["bytes_written"] / (1024 * 1024),
+                (record.get("peak_rss_bytes") or 0) / (1024 * 1024),
+            )
+        )
+
+    succeeded = [record for record in records if record.get("succeeded")]
+    if len(succeeded) < 2:
+        return
+    latest, earlier = succeeded[-1], succeeded[-runs - 1 : -1]
+
+    def throughput(record: dict[str, Any]) -> float:
+        return record["input_bytes"] / max(record["duration_seconds"], 1e-9)
+
+    print(
+        t(
+            "metrics_report_trend",
+            len(earlier),
+            relative_change(latest["duration_seconds"], statistics.median(r["duration_seconds"] for r in earlier)),
+            relative_change(throughput(latest), statistics.median(throughput(r) for r in earlier)),
+            relative_change(latest["input_bytes"], statistics.median(r["input_bytes"] for r in earlier)),
+            relative_change(latest["entries_gemini"], statistics.median(r["entries_gemini"] for r in earlier)),
+            relative_change(
+                latest.get("peak_rss_bytes") or 0,
+                statistics.median(r.get("peak_rss_bytes") or 0 for r in earlier),
+            ),
+        )
+    )
+
 
-        if last_entry_time_loaded < last_entry_time_processed:
-            with open(LAST_ENTRY_TIME_FILE, "w", encoding="utf-8") as f:
-                f.write(last_entry_time_processed.isoformat())
+TAKEOUT_ACTIVITY_FILENAMES = ("MyActivity.json", "マイアクティビティ.json")
+SERVICE_READ_CHUNK_BYTES = 1024 * 1024
 
-        print(t("processing_complete", last_entry_time_loaded, last_entry_time_processed, file_index))
-        return 0
+
+def extract_takeout_activity(archive_path: str, work_dir: str) -> Optional[str]:
+    """
+    Extract the activity JSON from a Takeout zip archive and return its path, or None if the
+    archive has none. An activity file under a Gemini folder is preferred over other products' files.
+    """
+    with zipfile.ZipFile(archive_path) as archive:
+        candidates = [
+            name for name in archive.namelist() if os.path.basename(name) in TAKEOUT_ACTIVITY_FILENAMES
+        ]
+        if not candidates:
+            print_error(t("file_not_found", f"{archive_path}:{TAKEOUT_ACTIVITY_FILENAMES[0]}"))
+            return None
+        member = next((name for name in candidates if "Gemini" in name), candidates[0])
+        extracted_path = os.path.join(work_dir, "MyActivity.json")
+        with archive.open(member) as source, open(extracted_path, "wb") as target:
+            shutil.copyfileobj(source, target, SERVICE_READ_CHUNK_BYTES)
+    return extracted_path
+
+
+def warm_up_worker() -> int:
+    """Process pool warm-up task: forces each worker to start and import this module."""
+    return os.getpid()
+
+
+def run_service_conversion(
+    upload_path: str, work_dir: str, options: ConversionOptions, completed_files: Any
+) -> tuple[Optional[ConversionResult], str]:
+    """
+    Service pool entry point: convert one uploaded export inside work_dir, putting each finished
+    output path on the completed_files queue. Returns (result, captured error output).
+    """
+    captured_stderr = io.StringIO()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(captured_stderr):
+        input_file: Optional[str] = upload_path
+        if zipfile.is_zipfile(upload_path):
+            input_file = extract_takeout_activity(upload_path, work_dir)
+            if input_file is None:
+                return None, captured_stderr.getvalue().strip()
+        options = replace(relocate_outputs(options, work_dir), input_file=input_file)
+        result = convert(options, on_file_written=completed_files.put)
+    return result, captured_stderr.getvalue().strip()
+
+
+class ConversionService:
+    """
+    Keeps a warm process pool of converters across requests and bounds how many
+    conversions run at once; requests beyond the bound are rejected with 503.
+    """
+
+    def __init__(self, options: ConversionOptions, max_concurrent: int) -> None:
+        self.options = options
+        self.max_concurrent = max_concurrent
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        self.executor = ProcessPoolExecutor(max_workers=max_concurrent)
+        self.manager = multiprocessing.Manager()
+        for future in [self.executor.submit(warm_up_worker) for _ in range(max_concurrent)]:
+            future.result()
+
+    def close(self) -> None:
+        self.executor.shutdown()
+        self.manager.shutdown()
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """POST /convert with a MyActivity.json or Takeout zip body; responds with a streamed zip of Markdown files."""
+
+    server: "ConversionHTTPServer"
+
+    def send_plain_error(self, status: HTTPStatus, message: str) -> None:
+        body = f"{message}\n".encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.send_header("Retry-After", "5")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != "/convert":
+            self.send_plain_error(HTTPStatus.NOT_FOUND, "Use POST /convert")
+            return
+        try:
+            content_length = int(self.headers.get("Content-Length", ""))
+            query = urllib.parse.parse_qs(url.query)
+            options = self.server.service.options
+            if "limit" in query:
+                options = replace(options, limit=int(query["limit"][0]))
+        except ValueError:
+            self.send_plain_error(HTTPStatus.BAD_REQUEST, "A numeric Content-Length (and limit) is required")
+            return
+
+        service = self.server.service
+        if not service.slots.acquire(blocking=False):
+            self.send_plain_error(HTTPStatus.SERVICE_UNAVAILABLE, "All conversion slots are busy")
+            return
+        slot_held = True
+
+        def release_slot() -> None:
+            nonlocal slot_held
+            if slot_held:
+                slot_held = False
+                service.slots.release()
+
+        try:
+            with tempfile.TemporaryDirectory(prefix="gemini_json2md_") as work_dir:
+                upload_path = os.path.join(work_dir, "upload")
+                with open(upload_path, "wb") as f:
+                    remaining = content_length
+                    while remaining > 0:
+                        chunk = self.rfile.read(min(remaining, SERVICE_READ_CHUNK_BYTES))
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        remaining -= len(chunk)
+                self.stream_conversion(service, upload_path, work_dir, options, release_slot)
+        finally:
+            release_slot()
+
+    def stream_conversion(
+        self,
+        service: ConversionService,
+        upload_path: str,
+        work_dir: str,
+        options: ConversionOptions,
+        release_slot: Callable[[], None],
+    ) -> None:
+        """
+        Stream each converted file into the response zip as soon as it is written. The slot is
+        released once the conversion is over and before the last bytes of the response are sent,
+        so a client whose next request follows the response does not find it still taken.
+        """
+        completed_files = service.manager.Queue()
+        future = service.executor.submit(run_service_conversion, upload_path, work_dir, options, completed_files)
+        archive: Optional[zipfile.ZipFile] = None
+        try:
+            while True:
+                try:
+                    path = completed_files.get(timeout=0.1)
+                except queue.Empty:
+                    if future.done() and completed_files.empty():
+                        break
+                    continue
+                if archive is None:
+                    self.send_response(HTTPStatus.OK)
+                    self.send_header("Content-Type", "application/zip")
+                    self.send_header("Content-Disposition", 'attachment; filename="Gemini_History.zip"')
+                    self.end_headers()
+                    # The socket is not seekable, so zipfile streams members with data descriptors.
+                    archive = zipfile.ZipFile(self.wfile, "w", zipfile.ZIP_DEFLATED)
+                archive.write(path, os.path.basename(path))
+                self.wfile.flush()
+
+            result, error = future.result()
+            release_slot()
+            if archive is None:
+                if result is None:
+                    self.send_plain_error(HTTPStatus.UNPROCESSABLE_ENTITY, error or "The upload could not be loaded")
+                else:
+                    self.send_response(HTTPStatus.NO_CONTENT)
+                    self.end_headers()
+        except Exception as e:
+            if archive is None:
+                self.send_plain_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+            else:
+                # Headers are already sent; dropping the connection leaves a truncated zip the client can detect.
+                self.close_connection = True
+                archive = None
+        finally:
+            if archive is not None:
+                archive.close()
+
+
+class ConversionHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: ConversionService) -> None:
+        super().__init__(address, ConversionRequestHandler)
+        self.service = service
+
+
+def build_serve_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="convert_history.py serve", description="Run a local HTTP conversion service"
+    )
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument(
+        "--max_concurrent", type=int, default=2, help="Maximum number of conversions running at once"
+    )
+    parser.add_argument("--limit", type=int, default=1000000, help="Default split file size limit in bytes")
+    parser.add_argument(
+        "--json-backend", choices=["auto", *JSON_BACKENDS], default="auto", help="JSON decoder to use"
+    )
+    return parser
+
+
+def serve_main(argv: list[str]) -> int:
+    args = build_serve_arg_parser().parse_args(argv)
+    options = ConversionOptions(limit=args.limit, json_backend=args.json_backend)
+    service = ConversionService(options, args.max_concurrent)
+    try:
+        with ConversionHTTPServer((args.host, args.port), service) as server:
+            host, port = server.server_address[:2]
+            print(t("serve_listening", host, port, args.max_concurrent), flush=True)
+            with contextlib.suppress(KeyboardInterrupt):
+                server.serve_forever()
+    finally:
+        service.close()
+    return 0
+
+
+# Every entry after the first one in a file starts with its "## date" heading right after the previous "---".
+# The literal separator comes first so the regex engine can skip ahead with a substring search.
+RESPLIT_ENTRY_SEPARATOR_PATTERN = re.compile(r"---\n\n(?=## \d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}\n\n)")
+# A file that opens with this heading carries on the entry that ends the previous file (see split_oversized_entry).
+RESPLIT_CONTINUATION_PATTERN = re.compile(r"## \d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2} \(continued\)\n\n")
+
+
+def numbered_output_files(base_name: str, ext: str) -> list[str]:
+    """Existing numbered outputs of base_name in numeric order."""
+    directory = os.path.dirname(base_name)
+    pattern = re.compile(rf"^{re.escape(os.path.basename(base_name))}-(\d+){re.escape(ext)}$")
+    numbered = []
+    for entry in os.listdir(directory or "."):
+        match = pattern.match(entry)
+        if match:
+            numbered.append((int(match.group(1)), os.path.join(directory, entry)))
+    return [path for _, path in sorted(numbered)]
+
+
+def iter_rendered_entries(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Stream the rendered entries of existing outputs, one file in memory at a time. The pieces of an
+    entry that was split across files are joined back into the whole entry.
+    """
+    pending = ""  # The last entry read, which may continue in the next file
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        header = OUTPUT_HEADER_TIMESTAMP_PATTERN.match(content)
+        body = content[header.end() :].lstrip("\n") if header else content
+        if not body:
+            continue
+        continuation = RESPLIT_CONTINUATION_PATTERN.match(body)
+        if pending and continuation:
+            body = pending + body[continuation.end() :]
+        elif pending:
+            yield pending
+        starts = [0, *(match.end() for match in RESPLIT_ENTRY_SEPARATOR_PATTERN.finditer(body))]
+        yield from (body[start:end] for start, end in zip(starts[:-1], starts[1:]))
+        pending = body[starts[-1] :]
+    if pending:
+        yield pending
+
+
+def resplit_outputs(output_file: str, limit: int) -> Optional[tuple[int, int, int]]:
+    """
+    Repack the entries of existing numbered outputs into files under a new size limit without
+    touching the JSON export. Entries are split and rejoined across files as a conversion would. New files are staged next to the outputs and moved into place at the
+    end, so a failure leaves the old set intact; files whose content did not change are left as is.
+    Returns (entries, input files, output files), or None if there was nothing to re-split.
+    """
+    base_name, ext = os.path.splitext(output_file)
+    inputs = numbered_output_files(base_name, ext)
+    if not inputs:
+        return None
+
+    header = build_output_header()
+    header_size = len(header.encode("utf-8"))
+    staging_dir = tempfile.mkdtemp(prefix=".resplit-", dir=os.path.dirname(base_name) or ".")
+    staged: list[str] = []
+    entries = 0
+
+    def stage(texts: list[str]) -> None:
+        staged_path = os.path.join(staging_dir, str(len(staged) + 1))
+        with open(staged_path, "w", encoding="utf-8") as f:
+            f.write(header)
+            f.writelines(texts)
+        staged.append(staged_path)
+
+    try:
+        texts: list[str] = []
+        current_file_size = header_size
+        for text in iter_rendered_entries(inputs):
+            entries += 1
+            for piece in split_oversized_entry(text, limit - header_size):
+                text_size = len(piece.encode("utf-8"))
+                if texts and current_file_size + text_size > limit:
+                    stage(texts)
+                    texts = []
+                    current_file_size = header_size
+                texts.append(piece)
+                current_file_size += text_size
+        if texts:
+            stage(texts)
+
+        for file_index, staged_path in enumerate(staged, start=1):
+            output_filename = f"{base_name}-{file_index:02d}{ext}"
+            if os.path.exists(output_filename) and output_file_digest(staged_path) == output_file_digest(
+                output_filename
+            ):
+                print(t("unchanged_output_file", output_filename))
+                continue
+            os.replace(staged_path, output_filename)
+            print(t("written_to_file", output_filename))
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    remove_numbered_output_files(base_name, ext, keep=len(staged))
+    return entries, len(inputs), len(staged)
+
+
+def build_resplit_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="convert_history.py resplit",
+        description="Repack existing Markdown outputs under a new --limit without reading the JSON export",
+    )
+    parser.add_argument(
+        "--output_file",
+        metavar="FILE",
+        type=str,
+        default="Gemini_History.md",
+        help="Output Markdown file name whose numbered files are re-split",
+    )
+    parser.add_argument("--limit", type=int, default=1000000, help="New split file size limit in bytes")
+    return parser
+
+
+def resplit_main(argv: list[str]) -> int:
+    args = build_resplit_arg_parser().parse_args(argv)
+    try:
+        counts = resplit_outputs(args.output_file, args.limit)
+    except Exception as e:
+        print_error(t("error_occurred", e))
+        return 1
+    if counts is None:
+        print_error(t("resplit_no_outputs", args.output_file))
+        return 1
+    print(t("resplit_complete", *counts, args.limit))
+    return 0
+
+
+def build_report_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="convert_history.py report",
+        description="Show recent runs from a metrics log and how the latest run compares with earlier ones",
+    )
+    parser.add_argument(
+        "--metrics-log",
+        metavar="FILE",
+        type=str,
+        default=METRICS_LOG_FILE,
+        help=f"Metrics log written with --metrics-log (default: {METRICS_LOG_FILE})",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=METRICS_REPORT_RUNS,
+        help=f"Number of recent runs to show and compare against (default: {METRICS_REPORT_RUNS})",
+    )
+    return parser
+
+
+def report_main(argv: list[str]) -> int:
+    args = build_report_arg_parser().parse_args(argv)
+    try:
+        records = load_run_metrics(args.metrics_log) if os.path.exists(args.metrics_log) else []
+        if not records:
+            print_error(t("metrics_report_empty", args.metrics_log))
+            return 1
+        print_metrics_report(records, args.runs)
+    except Exception as e:
+        print_error(t("error_occurred", e))
+        return 1
+    return 0
+
+
+COMMANDS: dict[str, Callable[[list[str]], int]] = {
+    "serve": serve_main,
+    "resplit": resplit_main,
+    "report": report_main,
+}
+
+
+def main() -> int:
+    argv = sys.argv[1:]
+    if argv and argv[0] in COMMANDS:
+        return COMMANDS[argv[0]](argv[1:])
+
+    parser = build_arg_parser()
+    args = parser.parse_args()
+    options = options_from_args(args)
+
+    if options.timezone:
+        if options.store_file:
+            print_error(t("error_timezone_store"))
+            return 1
+        try:
+            zoneinfo.ZoneInfo(options.timezone)
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            print_error(t("error_unknown_timezone", options.timezone))
+            return 1
+    if options.store_file and options.target_files:
+        # The store re-renders only the files from the first new entry on, which a balanced split cannot do.
+        print_error(t("error_store_option_unsupported", "--target-files"))
+        return 1
+    if options.store_file and options.attachments:
+        # The store renders from its Markdown and does not know where an export's attachments are.
+        print_error(t("error_store_option_unsupported", "--attachments"))
+        return 1
+    if args.bundle and (
+        options.store_file or options.attachments or args.batch or options.output_file == STDOUT_OUTPUT
+    ):
+        print_error(t("error_bundle_unsupported"))
+        return 1
+    if options.output_file == STDOUT_OUTPUT and (
+        options.store_file or options.products or options.attachments or args.batch
+    ):
+        print_error(t("error_stdout_output_unsupported"))
+        return 1
+
+    try:
+        if args.benchmark_json_backends:
+            input_megabytes = os.path.getsize(options.input_file) / (1024 * 1024)
+            for name, seconds in benchmark_json_backends(options.input_file):
+                print(f"{name:<8}{seconds:>9.3f} s{input_megabytes / seconds:>9.1f} MB/s")
+            return 0
+
+        if args.plan:
+            return 0 if plan(options) else 1
+
+        if args.preview is not None:
+            return 0 if preview(options, args.preview) else 1
+
+        if args.batch:
+            # Jobs already run in parallel; decoding inside each job stays single-process.
+            template = replace(options, workers=1)
+            results = run_batch(load_batch_jobs(args.batch), template, args.jobs)
+            print_batch_summary(results)
+            return 0 if all(job_result.succeeded for job_result in results) else 1
+
+        started = time.perf_counter()
+        if options.output_file == STDOUT_OUTPUT:
+            # The records own stdout; every message, including progress, moves to stderr.
+            sink = StdoutRecordSink(sys.stdout.buffer)
+            with contextlib.redirect_stdout(sys.stderr):
+                result = convert(options, sink=sink)
+        elif args.bundle:
+            bundle = ZipBundleSink(args.bundle)
+            result = None
+            try:
+                result = convert(options, sink=bundle)
+            finally:
+                bundle.close(keep=result is not None)
+            if result is not None:
+                print(t("bundle_written", args.bundle, len(result.files_written)))
+        else:
+            result = convert(options)
+        if args.metrics_log or args.prometheus_textfile:
+            record = build_run_metrics(options.input_file, time.perf_counter() - started, result)
+            if args.metrics_log:
+                append_run_metrics(args.metrics_log, record)
+            if args.prometheus_textfile:
+                write_prometheus_textfile(args.prometheus_textfile, record)
+        return 0 if result is not None else 1
     except Exception as e:
         print_error(t("error_occurred", e))
         return 1
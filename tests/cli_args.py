@@ -0,0 +1,49 @@
+import argparse
+import io
+import json
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, Optional, TextIO
+from unittest.mock import patch
+
+import convert_history
+
+
+def make_cli_args(**overrides: Any) -> argparse.Namespace:
+    """Build a CLI namespace populated with every option's default, then apply overrides."""
+    args, _ = convert_history.build_arg_parser().parse_known_args([])
+    for name, value in overrides.items():
+        setattr(args, name, value)
+    return args
+
+
+def make_activity(
+    day: int, title: Optional[str] = None, *, header: str = "Gemini Apps", hour: int = 0, padding: int = 0
+) -> dict:
+    """Build an activity dated June ``day`` 2026, with ``padding`` filler characters appended to the title."""
+    title = f"day{day}" if title is None else title
+    if padding:
+        title += " " + "x" * padding
+    return {"header": header, "time": f"2026-06-{day:02d}T{hour:02d}:00:00Z", "title": title}
+
+
+def write_export(path: str, activities: list[dict]) -> None:
+    """Write activities to path as a Takeout MyActivity.json export."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(activities, f)
+
+
+def run_main(state_file: str, stdout: Optional[TextIO] = None, **overrides: Any) -> tuple[int, str, str]:
+    """Run main() in English with the given CLI overrides and return (exit code, stdout, stderr).
+
+    state_file stands in for the default checkpoint. Pass stdout to capture binary output through your own
+    stream; the returned stdout text is then empty.
+    """
+    stdout_buffer = io.StringIO()
+    stderr_buffer = io.StringIO()
+    with patch("convert_history.get_system_language", return_value="en"), patch(
+        "convert_history.LAST_ENTRY_TIME_FILE", state_file
+    ), patch("argparse.ArgumentParser.parse_args", return_value=make_cli_args(**overrides)), redirect_stdout(
+        stdout_buffer if stdout is None else stdout
+    ), redirect_stderr(stderr_buffer):
+        exit_code = convert_history.main()
+    return exit_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import convert_history
+from cli_args import run_main, write_export
+
+
+class PlaceAttachmentTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.assets_dir = os.path.join(self.tmpdir.name, "assets")
+        os.makedirs(self.assets_dir)
+
+    def write(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_identical_files_are_stored_once_by_hardlink(self) -> None:
+        first = self.write("a.PNG", b"same image")
+        second = self.write("b.png", b"same image")
+
+        stored = {convert_history.place_attachment(path, self.assets_dir) for path in (first, second)}
+
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(os.listdir(self.assets_dir), list(stored))
+        stored_name = stored.pop()
+        self.assertTrue(stored_name.endswith(".png"))
+        if hasattr(os, "link"):
+            self.assertTrue(os.path.samefile(first, os.path.join(self.assets_dir, stored_name)))
+
+    def test_falls_back_to_a_copy_without_links_or_clones(self) -> None:
+        source = self.write("doc.pdf", b"%PDF")
+
+        with patch("os.link", side_effect=OSError("cross-device link")), patch(
+            "convert_history.clone_file", side_effect=OSError("not supported")
+        ):
+            stored_name = convert_history.place_attachment(source, self.assets_dir)
+
+        stored_path = os.path.join(self.assets_dir, stored_name)
+        self.assertFalse(os.path.samefile(source, stored_path))
+        with open(stored_path, "rb") as f:
+            self.assertEqual(f.read(), b"%PDF")
+        self.assertEqual(os.listdir(self.assets_dir), [stored_name])
+
+
+class AttachmentConversionTests(unittest.TestCase):
+    def test_outputs_link_the_stored_attachments(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = os.path.join(tmpdir, "Takeout")
+            output_dir = os.path.join(tmpdir, "out")
+            os.makedirs(input_dir)
+            os.makedirs(output_dir)
+            for name, content in (("photo 1.png", b"png"), ("notes.pdf", b"pdf")):
+                with open(os.path.join(input_dir, name), "wb") as f:
+                    f.write(content)
+            input_file = os.path.join(input_dir, "MyActivity.json")
+            write_export(
+                input_file,
+                [
+                    {
+                        "header": "Gemini Apps",
+                        "time": "2026-06-01T00:00:00Z",
+                        "title": "Prompted with files",
+                        "attachedFiles": ["photo 1.png", "notes.pdf", "missing.png", "../MyActivity.json"],
+                    }
+                ],
+            )
+
+            exit_code, _, stderr = run_main(
+                os.path.join(output_dir, "last_entry_time.txt"),
+                input_file=input_file,
+                output_file=os.path.join(output_dir, "Gemini_History.md"),
+                attachments=True,
+            )
+
+            self.assertEqual(exit_code, 0)
+            self.assertIn("2 referenced attachment(s) were not found", stderr)
+            assets_dir = os.path.join(output_dir, "Gemini_History_assets")
+            stored = {os.path.splitext(name)[1]: name for name in os.listdir(assets_dir)}
+            self.assertEqual(set(stored), {".png", ".pdf"})
+            with open(os.path.join(output_dir, "Gemini_History-01.md"), encoding="utf-8") as f:
+                content = f.read()
+            self.assertIn(
+                "### Attachments\n"
+                f"- ![photo 1.png](Gemini_History_assets/{stored['.png']})\n"
+                f"- [notes.pdf](Gemini_History_assets/{stored['.pdf']})\n\n---\n\n",
+                content,
+            )
+
+    def test_store_mode_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store_file = os.path.join(tmpdir, "history.sqlite")
+
+            exit_code, _, stderr = run_main(
+                os.path.join(tmpdir, "last_entry_time.txt"), store=store_file, attachments=True
+            )
+
+            self.assertEqual(exit_code, 1)
+            self.assertIn("--attachments cannot be combined with --store", stderr)
+            self.assertFalse(os.path.exists(store_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
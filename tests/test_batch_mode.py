@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+import convert_history
+from cli_args import make_activity, run_main, write_export
+
+
+class LoadBatchJobsTests(unittest.TestCase):
+    def test_rows_default_state_file_to_output_dir(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            jobs_file = os.path.join(tmpdir, "jobs.csv")
+            with open(jobs_file, "w", encoding="utf-8") as f:
+                f.write("# input_file,output_dir,state_file\n")
+                f.write("alice/MyActivity.json, out/alice, state/alice.txt\n")
+                f.write("\n")
+                f.write("bob/MyActivity.json,out/bob\n")
+
+            jobs = convert_history.load_batch_jobs(jobs_file)
+
+        self.assertEqual(
+            jobs,
+            [
+                convert_history.BatchJob("alice/MyActivity.json", "out/alice", "state/alice.txt"),
+                convert_history.BatchJob(
+                    "bob/MyActivity.json", "out/bob", os.path.join("out/bob", "last_entry_time.txt")
+                ),
+            ],
+        )
+
+
+class RunBatchTests(unittest.TestCase):
+    def test_each_job_gets_its_own_outputs_and_checkpoint_and_failures_are_isolated(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            alice_input = os.path.join(tmpdir, "alice.json")
+            bob_input = os.path.join(tmpdir, "bob.json")
+            write_export(alice_input, [make_activity(2), make_activity(1)])
+            write_export(bob_input, [make_activity(1)])
+
+            jobs_file = os.path.join(tmpdir, "jobs.csv")
+            with open(jobs_file, "w", encoding="utf-8") as f:
+                f.write(f"{alice_input},{os.path.join(tmpdir, 'alice')}\n")
+                f.write(f"{os.path.join(tmpdir, 'missing.json')},{os.path.join(tmpdir, 'missing')}\n")
+                f.write(f"{bob_input},{os.path.join(tmpdir, 'bob')},{os.path.join(tmpdir, 'bob.state')}\n")
+
+            # Jobs without a state file keep a checkpoint named after the default one next to their outputs.
+            result, stdout, stderr = run_main(convert_history.LAST_ENTRY_TIME_FILE, batch=jobs_file, jobs=2)
+
+            self.assertEqual(result, 1)
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "alice", "Gemini_History-01.md")))
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "bob", "Gemini_History-01.md")))
+            with open(os.path.join(tmpdir, "alice", "last_entry_time.txt"), encoding="utf-8") as f:
+                self.assertEqual(f.read(), "2026-06-02T00:00:00+00:00")
+            with open(os.path.join(tmpdir, "bob.state"), encoding="utf-8") as f:
+                self.assertEqual(f.read(), "2026-06-01T00:00:00+00:00")
+
+            self.assertIn(f"{alice_input}: 2 new entries, 1 file(s)", stdout)
+            self.assertIn(f"{bob_input}: 1 new entries, 1 file(s)", stdout)
+            self.assertIn("Batch completed: 2 succeeded, 1 failed.", stdout)
+            self.assertIn("missing.json: failed: Error: File not found", stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
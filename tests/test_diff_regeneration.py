@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+
+import convert_history
+from cli_args import make_activity, run_main, write_export
+
+
+class DiffAwareRegenerationTests(unittest.TestCase):
+    def convert(self, tmpdir: str, activities: list[dict]) -> str:
+        input_file = os.path.join(tmpdir, "MyActivity.json")
+        write_export(input_file, activities)
+
+        exit_code, stdout, _ = run_main(
+            os.path.join(tmpdir, "last_entry_time.txt"),
+            input_file=input_file,
+            output_file=os.path.join(tmpdir, "Gemini_History.md"),
+            limit=800,
+        )
+        self.assertEqual(exit_code, 0)
+        return stdout
+
+    def force_full_regeneration(self, tmpdir: str) -> None:
+        with open(os.path.join(tmpdir, "last_entry_time.txt"), "w", encoding="utf-8") as f:
+            f.write("")
+
+    def read(self, tmpdir: str, index: int) -> str:
+        with open(os.path.join(tmpdir, f"Gemini_History-{index:02d}.md"), encoding="utf-8") as f:
+            return f.read()
+
+    def test_full_regeneration_rewrites_only_files_whose_content_changed(self) -> None:
+        activities = [make_activity(day, f"day {day}", padding=300) for day in (6, 5, 4, 3, 2, 1)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.convert(tmpdir, activities)
+            for index in (1, 2, 3):
+                path = os.path.join(tmpdir, f"Gemini_History-{index:02d}.md")
+                content = convert_history.OUTPUT_HEADER_TIMESTAMP_PATTERN.sub(
+                    r"\1Generated at: 2000-01-01 00:00:00\n", self.read(tmpdir, index)
+                )
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(content)
+            before = [self.read(tmpdir, index) for index in (1, 2, 3)]
+
+            activities[0] = make_activity(6, "day 6 edited", padding=300)
+            self.force_full_regeneration(tmpdir)
+            stdout = self.convert(tmpdir, activities)
+            after = [self.read(tmpdir, index) for index in (1, 2, 3)]
+
+        self.assertEqual(after[:2], before[:2])
+        self.assertNotIn("2000-01-01 00:00:00", after[2])
+        self.assertIn("day 6 edited", after[2])
+        self.assertIn("Files that changed (1):", stdout)
+        self.assertIn("Gemini_History-03.md", stdout.split("Files that changed (1):")[1])
+        self.assertIn("Content unchanged, file left as is:", stdout)
+
+    def test_full_regeneration_removes_outputs_beyond_the_new_set(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.convert(tmpdir, [make_activity(day, f"day {day}", padding=300) for day in (4, 3, 2, 1)])
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "Gemini_History-02.md")))
+
+            self.force_full_regeneration(tmpdir)
+            self.convert(tmpdir, [make_activity(1, "day 1", padding=300)])
+
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "Gemini_History-01.md")))
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, "Gemini_History-02.md")))
+
+    def test_digest_ignores_only_the_header_timestamp(self) -> None:
+        body = "## 2026/06/01 00:00:00\n\nGenerated at: not a header line\n---\n\n"
+        first = "# Gemini Chat History Archive\n\nGenerated at: 2026-01-01 00:00:00\n\n" + body
+        second = "# Gemini Chat History Archive\n\nGenerated at: 2026-12-31 23:59:59\n\n" + body
+
+        self.assertEqual(convert_history.output_content_digest(first), convert_history.output_content_digest(second))
+        self.assertNotEqual(
+            convert_history.output_content_digest(first),
+            convert_history.output_content_digest(first.replace("not a header", "edited")),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,3 @@
-import argparse
 import io
 import os
 import tempfile
@@ -7,6 +6,7 @@ from contextlib import redirect_stderr, redirect_stdout
 from unittest.mock import patch
 
 import convert_history
+from cli_args import make_cli_args
 
 
 class ExitCodeTests(unittest.TestCase):
@@ -18,7 +18,7 @@ class ExitCodeTests(unittest.TestCase):
             "convert_history.load_json", return_value=[]), patch(
             "argparse.ArgumentParser.parse_args"
         ) as mock_args:
-            mock_args.return_value = argparse.Namespace(
+            mock_args.return_value = make_cli_args(
                 input_file="dummy.json",
                 output_file="Gemini_History.md",
                 limit=1000000,
@@ -36,7 +36,7 @@ class ExitCodeTests(unittest.TestCase):
         with patch("convert_history.get_system_language", return_value="en"), patch(
             "convert_history.load_json", side_effect=RuntimeError("Test error")
         ), patch("argparse.ArgumentParser.parse_args") as mock_args:
-            mock_args.return_value = argparse.Namespace(
+            mock_args.return_value = make_cli_args(
                 input_file="dummy.json",
                 output_file="Gemini_History.md",
                 limit=1000000,
@@ -66,7 +66,7 @@ class ExitCodeTests(unittest.TestCase):
             ) as mock_args, patch(
                 "convert_history.LAST_ENTRY_TIME_FILE", last_entry_time_file
             ):
-                mock_args.return_value = argparse.Namespace(
+                mock_args.return_value = make_cli_args(
                     input_file="dummy.json",
                     output_file=output_file,
                     limit=1000000,
@@ -0,0 +1,65 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import convert_history
+from cli_args import make_activity, run_main, write_export
+
+
+class ExternalSortTests(unittest.TestCase):
+    def test_merges_spilled_runs_stably_and_removes_them(self) -> None:
+        rng = random.Random(42)
+        entries = [{**make_activity(rng.randint(1, 9)), "seq": seq} for seq in range(500)]
+        expected = sorted(entries, key=convert_history.entry_time)
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch("tempfile.tempdir", tmpdir):
+            merged = list(convert_history.external_sort_entries(list(entries), run_entries=37))
+            self.assertEqual(os.listdir(tmpdir), [])
+
+        self.assertEqual(merged, expected)
+
+    def test_counts_order_breaks(self) -> None:
+        entries = [make_activity(1), make_activity(3), make_activity(2), make_activity(2), make_activity(1)]
+        self.assertEqual(convert_history.count_order_breaks(entries), 2)
+        self.assertEqual(convert_history.count_order_breaks(sorted(entries, key=convert_history.entry_time)), 0)
+
+    def test_ordered_entries_are_returned_as_is(self) -> None:
+        entries = [make_activity(1), make_activity(2)]
+        self.assertIs(convert_history.time_ordered_entries(entries), entries)
+
+
+class OutOfOrderConversionTests(unittest.TestCase):
+    def convert(self, tmpdir: str, activities: list[dict]) -> str:
+        input_file = os.path.join(tmpdir, "MyActivity.json")
+        write_export(input_file, activities)
+        exit_code, _, stderr = run_main(
+            os.path.join(tmpdir, "last_entry_time.txt"),
+            input_file=input_file,
+            output_file=os.path.join(tmpdir, "Gemini_History.md"),
+        )
+        self.assertEqual(exit_code, 0)
+        return stderr
+
+    def test_shuffled_export_is_written_in_time_order_and_checkpointed_at_the_newest(self) -> None:
+        activities = [make_activity(day, hour=hour) for day in range(1, 6) for hour in (0, 12)]
+        shuffled = activities[:]
+        random.Random(7).shuffle(shuffled)
+
+        with tempfile.TemporaryDirectory() as ordered_dir, tempfile.TemporaryDirectory() as shuffled_dir:
+            self.assertEqual(self.convert(ordered_dir, activities[::-1]), "")
+            stderr = self.convert(shuffled_dir, shuffled)
+
+            self.assertIn("not in time order", stderr)
+            digests = [
+                convert_history.output_file_digest(os.path.join(directory, "Gemini_History-01.md"))
+                for directory in (ordered_dir, shuffled_dir)
+            ]
+            self.assertEqual(digests[0], digests[1])
+            with open(os.path.join(shuffled_dir, "last_entry_time.txt"), encoding="utf-8") as f:
+                self.assertEqual(f.read(), "2026-06-05T12:00:00+00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
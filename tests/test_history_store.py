@@ -0,0 +1,125 @@
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+import convert_history
+from cli_args import make_activity, make_cli_args, write_export
+
+
+class HistoryStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.input_file = os.path.join(self.tmpdir.name, "MyActivity.json")
+        self.output_file = os.path.join(self.tmpdir.name, "Gemini_History.md")
+        self.state_file = os.path.join(self.tmpdir.name, "last_entry_time.txt")
+        self.store_file = os.path.join(self.tmpdir.name, "history.sqlite")
+
+    def output_path(self, index: int) -> str:
+        return os.path.join(self.tmpdir.name, f"Gemini_History-{index:02d}.md")
+
+    def run_export(
+        self, activities: list[dict], limit: int = 800, **overrides
+    ) -> convert_history.ConversionResult:
+        write_export(self.input_file, activities)
+        options = convert_history.ConversionOptions(
+            input_file=self.input_file,
+            output_file=self.output_file,
+            limit=limit,
+            state_file=self.state_file,
+            store_file=self.store_file,
+            **overrides,
+        )
+        with patch("convert_history.get_system_language", return_value="en"), redirect_stdout(
+            io.StringIO()
+        ), redirect_stderr(io.StringIO()):
+            result = convert_history.convert(options)
+        self.assertIsNotNone(result)
+        return result
+
+    def stored_titles(self) -> list[str]:
+        with sqlite3.connect(self.store_file) as connection:
+            rows = connection.execute("SELECT title FROM activities ORDER BY time_key, fingerprint").fetchall()
+        return [title.split(" ")[0] for (title,) in rows]
+
+    def test_later_cumulative_export_only_imports_and_renders_its_delta(self) -> None:
+        first_export = [make_activity(day, padding=300) for day in range(5, 0, -1)]
+        first = self.run_export(first_export)
+        self.assertEqual(first.new_entries, 5)
+        self.assertEqual(first.file_count, 3)
+        self.assertEqual(self.stored_titles(), [f"day{day}" for day in range(1, 6)])
+
+        second = self.run_export([make_activity(6, padding=300), *first_export])
+
+        self.assertEqual(second.new_entries, 1)
+        self.assertEqual(second.files_written, [self.output_path(3)])
+        self.assertEqual(second.file_count, 3)
+        with open(self.output_path(3), encoding="utf-8") as f:
+            tail = f.read()
+        self.assertLess(tail.index("day5"), tail.index("day6"))
+        with open(self.state_file, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "2026-06-06T00:00:00+00:00")
+
+    def test_lost_state_file_does_not_trigger_regeneration(self) -> None:
+        export = [make_activity(day, padding=300) for day in range(4, 0, -1)]
+        self.run_export(export)
+        os.remove(self.state_file)
+
+        result = self.run_export(export)
+
+        self.assertEqual(result.new_entries, 0)
+        self.assertEqual(result.files_written, [])
+        self.assertTrue(os.path.exists(self.state_file))
+
+    def test_entry_sharing_the_newest_timestamp_is_added_by_fingerprint(self) -> None:
+        export = [make_activity(day, padding=300) for day in range(4, 0, -1)]
+        self.run_export(export)
+
+        result = self.run_export([make_activity(4, "other4", padding=300), *export])
+
+        self.assertEqual(result.new_entries, 1)
+        self.assertEqual(sorted(self.stored_titles()[-2:]), ["day4", "other4"])
+
+    def test_changed_limit_or_missing_outputs_render_everything_again(self) -> None:
+        export = [make_activity(day, padding=300) for day in range(4, 0, -1)]
+        self.run_export(export)
+
+        result = self.run_export(export, limit=100000)
+        self.assertEqual(result.files_written, [self.output_path(1)])
+        self.assertFalse(os.path.exists(self.output_path(2)))
+
+        os.remove(self.output_path(1))
+        result = self.run_export(export, limit=100000)
+        self.assertEqual(result.files_written, [self.output_path(1)])
+
+    def test_changed_redaction_settings_render_everything_again(self) -> None:
+        export = [make_activity(day, f"day{day} bob@example.com", padding=300) for day in range(4, 0, -1)]
+        self.run_export(export)
+
+        result = self.run_export(export, redact=True)
+        self.assertEqual(result.new_entries, 0)
+        self.assertEqual(
+            result.files_written, [self.output_path(index) for index in range(1, result.file_count + 1)]
+        )
+        for output_file in result.files_written:
+            with open(output_file, encoding="utf-8") as f:
+                self.assertNotIn("bob@example.com", f.read())
+
+        self.assertEqual(self.run_export(export, redact=True).files_written, [])
+        result = self.run_export(export, redact=True, redact_terms=["day4"])
+        self.assertEqual(result.files_unchanged, [self.output_path(1)])
+        for output_file in result.files_written:
+            with open(output_file, encoding="utf-8") as f:
+                self.assertNotIn("day4", f.read())
+
+    def test_store_option_reaches_conversion_options(self) -> None:
+        args = make_cli_args(store=self.store_file)
+        self.assertEqual(convert_history.options_from_args(args).store_file, self.store_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
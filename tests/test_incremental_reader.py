@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+import convert_history
+from cli_args import make_activity, run_main, write_export
+
+
+def export(days: range) -> list[dict]:
+    """Newest first, as Takeout writes it, with an unrelated activity after every Gemini one."""
+    activities = []
+    for day in reversed(days):
+        activities.append(make_activity(day, padding=2000))
+        activities.append(make_activity(day, header="Search", padding=2000))
+    return activities
+
+
+class LoadEntriesUntilCheckpointTests(unittest.TestCase):
+    def test_stops_at_the_first_entry_at_or_before_the_checkpoint(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            write_export(input_file, export(range(1, 29)))
+            checkpoint = datetime(2026, 6, 25, tzinfo=timezone.utc)
+
+            activities, entries, bytes_read = convert_history.load_entries_until_checkpoint(input_file, checkpoint)
+
+            self.assertEqual([entry["title"][:5] for entry in entries], ["day28", "day27", "day26"])
+            self.assertEqual(activities, 7)
+            self.assertLess(bytes_read, os.path.getsize(input_file) // 7)
+
+    def test_without_an_older_entry_the_whole_file_is_read(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            write_export(input_file, export(range(1, 4)))
+            checkpoint = datetime.min.replace(tzinfo=timezone.utc)
+
+            activities, entries, _ = convert_history.load_entries_until_checkpoint(input_file, checkpoint)
+
+            self.assertEqual((activities, len(entries)), (6, 3))
+
+
+class IncrementalConversionTests(unittest.TestCase):
+    def run_daily(self, tmpdir: str, **overrides) -> str:
+        input_file = os.path.join(tmpdir, "MyActivity.json")
+        stdout = ""
+        for days in (range(1, 21), range(1, 24)):
+            write_export(input_file, export(days))
+            exit_code, run_stdout, _ = run_main(
+                os.path.join(tmpdir, "last_entry_time.txt"),
+                input_file=input_file,
+                output_file=os.path.join(tmpdir, "Gemini_History.md"),
+                limit=10000,
+                **overrides,
+            )
+            self.assertEqual(exit_code, 0)
+            stdout += run_stdout
+        return stdout
+
+    def outputs(self, tmpdir: str) -> dict[str, str]:
+        names = sorted(name for name in os.listdir(tmpdir) if name.startswith("Gemini_History-"))
+        return {
+            name: convert_history.output_file_digest(os.path.join(tmpdir, name)) for name in names
+        }
+
+    def test_daily_run_matches_a_full_read(self) -> None:
+        with tempfile.TemporaryDirectory() as full_dir, tempfile.TemporaryDirectory() as incremental_dir:
+            self.run_daily(full_dir)
+            stdout = self.run_daily(incremental_dir, incremental=True)
+
+            self.assertIn("Stopped at the last processed entry", stdout)
+            self.assertIn("(7 activities)", stdout)
+            self.assertEqual(self.outputs(incremental_dir), self.outputs(full_dir))
+            with open(os.path.join(incremental_dir, "last_entry_time.txt"), encoding="utf-8") as f:
+                self.assertEqual(f.read(), "2026-06-23T00:00:00+00:00")
+
+    def test_store_runs_read_the_whole_export(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stdout = self.run_daily(tmpdir, incremental=True, store=os.path.join(tmpdir, "history.sqlite"))
+            self.assertNotIn("Stopped at the last processed entry", stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest.mock import patch
+
+import convert_history
+
+
+class JsonBackendTests(unittest.TestCase):
+    def setUp(self) -> None:
+        convert_history.resolve_json_backend.cache_clear()
+
+    def tearDown(self) -> None:
+        convert_history.resolve_json_backend.cache_clear()
+
+    def test_auto_falls_back_to_stdlib_json_when_nothing_accelerated_is_importable(self) -> None:
+        with patch("convert_history.importlib.util.find_spec", return_value=None):
+            name, loads = convert_history.resolve_json_backend("auto")
+
+        self.assertEqual(name, "json")
+        self.assertEqual(loads(b'[{"header": "Gemini"}]'), [{"header": "Gemini"}])
+
+    def test_unavailable_explicit_backend_warns_and_uses_stdlib_json(self) -> None:
+        stderr_buffer = io.StringIO()
+        with patch("convert_history.get_system_language", return_value="en"), patch(
+            "convert_history.importlib.util.find_spec", return_value=None
+        ), redirect_stderr(stderr_buffer):
+            name, _ = convert_history.resolve_json_backend("ujson")
+
+        self.assertEqual(name, "json")
+        self.assertIn("JSON backend ujson is not available", stderr_buffer.getvalue())
+
+    def test_every_available_backend_decodes_the_same_document(self) -> None:
+        document = b'[{"header": "Gemini Apps", "title": "\\u65e5\\u672c \\"quoted\\""}]'
+        for name, loads in convert_history.JSON_BACKENDS.items():
+            if not convert_history.is_json_backend_available(name):
+                continue
+            with self.subTest(backend=name):
+                self.assertEqual(loads(document), json.loads(document))
+                with self.assertRaises(json.JSONDecodeError):
+                    loads(b'[{"header": ')
+
+    def test_benchmark_reports_each_available_backend(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            with open(input_file, "w", encoding="utf-8") as f:
+                json.dump([{"header": "Gemini Apps"}, {"header": "Search"}], f)
+
+            results = convert_history.benchmark_json_backends(input_file, repeat=1)
+
+        expected = [name for name in convert_history.JSON_BACKENDS if convert_history.is_json_backend_available(name)]
+        self.assertEqual([name for name, _ in results], expected)
+        self.assertTrue(all(seconds >= 0 for _, seconds in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,3 @@
-import argparse
 import io
 import os
 import tempfile
@@ -8,6 +7,7 @@ from datetime import datetime, timezone
 from unittest.mock import patch
 
 import convert_history
+from cli_args import make_cli_args
 
 
 class LastEntryTimeHandlingTests(unittest.TestCase):
@@ -72,7 +72,7 @@ class LastEntryTimeHandlingTests(unittest.TestCase):
             ) as mock_args, patch(
                 "convert_history.LAST_ENTRY_TIME_FILE", last_entry_time_file
             ):
-                mock_args.return_value = argparse.Namespace(
+                mock_args.return_value = make_cli_args(
                     input_file="dummy.json",
                     output_file=output_file,
                     limit=1000000,
@@ -138,7 +138,7 @@ class LastEntryTimeHandlingTests(unittest.TestCase):
                 convert_history.remove_numbered_output_files(base_name, ext)
 
             stderr = stderr_buffer.getvalue()
-            self.assertIn("Removed 1 existing output file(s)", stderr)
+            self.assertIn("Removed 1 stale numbered output file(s)", stderr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest.mock import patch
+
+import convert_history
+from cli_args import run_main, write_export
+
+
+class MmapInputTests(unittest.TestCase):
+    def test_open_input_view_yields_empty_bytes_for_empty_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            open(input_file, "wb").close()
+
+            with convert_history.open_input_view(input_file) as view:
+                self.assertEqual(len(view), 0)
+
+    def test_empty_file_reports_decode_error(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            open(input_file, "wb").close()
+
+            stderr_buffer = io.StringIO()
+            with patch("convert_history.get_system_language", return_value="en"), redirect_stderr(stderr_buffer):
+                total, entries = convert_history.load_gemini_entries(input_file)
+
+        self.assertEqual((total, entries), (0, []))
+        self.assertIn("JSON decode error", stderr_buffer.getvalue())
+
+    def test_prefilter_skips_decoding_of_non_gemini_activities(self) -> None:
+        raw = (
+            '[{"header": "Search", "title": "no match"},'
+            ' {"header": "\\u0047emini Apps", "title": "escaped header"},'
+            ' {"header": "YouTube", "title": "mentions Gemini in the title"},'
+            ' {"header": "Gemini Apps", "title": "plain header"}]'
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            with open(input_file, "w", encoding="utf-8") as f:
+                f.write(raw)
+
+            with patch(
+                "convert_history.is_gemini_entry", side_effect=convert_history.is_gemini_entry
+            ) as mock_filter:
+                total, entries = convert_history.load_gemini_entries(input_file)
+
+        self.assertEqual(total, 4)
+        self.assertEqual([entry["title"] for entry in entries], ["escaped header", "plain header"])
+        self.assertEqual(mock_filter.call_count, 3)
+
+    def test_main_with_mmap_writes_same_output_as_json_load(self) -> None:
+        activities = [
+            {"header": "Gemini Apps", "time": "2026-06-02T00:00:00Z", "title": "second"},
+            {"header": "Search", "time": "2026-06-01T12:00:00Z", "title": "ignored"},
+            {"header": "Gemini Apps", "time": "2026-06-01T00:00:00Z", "title": "first"},
+        ]
+        outputs = []
+        for use_mmap in (False, True):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                input_file = os.path.join(tmpdir, "MyActivity.json")
+                output_file = os.path.join(tmpdir, "Gemini_History.md")
+                write_export(input_file, activities)
+
+                result, _, _ = run_main(
+                    os.path.join(tmpdir, "last_entry_time.txt"),
+                    input_file=input_file,
+                    output_file=output_file,
+                    mmap=use_mmap,
+                )
+
+                self.assertEqual(result, 0)
+                with open(os.path.join(tmpdir, "Gemini_History-01.md"), encoding="utf-8") as f:
+                    outputs.append(f.read().split("\n", 3)[3])
+
+        self.assertEqual(outputs[0], outputs[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,3 @@
-import argparse
 import io
 import os
 import tempfile
@@ -7,6 +6,7 @@ from contextlib import redirect_stderr, redirect_stdout
 from unittest.mock import patch
 
 import convert_history
+from cli_args import make_cli_args
 
 
 class OutputStreamTests(unittest.TestCase):
@@ -28,7 +28,7 @@ class OutputStreamTests(unittest.TestCase):
             ), patch("argparse.ArgumentParser.parse_args") as mock_args, patch(
                 "convert_history.LAST_ENTRY_TIME_FILE", last_entry_time_file
             ):
-                mock_args.return_value = argparse.Namespace(
+                mock_args.return_value = make_cli_args(
                     input_file="dummy.json",
                     output_file=output_file,
                     limit=1000000,
@@ -56,7 +56,7 @@ class OutputStreamTests(unittest.TestCase):
         ), patch(
             "argparse.ArgumentParser.parse_args"
         ) as mock_args:
-            mock_args.return_value = argparse.Namespace(
+            mock_args.return_value = make_cli_args(
                 input_file="dummy.json",
                 output_file="Gemini_History.md",
                 limit=1000000,
@@ -92,7 +92,7 @@ class OutputStreamTests(unittest.TestCase):
             ) as mock_args, patch(
                 "convert_history.LAST_ENTRY_TIME_FILE", last_entry_time_file
             ):
-                mock_args.return_value = argparse.Namespace(
+                mock_args.return_value = make_cli_args(
                     input_file="dummy.json",
                     output_file=output_file,
                     limit=1000000,
@@ -0,0 +1,130 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+import convert_history
+from cli_args import write_export
+
+HEADING = "## 2026/06/01 00:00:00"
+
+
+def rendered_entry(paragraphs: list[str]) -> str:
+    return f"{HEADING}\n\n" + "".join(f"{paragraph}\n\n" for paragraph in paragraphs) + "---\n\n"
+
+
+def rejoin(pieces: list[str]) -> str:
+    continuation = f"{HEADING} (continued)\n\n"
+    return pieces[0] + "".join(piece[len(continuation) :] for piece in pieces[1:])
+
+
+class SplitOversizedEntryTests(unittest.TestCase):
+    def test_entry_that_fits_is_kept_whole(self) -> None:
+        text = rendered_entry(["short"])
+        self.assertEqual(list(convert_history.split_oversized_entry(text, 1000)), [text])
+
+    def test_cuts_at_paragraph_boundaries(self) -> None:
+        text = rendered_entry([f"paragraph {i} " + "x" * 80 for i in range(10)])
+
+        pieces = list(convert_history.split_oversized_entry(text, 300))
+
+        self.assertGreater(len(pieces), 3)
+        self.assertTrue(all(len(piece.encode("utf-8")) <= 300 for piece in pieces))
+        self.assertTrue(all(piece.endswith("\n\n") for piece in pieces))
+        self.assertTrue(all(piece.startswith(f"{HEADING} (continued)\n\n") for piece in pieces[1:]))
+        self.assertEqual(rejoin(pieces), text)
+
+    def test_long_lists_and_lines_are_cut_within_the_budget(self) -> None:
+        list_block = "\n".join(f"- item {i}" for i in range(60))
+        text = rendered_entry([list_block, "日本語の長い段落" * 40])
+
+        pieces = list(convert_history.split_oversized_entry(text, 200))
+
+        self.assertTrue(all(len(piece.encode("utf-8")) <= 200 for piece in pieces))
+        list_pieces = [piece for piece in pieces if "- item" in piece][:-1]
+        self.assertTrue(list_pieces)
+        self.assertTrue(all(piece.endswith("\n") and not piece.endswith("\n\n") for piece in list_pieces))
+        self.assertEqual(rejoin(pieces), text)
+
+
+    def test_budget_narrower_than_a_character_still_advances(self) -> None:
+        self.assertEqual(list(convert_history.iter_text_fragments("あいう", 2)), ["あ", "い", "う"])
+        self.assertEqual(list(convert_history.iter_text_fragments("aあb", 1)), ["a", "あ", "b"])
+
+    def test_tiny_capacity_keeps_a_cjk_entry_whole(self) -> None:
+        text = rendered_entry(["日本語の段落" * 20])
+        continuation_size = len(f"{HEADING} (continued)\n\n".encode())
+
+        for capacity in range(continuation_size, continuation_size + 12):
+            with self.subTest(capacity=capacity):
+                pieces = list(convert_history.split_oversized_entry(text, capacity))
+                self.assertEqual(pieces[0][: len(HEADING)], HEADING)
+                if len(pieces) > 1:
+                    self.assertEqual(rejoin(pieces), text)
+                else:
+                    self.assertEqual(pieces, [text])
+
+
+class OversizedConversionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.input_file = os.path.join(self.tmpdir.name, "MyActivity.json")
+        self.output_file = os.path.join(self.tmpdir.name, "Gemini_History.md")
+        self.huge = {
+            "header": "Gemini Apps",
+            "time": "2026-06-01T00:00:00Z",
+            "title": "huge",
+            "safeHtmlItem": [{"html": "".join(f"<p>paragraph {i} {'y' * 200}</p>" for i in range(40))}],
+        }
+
+    def convert(self, activities: list[dict], store: bool = False) -> None:
+        write_export(self.input_file, activities)
+        options = convert_history.ConversionOptions(
+            input_file=self.input_file,
+            output_file=self.output_file,
+            limit=2000,
+            state_file=os.path.join(self.tmpdir.name, "last_entry_time.txt"),
+            store_file=os.path.join(self.tmpdir.name, "history.sqlite") if store else None,
+        )
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            self.assertIsNotNone(convert_history.convert(options))
+
+    def outputs(self) -> list[str]:
+        base_name, ext = os.path.splitext(self.output_file)
+        contents = []
+        for path in convert_history.numbered_output_files(base_name, ext):
+            self.assertLessEqual(os.path.getsize(path), 2000)
+            with open(path, encoding="utf-8") as f:
+                contents.append(f.read())
+        return contents
+
+    def test_huge_entry_is_spread_over_files_under_the_limit(self) -> None:
+        self.convert([self.huge])
+
+        outputs = self.outputs()
+
+        self.assertGreater(len(outputs), 3)
+        self.assertIn("## 2026/06/01 00:00:00\n\n**Action**: huge", outputs[0])
+        self.assertIn("## 2026/06/01 00:00:00 (continued)\n\n", outputs[1])
+        self.assertIn("paragraph 39", outputs[-1])
+
+    def test_store_rerender_after_a_split_entry_does_not_duplicate_pieces(self) -> None:
+        later = {"header": "Gemini Apps", "time": "2026-06-02T00:00:00Z", "title": "later"}
+        self.convert([self.huge], store=True)
+        self.convert([later, self.huge], store=True)
+        incremental = self.outputs()
+
+        os.remove(os.path.join(self.tmpdir.name, "history.sqlite"))
+        self.convert([later, self.huge], store=True)
+
+        self.assertEqual(
+            [convert_history.output_content_digest(content) for content in incremental],
+            [convert_history.output_content_digest(content) for content in self.outputs()],
+        )
+        self.assertEqual(sum(content.count("paragraph 0 ") for content in incremental), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+import convert_history
+from cli_args import make_cli_args
+
+SAMPLE_ACTIVITIES = [
+    {
+        "header": "Gemini Apps",
+        "time": "2026-06-02T00:00:00Z",
+        "title": 'Prompted {"nested": [1, 2]} and "quotes"',
+        "subtitles": [{"name": "User", "value": "brackets ] } [ { inside a string \\\\"}],
+    },
+    {"header": "Search", "time": "2026-06-01T12:00:00Z", "title": 'escaped \\" quote } ]'},
+    {"header": "Gemini Apps", "time": "2026-06-01T00:00:00Z", "title": "日本語のタイトル"},
+]
+
+
+class ScanActivityBoundariesTests(unittest.TestCase):
+    def test_boundaries_decode_to_each_top_level_object(self) -> None:
+        buffer = json.dumps(SAMPLE_ACTIVITIES, ensure_ascii=False, indent=2).encode("utf-8")
+
+        boundaries = convert_history.scan_activity_boundaries(buffer)
+
+        decoded = [json.loads(buffer[start:end]) for start, end in boundaries]
+        self.assertEqual(decoded, SAMPLE_ACTIVITIES)
+
+    def test_empty_array_has_no_boundaries(self) -> None:
+        self.assertEqual(convert_history.scan_activity_boundaries(b"  [ ]\n"), [])
+
+    def test_non_array_input_raises_decode_error(self) -> None:
+        with self.assertRaises(json.JSONDecodeError):
+            convert_history.scan_activity_boundaries(b'{"header": "Gemini"}')
+
+    def test_truncated_array_raises_decode_error(self) -> None:
+        with self.assertRaises(json.JSONDecodeError):
+            convert_history.scan_activity_boundaries(b'[{"header": "Gemini"}, {"header": "Gem')
+
+    def test_newline_aligned_chunks_resolve_to_same_boundaries(self) -> None:
+        activities = SAMPLE_ACTIVITIES * 20
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for indent in (2, None):
+                with self.subTest(indent=indent):
+                    input_file = os.path.join(tmpdir, f"MyActivity-{indent}.json")
+                    with open(input_file, "w", encoding="utf-8") as f:
+                        json.dump(activities, f, ensure_ascii=False, indent=indent)
+                    with open(input_file, "rb") as f:
+                        expected = convert_history.scan_activity_boundaries(f.read())
+
+                    with convert_history.open_input_view(input_file) as view:
+                        chunks = convert_history.split_at_newlines(view, 7)
+                    scanned = [convert_history.scan_file_chunk(input_file, start, end) for start, end in chunks]
+
+                    self.assertEqual(convert_history.resolve_activity_boundaries(scanned), expected)
+                    self.assertEqual(len(expected), len(activities))
+
+
+class ParallelLoadTests(unittest.TestCase):
+    def test_parallel_load_matches_sequential_filter_order(self) -> None:
+        activities = SAMPLE_ACTIVITIES * 50
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            with open(input_file, "w", encoding="utf-8") as f:
+                json.dump(activities, f, ensure_ascii=False)
+
+            with patch("convert_history.PARALLEL_BATCH_BYTES", 512):
+                total, gemini_entries = convert_history.load_gemini_entries(input_file, 2)
+
+        self.assertEqual(total, len(activities))
+        self.assertEqual(gemini_entries, [entry for entry in activities if "Gemini" in entry["header"]])
+
+    def test_main_with_workers_writes_same_output_as_single_process(self) -> None:
+        outputs = []
+        for workers in (1, 2):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                input_file = os.path.join(tmpdir, "MyActivity.json")
+                output_file = os.path.join(tmpdir, "Gemini_History.md")
+                last_entry_time_file = os.path.join(tmpdir, "last_entry_time.txt")
+                with open(input_file, "w", encoding="utf-8") as f:
+                    json.dump(SAMPLE_ACTIVITIES, f, ensure_ascii=False)
+
+                with patch("convert_history.get_system_language", return_value="en"), patch(
+                    "argparse.ArgumentParser.parse_args"
+                ) as mock_args, patch("convert_history.LAST_ENTRY_TIME_FILE", last_entry_time_file):
+                    mock_args.return_value = make_cli_args(
+                        input_file=input_file, output_file=output_file, workers=workers
+                    )
+                    with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                        result = convert_history.main()
+
+                self.assertEqual(result, 0)
+                with open(os.path.join(tmpdir, "Gemini_History-01.md"), encoding="utf-8") as f:
+                    outputs.append(f.read().split("\n", 3)[3])
+
+        self.assertEqual(outputs[0], outputs[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import io
+import random
+import re
+import time
+import unittest
+from contextlib import redirect_stderr
+from datetime import datetime, timezone
+from typing import Callable
+from unittest.mock import patch
+
+import convert_history
+
+# Fragments that defeat the lazy tag-pair patterns: openings that never close, closings of another
+# kind, tags that never end, and nesting with the closing only after a line break.
+ADVERSARIAL_UNITS: dict[str, Callable[[int], str]] = {
+    "unclosed_headings": lambda i: f"<h{i % 6 + 1}>text ",
+    "unclosed_bold": lambda i: "<b>word " if i % 2 else "<strong>word ",
+    "mismatched_bold": lambda i: "<b>word</strong> ",
+    "unterminated_tags": lambda i: "<li class='x' " if i % 2 else "< a ",
+    "nested_unclosed": lambda i: "<h2><b><strong>x ",
+    "closing_after_line_break": lambda i: "<h1><b>x" + ("\n</b></h1>" if i % 50 == 49 else ""),
+}
+
+
+def adversarial_html(kind: str, units: int) -> str:
+    make_unit = ADVERSARIAL_UNITS[kind]
+    return "".join(make_unit(i) for i in range(units))
+
+
+def adversarial_entry(kind: str, units: int) -> dict:
+    """An activity whose safeHtmlItem payload is made of `units` adversarial fragments."""
+    return {
+        "header": "Gemini Apps",
+        "time": "2026-06-01T00:00:00Z",
+        "title": kind,
+        "safeHtmlItem": [{"html": adversarial_html(kind, units)}],
+    }
+
+
+def conversion_time(entry: dict, repeat: int = 3) -> float:
+    """Best of repeat timings of rendering the entry."""
+    checkpoint = datetime.min.replace(tzinfo=timezone.utc)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        convert_history.extract_text_content(entry, checkpoint)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def legacy_html_to_markdown(html_str: str) -> str:
+    """The regular expressions html_to_markdown used to apply, kept as the reference output."""
+    text = convert_history.html_module.unescape(convert_history.decode_unicode_escapes(html_str))
+    text = re.sub(r"<h[1-6][^>]*>(.*?)</h[1-6]>", r"\n**\1**\n", text, flags=re.IGNORECASE)
+    text = re.sub(r"<li[^>]*>", r"\n- ", text, flags=re.IGNORECASE)
+    text = re.sub(r"</p>", r"\n\n", text, flags=re.IGNORECASE)
+    text = re.sub(r"</div>", r"\n", text, flags=re.IGNORECASE)
+    text = re.sub(r"<br\s*/?>", r"\n", text, flags=re.IGNORECASE)
+    text = re.sub(r"<(b|strong)[^>]*>(.*?)</\1>", r"**\2**", text, flags=re.IGNORECASE)
+    text = re.sub(r"<[^>]+>", "", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+class PathologicalHtmlTimingTests(unittest.TestCase):
+    def test_conversion_time_grows_linearly_with_input_size(self) -> None:
+        for kind in ADVERSARIAL_UNITS:
+            with self.subTest(kind=kind):
+                small, large = adversarial_entry(kind, 5000), adversarial_entry(kind, 20000)
+
+                small_time = conversion_time(small)
+                large_time = conversion_time(large)
+
+                # Four times the input: about 4x for linear work, 16x for the quadratic patterns.
+                self.assertLess(large_time, max(small_time, 0.002) * 8)
+                self.assertLess(large_time, 1.0)
+
+
+class HtmlToMarkdownTests(unittest.TestCase):
+    def test_output_matches_the_previous_regular_expressions(self) -> None:
+        tokens = [
+            "<h1>", "<H2 class='a'>", "</h1>", "</H3>", "<b>", "<B>", "</b>", "<strong>", "</STRONG>",
+            "<blockquote>", "<h", "<", ">", "\n", "x", "<li>", "<li", "<br/>", "</p>", "</div>",
+            "&lt;", "\\u003e", "<h1 \n>", "{0}",
+        ]  # fmt: skip
+        rng = random.Random(48)
+        for _ in range(5000):
+            html = "".join(rng.choice(tokens) for _ in range(rng.randint(1, 20)))
+            with self.subTest(html=html):
+                self.assertEqual(convert_history.html_to_markdown(html), legacy_html_to_markdown(html))
+
+    def test_falls_back_to_tag_stripping_when_over_budget(self) -> None:
+        html = "<h1>Title</h1><p>a <b>bold</b> word</p>"
+        stderr = io.StringIO()
+
+        with patch("convert_history.get_system_language", return_value="en"), redirect_stderr(stderr):
+            converted = convert_history.html_to_markdown(html, time_budget=-1.0)
+
+        self.assertEqual(converted, "Titlea bold word")
+        self.assertIn("falling back to plain tag stripping", stderr.getvalue())
+        self.assertEqual(convert_history.html_to_markdown(html), "**Title**\na **bold** word")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import io
+import os
+import re
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from typing import Optional
+
+import convert_history
+from cli_args import make_activity, run_main, write_export
+
+
+class PlanModeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.input_file = os.path.join(self.tmpdir.name, "MyActivity.json")
+        self.output_file = os.path.join(self.tmpdir.name, "Gemini_History.md")
+        self.state_file = os.path.join(self.tmpdir.name, "last_entry_time.txt")
+
+    def write_export(self, days: range) -> None:
+        write_export(self.input_file, [make_activity(day, padding=300) for day in reversed(days)])
+
+    def convert(self, **overrides) -> tuple[int, str]:
+        exit_code, stdout, _ = run_main(
+            self.state_file, input_file=self.input_file, output_file=self.output_file, limit=800, **overrides
+        )
+        return exit_code, stdout
+
+    def planned_files(
+        self, entries: list[dict], target_files: Optional[int] = None
+    ) -> list[convert_history.PlannedFile]:
+        product = convert_history.ProductFilter("Gemini", ("Gemini",), self.output_file, 800, self.state_file)
+        planned, _, _ = convert_history.plan_numbered_outputs(entries, product, target_files)
+        return planned
+
+    def test_plan_writes_nothing_and_matches_the_real_split(self) -> None:
+        self.write_export(range(1, 6))
+
+        exit_code, stdout = self.convert(plan=True)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(os.listdir(self.tmpdir.name), ["MyActivity.json"])
+        self.assertIn("Plan for", stdout)
+        self.assertIn("Estimated time", stdout)
+
+        planned = self.planned_files([make_activity(day, padding=300) for day in range(1, 6)])
+        self.convert()
+        self.assertEqual(
+            [(planned_file.path, planned_file.size) for planned_file in planned],
+            [
+                (os.path.join(self.tmpdir.name, name), os.path.getsize(os.path.join(self.tmpdir.name, name)))
+                for name in ("Gemini_History-01.md", "Gemini_History-02.md", "Gemini_History-03.md")
+            ],
+        )
+        self.assertEqual(planned[0].first_time.day, 1)
+        self.assertEqual(planned[-1].last_time.day, 5)
+
+    def test_plan_continues_after_the_checkpoint(self) -> None:
+        self.write_export(range(1, 6))
+        self.convert()
+
+        planned = self.planned_files([make_activity(day, padding=300) for day in range(1, 8)])
+
+        self.assertEqual([planned_file.entries for planned_file in planned], [1, 1])
+        self.assertTrue(planned[0].appended)
+        self.assertEqual(planned[0].path, os.path.join(self.tmpdir.name, "Gemini_History-03.md"))
+        self.assertFalse(planned[1].appended)
+
+    def test_plan_follows_target_files(self) -> None:
+        self.write_export(range(1, 4))
+        self.convert()
+        self.write_export(range(1, 6))
+
+        planned = self.planned_files([make_activity(day, padding=300) for day in range(1, 6)], target_files=3)
+        self.convert(target_files=3)
+
+        self.assertEqual([planned_file.entries for planned_file in planned], [2, 2, 1])
+        self.assertFalse(any(planned_file.appended for planned_file in planned))
+        self.assertEqual(
+            [(planned_file.path, planned_file.size) for planned_file in planned],
+            [
+                (os.path.join(self.tmpdir.name, name), os.path.getsize(os.path.join(self.tmpdir.name, name)))
+                for name in ("Gemini_History-01.md", "Gemini_History-02.md", "Gemini_History-03.md")
+            ],
+        )
+
+    def test_split_and_out_of_order_entries_are_planned_like_the_real_run(self) -> None:
+        oversized = {**make_activity(3), "title": "day3\n" + "line of text\n" * 150}
+        oldest_first = [make_activity(day, padding=300) for day in (1, 2, 4)]
+        oldest_first.insert(1, oversized)
+        write_export(self.input_file, oldest_first[::-1])
+
+        with redirect_stderr(io.StringIO()):
+            planned = self.planned_files(oldest_first)
+        self.convert()
+
+        written = []
+        for planned_file in planned:
+            with open(planned_file.path, encoding="utf-8") as f:
+                content = f.read()
+            entries = len(re.findall(r"^## \d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}$", content, re.MULTILINE))
+            written.append((planned_file.path, len(content.encode("utf-8")), entries))
+        self.assertEqual(
+            [(planned_file.path, planned_file.size, planned_file.entries) for planned_file in planned],
+            written,
+        )
+        self.assertEqual([planned_file.entries for planned_file in planned], [2, 1, 0, 0, 1])
+        self.assertEqual([planned_file.first_time.day for planned_file in planned], [1, 3, 3, 3, 4])
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir.name, "Gemini_History-06.md")))
+
+    def test_sampled_html_ratio_is_used_for_responses(self) -> None:
+        entry = {"header": "Gemini Apps", "time": "2026-06-01T00:00:00Z", "safeHtmlItem": [{"html": "<p>abcd</p>"}]}
+
+        seconds_per_entry, markdown_per_html_char = convert_history.sample_conversion_cost([entry])
+
+        self.assertGreaterEqual(seconds_per_entry, 0.0)
+        self.assertAlmostEqual(markdown_per_html_char, 4 / len("<p>abcd</p>"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import collections
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import convert_history
+from cli_args import run_main, write_export
+
+
+class ReservoirSampleTests(unittest.TestCase):
+    def test_every_item_is_equally_likely(self) -> None:
+        rng = random.Random(49)
+        counts = collections.Counter()
+        for _ in range(20000):
+            sample = convert_history.reservoir_sample(iter(range(20)), 5, rng)
+            self.assertEqual(len(set(sample)), 5)
+            counts.update(sample)
+
+        # Each item is expected 5000 times; the standard deviation is about 61.
+        self.assertEqual(set(counts), set(range(20)))
+        self.assertLess(max(abs(count - 5000) for count in counts.values()), 300)
+
+    def test_short_streams_and_empty_samples(self) -> None:
+        self.assertEqual(sorted(convert_history.reservoir_sample(range(3), 5)), [0, 1, 2])
+        self.assertEqual(convert_history.reservoir_sample(range(3), 0), [])
+
+
+class PreviewModeTests(unittest.TestCase):
+    def test_renders_only_the_sampled_entries_into_one_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            write_export(
+                input_file,
+                [
+                    {"header": "Gemini Apps", "time": f"2026-{month:02d}-{day:02d}T00:00:00Z", "title": "x"}
+                    for month in range(12, 0, -1)
+                    for day in range(28, 0, -1)
+                ],
+            )
+            output_file = os.path.join(tmpdir, "Gemini_History.md")
+            state_file = os.path.join(tmpdir, "last_entry_time.txt")
+
+            with patch(
+                "convert_history.extract_text_content", wraps=convert_history.extract_text_content
+            ) as mock_extract:
+                exit_code, stdout, _ = run_main(
+                    state_file, input_file=input_file, output_file=output_file, preview=10
+                )
+
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(mock_extract.call_count, 10)
+            self.assertEqual(os.listdir(tmpdir).count("Gemini_History-preview.md"), 1)
+            self.assertFalse(os.path.exists(state_file))
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, "Gemini_History-01.md")))
+            with open(os.path.join(tmpdir, "Gemini_History-preview.md"), encoding="utf-8") as f:
+                headings = [line for line in f if line.startswith("## ")]
+            self.assertEqual(len(headings), 10)
+            self.assertEqual(headings, sorted(headings))
+            self.assertIn("(10 of 336 entries sampled)", stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+import unittest
+
+import convert_history
+from cli_args import run_main, write_export
+
+PADDING = " " + "x" * 200
+ACTIVITIES = [
+    {"header": "Gemini Apps", "time": "2026-06-04T00:00:00Z", "title": "gemini newest" + PADDING},
+    {"header": "Search", "time": "2026-06-03T00:00:00Z", "title": "search query" + PADDING},
+    {"header": "Bard", "time": "2026-06-02T00:00:00Z", "title": "bard answer" + PADDING},
+    {"header": "Maps", "time": "2026-06-02T00:00:00Z", "title": "maps route" + PADDING},
+    {"header": "Gemini Apps", "time": "2026-06-01T00:00:00Z", "title": "gemini oldest" + PADDING},
+]
+
+
+def read_text(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+class LoadProductFiltersTests(unittest.TestCase):
+    def test_defaults_and_single_pattern(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = os.path.join(tmpdir, "products.json")
+            with open(config, "w", encoding="utf-8") as f:
+                json.dump(
+                    [
+                        {"name": "Gemini", "match": ["Gemini", "Bard"], "output_file": "out/Gemini.md"},
+                        {"name": "Search", "match": "Search", "output_file": "Search.md", "limit": 10,
+                         "state_file": "search.state"},
+                    ],
+                    f,
+                )
+
+            products = convert_history.load_product_filters(config, default_limit=500)
+
+        self.assertEqual(
+            products,
+            [
+                convert_history.ProductFilter(
+                    "Gemini", ("Gemini", "Bard"), "out/Gemini.md", 500, "out/Gemini_last_entry_time.txt"
+                ),
+                convert_history.ProductFilter("Search", ("Search",), "Search.md", 10, "search.state"),
+            ],
+        )
+
+    def test_duplicate_output_files_are_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = os.path.join(tmpdir, "products.json")
+            with open(config, "w", encoding="utf-8") as f:
+                json.dump(
+                    [
+                        {"name": "A", "match": "A", "output_file": "same.md"},
+                        {"name": "B", "match": "B", "output_file": "same.md"},
+                    ],
+                    f,
+                )
+
+            with self.assertRaises(ValueError):
+                convert_history.load_product_filters(config, default_limit=500)
+
+
+class ProductMatcherTests(unittest.TestCase):
+    def test_first_product_in_config_order_wins_and_routes_are_cached(self) -> None:
+        products = [
+            convert_history.ProductFilter("Apps", ("Gemini Apps",), "apps.md", 10, "apps.state"),
+            convert_history.ProductFilter("Gemini", ("Gemini",), "gemini.md", 10, "gemini.state"),
+        ]
+        matcher = convert_history.ProductMatcher(products)
+
+        self.assertEqual(matcher.route("Gemini Apps"), 0)
+        self.assertEqual(matcher.route("Gemini in Gmail"), 1)
+        self.assertIsNone(matcher.route("Search"))
+        self.assertEqual(matcher.routes, {"Gemini Apps": 0, "Gemini in Gmail": 1, "Search": None})
+        self.assertTrue(matcher.matches({"header": "Gemini Apps"}))
+        self.assertFalse(matcher.matches({"title": "no header"}))
+
+
+class ProductConversionTests(unittest.TestCase):
+    def run_products(self, tmpdir: str, use_mmap: bool) -> str:
+        input_file = os.path.join(tmpdir, "MyActivity.json")
+        write_export(input_file, ACTIVITIES)
+        config = os.path.join(tmpdir, "products.json")
+        with open(config, "w", encoding="utf-8") as f:
+            json.dump(
+                [
+                    {"name": "Gemini", "match": ["Gemini", "Bard"],
+                     "output_file": os.path.join(tmpdir, "Gemini.md"), "limit": 300},
+                    {"name": "Search", "match": "Search", "output_file": os.path.join(tmpdir, "Search.md")},
+                ],
+                f,
+            )
+
+        # Product checkpoints are named after the default one and kept next to each product's outputs.
+        exit_code, stdout, _ = run_main(
+            convert_history.LAST_ENTRY_TIME_FILE, input_file=input_file, products=config, mmap=use_mmap
+        )
+
+        self.assertEqual(exit_code, 0)
+        return stdout
+
+    def test_each_product_gets_its_own_outputs_and_checkpoint(self) -> None:
+        for use_mmap in (False, True):
+            with self.subTest(use_mmap=use_mmap), tempfile.TemporaryDirectory() as tmpdir:
+                stdout = self.run_products(tmpdir, use_mmap)
+
+                self.assertIn("📦 Gemini: 3 entries", stdout)
+                self.assertIn("📦 Search: 1 entries", stdout)
+
+                # The per-product limit of 300 characters splits the Gemini history across files.
+                gemini_files = sorted(name for name in os.listdir(tmpdir) if name.startswith("Gemini-"))
+                self.assertGreater(len([name for name in gemini_files if name.endswith(".md")]), 1)
+                gemini_text = "".join(
+                    read_text(os.path.join(tmpdir, name)) for name in gemini_files if name.endswith(".md")
+                )
+                self.assertIn("gemini oldest", gemini_text)
+                self.assertIn("bard answer", gemini_text)
+                self.assertNotIn("search query", gemini_text)
+                self.assertNotIn("maps route", gemini_text)
+
+                search_text = read_text(os.path.join(tmpdir, "Search-01.md"))
+                self.assertIn("search query", search_text)
+                self.assertNotIn("gemini", search_text)
+
+                self.assertEqual(
+                    read_text(os.path.join(tmpdir, "Gemini_last_entry_time.txt")).strip(),
+                    "2026-06-04T00:00:00+00:00",
+                )
+                self.assertEqual(
+                    read_text(os.path.join(tmpdir, "Search_last_entry_time.txt")).strip(),
+                    "2026-06-03T00:00:00+00:00",
+                )
+                self.assertFalse(os.path.exists(os.path.join(tmpdir, "Gemini_History-01.md")))
+
+
+if __name__ == "__main__":
+    unittest.main()
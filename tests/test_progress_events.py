@@ -0,0 +1,73 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import convert_history
+from cli_args import run_main, write_export
+
+
+class ProgressReporterTests(unittest.TestCase):
+    def test_events_are_rate_limited(self) -> None:
+        stream = io.StringIO()
+        result = convert_history.ConversionResult(total_entries=10000, gemini_entries=10000)
+        reporter = convert_history.ProgressReporter(stream, "MyActivity.json", result, interval=3600)
+
+        self.assertEqual(sum(1 for _ in reporter.track(range(10000))), 10000)
+
+        self.assertEqual(stream.getvalue(), "")
+        self.assertEqual(reporter.entries_scanned, 10000)
+
+    def test_event_reports_throughput_and_eta(self) -> None:
+        stream = io.StringIO()
+        result = convert_history.ConversionResult(total_entries=4, gemini_entries=4, bytes_written=123)
+        reporter = convert_history.ProgressReporter(stream, "MyActivity.json", result)
+        for _ in reporter.track(range(2)):
+            reporter.rendered("Gemini_History-01.md")
+
+        with patch("time.monotonic", return_value=reporter.started + 2.0):
+            reporter.emit("progress")
+
+        event = json.loads(stream.getvalue())
+        self.assertEqual(event["entries_scanned"], 2)
+        self.assertEqual(event["entries_rendered"], 2)
+        self.assertEqual(event["bytes_written"], 123)
+        self.assertEqual(event["current_file"], "Gemini_History-01.md")
+        self.assertEqual(event["entries_per_second"], 1.0)
+        self.assertEqual(event["eta_seconds"], 2.0)
+
+
+class ProgressConversionTests(unittest.TestCase):
+    def test_conversion_emits_start_and_done_events_on_stderr(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            write_export(
+                input_file,
+                [
+                    {"header": "Gemini Apps", "time": "2026-06-02T00:00:00Z", "title": "second"},
+                    {"header": "Search", "time": "2026-06-01T12:00:00Z", "title": "search"},
+                    {"header": "Gemini Apps", "time": "2026-06-01T00:00:00Z", "title": "first"},
+                ],
+            )
+
+            exit_code, _, stderr = run_main(
+                os.path.join(tmpdir, "last_entry_time.txt"),
+                input_file=input_file,
+                output_file=os.path.join(tmpdir, "Gemini_History.md"),
+                progress="json",
+            )
+
+            self.assertEqual(exit_code, 0)
+            events = [json.loads(line) for line in stderr.splitlines()]
+            self.assertEqual([event["event"] for event in events], ["start", "done"])
+            done = events[-1]
+            self.assertEqual((done["entries_total"], done["entries_scanned"], done["entries_rendered"]), (2, 2, 2))
+            self.assertEqual(done["current_file"], os.path.join(tmpdir, "Gemini_History-01.md"))
+            self.assertEqual(done["bytes_written"], os.path.getsize(done["current_file"]))
+            self.assertEqual(done["eta_seconds"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
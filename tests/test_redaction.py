@@ -0,0 +1,111 @@
+import os
+import re
+import tempfile
+import unittest
+
+import convert_history
+from cli_args import run_main, write_export
+
+
+class LiteralTriePatternTests(unittest.TestCase):
+    def test_matches_exactly_the_given_terms(self) -> None:
+        terms = ["blue", "bluebird", "blue-jay", "red", "a.b"]
+        pattern = re.compile(rf"(?:{convert_history.literal_trie_pattern(terms)})\Z")
+
+        for term in terms:
+            with self.subTest(term=term):
+                self.assertTrue(pattern.match(term))
+        for other in ["blu", "bluebirds", "blue-", "aXb", "re"]:
+            with self.subTest(other=other):
+                self.assertFalse(pattern.match(other))
+
+    def test_prefers_the_longest_term(self) -> None:
+        pattern = re.compile(convert_history.literal_trie_pattern(["blue", "bluebird"]))
+        self.assertEqual(pattern.match("bluebird song").group(), "bluebird")
+
+
+class RedactorTests(unittest.TestCase):
+    def test_redacts_each_kind_and_counts_it(self) -> None:
+        redactor = convert_history.Redactor(["Project Phoenix", "Bluebird"])
+
+        redacted = redactor.redact(
+            "Ask project phoenix and BLUEBIRD (not bluebirds). Mail bob.smith@example.co.jp, "
+            "call +81 3-1234-5678 or (03) 1234-5678, key sk-abcdefghijklmnopqrstuvwxyz123. "
+            "Dates 2026-06-01 12:30:00 and version 1.2.3 stay."
+        )
+
+        self.assertEqual(
+            redacted,
+            "Ask [REDACTED:TERM] and [REDACTED:TERM] (not bluebirds). Mail [REDACTED:EMAIL], "
+            "call [REDACTED:PHONE] or [REDACTED:PHONE], key [REDACTED:API_KEY]. "
+            "Dates 2026-06-01 12:30:00 and version 1.2.3 stay.",
+        )
+        self.assertEqual(redactor.counts, {"EMAIL": 1, "PHONE": 2, "API_KEY": 1, "TERM": 2})
+        self.assertGreater(redactor.scanned_bytes, 0)
+
+    def test_matches_next_to_cjk_text_and_punctuation(self) -> None:
+        redactor = convert_history.Redactor(["ProjectX"])
+
+        cases = {
+            "メールはfoo@example.comです": "メールは[REDACTED:EMAIL]です",
+            "電話090-1234-5678まで": "電話[REDACTED:PHONE]まで",
+            "これはProjectXです": "これは[REDACTED:TERM]です",
+            "foo-ProjectX": "foo-[REDACTED:TERM]",
+            "キーはsk-abcdefghijklmnopqrstuvwxyz123です": "キーは[REDACTED:API_KEY]です",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(redactor.redact(text), expected)
+
+    def test_dates_and_partial_words_are_left_alone(self) -> None:
+        redactor = convert_history.Redactor(["ProjectX"])
+
+        for text in ["date 05-12-2024", "on 12/31/2025", "id 2024 05 1234", "ProjectXs and xProjectX"]:
+            with self.subTest(text=text):
+                self.assertEqual(redactor.redact(text), text)
+        self.assertEqual(redactor.counts, {"EMAIL": 0, "PHONE": 0, "API_KEY": 0, "TERM": 0})
+
+    def test_entry_headings_are_left_alone(self) -> None:
+        redactor = convert_history.Redactor()
+        text = "## 2026/06/01 00:00:00\n\n**Action**: hello\n\n---\n\n"
+        self.assertEqual(redactor.redact(text), text)
+
+
+class RedactionConversionTests(unittest.TestCase):
+    def test_outputs_are_redacted_and_summary_is_printed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            write_export(
+                input_file,
+                [
+                    {
+                        "header": "Gemini Apps",
+                        "time": "2026-06-01T00:00:00Z",
+                        "title": "Prompt about Bluebird",
+                        "safeHtmlItem": [{"html": "<p>Write to alice@example.com</p>"}],
+                    }
+                ],
+            )
+            terms_file = os.path.join(tmpdir, "terms.txt")
+            with open(terms_file, "w", encoding="utf-8") as f:
+                f.write("# internal project names\nBluebird\n\n")
+            output_file = os.path.join(tmpdir, "Gemini_History.md")
+
+            exit_code, stdout, _ = run_main(
+                os.path.join(tmpdir, "last_entry_time.txt"),
+                input_file=input_file,
+                output_file=output_file,
+                redact_terms=terms_file,
+            )
+
+            self.assertEqual(exit_code, 0)
+            with open(os.path.join(tmpdir, "Gemini_History-01.md"), encoding="utf-8") as f:
+                content = f.read()
+            self.assertIn("Prompt about [REDACTED:TERM]", content)
+            self.assertIn("Write to [REDACTED:EMAIL]", content)
+            self.assertNotIn("alice", content)
+            self.assertIn("Redacted 2 item(s) (emails: 1, phone numbers: 0, API keys: 0, terms: 1)", stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+import convert_history
+from cli_args import make_activity, write_export
+
+
+class ResplitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.input_file = os.path.join(self.tmpdir.name, "MyActivity.json")
+        # Looks like a separator followed by a heading, but is part of the entry.
+        subtitles = [{"name": "User", "value": "---\n\n## not a new entry"}]
+        write_export(
+            self.input_file,
+            [{**make_activity(day, padding=200), "subtitles": subtitles} for day in range(9, 0, -1)],
+        )
+
+    def convert_to(self, directory: str, limit: int) -> str:
+        os.makedirs(directory, exist_ok=True)
+        output_file = os.path.join(directory, "Gemini_History.md")
+        options = convert_history.ConversionOptions(
+            input_file=self.input_file,
+            output_file=output_file,
+            limit=limit,
+            state_file=os.path.join(directory, "last_entry_time.txt"),
+        )
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            convert_history.convert(options)
+        return output_file
+
+    def digests(self, output_file: str) -> list[str]:
+        base_name, ext = os.path.splitext(output_file)
+        return [
+            convert_history.output_file_digest(path)
+            for path in convert_history.numbered_output_files(base_name, ext)
+        ]
+
+    def resplit(self, output_file: str, limit: int) -> int:
+        with patch("convert_history.get_system_language", return_value="en"), patch(
+            "sys.argv", ["convert_history.py", "resplit", "--output_file", output_file, "--limit", str(limit)]
+        ), redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            return convert_history.main()
+
+    def test_resplit_matches_a_conversion_with_the_new_limit(self) -> None:
+        with patch("convert_history.get_system_language", return_value="en"):
+            output_file = self.convert_to(os.path.join(self.tmpdir.name, "a"), 700)
+            expected_small = self.digests(output_file)
+            expected_large = self.digests(self.convert_to(os.path.join(self.tmpdir.name, "b"), 1500))
+        self.assertGreater(len(expected_small), len(expected_large))
+
+        self.assertEqual(self.resplit(output_file, 1500), 0)
+        self.assertEqual(self.digests(output_file), expected_large)
+
+        self.assertEqual(self.resplit(output_file, 700), 0)
+        self.assertEqual(self.digests(output_file), expected_small)
+        self.assertFalse([name for name in os.listdir(os.path.dirname(output_file)) if name.startswith(".resplit-")])
+
+    def test_oversized_entries_are_split_and_joined_again(self) -> None:
+        with open(self.input_file, "w", encoding="utf-8") as f:
+            json.dump(
+                [
+                    {
+                        "header": "Gemini Apps",
+                        "time": f"2026-06-{day:02d}T00:00:00Z",
+                        "title": f"day{day}",
+                        "safeHtmlItem": [
+                            {"html": "".join(f"<p>day{day} paragraph {i} {'y' * 50}</p>" for i in range(150))}
+                        ],
+                    }
+                    for day in range(3, 0, -1)
+                ],
+                f,
+            )
+        with patch("convert_history.get_system_language", return_value="en"):
+            output_file = self.convert_to(os.path.join(self.tmpdir.name, "a"), 100000)
+            expected_large = self.digests(output_file)
+            expected_small = self.digests(self.convert_to(os.path.join(self.tmpdir.name, "b"), 3000))
+        self.assertEqual(len(expected_large), 1)
+
+        self.assertEqual(self.resplit(output_file, 3000), 0)
+        self.assertEqual(self.digests(output_file), expected_small)
+        base_name, ext = os.path.splitext(output_file)
+        for path in convert_history.numbered_output_files(base_name, ext):
+            self.assertLessEqual(os.path.getsize(path), 3000)
+
+        self.assertEqual(self.resplit(output_file, 100000), 0)
+        self.assertEqual(self.digests(output_file), expected_large)
+
+    def test_missing_outputs_fail(self) -> None:
+        self.assertEqual(self.resplit(os.path.join(self.tmpdir.name, "Missing.md"), 1000), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+import convert_history
+from cli_args import make_activity, run_main, write_export
+
+
+class RunMetricsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.input_file = os.path.join(self.tmpdir.name, "MyActivity.json")
+        self.metrics_log = os.path.join(self.tmpdir.name, "run_metrics.jsonl")
+        self.textfile = os.path.join(self.tmpdir.name, "gemini_json2md.prom")
+
+    def write_export(self, days: int) -> None:
+        write_export(self.input_file, [make_activity(day) for day in range(days, 0, -1)])
+
+    def convert(self, **overrides) -> int:
+        exit_code, _, _ = run_main(
+            os.path.join(self.tmpdir.name, "last_entry_time.txt"),
+            input_file=self.input_file,
+            output_file=os.path.join(self.tmpdir.name, "Gemini_History.md"),
+            metrics_log=self.metrics_log,
+            **overrides,
+        )
+        return exit_code
+
+    def report(self) -> tuple[int, str]:
+        stdout_buffer = io.StringIO()
+        with patch("convert_history.get_system_language", return_value="en"), patch(
+            "sys.argv", ["convert_history.py", "report", "--metrics-log", self.metrics_log]
+        ), redirect_stdout(stdout_buffer), redirect_stderr(io.StringIO()):
+            exit_code = convert_history.main()
+        return exit_code, stdout_buffer.getvalue()
+
+    def test_each_run_appends_a_record(self) -> None:
+        self.write_export(2)
+        self.assertEqual(self.convert(prometheus_textfile=self.textfile), 0)
+        self.write_export(3)
+        self.assertEqual(self.convert(), 0)
+
+        records = convert_history.load_run_metrics(self.metrics_log)
+
+        self.assertEqual([record["entries_new"] for record in records], [2, 1])
+        self.assertEqual(records[1]["entries_gemini"], 3)
+        self.assertEqual(records[1]["input_bytes"], os.path.getsize(self.input_file))
+        self.assertTrue(all(record["succeeded"] for record in records))
+        self.assertGreater(records[0]["bytes_written"], 0)
+        if os.name == "posix":
+            self.assertGreater(records[0]["peak_rss_bytes"], 0)
+
+        with open(self.textfile, encoding="utf-8") as f:
+            textfile = f.read()
+        self.assertIn("# TYPE gemini_json2md_last_run_duration_seconds gauge\n", textfile)
+        self.assertIn('gemini_json2md_entries{kind="new"} 2\n', textfile)
+        self.assertIn("gemini_json2md_last_run_success 1\n", textfile)
+
+    def test_failed_runs_are_recorded_and_truncated_lines_skipped(self) -> None:
+        self.assertEqual(self.convert(), 1)
+        with open(self.metrics_log, "a", encoding="utf-8") as f:
+            f.write('{"finished_at": "2026-')
+
+        records = convert_history.load_run_metrics(self.metrics_log)
+
+        self.assertEqual(len(records), 1)
+        self.assertFalse(records[0]["succeeded"])
+
+    def test_report_compares_the_latest_run_with_the_median(self) -> None:
+        base = {
+            "input_file": "MyActivity.json",
+            "succeeded": True,
+            "entries_total": 100,
+            "entries_new": 1,
+            "files_written": 1,
+            "files_unchanged": 0,
+            "bytes_written": 1024 * 1024,
+            "peak_rss_bytes": 100 * 1024 * 1024,
+        }
+        runs = [(1.0, 1000, 10), (2.0, 1000, 10), (1.0, 1000, 10), (3.0, 2000, 15)]
+        with open(self.metrics_log, "w", encoding="utf-8") as f:
+            for day, (seconds, input_bytes, gemini) in enumerate(runs, 1):
+                record = {
+                    **base,
+                    "finished_at": f"2026-06-{day:02d}T00:00:00+00:00",
+                    "duration_seconds": seconds,
+                    "input_bytes": input_bytes,
+                    "entries_gemini": gemini,
+                }
+                f.write(json.dumps(record) + "\n")
+
+        exit_code, stdout = self.report()
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("2026-06-04T00:00:00+00:00: 3.00 s", stdout)
+        self.assertIn(
+            "median of 3 earlier run(s): duration +200%, throughput -33%, input size +100%, "
+            "Gemini entries +50%, peak RSS +0%",
+            stdout,
+        )
+
+    def test_report_without_a_log_fails(self) -> None:
+        exit_code, _ = self.report()
+        self.assertEqual(exit_code, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import http.client
+import io
+import json
+import threading
+import unittest
+import zipfile
+from contextlib import redirect_stderr
+
+import convert_history
+
+ACTIVITIES = [
+    {"header": "Gemini Apps", "time": "2026-06-02T00:00:00Z", "title": "second " + "x" * 200},
+    {"header": "Search", "time": "2026-06-01T12:00:00Z", "title": "ignored"},
+    {"header": "Gemini Apps", "time": "2026-06-01T00:00:00Z", "title": "first " + "x" * 200},
+]
+
+
+class ServeModeTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.service = convert_history.ConversionService(convert_history.ConversionOptions(), max_concurrent=1)
+        cls.server = convert_history.ConversionHTTPServer(("127.0.0.1", 0), cls.service)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.service.close()
+
+    def post(self, path: str, body: bytes) -> tuple[int, bytes]:
+        connection = http.client.HTTPConnection(*self.server.server_address[:2], timeout=30)
+        try:
+            with redirect_stderr(io.StringIO()):
+                connection.request("POST", path, body=body)
+                response = connection.getresponse()
+                return response.status, response.read()
+        finally:
+            connection.close()
+
+    def test_json_upload_streams_back_numbered_markdown_files(self) -> None:
+        status, body = self.post("/convert?limit=400", json.dumps(ACTIVITIES).encode())
+
+        self.assertEqual(status, 200)
+        with zipfile.ZipFile(io.BytesIO(body)) as archive:
+            self.assertEqual(archive.namelist(), ["Gemini_History-01.md", "Gemini_History-02.md"])
+            self.assertIn("first", archive.read("Gemini_History-01.md").decode())
+            self.assertIn("second", archive.read("Gemini_History-02.md").decode())
+
+    def test_takeout_archive_upload_uses_gemini_activity_file(self) -> None:
+        archive_buffer = io.BytesIO()
+        with zipfile.ZipFile(archive_buffer, "w") as archive:
+            archive.writestr("Takeout/My Activity/Search/MyActivity.json", json.dumps(ACTIVITIES[1:2]))
+            archive.writestr("Takeout/My Activity/Gemini Apps/MyActivity.json", json.dumps(ACTIVITIES))
+
+        status, body = self.post("/convert", archive_buffer.getvalue())
+
+        self.assertEqual(status, 200)
+        with zipfile.ZipFile(io.BytesIO(body)) as archive:
+            content = archive.read("Gemini_History-01.md").decode()
+        self.assertIn("first", content)
+        self.assertIn("second", content)
+
+    def test_invalid_upload_is_rejected_with_the_decode_error(self) -> None:
+        status, body = self.post("/convert", b"[{not json")
+
+        self.assertEqual(status, 422)
+        self.assertIn(b"JSON", body)
+
+    def test_busy_service_rejects_with_503(self) -> None:
+        self.service.slots.acquire()
+        try:
+            status, _ = self.post("/convert", json.dumps(ACTIVITIES).encode())
+        finally:
+            self.service.slots.release()
+
+        self.assertEqual(status, 503)
+
+    def test_unknown_path_is_404(self) -> None:
+        status, _ = self.post("/other", b"[]")
+
+        self.assertEqual(status, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
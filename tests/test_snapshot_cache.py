@@ -0,0 +1,124 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+import convert_history
+from cli_args import write_export
+
+ACTIVITIES = [
+    {"header": "Gemini Apps", "time": "2026-06-02T00:00:00Z", "title": "second"},
+    {"header": "Search", "time": "2026-06-01T12:00:00Z", "title": "search"},
+    {"header": "Gemini Apps", "time": "2026-06-01T00:00:00Z", "title": "first"},
+]
+
+
+class SnapshotCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.input_file = os.path.join(self.tmpdir.name, "MyActivity.json")
+        self.snapshot_dir = os.path.join(self.tmpdir.name, "snapshots")
+        self.write_input(ACTIVITIES)
+
+    def write_input(self, activities: list[dict]) -> None:
+        write_export(self.input_file, activities)
+
+    def load(self, **overrides) -> tuple[list[dict], str]:
+        options = convert_history.ConversionOptions(
+            input_file=self.input_file, snapshot_dir=self.snapshot_dir, **overrides
+        )
+        stdout_buffer = io.StringIO()
+        with patch("convert_history.get_system_language", return_value="en"), redirect_stdout(
+            stdout_buffer
+        ), redirect_stderr(io.StringIO()):
+            loaded = convert_history.load_routed_entries(options)
+        self.assertIsNotNone(loaded)
+        _, routed_entries, result = loaded
+        self.assertEqual(result.total_entries, 3)
+        return routed_entries[0], stdout_buffer.getvalue()
+
+    def test_second_run_loads_the_snapshot_instead_of_the_json(self) -> None:
+        entries, stdout = self.load()
+        self.assertIn("Snapshot saved", stdout)
+
+        with patch("convert_history.load_json", side_effect=AssertionError("JSON should not be decoded")):
+            cached_entries, stdout = self.load()
+
+        self.assertIn("Loaded 2 selected entries from snapshot", stdout)
+        self.assertEqual(cached_entries, entries)
+        self.assertEqual([entry["title"] for entry in cached_entries], ["second", "first"])
+
+    def test_changed_input_rebuilds_the_snapshot(self) -> None:
+        self.load()
+        stat = os.stat(self.input_file)
+        self.write_input([{**ACTIVITIES[0], "title": "edited"}, *ACTIVITIES[1:]])
+        os.utime(self.input_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        entries, stdout = self.load()
+
+        self.assertIn("Snapshot saved", stdout)
+        self.assertEqual(entries[0]["title"], "edited")
+
+    def test_touched_but_identical_input_is_accepted_by_hash(self) -> None:
+        self.load()
+        stat = os.stat(self.input_file)
+        os.utime(self.input_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with patch("convert_history.load_json", side_effect=AssertionError("JSON should not be decoded")):
+            _, stdout = self.load()
+        self.assertIn("Loaded 2 selected entries", stdout)
+
+        with patch("convert_history.file_sha256", side_effect=AssertionError("mtime was refreshed")), patch(
+            "convert_history.load_json", side_effect=AssertionError("JSON should not be decoded")
+        ):
+            self.load()
+
+    def test_plan_uses_snapshots_but_never_writes_them(self) -> None:
+        options = convert_history.ConversionOptions(
+            input_file=self.input_file,
+            output_file=os.path.join(self.tmpdir.name, "Gemini_History.md"),
+            state_file=os.path.join(self.tmpdir.name, "last_entry_time.txt"),
+            snapshot_dir=self.snapshot_dir,
+        )
+        with patch("convert_history.get_system_language", return_value="en"), redirect_stdout(
+            io.StringIO()
+        ), redirect_stderr(io.StringIO()):
+            self.assertTrue(convert_history.plan(options))
+            self.assertFalse(os.path.exists(self.snapshot_dir))
+
+            self.load()
+            stat = os.stat(self.input_file)
+            os.utime(self.input_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            snapshots = os.listdir(self.snapshot_dir)
+            mtimes = [os.stat(os.path.join(self.snapshot_dir, name)).st_mtime_ns for name in snapshots]
+            with patch("convert_history.load_json", side_effect=AssertionError("JSON should not be decoded")):
+                self.assertTrue(convert_history.plan(options))
+
+        self.assertEqual(os.listdir(self.snapshot_dir), snapshots)
+        self.assertEqual(
+            [os.stat(os.path.join(self.snapshot_dir, name)).st_mtime_ns for name in snapshots], mtimes
+        )
+
+    def test_snapshots_are_kept_per_filter_and_corrupt_ones_ignored(self) -> None:
+        self.load()
+        products = [convert_history.ProductFilter("Search", ("Search",), "Search.md", 1000, "search.txt")]
+
+        entries, stdout = self.load(products=products)
+
+        self.assertIn("Snapshot saved", stdout)
+        self.assertEqual([entry["title"] for entry in entries], ["search"])
+        self.assertEqual(len(os.listdir(self.snapshot_dir)), 2)
+
+        for name in os.listdir(self.snapshot_dir):
+            with open(os.path.join(self.snapshot_dir, name), "r+b") as f:
+                f.truncate(30)
+        entries, stdout = self.load()
+        self.assertIn("Snapshot saved", stdout)
+        self.assertEqual(len(entries), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
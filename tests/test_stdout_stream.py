@@ -0,0 +1,82 @@
+import io
+import os
+import tempfile
+import unittest
+
+import convert_history
+from cli_args import make_activity, run_main, write_export
+
+
+def parse_records(data: bytes) -> list[tuple[str, str]]:
+    records = []
+    for record in data.decode("utf-8").split(convert_history.STREAM_FILE_SEPARATOR)[1:]:
+        name, _, content = record.partition("\n")
+        records.append((name, content))
+    return records
+
+
+class StdoutStreamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.input_file = os.path.join(self.tmpdir.name, "MyActivity.json")
+        self.state_file = os.path.join(self.tmpdir.name, "last_entry_time.txt")
+
+    def write_input(self, days: range) -> None:
+        write_export(self.input_file, [make_activity(day, f"day {day}\x1c") for day in reversed(days)])
+
+    def convert(self, **overrides) -> tuple[int, bytes, str]:
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        exit_code, _, stderr = run_main(
+            self.state_file, stdout=stdout, input_file=self.input_file, output_file="-", **overrides
+        )
+        stdout.flush()
+        return exit_code, stdout.buffer.getvalue(), stderr
+
+    def test_files_are_streamed_as_records_and_messages_go_to_stderr(self) -> None:
+        self.write_input(range(1, 6))
+
+        exit_code, data, stderr = self.convert(limit=300)
+
+        self.assertEqual(exit_code, 0)
+        records = parse_records(data)
+        self.assertGreater(len(records), 1)
+        self.assertEqual(
+            [name for name, _ in records], [f"Gemini_History-{i:02d}.md" for i in range(1, len(records) + 1)]
+        )
+        for _, content in records:
+            self.assertTrue(content.startswith("# Gemini Chat History Archive\n"))
+            self.assertLessEqual(len(content.encode("utf-8")), 300)
+        titles = "".join(content for _, content in records)
+        self.assertEqual([day for day in range(1, 6) if f"day {day}\n" in titles], [1, 2, 3, 4, 5])
+        self.assertIn("streamed to stdout as: Gemini_History-01.md", stderr)
+        self.assertFalse(any(name.startswith("Gemini_History-") for name in os.listdir(self.tmpdir.name)))
+        self.assertFalse(any(name.startswith("--") for name in os.listdir(".")))
+
+    def test_every_run_streams_the_whole_history_and_leaves_the_checkpoint_alone(self) -> None:
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            f.write("2026-06-02T00:00:00+00:00")
+        self.write_input(range(1, 4))
+
+        for _ in range(2):
+            exit_code, data, _ = self.convert(incremental=True)
+
+            self.assertEqual(exit_code, 0)
+            records = parse_records(data)
+            self.assertEqual([name for name, _ in records], ["Gemini_History-01.md"])
+            self.assertTrue(all(f"day {day}" in records[0][1] for day in range(1, 4)))
+            with open(self.state_file, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "2026-06-02T00:00:00+00:00")
+
+    def test_modes_with_other_outputs_are_rejected(self) -> None:
+        self.write_input(range(1, 2))
+
+        exit_code, data, stderr = self.convert(store=os.path.join(self.tmpdir.name, "history.sqlite"))
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(data, b"")
+        self.assertIn("--output_file - cannot be combined", stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
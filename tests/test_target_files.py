@@ -0,0 +1,125 @@
+import functools
+import os
+import random
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+
+import convert_history
+from cli_args import make_activity, run_main, write_export
+
+
+def file_sizes(sizes: list[int], header_size: int, points: list[int]) -> list[int]:
+    bounds = [0, *points, len(sizes)]
+    return [header_size + sum(sizes[start:end]) for start, end in zip(bounds, bounds[1:])]
+
+
+def optimal_largest_file(sizes: list[int], header_size: int, files: int) -> int:
+    """Exhaustive minimum of the largest file over every split into at most `files` files."""
+
+    @functools.cache
+    def best(start: int, remaining: int) -> float:
+        if start == len(sizes):
+            return 0
+        if remaining == 0:
+            return float("inf")
+        return min(
+            max(header_size + sum(sizes[start:end]), best(end, remaining - 1))
+            for end in range(start + 1, len(sizes) + 1)
+        )
+
+    return best(0, files)
+
+
+class BalancedSplitPointsTests(unittest.TestCase):
+    def test_minimizes_the_largest_file_within_the_limit(self) -> None:
+        rng = random.Random(36)
+        for _ in range(200):
+            sizes = [rng.randint(1, 50) for _ in range(rng.randint(1, 12))]
+            target_files = rng.randint(1, 5)
+            with self.subTest(sizes=sizes, target_files=target_files):
+                points = convert_history.balanced_split_points(sizes, 10, 10000, target_files)
+                self.assertEqual(points, sorted(set(points)))
+                self.assertLessEqual(len(points) + 1, target_files)
+                self.assertEqual(
+                    max(file_sizes(sizes, 10, points)), optimal_largest_file(tuple(sizes), 10, target_files)
+                )
+
+    def test_falls_back_to_the_greedy_split_when_the_target_is_infeasible(self) -> None:
+        sizes = [40, 40, 40, 40]
+
+        points = convert_history.balanced_split_points(sizes, 10, 100, 1)
+
+        self.assertEqual(points, [2])
+        self.assertTrue(all(size <= 100 for size in file_sizes(sizes, 10, points)))
+
+    def test_oversized_entry_gets_its_own_file(self) -> None:
+        sizes = [10, 500, 10, 10]
+
+        points = convert_history.balanced_split_points(sizes, 0, 100, 3)
+
+        self.assertEqual(points, [1, 2])
+
+    def test_a_million_entries_are_split_quickly(self) -> None:
+        rng = random.Random(1)
+        sizes = [rng.randint(200, 5000) for _ in range(1_000_000)]
+
+        started = time.perf_counter()
+        points = convert_history.balanced_split_points(sizes, 80, 1_000_000_000, 50)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(points), 49)
+        self.assertLess(elapsed, 5.0)
+
+
+class SpillPiecesTests(unittest.TestCase):
+    def test_pieces_are_read_back_in_order_with_their_sizes(self) -> None:
+        dt = datetime(2026, 6, 1, 12, 30, 0, 123000, tzinfo=timezone.utc)
+        pieces = [(dt, "## entry\n\n", True), (dt, "日本語 continued\n\n", False), (dt, "", True)]
+
+        sizes, replayed = convert_history.spill_pieces(iter(pieces))
+
+        self.assertEqual(sizes, [len(text.encode("utf-8")) for _, text, _ in pieces])
+        self.assertEqual(list(replayed), pieces)
+
+
+class TargetFilesConversionTests(unittest.TestCase):
+    def test_outputs_are_balanced_instead_of_leaving_a_tiny_last_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            write_export(input_file, [make_activity(day, "x" * 300) for day in range(5, 0, -1)])
+            output_file = os.path.join(tmpdir, "Gemini_History.md")
+
+            exit_code, _, _ = run_main(
+                os.path.join(tmpdir, "last_entry_time.txt"),
+                input_file=input_file,
+                output_file=output_file,
+                limit=1500,
+                target_files=2,
+            )
+
+            self.assertEqual(exit_code, 0)
+            outputs = sorted(name for name in os.listdir(tmpdir) if name.startswith("Gemini_History-"))
+            self.assertEqual(outputs, ["Gemini_History-01.md", "Gemini_History-02.md"])
+            entry_counts = []
+            for name in outputs:
+                with open(os.path.join(tmpdir, name), encoding="utf-8") as f:
+                    entry_counts.append(f.read().count("\n---\n"))
+            self.assertEqual(entry_counts, [3, 2])
+
+    def test_store_mode_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store_file = os.path.join(tmpdir, "history.sqlite")
+
+            exit_code, _, stderr = run_main(
+                os.path.join(tmpdir, "last_entry_time.txt"), store=store_file, target_files=3
+            )
+
+            self.assertEqual(exit_code, 1)
+            self.assertIn("--target-files cannot be combined with --store", stderr)
+            self.assertFalse(os.path.exists(store_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
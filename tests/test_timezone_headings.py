@@ -0,0 +1,78 @@
+import os
+import random
+import tempfile
+import unittest
+import zoneinfo
+from datetime import datetime, timezone
+
+import convert_history
+from cli_args import run_main, write_export
+
+HEADING_FORMAT = "%Y/%m/%d %H:%M:%S"
+# Zones with daylight saving time, half-hour and 45-minute offsets, and a skipped calendar day.
+ZONES = ["UTC", "America/New_York", "Europe/London", "Australia/Lord_Howe", "Asia/Kathmandu", "Pacific/Apia"]
+
+
+class HeadingTimeFormatterTests(unittest.TestCase):
+    def test_matches_astimezone_and_strftime(self) -> None:
+        rng = random.Random(50)
+        for name in ZONES:
+            zone = zoneinfo.ZoneInfo(name)
+            formatter = convert_history.HeadingTimeFormatter(zone)
+            for _ in range(500):
+                dt = datetime.fromtimestamp(rng.randrange(0, 2_000_000_000), timezone.utc)
+                dt = dt.replace(microsecond=rng.randrange(1_000_000))
+                with self.subTest(zone=name, dt=dt):
+                    self.assertEqual(formatter.format(dt), dt.astimezone(zone).strftime(HEADING_FORMAT))
+
+    def test_transitions_are_found_to_the_second(self) -> None:
+        zone = zoneinfo.ZoneInfo("America/New_York")
+        formatter = convert_history.HeadingTimeFormatter(zone)
+        spring_forward = int(datetime(2026, 3, 8, 7, 0, tzinfo=timezone.utc).timestamp())
+
+        before, after = (datetime.fromtimestamp(spring_forward + delta, timezone.utc) for delta in (-1, 0))
+
+        self.assertEqual(formatter.format(before), "2026/03/08 01:59:59")
+        self.assertEqual(formatter.format(after), "2026/03/08 03:00:00")
+        starts, offsets = formatter.spans[spring_forward >> convert_history.OFFSET_SPAN_SHIFT]
+        self.assertIn(spring_forward, starts)
+        self.assertEqual(offsets[starts.index(spring_forward)], -4 * 3600)
+
+    def test_default_format_keeps_the_time_of_the_export(self) -> None:
+        dt = datetime.fromisoformat("2026-06-01T03:04:05.678+09:00")
+        self.assertEqual(convert_history.format_heading_time(dt), dt.strftime(HEADING_FORMAT))
+
+
+class TimezoneOptionTests(unittest.TestCase):
+    def convert(self, tmpdir: str, **overrides) -> tuple[int, str]:
+        input_file = os.path.join(tmpdir, "MyActivity.json")
+        write_export(
+            input_file, [{"header": "Gemini Apps", "time": "2026-06-01T20:30:00.123Z", "title": "late"}]
+        )
+        exit_code, _, stderr = run_main(
+            os.path.join(tmpdir, "last_entry_time.txt"),
+            input_file=input_file,
+            output_file=os.path.join(tmpdir, "Gemini_History.md"),
+            **overrides,
+        )
+        return exit_code, stderr
+
+    def test_headings_use_the_given_time_zone(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exit_code, _ = self.convert(tmpdir, timezone="Asia/Tokyo")
+
+            self.assertEqual(exit_code, 0)
+            with open(os.path.join(tmpdir, "Gemini_History-01.md"), encoding="utf-8") as f:
+                self.assertIn("## 2026/06/02 05:30:00\n", f.read())
+
+    def test_unknown_time_zone_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exit_code, stderr = self.convert(tmpdir, timezone="Mars/Olympus_Mons")
+
+            self.assertEqual(exit_code, 1)
+            self.assertIn("Unknown time zone: Mars/Olympus_Mons", stderr)
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, "Gemini_History-01.md")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+import convert_history
+from cli_args import run_main, write_export
+
+
+class LengthHistogramTests(unittest.TestCase):
+    def test_power_of_two_buckets_and_percentiles(self) -> None:
+        histogram = convert_history.LengthHistogram()
+        for length in [0, 1, 3, 4, 100, 100, 100, 100, 100, 5000]:
+            histogram.add(length)
+
+        stats = histogram.to_dict()
+
+        self.assertEqual((stats["count"], stats["sum"], stats["min"], stats["max"]), (10, 5508, 0, 5000))
+        self.assertEqual(stats["p50"], 127)
+        self.assertEqual(stats["p99"], 5000)
+        self.assertEqual(
+            [bucket["count"] for bucket in stats["histogram"]], [1, 1, 1, 1, 0, 0, 0, 5, 0, 0, 0, 0, 0, 1]
+        )
+        self.assertEqual(stats["histogram"][7]["below"], 128)
+
+    def test_size_is_fixed(self) -> None:
+        histogram = convert_history.LengthHistogram()
+        histogram.add(10**12)
+        self.assertEqual(len(histogram.buckets), convert_history.STATS_HISTOGRAM_BUCKETS)
+        self.assertEqual(histogram.to_dict()["histogram"][-1], {"below": None, "count": 1})
+
+
+class TopCounterTests(unittest.TestCase):
+    def test_frequent_keys_survive_a_long_tail(self) -> None:
+        counter = convert_history.TopCounter(capacity=50)
+        rng = random.Random(45)
+        keys = [f"rare {i}" for i in range(2000)] + ["Used Gemini Apps"] * 300 + ["Created Gem"] * 200
+        rng.shuffle(keys)
+
+        for key in keys:
+            counter.add(key)
+
+        self.assertLessEqual(len(counter.counts), 50)
+        top = counter.most_common(2)
+        self.assertEqual([item["title"] for item in top], ["Used Gemini Apps", "Created Gem"])
+        for item, true_count in zip(top, (300, 200)):
+            self.assertLessEqual(item["count"], true_count)
+            self.assertGreaterEqual(item["count"], true_count - counter.max_error)
+        self.assertLessEqual(counter.max_error, len(keys) // 51)
+
+
+class StatsConversionTests(unittest.TestCase):
+    def test_stats_file_is_written_alongside_the_conversion(self) -> None:
+        activities = [
+            {
+                "header": "Gemini Apps",
+                "time": "2026-06-02T10:00:00Z",
+                "title": "Prompted hello",
+                "subtitles": [{"name": "User", "value": "hello"}],
+                "safeHtmlItem": [{"html": "<p>hi</p>"}],
+            },
+            {"header": "Gemini Apps", "time": "2026-06-02T09:00:00Z", "title": "Prompted again"},
+            {"header": "Gemini Apps", "time": "2026-05-31T23:00:00Z", "title": "Used Gemini Apps"},
+            {"header": "Search", "time": "2026-05-30T00:00:00Z", "title": "Searched for cats"},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "MyActivity.json")
+            write_export(input_file, activities)
+            stats_file = os.path.join(tmpdir, "stats.json")
+
+            exit_code, _, _ = run_main(
+                os.path.join(tmpdir, "last_entry_time.txt"),
+                input_file=input_file,
+                output_file=os.path.join(tmpdir, "Gemini_History.md"),
+                stats=stats_file,
+            )
+
+            self.assertEqual(exit_code, 0)
+            with open(stats_file, encoding="utf-8") as f:
+                stats = json.load(f)
+
+        self.assertEqual(stats["entries"], 3)
+        self.assertEqual(stats["entries_per_day"], {"2026-05-31": 1, "2026-06-02": 2})
+        self.assertEqual(stats["entries_per_month"], {"2026-05": 1, "2026-06": 2})
+        self.assertEqual(stats["first_time"], "2026-05-31T23:00:00+00:00")
+        self.assertEqual(stats["prompt_chars"]["sum"], 5)
+        self.assertEqual(stats["response_html_chars"]["max"], len("<p>hi</p>"))
+        self.assertEqual(stats["top_actions"][0], {"title": "Prompted", "count": 2})
+        self.assertEqual(len(stats["top_titles"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
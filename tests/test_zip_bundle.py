@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+import convert_history
+from cli_args import make_activity, run_main, write_export
+
+
+class ZipBundleTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.input_file = os.path.join(self.tmpdir.name, "MyActivity.json")
+        self.bundle = os.path.join(self.tmpdir.name, "out.zip")
+        self.output_file = os.path.join(self.tmpdir.name, "Gemini_History.md")
+        write_export(self.input_file, [make_activity(day, f"day {day}") for day in range(5, 0, -1)])
+
+    def convert(self, **overrides) -> tuple[int, str]:
+        exit_code, _, stderr = run_main(
+            os.path.join(self.tmpdir.name, "last_entry_time.txt"),
+            input_file=self.input_file,
+            output_file=self.output_file,
+            bundle=self.bundle,
+            **overrides,
+        )
+        return exit_code, stderr
+
+    def test_members_respect_the_limit_and_are_listed_in_the_manifest(self) -> None:
+        exit_code, _ = self.convert(limit=300)
+
+        self.assertEqual(exit_code, 0)
+        # Bundles always hold the whole history, so the checkpoint of runs to disk is not written.
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ["MyActivity.json", "out.zip"])
+        with zipfile.ZipFile(self.bundle) as archive:
+            manifest = json.loads(archive.read(convert_history.BUNDLE_MANIFEST_FILE))
+            names = [info["file"] for info in manifest["files"]]
+            self.assertEqual(archive.namelist(), [*names, convert_history.BUNDLE_MANIFEST_FILE])
+            self.assertEqual(names, [f"Gemini_History-{i:02d}.md" for i in range(1, len(names) + 1)])
+            self.assertGreater(len(names), 1)
+            contents = [archive.read(name) for name in names]
+
+        for info, content in zip(manifest["files"], contents):
+            self.assertLessEqual(len(content), 300)
+            self.assertEqual(info["bytes"], len(content))
+            self.assertEqual(info["entries"], content.count(b"\n---\n"))
+        self.assertEqual(sum(info["entries"] for info in manifest["files"]), 5)
+        self.assertEqual(manifest["files"][0]["first_entry_time"], "2026-06-01T00:00:00+00:00")
+        self.assertEqual(manifest["files"][-1]["last_entry_time"], "2026-06-05T00:00:00+00:00")
+        for previous, current in zip(manifest["files"], manifest["files"][1:]):
+            self.assertLess(previous["last_entry_time"], current["first_entry_time"])
+
+    def test_failed_run_keeps_the_previous_bundle(self) -> None:
+        with open(self.bundle, "wb") as f:
+            f.write(b"previous")
+
+        with patch("convert_history.extract_text_content", side_effect=RuntimeError("boom")):
+            exit_code, stderr = self.convert()
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("boom", stderr)
+        with open(self.bundle, "rb") as f:
+            self.assertEqual(f.read(), b"previous")
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ["MyActivity.json", "out.zip"])
+
+    def test_store_mode_is_rejected(self) -> None:
+        exit_code, stderr = self.convert(store=os.path.join(self.tmpdir.name, "history.sqlite"))
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("--bundle cannot be combined", stderr)
+        self.assertFalse(os.path.exists(self.bundle))
+
+
+if __name__ == "__main__":
+    unittest.main()